@@ -2,45 +2,46 @@
 DataForge - 高效、灵活的测试数据生成工具
 """
 
+import os
+
 __version__ = "1.0.0"
 __author__ = "DataForge Team"
 __email__ = "contact@dataforge.org"
 __license__ = "MIT"
 
-from .cli.main import main as cli_main
 from .core.factory import default_factory, default_registry, register_generator
 from .core.generator import DataGenerator, GenerationContext, GeneratorConfig
 
 
-# 自动注册内置生成器和启动数据预加载
+# 注册内置生成器清单和预加载表（生成器模块在首次 default_registry.get() 时才导入）
 def _register_builtin_generators():
-    """注册内置生成器"""
-    try:
-        # 导入各类生成器
-        from .generators import (
-            basic,
-            contact,
-            identifier,
-            network,
-            numeric,
-            text,
-            finance,
-            advanced,
-            auth,
-        )
-    except ImportError:
-        pass  # 在某些情况下可能无法导入
+    """注册内置生成器和预加载表"""
+    from .core.preloader import default_preloader
+    from .generators import register_builtin_generators, register_builtin_tables
+
+    register_builtin_generators(default_registry)
+    register_builtin_tables(default_preloader)
 
 
 def _initialize_performance_optimizations():
     """初始化性能优化功能"""
-    try:
-        from .core.preloader import start_data_preload
+    # 预加载会拖慢短生命周期进程的启动，需通过环境变量显式开启
+    if os.environ.get("DATAFORGE_PRELOAD", "").lower() not in ("1", "true", "yes"):
+        return
+
+    from .core.preloader import start_data_preload
+
+    # 启动数据预加载（异步执行，不会阻塞导入）
+    start_data_preload()
+
+
+def __getattr__(name):
+    """延迟导入命令行入口，避免 import dataforge 时加载CLI依赖"""
+    if name == "cli_main":
+        from .cli.main import main as cli_main
 
-        # 启动数据预加载（异步执行，不会阻塞导入）
-        start_data_preload()
-    except ImportError:
-        pass  # 如果预加载模块不可用，跳过
+        return cli_main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 _register_builtin_generators()
@@ -54,4 +55,4 @@ __all__ = [
     "default_registry",
     "register_generator",
     "cli_main",
-]
\ No newline at end of file
+]
@@ -4,8 +4,8 @@ DataForge 核心模块
 
 from .factory import GeneratorConfig, default_factory, default_registry
 from .generator import DataGenerator
+from .record_batch import RecordBatch, Schema
 from .types import GeneratorType
-from .validator import DataValidator as Validator
 
 __all__ = [
     'GeneratorConfig',
@@ -13,5 +13,13 @@ __all__ = [
     'default_registry',
     'DataGenerator',
     'GeneratorType',
-    'Validator'
-]
\ No newline at end of file
+    'RecordBatch',
+    'Schema',
+]
+
+try:
+    from .validator import DataValidator as Validator
+
+    __all__.append('Validator')
+except ImportError:
+    pass  # 验证模块不可用时跳过
\ No newline at end of file
@@ -0,0 +1,156 @@
+"""
+模板编译模块
+
+把多字段模板编译成专用的 Python 行生成函数：字段循环被展开，
+各字段的单条生成函数（DataGenerator._specialize 的返回值，按参数的分支已提前解析）、
+随机数生成器及其 seek 方法都绑定为局部变量，每行以元组输出。
+
+生成的源码只取决于模板结构，按结构哈希缓存；CompiledTemplate.source
+可直接查看，异常回溯中也能显示生成代码的行。
+
+编译结果与 DataTemplate.generate_range 的逐行解释执行逐值相同。
+"""
+
+import hashlib
+import json
+import linecache
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from .generator import GenerationContext
+from .plan import PlanCache
+from .random_access import CounterRandom, stream_key
+
+# 结构哈希 -> (源码, 代码对象)
+_code_cache = PlanCache(maxsize=256)
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """编译后的模板"""
+
+    key: str  # 模板结构哈希
+    source: str  # 生成的源码
+    field_names: tuple[str, ...]
+    build_rows: Callable[..., list[tuple]]  # build_rows(start, stop, seed, context=None)
+
+    def rows(self, start: int, stop: int, seed: object, context: Optional[GenerationContext] = None) -> list[tuple]:
+        """生成 [start, stop) 区间的行（元组，顺序同 field_names）"""
+        return self.build_rows(start, stop, seed, context)
+
+    def records(
+        self, start: int, stop: int, seed: object, context: Optional[GenerationContext] = None
+    ) -> list[dict[str, Any]]:
+        """生成 [start, stop) 区间的行（字典）"""
+        names = self.field_names
+        return [dict(zip(names, row)) for row in self.build_rows(start, stop, seed, context)]
+
+
+def _structure(template) -> dict[str, Any]:
+    """决定生成源码的模板结构"""
+    slots: dict[int, int] = {}  # id(生成器实例) -> 槽位，同一实例可能被多个字段共享
+    fields = []
+    for template_field, generator in zip(template.fields, template.generators):
+        slot = slots.setdefault(id(generator), len(slots))
+        fields.append({"name": template_field.name, "generator": template_field.generator, "slot": slot})
+    return {
+        "fields": fields,
+        "uses_context": any(generator.uses_context for generator in template.generators),
+    }
+
+
+def _generate_source(structure: dict[str, Any]) -> str:
+    fields = structure["fields"]
+    uses_context = structure["uses_context"]
+    slot_count = max((item["slot"] for item in fields), default=-1) + 1
+    shared = {
+        slot for slot in range(slot_count) if sum(item["slot"] == slot for item in fields) > 1
+    }
+
+    lines = ["def build_rows(start, stop, seed, context=None):"]
+    emit = lines.append
+    for i, item in enumerate(fields):
+        emit(f"    rng_{i} = CounterRandom(stream_key(seed, {item['name']!r}))")
+        emit(f"    seek_{i} = rng_{i}.seek")
+    if uses_context:
+        emit("    base = new_context(context)")
+    emit("    rows = []")
+    emit("    append = rows.append")
+
+    # 非共享实例在整个区间内固定使用本字段的随机数生成器
+    for slot in range(slot_count):
+        emit(f"    previous_{slot} = getattr(local_{slot}, 'rng', None)")
+    for i, item in enumerate(fields):
+        if item["slot"] not in shared:
+            emit(f"    local_{item['slot']}.rng = rng_{i}")
+
+    emit("    try:")
+    emit("        for index in range(start, stop):")
+    if uses_context:
+        emit("            related = dict(base.related_data)")
+        emit(
+            "            row_context = Context(related, base.generation_id, base.batch_id, "
+            "base.user_id, base.session_data)"
+        )
+    argument = "row_context" if uses_context else "None"
+    for i, item in enumerate(fields):
+        emit(f"            seek_{i}(index)")
+        if item["slot"] in shared:
+            emit(f"            local_{item['slot']}.rng = rng_{i}")
+        emit(f"            value_{i} = generate_{i}({argument})")
+        if uses_context:
+            emit(f"            related[{item['name']!r}] = value_{i}")
+            emit(f"            related[{item['generator']!r}] = value_{i}")
+    values = ", ".join(f"value_{i}" for i in range(len(fields)))
+    emit(f"            append(({values}{',' if len(fields) == 1 else ''}))")
+    emit("    finally:")
+    for slot in range(slot_count):
+        emit(f"        if previous_{slot} is None:")
+        emit(f"            local_{slot}.__dict__.pop('rng', None)")
+        emit("        else:")
+        emit(f"            local_{slot}.rng = previous_{slot}")
+    emit("    return rows")
+    return "\n".join(lines) + "\n"
+
+
+def _compile_source(key: str, structure: dict[str, Any]) -> tuple[str, Any]:
+    source = _generate_source(structure)
+    filename = f"<dataforge-template-{key[:12]}>"
+    # 注册到 linecache，异常回溯可以显示生成代码
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    return source, compile(source, filename, "exec")
+
+
+def compile_template(template) -> CompiledTemplate:
+    """
+    编译模板
+
+    Args:
+        template: DataTemplate 实例
+
+    Returns:
+        编译后的模板，源码按模板结构缓存，生成器按本模板实例绑定
+    """
+    structure = _structure(template)
+    key = hashlib.sha256(json.dumps(structure, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
+    source, code = _code_cache.get_or_build(key, lambda: _compile_source(key, structure))
+
+    namespace: dict[str, Any] = {
+        "CounterRandom": CounterRandom,
+        "stream_key": stream_key,
+        "Context": GenerationContext,
+        "new_context": template._new_context,
+    }
+    bound: dict[int, int] = {}
+    for i, generator in enumerate(template.generators):
+        slot = bound.setdefault(id(generator), len(bound))
+        namespace[f"generate_{i}"] = generator._specialize()
+        namespace[f"local_{slot}"] = generator._local
+    exec(code, namespace)
+
+    return CompiledTemplate(
+        key=key,
+        source=source,
+        field_names=tuple(template.field_names),
+        build_rows=namespace["build_rows"],
+    )
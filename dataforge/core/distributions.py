@@ -0,0 +1,331 @@
+"""
+数值分布模块
+
+所有分布都以逆累积分布函数（分位数函数）表示：取值 = quantile(u)，u 为 [0, 1) 上的均匀随机数。
+截断到区间只需把 u 线性映射到 [F(low), F(high)]，不需要拒绝采样；
+逐个采样和整列采样消耗相同的随机数，结果逐值相同。
+整列采样时 u 一次取出，映射和求分位数都由 map 在C层完成（正态分位数由 statistics 的C实现计算）。
+
+安装了 NumPy 时，sample_numpy 在 numpy.random.Generator 上整列采样，返回 float64 数组。
+"""
+
+import bisect
+import itertools
+import math
+import operator
+import random
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Any, Optional, Sequence, Union
+
+from .random_access import stream_key
+from .sampling import uniform_floats
+
+DISTRIBUTIONS = ("uniform", "normal", "lognormal", "zipf", "histogram")
+
+# 分位数函数的定义域为开区间 (0, 1)
+_MIN_PROBABILITY = math.ulp(0.0)
+_MAX_PROBABILITY = 1.0 - 2.0 ** -53
+
+
+def _affine(values: Any, offset: float, scale: float) -> Any:
+    """逐个计算 offset + value * scale（返回迭代器）"""
+    return map(operator.add, itertools.repeat(offset), map(operator.mul, values, itertools.repeat(scale)))
+
+
+@dataclass(frozen=True)
+class UniformDistribution:
+    """[low, high) 上的均匀分布"""
+
+    low: float
+    high: float
+
+    def quantile(self, u: float) -> float:
+        return self.low + u * (self.high - self.low)
+
+    def quantiles(self, uniforms: Sequence[float]) -> list[float]:
+        return list(_affine(uniforms, self.low, self.high - self.low))
+
+    def sample_numpy(self, generator: Any, count: int) -> Any:
+        return self.low + generator.random(count) * (self.high - self.low)
+
+
+@dataclass(frozen=True)
+class NormalDistribution:
+    """
+    截断的正态分布；log 为True时为对数正态分布（对取对数后的值截断）
+
+    截断区间位于均值右侧时，累积概率接近1、双精度分辨率不足，
+    因此关于均值镜像到左尾计算：取值 = center + sign * inv_cdf(offset + u * scale)。
+    """
+
+    normal: NormalDist
+    # 截断区间（对数正态分布为取对数后的区间）
+    low: float
+    high: float
+    offset: float
+    scale: float
+    center: float
+    sign: float
+    log: bool = False
+
+    @property
+    def mass(self) -> float:
+        """截断区间内的概率"""
+        return abs(self.scale)
+
+    def quantile(self, u: float) -> float:
+        value = self.center + self.sign * self.normal.inv_cdf(self.offset + u * self.scale)
+        return math.exp(value) if self.log else value
+
+    def quantiles(self, uniforms: Sequence[float]) -> list[float]:
+        values = map(self.normal.inv_cdf, _affine(uniforms, self.offset, self.scale))
+        if self.sign < 0:
+            values = map(operator.sub, itertools.repeat(self.center), values)
+        return list(map(math.exp, values) if self.log else values)
+
+    def sample_numpy(self, generator: Any, count: int) -> Any:
+        """
+        拒绝采样：每轮按截断区间的概率多取一些，通常一轮即可
+
+        截断区间的概率过小时改用分位数函数逐个计算。
+        """
+        import numpy as np
+
+        mass = self.mass
+        if mass < 1e-3:
+            return np.fromiter(self.quantiles(generator.random(count).tolist()), dtype=np.float64, count=count)
+        parts = [np.empty(0)]
+        remaining = count
+        while remaining > 0:
+            values = generator.normal(self.normal.mean, self.normal.stdev, int(remaining / mass * 1.1) + 16)
+            values = values[(values >= self.low) & (values < self.high)][:remaining]
+            parts.append(values)
+            remaining -= len(values)
+        values = np.concatenate(parts)
+        return np.exp(values) if self.log else values
+
+
+def truncated_normal(mean: float, std: float, low: float, high: float, log: bool = False) -> NormalDistribution:
+    """
+    构建截断到 [low, high) 的（对数）正态分布，对数正态分布的 mean/std 为取对数后的参数
+
+    Raises:
+        ValueError: 区间内的概率为0
+    """
+    normal = NormalDist(mean, std)
+    if log:
+        low = math.log(low) if low > 0 else -math.inf
+        high = math.log(high)
+
+    def probability(x: float) -> float:
+        return min(max(normal.cdf(x) if x > -math.inf else 0.0, _MIN_PROBABILITY), _MAX_PROBABILITY)
+
+    if low + high > 2 * mean:
+        # 镜像：x = 2 * mean - y，y 落在 (2 * mean - high, 2 * mean - low]，u = 0 对应 y 的上端
+        low_p, high_p = probability(2 * mean - high), probability(2 * mean - low)
+        offset, scale, center, sign = high_p, low_p - high_p, 2 * mean, -1.0
+    else:
+        low_p, high_p = probability(low), probability(high)
+        offset, scale, center, sign = low_p, high_p - low_p, 0.0, 1.0
+    if high_p <= low_p:
+        raise ValueError("distribution has no mass in the requested range")
+    return NormalDistribution(normal, low, high, offset, scale, center, sign, log)
+
+
+@dataclass(frozen=True)
+class ZipfDistribution:
+    """
+    截断的 Zipf 分布：取值 low + k（k = 0, 1, ..., n - 1）的概率与 1 / (k + 1) ** exponent 成正比
+
+    取值为整数（以浮点数表示）。
+    """
+
+    low: int
+    # 各取值的累积概率，最后一项为无穷大，保证二分查找不越界
+    cum_probabilities: tuple[float, ...]
+
+    def quantile(self, u: float) -> float:
+        return float(self.low + bisect.bisect_right(self.cum_probabilities, u))
+
+    def quantiles(self, uniforms: Sequence[float]) -> list[float]:
+        ranks = map(bisect.bisect_right, itertools.repeat(self.cum_probabilities), uniforms)
+        return list(map(float, map(operator.add, itertools.repeat(self.low), ranks)))
+
+    def sample_numpy(self, generator: Any, count: int) -> Any:
+        import numpy as np
+
+        cum = np.array(self.cum_probabilities[:-1])
+        return (self.low + np.searchsorted(cum, generator.random(count), side="right")).astype(np.float64)
+
+
+def zipf(low: int, size: int, exponent: float) -> ZipfDistribution:
+    """构建取值为 low 到 low + size - 1 的 Zipf 分布"""
+    cum = list(itertools.accumulate(rank ** -exponent for rank in range(1, size + 1)))
+    total = cum[-1]
+    return ZipfDistribution(low, tuple(weight / total for weight in cum[:-1]) + (math.inf,))
+
+
+@dataclass(frozen=True)
+class HistogramDistribution:
+    """
+    经验直方图分布：先按权重选取区间，再在区间内均匀取值
+
+    分位数函数为累积概率到区间端点的分段线性插值，第 i 段为 intercepts[i] + u * slopes[i]。
+    """
+
+    # 区间端点，递增
+    edges: tuple[float, ...]
+    # 各区间端点处的累积概率，首项为0、末项为1
+    cum_probabilities: tuple[float, ...]
+    # 按 bisect_right(cum_probabilities, u) 索引的各段截距和斜率（下标0不会用到）
+    intercepts: tuple[float, ...]
+    slopes: tuple[float, ...]
+
+    def quantile(self, u: float) -> float:
+        index = bisect.bisect_right(self.cum_probabilities, u)
+        return self.intercepts[index] + u * self.slopes[index]
+
+    def quantiles(self, uniforms: Sequence[float]) -> list[float]:
+        indexes = list(map(bisect.bisect_right, itertools.repeat(self.cum_probabilities), uniforms))
+        intercepts = map(self.intercepts.__getitem__, indexes)
+        return list(map(operator.add, intercepts, map(operator.mul, uniforms, map(self.slopes.__getitem__, indexes))))
+
+    def sample_numpy(self, generator: Any, count: int) -> Any:
+        import numpy as np
+
+        return np.interp(generator.random(count), self.cum_probabilities, self.edges)
+
+
+Distribution = Union[UniformDistribution, NormalDistribution, ZipfDistribution, HistogramDistribution]
+
+
+def histogram(
+    edges: Sequence[float], weights: Sequence[float], low: float, high: float
+) -> HistogramDistribution:
+    """
+    构建截断到 [low, high) 的直方图分布，部分落在区间内的组按落入的比例保留权重
+
+    Raises:
+        ValueError: 端点或权重不合法，或截断后总权重为0
+    """
+    edges = [float(edge) for edge in edges]
+    weights = [float(weight) for weight in weights]
+    if len(edges) != len(weights) + 1 or not weights:
+        raise ValueError("histogram needs len(bins) == len(weights) + 1")
+    if any(right <= left for left, right in zip(edges, edges[1:])):
+        raise ValueError("histogram bins must be strictly increasing")
+    if any(weight < 0 for weight in weights):
+        raise ValueError("histogram weights must be non-negative")
+
+    kept_edges = []
+    kept_weights = []
+    for left, right, weight in zip(edges, edges[1:], weights):
+        clipped_left, clipped_right = max(left, float(low)), min(right, float(high))
+        if clipped_right <= clipped_left:
+            continue
+        if not kept_edges:
+            kept_edges.append(clipped_left)
+        kept_edges.append(clipped_right)
+        kept_weights.append(weight * (clipped_right - clipped_left) / (right - left))
+
+    total = sum(kept_weights)
+    if total <= 0:
+        raise ValueError(f"histogram has no weight in [{low}, {high})")
+    cum = [0.0] + [weight / total for weight in itertools.accumulate(kept_weights)]
+    cum[-1] = 1.0
+
+    # 概率为0的区间不会被 bisect_right 选中，其斜率取0即可
+    intercepts = [0.0]
+    slopes = [0.0]
+    for index in range(1, len(cum)):
+        width = cum[index] - cum[index - 1]
+        slope = (kept_edges[index] - kept_edges[index - 1]) / width if width > 0 else 0.0
+        intercepts.append(kept_edges[index - 1] - cum[index - 1] * slope)
+        slopes.append(slope)
+    # u 不会达到1，末尾补一段仅为防御
+    intercepts.append(kept_edges[-1])
+    slopes.append(0.0)
+    return HistogramDistribution(tuple(kept_edges), tuple(cum), tuple(intercepts), tuple(slopes))
+
+
+def build_distribution(
+    kind: str,
+    low: float,
+    high: float,
+    mean: Optional[float] = None,
+    std: Optional[float] = None,
+    median: Optional[float] = None,
+    sigma: float = 1.0,
+    exponent: float = 1.0,
+    bins: Optional[Sequence[float]] = None,
+    weights: Optional[Sequence[float]] = None,
+) -> Distribution:
+    """
+    按名称构建截断到 [low, high) 的分布
+
+    Args:
+        kind: "uniform"、"normal"、"lognormal"、"zipf" 或 "histogram"
+        low: 下界（含）
+        high: 上界（不含）；zipf 分布的取值为 low 到 high - 1 的整数
+        mean: 正态分布的均值，默认为区间中点
+        std: 正态分布的标准差，默认为区间长度的 1/6
+        median: 对数正态分布的中位数，默认为区间端点（不小于1）的几何平均
+        sigma: 对数正态分布取对数后的标准差
+        exponent: zipf 分布的指数
+        bins: 直方图的区间端点
+        weights: 直方图各区间的权重
+
+    Raises:
+        ValueError: 分布名称未知或参数不合法
+    """
+    if not low < high:
+        raise ValueError(f"empty range [{low}, {high})")
+    if kind == "uniform":
+        return UniformDistribution(low, high)
+    if kind == "normal":
+        mean = (low + high) / 2 if mean is None else mean
+        std = (high - low) / 6 if std is None else std
+        if std <= 0:
+            raise ValueError(f"std must be positive, got {std}")
+        return truncated_normal(mean, std, low, high)
+    if kind == "lognormal":
+        if high <= 0:
+            raise ValueError("lognormal distribution needs a positive upper bound")
+        median = math.sqrt(max(low, 1.0) * max(high, 1.0)) if median is None else median
+        if median <= 0 or sigma <= 0:
+            raise ValueError("lognormal distribution needs positive median and sigma")
+        return truncated_normal(math.log(median), sigma, low, high, log=True)
+    if kind == "zipf":
+        if low != int(low) or high != int(high):
+            raise ValueError("zipf distribution needs integer bounds")
+        if exponent < 0:
+            raise ValueError(f"zipf exponent must be non-negative, got {exponent}")
+        return zipf(int(low), int(high - low), exponent)
+    if kind == "histogram":
+        if bins is None or weights is None:
+            raise ValueError("histogram distribution needs bins and weights")
+        return histogram(bins, weights, low, high)
+    raise ValueError(f"Unknown distribution: {kind}, expected one of {DISTRIBUTIONS}")
+
+
+def sample_values(rng: random.Random, distribution: Distribution, count: int) -> list[float]:
+    """整列采样 count 个取值，与逐个调用 distribution.quantile(rng.random()) 的结果相同"""
+    return distribution.quantiles(uniform_floats(rng, count))
+
+
+def numpy_generator(seed: Optional[object]) -> Any:
+    """
+    numpy.random.Generator（PCG64），非整数种子先派生为整数
+
+    Raises:
+        ImportError: 未安装 numpy
+    """
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError("NumPy sampling requires numpy: pip install numpy") from e
+    if seed is not None and not isinstance(seed, int):
+        seed = int.from_bytes(stream_key(seed, "numpy"), "little")
+    return np.random.default_rng(seed)
+
@@ -0,0 +1,127 @@
+"""
+组合空间枚举模块
+
+由若干有限词表拼接而成的数据（公司名称等）构成一个组合空间：
+第 i 个取值按混合进制把 i 拆成各段的下标后拼接得到。
+配合随机置换 RandomPermutation 依次解码 perm(0), perm(1), ...，
+即可 O(1) 地逐个生成保证不重复的取值，直到取尽整个空间，无需重试和去重。
+"""
+
+import hashlib
+from dataclasses import dataclass
+from typing import Iterable, Sequence
+
+# Feistel 轮函数的乘数（64位奇数）
+_MULTIPLIERS = (0x9E3779B97F4A7C15, 0xBF58476D1CE4E5B9, 0x94D049BB133111EB, 0xD6E8FEB86659FD93)
+_MASK64 = (1 << 64) - 1
+
+
+def _dedupe(values: Iterable[str]) -> tuple[str, ...]:
+    return tuple(dict.fromkeys(values))
+
+
+def _is_prefix_free(values: Sequence[str]) -> bool:
+    """是否没有任何取值是另一个取值的真前缀（排序后只需比较相邻项）"""
+    ordered = sorted(values)
+    return not any(following.startswith(value) for value, following in zip(ordered, ordered[1:]))
+
+
+@dataclass(frozen=True)
+class MixedRadixSpace:
+    """
+    若干段词表的笛卡尔积，各段取值依次拼接
+
+    通过 build 构建时保证不同下标解码出的字符串互不相同，size 即不重复取值的确切数量。
+    """
+
+    segments: tuple[tuple[str, ...], ...]
+
+    @classmethod
+    def build(cls, segments: Sequence[Iterable[str]]) -> "MixedRadixSpace":
+        """
+        由各段候选词构建组合空间
+
+        每段先去重；除最后一段外，若某段中有词是另一个词的前缀（含空串），
+        拼接结果可能相同，此时把该段与下一段合并展开后去重，直到各段都是前缀码。
+        前缀码的拼接可以唯一拆分，因此不同下标对应的字符串必然不同。
+        """
+        pending = [_dedupe(segment) for segment in segments]
+        if not pending:
+            raise ValueError("MixedRadixSpace needs at least one segment")
+        if any(not segment for segment in pending):
+            return cls(tuple(pending))  # 空空间
+
+        built: list[tuple[str, ...]] = []
+        current = pending[0]
+        for following in pending[1:]:
+            if _is_prefix_free(current):
+                built.append(current)
+                current = following
+            else:
+                current = _dedupe(head + tail for head in current for tail in following)
+        built.append(current)
+        return cls(tuple(built))
+
+    @property
+    def size(self) -> int:
+        """不重复取值的数量"""
+        size = 1
+        for segment in self.segments:
+            size *= len(segment)
+        return size
+
+    def digits(self, index: int) -> tuple[int, ...]:
+        """第 index 个取值在各段中的下标（最后一段为最低位）"""
+        if not 0 <= index < self.size:
+            raise IndexError(f"index {index} out of range for space of size {self.size}")
+        digits = []
+        for segment in reversed(self.segments):
+            index, digit = divmod(index, len(segment))
+            digits.append(digit)
+        return tuple(reversed(digits))
+
+    def decode(self, index: int) -> str:
+        """第 index 个取值"""
+        return "".join(segment[digit] for segment, digit in zip(self.segments, self.digits(index)))
+
+
+class RandomPermutation:
+    """
+    [0, size) 上由种子决定的随机置换，O(1) 计算任一位置的值，不占用 O(size) 内存
+
+    在不小于 size 的 4 的幂上做 4 轮平衡 Feistel 变换，
+    结果超出范围时对其继续变换（cycle walking），平均不超过 4 次。
+    """
+
+    def __init__(self, size: int, seed: object):
+        if size <= 0:
+            raise ValueError(f"Permutation size must be positive, got {size}")
+        self.size = size
+        self._half_bits = max(1, ((size - 1).bit_length() + 1) // 2)
+        self._half_mask = (1 << self._half_bits) - 1
+        digest = hashlib.blake2b(f"{seed}".encode("utf-8"), digest_size=8 * len(_MULTIPLIERS)).digest()
+        self._keys = tuple(
+            int.from_bytes(digest[i * 8:(i + 1) * 8], "little") for i in range(len(_MULTIPLIERS))
+        )
+
+    def _round(self, value: int, key: int, multiplier: int) -> int:
+        mixed = ((value ^ key) * multiplier) & _MASK64
+        return (mixed ^ (mixed >> 29)) & self._half_mask
+
+    def _encrypt(self, value: int) -> int:
+        bits = self._half_bits
+        left, right = value >> bits, value & self._half_mask
+        for key, multiplier in zip(self._keys, _MULTIPLIERS):
+            left, right = right, left ^ self._round(right, key, multiplier)
+        return (left << bits) | right
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: int) -> int:
+        if not 0 <= index < self.size:
+            raise IndexError(f"index {index} out of range for permutation of size {self.size}")
+        value = self._encrypt(index)
+        while value >= self.size:
+            value = self._encrypt(value)
+        return value
@@ -2,11 +2,16 @@
 Generator factory and registry system for DataForge
 """
 
-import inspect
-from typing import Dict, List, Optional, Type, Union, Any
+import copy
+import importlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, List, NamedTuple, Optional, Type, Union, Any
 from dataclasses import dataclass
 
 from .generator import DataGenerator, GenerationContext
+from .generator import GeneratorConfig as _InstanceConfig
+from .plan import freeze_parameters
 
 
 @dataclass
@@ -14,6 +19,9 @@ class GeneratorConfig:
     """Configuration for creating generators"""
     generator_type: str
     parameters: Dict[str, Any] = None
+    pool_size: Optional[int] = None  # serve values from a pre-generated pool of this size
+    pool_distribution: str = "uniform"  # "uniform" or "zipf" reuse of pooled values
+    pool_workers: int = 1
     
     def __post_init__(self):
         if self.parameters is None:
@@ -26,6 +34,8 @@ class GeneratorRegistry:
     def __init__(self):
         self._generators: Dict[str, Type[DataGenerator]] = {}
         self._aliases: Dict[str, str] = {}
+        # name -> "module:Class" for generators whose module is not imported yet
+        self._lazy: Dict[str, str] = {}
     
     def register(self, name: str, generator_class: Type[DataGenerator], aliases: Optional[List[str]] = None):
         """Register a generator class"""
@@ -33,43 +43,87 @@ class GeneratorRegistry:
             raise ValueError(f"Generator class must inherit from DataGenerator")
         
         self._generators[name] = generator_class
+        self._lazy.pop(name, None)
         
         # Register aliases
         if aliases:
             for alias in aliases:
                 self._aliases[alias] = name
     
+    def register_lazy(self, name: str, target: str, aliases: Optional[List[str]] = None):
+        """Register a generator by "module:Class" path without importing it"""
+        module_name, sep, class_name = target.partition(":")
+        if not sep or not module_name or not class_name:
+            raise ValueError(f"Lazy generator target must be 'module:Class', got {target!r}")
+        
+        if name not in self._generators:
+            self._lazy[name] = target
+        
+        if aliases:
+            for alias in aliases:
+                self._aliases[alias] = name
+    
+    def _load(self, name: str) -> Optional[Type[DataGenerator]]:
+        """Import the module of a lazily registered generator"""
+        target = self._lazy.get(name)
+        if target is None:
+            return None
+        
+        module_name, _, class_name = target.partition(":")
+        module = importlib.import_module(module_name)
+        generator_class = getattr(module, class_name)
+        
+        # Importing usually registers the class through @register_generator;
+        # register explicitly in case the module lives in another registry.
+        if name not in self._generators:
+            self.register(name, generator_class)
+        return self._generators[name]
+    
     def get(self, name: str) -> Optional[Type[DataGenerator]]:
         """Get generator class by name or alias"""
-        # Check direct name first
-        if name in self._generators:
-            return self._generators[name]
+        # Resolve aliases to the canonical name
+        actual_name = self._aliases.get(name, name)
         
-        # Check aliases
-        if name in self._aliases:
-            actual_name = self._aliases[name]
+        if actual_name in self._generators:
             return self._generators[actual_name]
         
-        return None
+        return self._load(actual_name)
+    
+    def resolve_name(self, name: str) -> str:
+        """Resolve an alias to its canonical generator name"""
+        return self._aliases.get(name, name)
     
     def is_registered(self, name: str) -> bool:
         """Check if generator is registered"""
-        return name in self._generators or name in self._aliases
+        return name in self._generators or name in self._lazy or name in self._aliases
     
     def list_generators(self) -> List[str]:
         """List all registered generator names"""
-        return list(self._generators.keys())
+        return list(self._generators.keys()) + [name for name in self._lazy if name not in self._generators]
     
     def list_aliases(self) -> Dict[str, str]:
         """List all aliases and their targets"""
         return self._aliases.copy()
 
 
+class CacheInfo(NamedTuple):
+    """Statistics of the generator instance cache"""
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
 class GeneratorFactory:
     """Factory for creating generator instances"""
     
-    def __init__(self, registry: GeneratorRegistry):
+    def __init__(self, registry: GeneratorRegistry, cache_size: int = 128):
         self.registry = registry
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Hashable, DataGenerator]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
     
     def create_generator(self, config: GeneratorConfig) -> DataGenerator:
         """Create a generator instance from config"""
@@ -79,12 +133,108 @@ class GeneratorFactory:
             raise ValueError(f"Unknown generator type: {config.generator_type}")
         
         # Create instance with parameters
-        return generator_class(config.parameters or {})
+        return generator_class(self._instance_config(config, config.parameters or {}))
+    
+    @staticmethod
+    def _instance_config(config: GeneratorConfig, parameters: Dict[str, Any]) -> _InstanceConfig:
+        """Translate a factory config into the config a generator instance is built with"""
+        return _InstanceConfig(
+            generator_type=config.generator_type,
+            parameters=parameters,
+            pool_size=config.pool_size,
+            pool_distribution=config.pool_distribution,
+            pool_workers=config.pool_workers,
+        )
     
     def create_generator_simple(self, generator_type: str, **parameters) -> DataGenerator:
         """Create a generator with simple parameters"""
         config = GeneratorConfig(generator_type, parameters)
         return self.create_generator(config)
+    
+    def get_generator(self, config: GeneratorConfig) -> DataGenerator:
+        """Get a shared, ready-to-use generator instance from the LRU cache
+        
+        Instances are keyed by canonical generator name and frozen parameters,
+        so aliases and reordered parameters hit the same entry. The returned
+        instance is shared between callers and threads and must not be
+        mutated; use create_generator() for a private instance.
+        """
+        generator_class = self.registry.get(config.generator_type)
+        if generator_class is None:
+            raise ValueError(f"Unknown generator type: {config.generator_type}")
+        
+        parameters = config.parameters or {}
+        try:
+            key = (
+                self.registry.resolve_name(config.generator_type),
+                generator_class,
+                freeze_parameters(parameters),
+                config.pool_size,
+                config.pool_distribution,
+            )
+        except TypeError:
+            key = None  # unhashable parameters, bypass the cache
+        
+        if key is None or self.cache_size <= 0:
+            with self._cache_lock:
+                self._misses += 1
+            return generator_class(self._instance_config(config, copy.deepcopy(parameters)))
+        
+        with self._cache_lock:
+            generator = self._cache.get(key)
+            if generator is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return generator
+            self._misses += 1
+        
+        # Build outside the lock so slow setups do not block other lookups
+        generator = generator_class(self._instance_config(config, copy.deepcopy(parameters)))
+        
+        with self._cache_lock:
+            # Another thread may have built the same entry meanwhile
+            existing = self._cache.get(key)
+            if existing is not None:
+                self._cache.move_to_end(key)
+                return existing
+            self._cache[key] = generator
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return generator
+    
+    def get_generator_simple(self, generator_type: str, **parameters) -> DataGenerator:
+        """Get a shared cached generator with simple parameters"""
+        return self.get_generator(GeneratorConfig(generator_type, parameters))
+    
+    def invalidate(self, generator_type: Optional[str] = None) -> int:
+        """Drop cached instances, all of them or only those of one generator type
+        
+        Returns:
+            Number of removed instances
+        """
+        with self._cache_lock:
+            if generator_type is None:
+                removed = len(self._cache)
+                self._cache.clear()
+                return removed
+            
+            name = self.registry.resolve_name(generator_type)
+            stale = [key for key in self._cache if key[0] == name]
+            for key in stale:
+                del self._cache[key]
+            return len(stale)
+    
+    def cache_info(self) -> CacheInfo:
+        """Return hit/miss statistics of the instance cache"""
+        with self._cache_lock:
+            return CacheInfo(self._hits, self._misses, self.cache_size, len(self._cache))
+    
+    def cache_clear(self) -> None:
+        """Drop all cached instances and reset the statistics"""
+        with self._cache_lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
 
 
 # Global registry and factory instances
@@ -2,10 +2,20 @@
 DataForge核心生成器接口和基类
 """
 
+import json
+import random
+import threading
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Generic, Optional, TypeVar
+from typing import Any, Callable, Generic, Iterator, Optional, TypeVar, Union
+
+from .parallel import DEFAULT_CHUNK_SIZE, EXECUTORS, run_chunks
+from .plan import PlanCache, freeze_parameters
+from .pool import ValuePool
+from .record_batch import FixedWidthColumn
+from .random_access import CounterRandom, stream_key
 
 T = TypeVar("T")
 
@@ -42,11 +52,16 @@ class GeneratorConfig:
     validate: bool = True
     unique: bool = False
     related_fields: Optional[dict[str, str]] = None
+    pool_size: Optional[int] = None  # 取值池大小，设置后逐行生成改为从池中采样（不能与 unique 同时设置）
+    pool_distribution: str = "uniform"  # 池取值的复用分布："uniform" 或 "zipf"
+    pool_workers: int = 1  # 填充取值池的工作线程数
 
     def __post_init__(self):
         """初始化后处理"""
         if self.parameters is None:
             self.parameters = {}
+        if self.pool_size and self.unique:
+            raise ValueError("pool_size cannot be combined with unique=True: pooled values repeat by design")
 
 
 @dataclass
@@ -70,51 +85,325 @@ class GenerationContext:
 class DataGenerator(ABC, Generic[T]):
     """数据生成器抽象基类"""
 
-    def __init__(self, config: GeneratorConfig):
+    # 每个子类独立的生成计划缓存，键为规范化后的参数
+    _plan_cache: PlanCache = PlanCache()
+
+    # 读取 context.related_data 的生成器需设为True，模板编译器据此决定是否为每行构建上下文
+    uses_context: bool = False
+
+    # 输出为定长 ASCII 字符串时的宽度（如身份证号18位），批量生成时可存入 FixedWidthColumn
+    fixed_width: Optional[int] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._plan_cache = PlanCache()
+
+    def __init__(self, config: Optional[Union[GeneratorConfig, dict[str, Any]]] = None):
         """
         初始化数据生成器
 
         Args:
-            config: 生成器配置
+            config: 生成器配置，也可以直接传入参数字典
         """
+        if config is None or isinstance(config, dict):
+            config = GeneratorConfig(generator_type=type(self).__name__, parameters=config)
         self.config = config
         self.parameters = config.parameters or {}
+        self._local = threading.local()
+        self._pool: Optional[ValuePool] = None
+        self._pool_lock = threading.Lock()
         self._setup()
 
+    def __getstate__(self) -> dict[str, Any]:
+        """线程局部状态不参与序列化"""
+        state = self.__dict__.copy()
+        state.pop("_local", None)
+        state.pop("_pool_lock", None)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._local = threading.local()
+        self._pool_lock = threading.Lock()
+
+    @property
+    def rng(self) -> random.Random:
+        """当前线程的随机数生成器，各线程互不共享状态"""
+        try:
+            return self._local.rng
+        except AttributeError:
+            self._local.rng = random.Random()
+            return self._local.rng
+
+    @contextmanager
+    def _using_rng(self, rng: random.Random) -> Iterator[random.Random]:
+        """在当前线程内临时替换随机数生成器"""
+        previous = getattr(self._local, "rng", None)
+        self._local.rng = rng
+        try:
+            yield rng
+        finally:
+            if previous is None:
+                del self._local.rng
+            else:
+                self._local.rng = previous
+
+    def _run_batch(
+        self,
+        produce: Any,
+        count: int,
+        workers: int = 1,
+        executor: str = "thread",
+        seed: Optional[object] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> list[T]:
+        """
+        按分块执行批量生成，produce(n) 在当前线程的随机数生成器上生成 n 条数据
+
+        未指定种子且单线程时直接在调用线程中生成。
+        """
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor: {executor}, expected one of {EXECUTORS}")
+        if seed is None and workers <= 1:
+            return produce(count)
+        if seed is None:
+            seed = self.rng.getrandbits(64)
+
+        def produce_chunk(rows: int, rng: random.Random) -> list[T]:
+            with self._using_rng(rng):
+                return produce(rows)
+
+        return run_chunks(produce_chunk, count, seed, workers, executor, chunk_size)
+
+    def _run_unique_batch(
+        self,
+        produce: Any,
+        count: int,
+        max_attempts: Optional[int] = None,
+        workers: int = 1,
+        executor: str = "thread",
+        seed: Optional[object] = None,
+    ) -> list[T]:
+        """
+        批量生成不重复的数据，按生成顺序去重后补齐缺口
+
+        Args:
+            produce: 同 _run_batch
+            count: 需要的数量
+            max_attempts: 最多生成的候选总数，None表示不限制
+            workers: 工作线程数
+            executor: "thread" 或 "serial"
+            seed: 随机种子，每轮补齐使用由其派生的新种子
+        """
+        results: dict[T, None] = {}
+        attempts = 0
+        round_index = 0
+        while len(results) < count:
+            rows = count - len(results)
+            if max_attempts is not None:
+                rows = min(rows, max_attempts - attempts)
+                if rows <= 0:
+                    break
+            round_seed = seed if seed is None or round_index == 0 else f"{seed}:round{round_index}"
+            for item in self._run_batch(produce, rows, workers, executor, round_seed):
+                results[item] = None
+            attempts += rows
+            round_index += 1
+        return list(results)
+
     @abstractmethod
     def _setup(self) -> None:
         """设置生成器参数，子类必须实现"""
         pass
 
+    def _build_plan(self, parameters: dict[str, Any]) -> Any:
+        """由参数编译不可变的生成计划，使用计划的子类需要实现"""
+        raise NotImplementedError(f"{type(self).__name__} does not support generation plans")
+
+    def _plan_for(self, parameters: dict[str, Any]) -> Any:
+        """
+        获取参数对应的生成计划，相同参数的计划在同类实例间复用
+
+        Args:
+            parameters: 完整参数
+
+        Returns:
+            生成计划
+        """
+        try:
+            key = freeze_parameters(parameters)
+        except TypeError:
+            return self._build_plan(parameters)  # 参数不可哈希时不缓存
+        return self._plan_cache.get_or_build(key, lambda: self._build_plan(parameters))
+
+    def _plan_with_overrides(self, overrides: dict[str, Any]) -> Any:
+        """获取应用了单次调用参数覆盖的计划，不修改实例状态"""
+        if not overrides:
+            return self._plan
+        return self._plan_for({**self.parameters, **overrides})
+
     @abstractmethod
     def _generate_raw(self, context: Optional[GenerationContext] = None) -> T:
         """生成原始数据，子类必须实现"""
         pass
 
+    def _generate_value(self, context: Optional[GenerationContext] = None) -> T:
+        """逐条生成一条数据（不经过取值池）"""
+        return self._generate_raw(context)
+
+    @property
+    def value_pool(self) -> Optional[ValuePool]:
+        """
+        取值池，未设置 pool_size 时为None
+
+        首次访问时填充。池的内容由生成器类型和参数决定（以其派生种子），
+        与进程和 pool_workers 无关，因此按种子生成的数据集仍可复现。
+        """
+        if not self.config.pool_size:
+            return None
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = self._fill_pool()
+        return self._pool
+
+    def _fill_pool(self) -> ValuePool:
+        parameters = json.dumps(self.parameters, ensure_ascii=False, sort_keys=True, default=str)
+        values = self._run_batch(
+            lambda rows: [self._generate_value() for _ in range(rows)],
+            self.config.pool_size,
+            workers=self.config.pool_workers,
+            seed=f"pool:{type(self).__name__}:{parameters}",
+        )
+        return ValuePool.build(values, self.config.pool_distribution)
+
     def generate(self, context: Optional[GenerationContext] = None) -> T:
         """
         生成数据
 
+        设置了 pool_size 时从取值池中采样，此时不使用上下文中的关联数据。
+
         Args:
             context: 生成上下文
 
         Returns:
             生成的数据
         """
-        return self._generate_raw(context)
+        pool = self.value_pool
+        if pool is not None:
+            return pool.sample(self.rng)[0]
+        return self._generate_value(context)
+
+    def _specialize(self) -> Callable[[Optional[GenerationContext]], T]:
+        """
+        返回与 generate 等价的单条生成函数，供模板编译器绑定为局部变量
 
-    def generate_batch(self, count: int, context: Optional[GenerationContext] = None) -> list[T]:
+        子类可以在这里提前解析按参数的分支（格式、详细程度等），
+        返回的函数必须与 generate 消耗相同的随机数并产生相同的结果。
+        """
+        pool = self.value_pool
+        if pool is not None:
+            sample = pool.sample
+            return lambda context=None: sample(self.rng)[0]
+        return self._generate_value
+
+    def generate_batch(
+        self,
+        count: int,
+        context: Optional[GenerationContext] = None,
+        workers: int = 1,
+        executor: str = "thread",
+        seed: Optional[int] = None,
+    ) -> list[T]:
         """
         批量生成数据
 
         Args:
             count: 生成数量
             context: 生成上下文
+            workers: 工作线程数，大于1时分块并行生成（GIL构建上退化为串行）
+            executor: "thread" 或 "serial"
+            seed: 随机种子，指定后结果与 workers/executor 无关且可复现
 
         Returns:
             生成的数据列表
         """
-        return [self.generate(context) for _ in range(count)]
+        pool = self.value_pool
+        if pool is not None:
+            return self._run_batch(lambda rows: pool.sample(self.rng, rows), count, workers, executor, seed)
+        return self._run_batch(
+            lambda rows: [self.generate(context) for _ in range(rows)],
+            count,
+            workers=workers,
+            executor=executor,
+            seed=seed,
+        )
+
+    def generate_column(
+        self,
+        count: int,
+        workers: int = 1,
+        executor: str = "thread",
+        seed: Optional[int] = None,
+    ) -> Union[FixedWidthColumn, list[T]]:
+        """
+        批量生成一列数据，定长生成器直接写入 FixedWidthColumn
+
+        结果与 generate_batch 的参数相同时逐值相同；非定长生成器返回列表。
+        """
+        width = self.fixed_width
+        if width is None:
+            return self.generate_batch(count, workers=workers, executor=executor, seed=seed)
+
+        generate = self._specialize()
+
+        def produce(rows: int) -> list[FixedWidthColumn]:
+            part = FixedWidthColumn(width)
+            # 按块编码写入，临时 str 对象不会超过一个块
+            for offset in range(0, rows, DEFAULT_CHUNK_SIZE):
+                part.extend([generate(None) for _ in range(min(DEFAULT_CHUNK_SIZE, rows - offset))])
+            return [part]
+
+        column = FixedWidthColumn(width)
+        for part in self._run_batch(produce, count, workers=workers, executor=executor, seed=seed):
+            column.data += part.data
+        return column
+
+    def generate_at(self, index: int, seed: object, context: Optional[GenerationContext] = None) -> T:
+        """
+        直接生成种子数据集中的第 index 条数据，无需生成前面的数据
+
+        Args:
+            index: 行号（从0开始）
+            seed: 数据集种子
+            context: 生成上下文
+
+        Returns:
+            与 generate_range(0, index + 1, seed)[index] 相同的数据
+        """
+        return self.generate_range(index, index + 1, seed, context)[0]
+
+    def generate_range(
+        self,
+        start: int,
+        stop: int,
+        seed: object,
+        context: Optional[GenerationContext] = None,
+    ) -> list[T]:
+        """
+        生成种子数据集中 [start, stop) 区间的数据
+
+        每行使用由 (seed, 行号) 定位的计数器随机数，任意区间可独立生成，
+        拼接多个区间的结果与一次生成整个区间完全相同。
+        注意这与 generate_batch(seed=...) 是不同的数据流，也不做去重。
+        """
+        rng = CounterRandom(stream_key(seed))
+        results = []
+        with self._using_rng(rng):
+            for index in range(start, stop):
+                rng.seek(index)
+                results.append(self.generate(context))
+        return results
 
     def validate(self, data: T) -> bool:
         """
@@ -143,9 +432,9 @@ class DataGenerator(ABC, Generic[T]):
 class ValidatedDataGenerator(DataGenerator[T], ABC):
     """带验证功能的数据生成器基类"""
 
-    def generate(self, context: Optional[GenerationContext] = None) -> T:
+    def _generate_value(self, context: Optional[GenerationContext] = None) -> T:
         """
-        生成并验证数据
+        生成并验证数据（取值池中的数据也在填充时验证）
 
         Args:
             context: 生成上下文
@@ -156,7 +445,10 @@ class ValidatedDataGenerator(DataGenerator[T], ABC):
         Raises:
             ValueError: 如果生成的数据无效
         """
-        data = self._generate_raw(context)
+        return self._validated(self._generate_raw(context))
+
+    def _validated(self, data: T) -> T:
+        """按配置验证数据，无效时抛出 ValueError"""
         if self.config.validate and not self.validate(data):
             raise ValueError(f"Generated data failed validation: {data}")
         return data
\ No newline at end of file
@@ -0,0 +1,83 @@
+"""
+并行批量生成模块
+
+将批量生成拆分为固定大小的分块，每个分块使用由 (seed, 分块序号) 派生的
+独立随机数生成器，因此给定种子时输出与线程数和执行方式无关。
+在启用GIL的解释器上线程无法带来加速，会自动退化为串行执行。
+"""
+
+import os
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# 默认分块大小，决定种子到输出的映射，修改会改变带种子批量生成的结果
+DEFAULT_CHUNK_SIZE = 4096
+
+EXECUTORS = ("thread", "serial")
+
+
+def gil_enabled() -> bool:
+    """当前解释器是否启用了GIL（3.13 之前的版本始终启用）"""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def default_workers() -> int:
+    """默认工作线程数"""
+    return os.cpu_count() or 1
+
+
+def chunk_rng(seed: object, index: int) -> random.Random:
+    """派生第 index 个分块的随机数生成器（字符串种子经SHA-512哈希，跨进程稳定）"""
+    return random.Random(f"{seed}:{index}")
+
+
+def split_chunks(count: int, chunk_size: int = DEFAULT_CHUNK_SIZE) -> list[tuple[int, int]]:
+    """将 count 拆分为 (分块序号, 行数) 列表"""
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    return [(index, min(chunk_size, count - start)) for index, start in enumerate(range(0, count, chunk_size))]
+
+
+def run_chunks(
+    produce: Callable[[int, random.Random], list[T]],
+    count: int,
+    seed: object,
+    workers: int = 1,
+    executor: str = "thread",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> list[T]:
+    """
+    分块执行批量生成并按分块顺序拼接结果
+
+    Args:
+        produce: 分块生成函数，参数为 (行数, 分块随机数生成器)
+        count: 总行数
+        seed: 种子，各分块的随机数生成器由其派生
+        workers: 工作线程数
+        executor: "thread" 使用线程池（GIL构建上自动退化为串行），"serial" 串行执行
+        chunk_size: 分块大小
+
+    Returns:
+        生成结果列表
+    """
+    if executor not in EXECUTORS:
+        raise ValueError(f"Unknown executor: {executor}, expected one of {EXECUTORS}")
+
+    chunks = split_chunks(count, chunk_size)
+    tasks = [lambda index=index, rows=rows: produce(rows, chunk_rng(seed, index)) for index, rows in chunks]
+
+    if executor == "serial" or workers <= 1 or len(tasks) <= 1 or gil_enabled():
+        parts = [task() for task in tasks]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dataforge-batch") as pool:
+            parts = list(pool.map(lambda task: task(), tasks))
+
+    results: list[T] = []
+    for part in parts:
+        results.extend(part)
+    return results
@@ -0,0 +1,66 @@
+"""
+生成计划模块
+
+生成计划是由参数编译得到的不可变对象，生成过程只读取计划，
+不修改生成器实例，因此同一实例可以安全地在多线程中共享，
+单次调用的参数覆盖也只需构建（或复用）另一个计划。
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+def freeze_parameters(value: Any) -> Hashable:
+    """
+    将参数转换为规范的可哈希形式
+
+    字典按键排序，列表与元组视为相同，集合转为 frozenset。
+
+    Raises:
+        TypeError: 参数中包含无法哈希的值
+    """
+    if isinstance(value, dict):
+        return ("__dict__",) + tuple(
+            sorted(((key, freeze_parameters(item)) for key, item in value.items()), key=lambda kv: repr(kv[0]))
+        )
+    if isinstance(value, (list, tuple)):
+        return ("__seq__",) + tuple(freeze_parameters(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return ("__set__", frozenset(freeze_parameters(item) for item in value))
+    hash(value)
+    return value
+
+
+class PlanCache:
+    """线程安全的有界LRU计划缓存"""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._plans: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key: Hashable, builder: Callable[[], Any]) -> Any:
+        """获取缓存的计划，不存在时调用 builder 构建"""
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is not None:
+                self._plans.move_to_end(key)
+                return plan
+
+        plan = builder()
+
+        with self._lock:
+            plan = self._plans.setdefault(key, plan)
+            self._plans.move_to_end(key)
+            while len(self._plans) > self.maxsize:
+                self._plans.popitem(last=False)
+        return plan
+
+    def clear(self) -> None:
+        """清空缓存"""
+        with self._lock:
+            self._plans.clear()
+
+    def __len__(self) -> int:
+        return len(self._plans)
@@ -0,0 +1,64 @@
+"""
+取值池模块
+
+对不要求唯一的字段（地址、公司名称等），预先生成一个固定大小的取值池，
+之后每行只需按复用分布采样池中的下标，逐行生成的开销降为一次采样。
+"""
+
+import itertools
+import random
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence
+
+POOL_DISTRIBUTIONS = ("uniform", "zipf")
+
+# Zipf 分布的默认指数：第 k 个取值的权重为 1 / k**s
+DEFAULT_ZIPF_EXPONENT = 1.0
+
+
+@dataclass(frozen=True)
+class ValuePool:
+    """不可变的取值池"""
+
+    values: tuple[Any, ...]
+    distribution: str = "uniform"
+    cum_weights: Optional[tuple[float, ...]] = None  # 非均匀分布的累积权重
+
+    @classmethod
+    def build(
+        cls,
+        values: Sequence[Any],
+        distribution: str = "uniform",
+        zipf_exponent: float = DEFAULT_ZIPF_EXPONENT,
+    ) -> "ValuePool":
+        """
+        由生成好的取值构建取值池
+
+        Args:
+            values: 池中的取值
+            distribution: 复用分布，"uniform" 或 "zipf"（越靠前的取值复用越多）
+            zipf_exponent: Zipf 分布的指数
+
+        Raises:
+            ValueError: 分布未知或取值为空
+        """
+        if distribution not in POOL_DISTRIBUTIONS:
+            raise ValueError(f"Unknown pool distribution: {distribution}, expected one of {POOL_DISTRIBUTIONS}")
+        if not values:
+            raise ValueError("Value pool must not be empty")
+
+        cum_weights = None
+        if distribution == "zipf":
+            cum_weights = tuple(
+                itertools.accumulate(1.0 / rank ** zipf_exponent for rank in range(1, len(values) + 1))
+            )
+        return cls(tuple(values), distribution, cum_weights)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def sample(self, rng: random.Random, k: int = 1) -> list[Any]:
+        """按复用分布采样 k 个取值"""
+        if self.cum_weights is None:
+            return rng.choices(self.values, k=k)
+        return rng.choices(self.values, cum_weights=self.cum_weights, k=k)
@@ -0,0 +1,276 @@
+"""
+数据预加载模块
+
+在后台线程中加载词库、地区表和编译后的采样表，并将编译结果
+持久化到按版本划分的磁盘缓存中，后续进程可直接读取而无需重建。
+"""
+
+import importlib
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Sequence
+
+# 缓存文件格式版本，修改缓存载荷结构时递增
+CACHE_FORMAT = 1
+
+
+def default_cache_dir() -> str:
+    """默认缓存目录，可通过 DATAFORGE_CACHE_DIR 环境变量覆盖"""
+    base = os.environ.get("DATAFORGE_CACHE_DIR")
+    if not base:
+        base = os.path.join(
+            os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+            "dataforge",
+        )
+    return base
+
+
+@dataclass
+class TableSpec:
+    """预加载表定义"""
+
+    name: str
+    target: str  # "module:function"，函数无参数并返回可pickle的结构
+    version: int = 1
+    sources: tuple[str, ...] = ()  # 表数据所在的其他模块，与构建函数所在模块一起计入缓存指纹
+
+
+@dataclass
+class TableTiming:
+    """单个表的加载耗时"""
+
+    seconds: float
+    source: str  # "memory", "disk" 或 "built"
+
+
+class DataPreloader:
+    """后台数据预加载器"""
+
+    def __init__(self, cache_dir: Optional[str] = None, use_disk_cache: Optional[bool] = None):
+        """
+        初始化预加载器
+
+        Args:
+            cache_dir: 磁盘缓存根目录，默认为 default_cache_dir()（每次访问时解析，随环境变量变化）
+            use_disk_cache: 是否读写磁盘缓存，默认由 DATAFORGE_TABLE_CACHE 环境变量决定（默认开启）
+        """
+        if use_disk_cache is None:
+            use_disk_cache = os.environ.get("DATAFORGE_TABLE_CACHE", "1").lower() not in ("0", "false", "no")
+        self._cache_dir = cache_dir
+        self.use_disk_cache = use_disk_cache
+
+        self._specs: Dict[str, TableSpec] = {}
+        self._tables: Dict[str, Any] = {}
+        self._timings: Dict[str, TableTiming] = {}
+        self._errors: Dict[str, BaseException] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+
+    @property
+    def cache_dir(self) -> str:
+        """磁盘缓存根目录"""
+        return self._cache_dir or default_cache_dir()
+
+    def register(self, name: str, target: str, version: int = 1, sources: Sequence[str] = ()) -> None:
+        """
+        注册预加载表
+
+        Args:
+            name: 表名
+            target: 构建函数 "module:function"
+            version: 表版本，修改表结构时递增
+            sources: 表数据所在的其他模块名（如构建函数从另一个模块读取数据），其源文件变化时缓存失效
+        """
+        module_name, sep, func_name = target.partition(":")
+        if not sep or not module_name or not func_name:
+            raise ValueError(f"Preload target must be 'module:function', got {target!r}")
+
+        with self._lock:
+            self._specs[name] = TableSpec(name, target, version, tuple(sources))
+            self._locks.setdefault(name, threading.Lock())
+            self._tables.pop(name, None)
+
+    def list_tables(self) -> list[str]:
+        """列出已注册的表"""
+        return list(self._specs)
+
+    def start(self) -> None:
+        """在后台线程中加载所有已注册的表，重复调用无副作用"""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="dataforge-preload", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            for name in list(self._specs):
+                try:
+                    self.get(name)
+                except Exception as e:  # 后台加载失败不影响使用，get() 时会重新尝试
+                    self._errors[name] = e
+        finally:
+            self._ready.set()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        等待后台预加载完成
+
+        Args:
+            timeout: 最长等待秒数，None表示一直等待
+
+        Returns:
+            是否已完成；未启动预加载时返回False
+        """
+        if self._thread is None:
+            return False
+        return self._ready.wait(timeout)
+
+    @property
+    def is_ready(self) -> bool:
+        """后台预加载是否已完成"""
+        return self._ready.is_set()
+
+    def get(self, name: str) -> Any:
+        """
+        获取表，未加载时同步加载（优先读取磁盘缓存）
+
+        Raises:
+            KeyError: 表未注册
+        """
+        table = self._tables.get(name)
+        if table is not None:
+            return table
+
+        spec = self._specs.get(name)
+        if spec is None:
+            raise KeyError(f"Unknown preload table: {name}")
+
+        # 每个表一把锁，后台线程正在构建时调用方在此等待
+        with self._locks[name]:
+            table = self._tables.get(name)
+            if table is not None:
+                return table
+
+            start = time.perf_counter()
+            builder, fingerprint = self._resolve(spec)
+            table = self._read_cache(spec, fingerprint)
+            source = "disk"
+            if table is None:
+                table = builder()
+                source = "built"
+                self._write_cache(spec, fingerprint, table)
+
+            self._tables[name] = table
+            self._timings[name] = TableTiming(time.perf_counter() - start, source)
+            self._errors.pop(name, None)
+            return table
+
+    def timings(self) -> Dict[str, TableTiming]:
+        """各表的加载耗时"""
+        return dict(self._timings)
+
+    def errors(self) -> Dict[str, BaseException]:
+        """后台加载失败的表及异常"""
+        return dict(self._errors)
+
+    def clear_cache(self) -> None:
+        """删除当前版本的磁盘缓存文件，并清空内存中的表"""
+        with self._lock:
+            self._tables.clear()
+            self._timings.clear()
+        directory = self._cache_path()
+        if not os.path.isdir(directory):
+            return
+        for filename in os.listdir(directory):
+            if filename.endswith(".pkl"):
+                try:
+                    os.remove(os.path.join(directory, filename))
+                except OSError:
+                    pass
+
+    def _resolve(self, spec: TableSpec) -> tuple[Callable[[], Any], tuple]:
+        """导入构建函数，并以其模块和 spec.sources 中各模块源文件的状态作为缓存指纹"""
+        module_name, _, func_name = spec.target.partition(":")
+        module = importlib.import_module(module_name)
+        builder = getattr(module, func_name)
+
+        fingerprint: tuple = (spec.target, spec.version)
+        for source in (module, *map(importlib.import_module, spec.sources)):
+            source_file = getattr(source, "__file__", None)
+            if not source_file:
+                continue
+            try:
+                stat = os.stat(source_file)
+                fingerprint += (source.__name__, stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                pass
+        return builder, fingerprint
+
+    def _cache_path(self, name: Optional[str] = None) -> str:
+        from dataforge import __version__
+
+        directory = os.path.join(self.cache_dir, f"tables-{__version__}-f{CACHE_FORMAT}")
+        if name is None:
+            return directory
+        return os.path.join(directory, f"{name}.pkl")
+
+    def _read_cache(self, spec: TableSpec, fingerprint: tuple) -> Any:
+        if not self.use_disk_cache:
+            return None
+
+        import pickle
+
+        try:
+            with open(self._cache_path(spec.name), "rb") as f:
+                payload = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, IndexError):
+            return None
+
+        if not isinstance(payload, dict) or payload.get("fingerprint") != fingerprint:
+            return None
+        return payload.get("table")
+
+    def _write_cache(self, spec: TableSpec, fingerprint: tuple, table: Any) -> None:
+        if not self.use_disk_cache:
+            return
+
+        import pickle
+
+        path = self._cache_path(spec.name)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                pickle.dump({"fingerprint": fingerprint, "table": table}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            # 原子替换，避免并发进程读到写了一半的文件
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+# 全局预加载器
+default_preloader = DataPreloader()
+
+
+def start_data_preload() -> DataPreloader:
+    """启动全局预加载器的后台加载"""
+    default_preloader.start()
+    return default_preloader
+
+
+def wait_ready(timeout: Optional[float] = None) -> bool:
+    """等待全局预加载器完成"""
+    return default_preloader.wait_ready(timeout)
+
+
+def get_table(name: str) -> Any:
+    """从全局预加载器获取表"""
+    return default_preloader.get(name)
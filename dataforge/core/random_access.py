@@ -0,0 +1,80 @@
+"""
+随机访问生成模块
+
+CounterRandom 是基于计数器的随机数生成器：第 n 个64位随机字由
+以 (种子, 数据流) 为密钥的 BLAKE2b 对计数器 n 做哈希得到，
+不依赖之前生成过的数据。每一行占用计数器的一段独立区间，
+因此可以直接定位到任意行，无需生成前面的行。
+"""
+
+import hashlib
+import random
+import struct
+from typing import Any
+
+# 每行可用的计数器区间为 2**ROW_SHIFT 个哈希块（每块8个64位随机字）
+ROW_SHIFT = 32
+
+_WORDS = struct.Struct("<8Q")
+
+
+def stream_key(seed: object, stream: str = "") -> bytes:
+    """由种子和数据流名称（如字段名）派生 BLAKE2b 密钥"""
+    return hashlib.blake2b(f"{seed}\x00{stream}".encode("utf-8"), digest_size=32).digest()
+
+
+class CounterRandom(random.Random):
+    """基于 (密钥, 计数器) 哈希的随机数生成器，支持 O(1) 定位到任意行"""
+
+    def __init__(self, key: bytes = b""):
+        self._key = key
+        self._counter = 0
+        self._words: tuple[int, ...] = ()
+        self._pos = 8
+        super().__init__(key)
+
+    def seed(self, a: Any = None, version: int = 2) -> None:
+        """以 a 派生新的密钥并回到第0行"""
+        if not isinstance(a, bytes):
+            a = stream_key(a)
+        self._key = a
+        self.gauss_next = None
+        self.seek(0)
+
+    def seek(self, row: int) -> None:
+        """定位到第 row 行的起始位置"""
+        if row < 0:
+            raise ValueError(f"row must be non-negative, got {row}")
+        self._counter = row << ROW_SHIFT
+        self._pos = 8
+
+    def _next_word(self) -> int:
+        if self._pos == 8:
+            digest = hashlib.blake2b(self._counter.to_bytes(16, "little"), key=self._key, digest_size=64).digest()
+            self._words = _WORDS.unpack(digest)
+            self._counter += 1
+            self._pos = 0
+        word = self._words[self._pos]
+        self._pos += 1
+        return word
+
+    def random(self) -> float:
+        """返回 [0.0, 1.0) 区间的浮点数"""
+        return (self._next_word() >> 11) * (1.0 / 9007199254740992.0)
+
+    def getrandbits(self, k: int) -> int:
+        """返回 k 位随机整数"""
+        if k < 0:
+            raise ValueError("number of bits must be non-negative")
+        if k <= 64:
+            return self._next_word() >> (64 - k)
+        value = 0
+        for shift in range(0, k, 64):
+            value |= self._next_word() << shift
+        return value & ((1 << k) - 1)
+
+    def getstate(self) -> tuple:
+        return (self._key, self._counter, self._words, self._pos, self.gauss_next)
+
+    def setstate(self, state: tuple) -> None:
+        self._key, self._counter, self._words, self._pos, self.gauss_next = state
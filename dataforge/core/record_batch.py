@@ -0,0 +1,439 @@
+"""
+列式记录批次模块
+
+RecordBatch 以“模式 + 列”的形式保存一批记录：字段名只在模式中出现一次，
+每个字段的值存放在一列中（整数/浮点列使用 array 紧凑存储，
+身份证号、手机号等定长 ASCII 列使用一段连续的缓冲区，
+变长字符串列可以编码为“偏移量 + UTF-8 数据”两段缓冲区，便于跨进程共享），
+相比每行一个 dict 大幅减少内存。按行访问时返回不复制数据的行视图。
+"""
+
+import itertools
+import re
+from array import array
+from collections.abc import Mapping, Sequence as SequenceABC
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, Optional, Sequence, Union
+
+from .types import DataType
+
+# 可使用 array 紧凑存储的列类型
+_ARRAY_TYPECODES = {DataType.INTEGER: ("q", int), DataType.FLOAT: ("d", float)}
+
+_ALNUM = re.compile(rb"[0-9A-Za-z]*")
+
+# 缓冲区：自有的 bytearray，或映射自共享内存等外部缓冲区的 memoryview（只读使用）
+Buffer = Union[bytearray, memoryview]
+
+_PYTHON_TYPES = (
+    (bool, DataType.BOOLEAN),  # bool 是 int 的子类，必须先判断
+    (int, DataType.INTEGER),
+    (float, DataType.FLOAT),
+    (str, DataType.STRING),
+    (dict, DataType.DICT),
+    (list, DataType.LIST),
+    (tuple, DataType.LIST),
+)
+
+
+def infer_type(values: Iterable[Any]) -> DataType:
+    """根据第一个非空值推断列类型，全为空时视为字符串"""
+    for value in values:
+        if value is None:
+            continue
+        for python_type, data_type in _PYTHON_TYPES:
+            if isinstance(value, python_type):
+                return data_type
+        return DataType.STRING
+    return DataType.STRING
+
+
+@dataclass(frozen=True)
+class FieldSchema:
+    """字段定义"""
+
+    name: str
+    type: DataType = DataType.STRING
+    width: Optional[int] = None  # 定长 ASCII 字符串列的宽度
+
+
+class FixedWidthColumn(SequenceABC):
+    """
+    定长 ASCII 字符串列
+
+    所有值连续存放在一个 bytearray 中，第 i 个值占 [i*width, (i+1)*width) 字节。
+    18位身份证号每个只占18字节（str 对象约67字节）；view/views 返回不复制数据的 memoryview 切片。
+    """
+
+    __slots__ = ("width", "data")
+
+    def __init__(self, width: int, data: Optional[Buffer] = None):
+        if width <= 0:
+            raise ValueError(f"width must be positive, got {width}")
+        data = bytearray() if data is None else data
+        if len(data) % width:
+            raise ValueError(f"Buffer length {len(data)} is not a multiple of width {width}")
+        self.width = width
+        self.data = data
+
+    @classmethod
+    def from_strings(cls, values: Sequence[str], width: int) -> "FixedWidthColumn":
+        """
+        由字符串创建（整块编码一次）
+
+        Raises:
+            ValueError: 存在长度不等于 width 或非 ASCII 的值
+        """
+        column = cls(width)
+        column.extend(values)
+        return column
+
+    def __len__(self) -> int:
+        return len(self.data) // self.width
+
+    def __getitem__(self, index):
+        width = self.width
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return FixedWidthColumn(width, self.data[start * width:max(start, stop) * width])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("column index out of range")
+        return str(self.data[index * width:(index + 1) * width], "ascii")
+
+    def __iter__(self) -> Iterator[str]:
+        # 整块解码一次后切片，比逐个解码快得多
+        text = str(self.data, "ascii")
+        width = self.width
+        return (text[offset:offset + width] for offset in range(0, len(text), width))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, FixedWidthColumn):
+            return self.width == other.width and self.data == other.data
+        return NotImplemented
+
+    def append(self, value: str) -> None:
+        """追加一个值"""
+        self.extend((value,))
+
+    def extend(self, values: Iterable[str]) -> None:
+        """追加多个值"""
+        values = list(values)
+        width = self.width
+        if any(len(value) != width for value in values):
+            raise ValueError(f"All values must be exactly {width} characters")
+        try:
+            self.data += "".join(values).encode("ascii")
+        except UnicodeEncodeError as e:
+            raise ValueError("Fixed-width column values must be ASCII") from e
+
+    def is_alnum(self) -> bool:
+        """是否只含 ASCII 字母和数字（导出时无需任何转义）"""
+        return _ALNUM.fullmatch(self.data) is not None
+
+    def view(self, index: int) -> memoryview:
+        """第 index 个值的 memoryview（不复制）"""
+        return memoryview(self.data)[index * self.width:(index + 1) * self.width]
+
+    def views(self) -> list[memoryview]:
+        """所有值的 memoryview 切片"""
+        buffer = memoryview(self.data)
+        width = self.width
+        return [buffer[offset:offset + width] for offset in range(0, len(self.data), width)]
+
+    @property
+    def nbytes(self) -> int:
+        """数据占用的字节数"""
+        return len(self.data)
+
+    def __repr__(self) -> str:
+        return f"FixedWidthColumn(width={self.width}, rows={len(self)})"
+
+
+class OffsetStringColumn(SequenceABC):
+    """
+    变长字符串列
+
+    所有值的 UTF-8 编码连续存放在 data 中，第 i 个值为 data[offsets[i]:offsets[i + 1]]。
+    含非 ASCII 字符时另存字符偏移量 char_offsets，遍历时整块解码后按字符偏移切片，
+    不必逐个值解码。缓冲区都可以直接映射自共享内存，无需为每个值创建对象。
+    """
+
+    __slots__ = ("offsets", "data", "char_offsets")
+
+    def __init__(
+        self,
+        offsets: Union[array, memoryview],
+        data: Buffer,
+        char_offsets: Optional[Union[array, memoryview]] = None,
+    ):
+        if len(offsets) == 0 or offsets[0] != 0 or offsets[len(offsets) - 1] != len(data):
+            raise ValueError("offsets must start at 0 and end at len(data)")
+        if char_offsets is not None and len(char_offsets) != len(offsets):
+            raise ValueError("char_offsets must have the same length as offsets")
+        self.offsets = offsets
+        self.data = data
+        self.char_offsets = char_offsets
+
+    @classmethod
+    def from_strings(cls, values: Sequence[str]) -> "OffsetStringColumn":
+        """由字符串创建"""
+        text = "".join(values)
+        data = bytearray(text.encode("utf-8"))
+        char_offsets = array("q", [0])
+        char_offsets.extend(itertools.accumulate(map(len, values)))
+        if len(data) == len(text):
+            # 纯 ASCII：字节偏移即字符偏移
+            return cls(char_offsets, data)
+        offsets = array("q", [0])
+        offsets.extend(itertools.accumulate(len(value.encode("utf-8")) for value in values))
+        return cls(offsets, data, char_offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            stop = max(start, stop)
+            return OffsetStringColumn(
+                _rebase(self.offsets, start, stop),
+                self.data[self.offsets[start]:self.offsets[stop]],
+                None if self.char_offsets is None else _rebase(self.char_offsets, start, stop),
+            )
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("column index out of range")
+        return str(self.data[self.offsets[index]:self.offsets[index + 1]], "utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        # 整块解码后按字符偏移切片
+        text = str(self.data, "utf-8")
+        offsets = self.offsets if self.char_offsets is None else self.char_offsets
+        if len(offsets) > 1 and offsets[len(offsets) - 1] != len(text):
+            raise ValueError("non-ASCII OffsetStringColumn requires char_offsets")
+        return (text[offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1))
+
+    @property
+    def nbytes(self) -> int:
+        """数据和偏移量占用的字节数"""
+        extra = 0 if self.char_offsets is None else len(self.char_offsets) * 8
+        return len(self.data) + len(self.offsets) * 8 + extra
+
+    def __repr__(self) -> str:
+        return f"OffsetStringColumn(rows={len(self)}, bytes={len(self.data)})"
+
+
+def _rebase(offsets: Union[array, memoryview], start: int, stop: int) -> array:
+    """取 [start, stop) 行的偏移量并平移到从 0 开始"""
+    base = offsets[start]
+    return array("q", (offset - base for offset in offsets[start:stop + 1]))
+
+
+@dataclass(frozen=True)
+class Schema:
+    """记录批次的模式"""
+
+    fields: tuple[FieldSchema, ...]
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """字段名"""
+        return tuple(item.name for item in self.fields)
+
+    def index(self, name: str) -> int:
+        """字段序号"""
+        for i, item in enumerate(self.fields):
+            if item.name == name:
+                return i
+        raise KeyError(name)
+
+
+class RowView(Mapping):
+    """批次中一行的只读视图，不复制数据"""
+
+    __slots__ = ("_batch", "_index")
+
+    def __init__(self, batch: "RecordBatch", index: int):
+        self._batch = batch
+        self._index = index
+
+    def __getitem__(self, key: Union[str, int]) -> Any:
+        batch = self._batch
+        if isinstance(key, int):
+            return batch.columns[key][self._index]
+        return batch.columns[batch.schema.index(key)][self._index]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._batch.schema.names)
+
+    def __len__(self) -> int:
+        return len(self._batch.columns)
+
+    def __repr__(self) -> str:
+        return f"RowView({dict(self)!r})"
+
+
+class RecordBatch:
+    """列式存储的记录批次"""
+
+    def __init__(self, schema: Schema, columns: Sequence[Sequence[Any]]):
+        """
+        初始化记录批次
+
+        Args:
+            schema: 模式
+            columns: 各字段的列，顺序与模式一致
+
+        Raises:
+            ValueError: 列数与模式不符或列长度不一致
+        """
+        if len(columns) != len(schema.fields):
+            raise ValueError(f"Expected {len(schema.fields)} columns, got {len(columns)}")
+        lengths = {len(column) for column in columns}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns have different lengths: {sorted(lengths)}")
+
+        self.schema = schema
+        self.columns = list(columns)
+        self._length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_rows(
+        cls,
+        names: Sequence[str],
+        rows: Sequence[Sequence[Any]],
+        schema: Optional[Schema] = None,
+        widths: Optional[Sequence[Optional[int]]] = None,
+    ) -> "RecordBatch":
+        """
+        由元组行创建（列转置只做一次）
+
+        Args:
+            names: 字段名
+            rows: 行元组，顺序与 names 一致
+            schema: 已知的模式，默认按各列第一个非空值推断
+            widths: 推断模式时各字段的定长宽度（None 表示非定长）
+        """
+        columns = [list(column) for column in zip(*rows)] if rows else [[] for _ in names]
+        if schema is None:
+            widths = widths or [None] * len(names)
+            schema = Schema(
+                tuple(
+                    FieldSchema(name, infer_type(column), width)
+                    for name, column, width in zip(names, columns, widths)
+                )
+            )
+        return cls(schema, [_compact(item, column) for item, column in zip(schema.fields, columns)])
+
+    @classmethod
+    def from_records(cls, records: Sequence[dict[str, Any]], names: Optional[Sequence[str]] = None) -> "RecordBatch":
+        """由字典记录创建，字段顺序默认取第一条记录的键"""
+        if names is None:
+            names = list(records[0]) if records else []
+        return cls.from_rows(names, [tuple(record.get(name) for name in names) for record in records])
+
+    @classmethod
+    def concat(cls, batches: Sequence["RecordBatch"]) -> "RecordBatch":
+        """按顺序拼接模式相同的批次"""
+        if not batches:
+            raise ValueError("Cannot concatenate an empty list of batches")
+        schema = batches[0].schema
+        columns = []
+        for i in range(len(schema.fields)):
+            column = list(batches[0].columns[i])
+            for batch in batches[1:]:
+                if batch.schema != schema:
+                    raise ValueError("Cannot concatenate batches with different schemas")
+                column.extend(batch.columns[i])
+            columns.append(_compact(schema.fields[i], column))
+        return cls(schema, columns)
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """字段名"""
+        return self.schema.names
+
+    def __len__(self) -> int:
+        return self._length
+
+    def column(self, name: str) -> Sequence[Any]:
+        """按字段名取列"""
+        return self.columns[self.schema.index(name)]
+
+    def row(self, index: int) -> RowView:
+        """第 index 行的视图"""
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("row index out of range")
+        return RowView(self, index)
+
+    def __iter__(self) -> Iterator[RowView]:
+        return (RowView(self, index) for index in range(self._length))
+
+    def rows(self) -> Iterator[tuple]:
+        """按行迭代元组"""
+        return zip(*self.columns)
+
+    def slice(self, start: int, stop: Optional[int] = None) -> "RecordBatch":
+        """[start, stop) 行组成的新批次"""
+        return RecordBatch(self.schema, [column[start:stop] for column in self.columns])
+
+    def to_records(self) -> list[dict[str, Any]]:
+        """转换为字典记录列表（兼容旧接口，会为每行创建 dict）"""
+        names = self.names
+        return [dict(zip(names, row)) for row in self.rows()]
+
+    def to_arrow(self):
+        """
+        转换为 pyarrow.Table
+
+        Raises:
+            ImportError: 未安装 pyarrow
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError("RecordBatch.to_arrow() requires pyarrow: pip install pyarrow") from e
+
+        arrow_types = {
+            DataType.STRING: pa.string(),
+            DataType.INTEGER: pa.int64(),
+            DataType.FLOAT: pa.float64(),
+            DataType.BOOLEAN: pa.bool_(),
+        }
+        arrays = [
+            pa.array(list(column), type=arrow_types.get(item.type))
+            for item, column in zip(self.schema.fields, self.columns)
+        ]
+        return pa.Table.from_arrays(arrays, names=list(self.names))
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{item.name}: {item.type.value}" for item in self.schema.fields)
+        return f"RecordBatch({self._length} rows; {fields})"
+
+
+def _compact(schema: FieldSchema, column: list) -> Sequence[Any]:
+    """定长列转换为 FixedWidthColumn，整数/浮点列中的值类型完全一致时转换为 array 紧凑存储"""
+    data_type = schema.type
+    if schema.width is not None and data_type is DataType.STRING:
+        try:
+            return FixedWidthColumn.from_strings(column, schema.width)
+        except (TypeError, ValueError):
+            return column  # 含空值或不符合宽度时保留原值
+    if data_type not in _ARRAY_TYPECODES:
+        return column
+    typecode, python_type = _ARRAY_TYPECODES[data_type]
+    if not all(type(value) is python_type for value in column):
+        return column  # 含空值或混合类型（如 bool/int、int/float）时保留原值
+    try:
+        return array(typecode, column)
+    except (TypeError, OverflowError):
+        return column  # 超出 64 位范围
@@ -0,0 +1,181 @@
+"""
+批量采样模块
+
+批量生成时不再逐行调用 random.choice/random.random，而是一次取出整块随机字节，
+按16位分组为 array("H")，再通过 65536 项的查表直接映射为取值，
+每个取值只需一次下标访问，不再逐个调用随机数生成器。
+
+查表把 [0, 65536) 按权重划分给各取值，概率的量化误差不超过 1/65536。
+随机字节取自传入的随机数生成器（rng.randbytes），因此指定种子时结果可复现。
+"""
+
+import bisect
+import itertools
+import random
+from array import array
+from typing import Any, Optional, Sequence
+
+from .plan import PlanCache
+
+LANE_BITS = 16
+LANES = 1 << LANE_BITS
+
+# (取值, 权重) -> 查表
+_table_cache = PlanCache(maxsize=512)
+
+
+def lane_table(values: Sequence[Any], weights: Optional[Sequence[float]] = None) -> tuple[Any, ...]:
+    """
+    构建 65536 项的查表：随机16位整数 r 对应的取值为 table[r]
+
+    Args:
+        values: 取值
+        weights: 各取值的权重，默认均匀
+    """
+    values = tuple(values)
+    weights = tuple(weights) if weights is not None else None
+    if not values:
+        raise ValueError("lane_table needs at least one value")
+
+    def build() -> tuple[Any, ...]:
+        cum_weights = list(itertools.accumulate(weights if weights is not None else [1.0] * len(values)))
+        total = cum_weights[-1]
+        last = len(values) - 1
+        return tuple(
+            values[min(last, bisect.bisect_right(cum_weights, (lane + 0.5) * total / LANES))] for lane in range(LANES)
+        )
+
+    try:
+        return _table_cache.get_or_build((values, weights), build)
+    except TypeError:  # 取值不可哈希时不缓存
+        return build()
+
+
+def optional_table(values: Sequence[Any], probability: float, absent: Any = "") -> tuple[Any, ...]:
+    """以 probability 的概率均匀取 values 之一，否则取 absent"""
+    if not values or probability <= 0:
+        return lane_table([absent])
+    share = probability / len(values)
+    return lane_table([absent, *values], [1.0 - probability] + [share] * len(values))
+
+
+def optional_part(values: Sequence[str], probability: float) -> tuple[list[str], Optional[list[float]]]:
+    """joint_table 的可选部分：以 probability 的概率均匀取 values 之一，否则为空串"""
+    if probability <= 0 or not values:
+        return [""], None
+    return ["", *values], [1.0 - probability] + [probability / len(values)] * len(values)
+
+
+def joint_table(*parts: tuple[Sequence[str], Optional[Sequence[float]]]) -> tuple[str, ...]:
+    """
+    若干独立部分拼接的查表：每个部分为 (取值, 权重)，权重为None表示均匀
+
+    一次查表即可得到整个拼接结果，代替逐部分采样后再拼接。
+    """
+    combos = [("", 1.0)]
+    for values, weights in parts:
+        if weights is None:
+            weights = [1.0] * len(values)
+        total = sum(weights)
+        combos = [
+            (head + value, share * weight / total) for head, share in combos for value, weight in zip(values, weights)
+        ]
+    return lane_table([value for value, _ in combos], [weight for _, weight in combos])
+
+
+def keyed_table(tables: Sequence[Sequence[Any]], key_bits: int) -> tuple[Any, ...]:
+    """
+    以随机整数的高 key_bits 位为键选择子查表：键为 k 时按 tables[k] 采样
+
+    配合 share_key 使用，可以让同一行的多次采样共用一个随机选定的键（如分隔符），
+    整列查表仍在C层完成。低位的分辨率为 1/2**(16 - key_bits)。
+    """
+    if len(tables) != 1 << key_bits:
+        raise ValueError(f"keyed_table needs {1 << key_bits} tables, got {len(tables)}")
+    step = 1 << key_bits
+    return tuple(itertools.chain.from_iterable(table[step // 2::step] for table in tables))
+
+
+def share_key(rng: random.Random, lanes: array, key_bits: int) -> array:
+    """新的一列随机16位整数，高 key_bits 位与 lanes 逐个相同，其余位随机"""
+    high = ((1 << key_bits) - 1) << (LANE_BITS - key_bits)
+    low = (LANES - 1) ^ high
+    return array("H", [lane & high | noise & low for lane, noise in zip(lanes, draw_lanes(rng, len(lanes)))])
+
+
+def draw_lanes(rng: random.Random, count: int) -> array:
+    """count 个均匀分布的16位随机整数"""
+    lanes = array("H")
+    lanes.frombytes(rng.randbytes(2 * count))
+    return lanes
+
+
+def bernoulli_flags(rng: random.Random, probability: float, count: int) -> list[bool]:
+    """count 个独立的伯努利试验结果，概率量化到 1/65536"""
+    threshold = min(LANES, max(0, round(probability * LANES)))
+    return [lane < threshold for lane in draw_lanes(rng, count)]
+
+
+def sample(rng: random.Random, table: Sequence[Any], count: int) -> list[Any]:
+    """按查表采样 count 个取值"""
+    return lookup(table, draw_lanes(rng, count))
+
+
+def lookup(table: Sequence[Any], lanes: array) -> list[Any]:
+    """按给定的随机16位整数查表"""
+    return [table[lane] for lane in lanes]
+
+
+def uniform_floats(rng: random.Random, count: int) -> list[float]:
+    """count 个 [0, 1) 上均匀分布的浮点数"""
+    random_float = rng.random
+    return [random_float() for _ in range(count)]
+
+
+def random_below(rng: random.Random, bound: int, count: int) -> list[int]:
+    """
+    count 个 [0, bound) 上的随机整数，bound 不超过 2**128
+
+    bound 不超过 2**64 时每个取值由8个随机字节组成的64位整数对 bound 取模，与逐个计算
+    int.from_bytes(rng.randbytes(8), "little") % bound 的结果相同；取模的偏差不超过 bound / 2**64。
+    bound 更大时每个取值使用16个随机字节（与 int.from_bytes(rng.randbytes(16), "little") % bound 相同）。
+    """
+    if not 0 < bound <= 1 << 128:
+        raise ValueError(f"bound must be in 1..2**128, got {bound}")
+    if bound > 1 << 64:
+        words = array("Q")
+        words.frombytes(rng.randbytes(16 * count))
+        return [(low | high << 64) % bound for low, high in zip(words[::2], words[1::2])]
+    words = array("Q")
+    words.frombytes(rng.randbytes(8 * count))
+    return [word % bound for word in words]
+
+
+def random_strings(rng: random.Random, alphabet: str, lengths: Sequence[int]) -> list[str]:
+    """
+    生成随机字符串，第 i 个的长度为 lengths[i]
+
+    一次取出整块随机字节，用 bytes.translate 映射到字母表并删除超出
+    256 // len(alphabet) * len(alphabet) 的字节（在C层做拒绝采样，保证均匀）。
+    每行占用 max(lengths) 个字符的固定区间，按起点和长度切片。
+    """
+    size = len(alphabet)
+    if not 0 < size <= 256:
+        raise ValueError(f"alphabet size must be in 1..256, got {size}")
+    if not lengths:
+        return []
+    accepted = 256 // size * size
+    table = bytes(ord(alphabet[byte % size]) if byte < accepted else 0 for byte in range(256))
+    rejected = bytes(range(accepted, 256))
+
+    stride = max(lengths)
+    chunks = []
+    remaining = stride * len(lengths)
+    while remaining > 0:
+        # 按接受率多取一些，通常一次即可
+        chunk = rng.randbytes(remaining * 256 // accepted + 16).translate(table, rejected)[:remaining]
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    text = b"".join(chunks).decode("latin-1")
+
+    return [text[start:start + length] for start, length in zip(range(0, stride * len(lengths), stride), lengths)]
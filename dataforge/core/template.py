@@ -0,0 +1,210 @@
+"""
+多字段模板模块
+
+模板由若干字段组成，每个字段指定生成器类型和参数，
+格式与前端导出的模板JSON（fields 列表）一致。
+"""
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Optional, Union
+
+from .codegen import CompiledTemplate, compile_template
+from .factory import GeneratorConfig, GeneratorFactory, default_factory
+from .generator import DataGenerator, GenerationContext
+from .record_batch import RecordBatch
+
+
+@dataclass
+class TemplateField:
+    """模板字段定义"""
+
+    name: str
+    generator: str
+    parameters: dict[str, Any] = field(default_factory=dict)
+    required: bool = True
+    pool_size: Optional[int] = None  # 见 GeneratorConfig.pool_size
+    pool_distribution: str = "uniform"
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "TemplateField":
+        """从模板JSON中的字段定义创建"""
+        generator = data.get("generator") or data.get("type")
+        if not generator:
+            raise ValueError(f"Template field {data.get('name')!r} has no generator")
+        return cls(
+            name=data.get("name") or data.get("id") or generator,
+            generator=generator,
+            parameters=dict(data.get("parameters") or {}),
+            required=data.get("required", True),
+            pool_size=data.get("pool_size"),
+            pool_distribution=data.get("pool_distribution", "uniform"),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """转换为模板JSON中的字段定义"""
+        data = {
+            "name": self.name,
+            "generator": self.generator,
+            "parameters": dict(self.parameters),
+            "required": self.required,
+        }
+        if self.pool_size:
+            data["pool_size"] = self.pool_size
+            data["pool_distribution"] = self.pool_distribution
+        return data
+
+
+class DataTemplate:
+    """多字段数据模板"""
+
+    def __init__(
+        self,
+        fields: list[TemplateField],
+        name: Optional[str] = None,
+        factory: Optional[GeneratorFactory] = None,
+    ):
+        """
+        初始化模板
+
+        Args:
+            fields: 字段定义列表
+            name: 模板名称
+            factory: 用于获取生成器的工厂，默认为全局工厂
+
+        Raises:
+            ValueError: 字段名重复或生成器类型未知
+        """
+        names = [template_field.name for template_field in fields]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicate field names in template: {names}")
+
+        self.name = name
+        self.fields = list(fields)
+        self.factory = factory or default_factory
+        # 生成计划不可变，工厂缓存的共享实例可以直接使用
+        self.generators: list[DataGenerator] = [
+            self.factory.get_generator(
+                GeneratorConfig(
+                    template_field.generator,
+                    template_field.parameters,
+                    pool_size=template_field.pool_size,
+                    pool_distribution=template_field.pool_distribution,
+                )
+            )
+            for template_field in self.fields
+        ]
+        self._compiled: Optional[CompiledTemplate] = None
+
+    @classmethod
+    def from_dict(cls, data: Union[dict[str, Any], list], factory: Optional[GeneratorFactory] = None) -> "DataTemplate":
+        """从模板JSON（或字段列表）创建"""
+        if isinstance(data, list):
+            data = {"fields": data}
+        fields = [TemplateField.from_dict(item) for item in data.get("fields", [])]
+        return cls(fields, name=data.get("name"), factory=factory)
+
+    @classmethod
+    def from_file(cls, path: str, factory: Optional[GeneratorFactory] = None) -> "DataTemplate":
+        """从模板JSON文件创建"""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f), factory=factory)
+
+    def to_dict(self) -> dict[str, Any]:
+        """转换为模板JSON"""
+        return {"name": self.name, "fields": [template_field.to_dict() for template_field in self.fields]}
+
+    @property
+    def field_names(self) -> list[str]:
+        """字段名列表"""
+        return [template_field.name for template_field in self.fields]
+
+    def _new_context(self, context: Optional[GenerationContext]) -> GenerationContext:
+        """创建行上下文，生成过程中 related_data 按字段名和生成器类型记录本行已生成的值"""
+        related_data = dict(context.related_data) if context else {}
+        return GenerationContext(
+            related_data=related_data,
+            generation_id=context.generation_id if context else None,
+            batch_id=context.batch_id if context else None,
+            user_id=context.user_id if context else None,
+            session_data=context.session_data if context else None,
+        )
+
+    def generate_row(self, context: Optional[GenerationContext] = None) -> dict[str, Any]:
+        """生成一行数据"""
+        row: dict[str, Any] = {}
+        row_context = self._new_context(context)
+        for template_field, generator in zip(self.fields, self.generators):
+            value = generator.generate(row_context)
+            row[template_field.name] = value
+            row_context.related_data[template_field.name] = value
+            row_context.related_data[template_field.generator] = value
+        return row
+
+    def generate_batch(
+        self,
+        count: int,
+        seed: Optional[object] = None,
+        context: Optional[GenerationContext] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        批量生成数据
+
+        指定种子时等价于 generate_range(0, count, seed)。
+        """
+        if seed is not None:
+            return self.generate_range(0, count, seed, context)
+        return [self.generate_row(context) for _ in range(count)]
+
+    def generate_at(self, index: int, seed: object, context: Optional[GenerationContext] = None) -> dict[str, Any]:
+        """直接生成种子数据集中的第 index 行"""
+        return self.generate_range(index, index + 1, seed, context)[0]
+
+    def compile(self) -> CompiledTemplate:
+        """编译为专用的行生成函数（首次调用时编译，之后复用）"""
+        if self._compiled is None:
+            self._compiled = compile_template(self)
+        return self._compiled
+
+    def generate_range(
+        self,
+        start: int,
+        stop: int,
+        seed: object,
+        context: Optional[GenerationContext] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        生成种子数据集中 [start, stop) 区间的行
+
+        每个字段使用以 (seed, 字段名) 为密钥的计数器随机数，
+        增删其他字段不会改变已有字段的值，任意区间可由不同进程独立生成。
+        """
+        return self.compile().records(start, stop, seed, context)
+
+    def generate_tuples(
+        self,
+        start: int,
+        stop: int,
+        seed: object,
+        context: Optional[GenerationContext] = None,
+    ) -> list[tuple]:
+        """同 generate_range，但每行以元组输出（顺序同 field_names），省去字典构建"""
+        return self.compile().rows(start, stop, seed, context)
+
+    def generate_record_batch(
+        self,
+        start: int,
+        stop: int,
+        seed: object,
+        context: Optional[GenerationContext] = None,
+    ) -> RecordBatch:
+        """
+        同 generate_range，但以列式的 RecordBatch 返回，批量生成和导出的快速路径
+
+        定长生成器（身份证号、统一社会信用代码、无格式手机号）的列存为 FixedWidthColumn。
+        """
+        return RecordBatch.from_rows(
+            self.field_names,
+            self.compile().rows(start, stop, seed, context),
+            widths=[generator.fixed_width for generator in self.generators],
+        )
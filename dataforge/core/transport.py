@@ -0,0 +1,311 @@
+"""
+多进程结果传输模块
+
+在子进程中生成的记录批次需要传回父进程。逐个 pickle 数百万个 str 对象的开销
+往往超过生成本身，SharedMemoryTransport 改为：
+
+- 子进程把每一列编码进一块共享内存：定长列直接写入其缓冲区，变长字符串列写成
+  “偏移量 + UTF-8 数据”，整数/浮点 array 写入原始字节，其余列 pickle 后写入；
+- 父进程映射这块共享内存，用 memoryview 构建 FixedWidthColumn / OffsetStringColumn，
+  不复制数据，直接交给导出器。
+
+PickleTransport 以普通 pickle 传输，用于对比和不支持共享内存的环境。
+"""
+
+import os
+import pickle
+import threading
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional, Union
+
+from .record_batch import FixedWidthColumn, OffsetStringColumn, RecordBatch, Schema
+from .types import DataType
+
+TRANSPORTS = ("shared_memory", "pickle")
+
+
+@dataclass(frozen=True)
+class ColumnLayout:
+    """共享内存中一列的位置"""
+
+    kind: str  # "fixed"、"offsets"、"array" 或 "pickle"
+    offset: int  # 数据起始位置
+    length: int  # 数据字节数
+    width: int = 0  # fixed: 宽度
+    typecode: str = ""  # array: 类型码
+    offsets_offset: int = 0  # offsets: 字节偏移量数组的位置
+    char_offsets_offset: int = -1  # offsets: 字符偏移量数组的位置，-1 表示纯 ASCII 无此数组
+    rows: int = 0  # offsets: 行数
+
+
+@dataclass(frozen=True)
+class SharedBatchHandle:
+    """子进程返回给父进程的共享内存批次描述（可 pickle，不含数据本身）"""
+
+    name: str
+    schema: Schema
+    rows: int
+    columns: tuple[ColumnLayout, ...]
+
+
+def _column_parts(column: Any, data_type: DataType) -> tuple[str, list, dict[str, Any]]:
+    """把一列编码为 (类型, 缓冲区片段, 附加信息)"""
+    if isinstance(column, FixedWidthColumn):
+        return "fixed", [column.data], {"width": column.width}
+    if isinstance(column, array):
+        return "array", [column], {"typecode": column.typecode}
+    if data_type is DataType.STRING and not isinstance(column, OffsetStringColumn):
+        try:
+            column = OffsetStringColumn.from_strings(column)
+        except TypeError:
+            pass  # 含空值或非字符串值
+    if isinstance(column, OffsetStringColumn):
+        parts = [column.data, column.offsets]
+        if column.char_offsets is not None:
+            parts.append(column.char_offsets)
+        return "offsets", parts, {"rows": len(column)}
+    return "pickle", [pickle.dumps(list(column), protocol=pickle.HIGHEST_PROTOCOL)], {}
+
+
+# 关闭时映射仍被调用方的视图引用的共享内存（名称已删除），保留到视图回收后再关闭，
+# 避免 SharedMemory 被回收时 close() 抛出 BufferError
+_lingering: list[Any] = []
+_lingering_lock = threading.Lock()
+
+
+def _close_mapping(shm: Any) -> None:
+    """关闭共享内存的映射；仍有视图时暂存，之后每次关闭时重试"""
+    with _lingering_lock:
+        candidates = [*_lingering, shm]
+        _lingering.clear()
+        for item in candidates:
+            try:
+                item.close()
+            except BufferError:
+                _lingering.append(item)
+
+
+def _untrack(shm: Any) -> None:
+    """取消 resource_tracker 对共享内存的登记，子进程退出时不删除（生命周期由父进程负责）"""
+    if os.name != "posix":
+        return  # 只有 POSIX 平台登记共享内存
+    from multiprocessing import resource_tracker
+
+    # 登记的是带前导斜杠的 POSIX 共享内存名称，SharedMemory.name 去掉了这个斜杠
+    resource_tracker.unregister("/" + shm.name, "shared_memory")
+
+
+def _write_columns(buffer: memoryview, encoded: list[tuple[str, list, dict[str, Any]]]) -> list[ColumnLayout]:
+    """把编码后的各列依次写入缓冲区，返回各列的位置"""
+    layouts = []
+    position = 0
+    for kind, parts, extra in encoded:
+        starts = []
+        for part in parts:
+            raw = memoryview(part).cast("B")
+            buffer[position:position + raw.nbytes] = raw
+            starts.append((position, raw.nbytes))
+            position += raw.nbytes
+        if kind == "offsets":
+            (data_at, data_length), (offsets_at, _) = starts[:2]
+            char_offsets_at = starts[2][0] if len(starts) > 2 else -1
+            layouts.append(
+                ColumnLayout(
+                    kind,
+                    data_at,
+                    data_length,
+                    offsets_offset=offsets_at,
+                    char_offsets_offset=char_offsets_at,
+                    **extra,
+                )
+            )
+        else:
+            layouts.append(ColumnLayout(kind, starts[0][0], starts[0][1], **extra))
+    return layouts
+
+
+class SharedBatch:
+    """映射自共享内存的记录批次，用完后必须 close() 释放共享内存"""
+
+    def __init__(self, batch: RecordBatch, shm: Any = None, views: Optional[list[memoryview]] = None):
+        self.batch = batch
+        self._shm = shm
+        self._views = views or []
+
+    def close(self) -> None:
+        """
+        释放映射并删除共享内存，之后不能再访问 batch 中的映射列
+
+        调用方仍持有映射列的视图（如 batch.slice() 的结果）时，共享内存照常删除，
+        映射保留到这些视图被回收后，在之后的 close() 中释放。
+        """
+        for view in self._views:
+            view.release()
+        self._views = []
+        shm, self._shm = self._shm, None
+        if shm is None:
+            return
+        try:
+            _close_mapping(shm)
+        finally:
+            shm.unlink()
+
+    def __enter__(self) -> RecordBatch:
+        return self.batch
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class SharedMemoryTransport:
+    """基于 multiprocessing.shared_memory 的零拷贝传输"""
+
+    name = "shared_memory"
+
+    def send(self, batch: RecordBatch) -> SharedBatchHandle:
+        """（子进程）把批次写入新的共享内存块，返回描述"""
+        from multiprocessing import shared_memory
+
+        encoded = [_column_parts(column, item.type) for column, item in zip(batch.columns, batch.schema.fields)]
+        size = sum(memoryview(part).nbytes for _, parts, _ in encoded for part in parts)
+        shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        try:
+            layouts = _write_columns(shm.buf, encoded)
+        except BaseException:
+            # 写入失败时父进程拿不到名称，由子进程删除
+            shm.close()
+            shm.unlink()
+            raise
+        shm.close()
+        # 写入成功后共享内存的生命周期由父进程负责，子进程退出时不应删除
+        _untrack(shm)
+        return SharedBatchHandle(shm.name, batch.schema, len(batch), tuple(layouts))
+
+    def receive(self, handle: SharedBatchHandle) -> SharedBatch:
+        """（父进程）映射共享内存并构建批次，不复制定长列、变长字符串列和数值列"""
+        from multiprocessing import shared_memory
+
+        shm = shared_memory.SharedMemory(name=handle.name)
+        buffer = shm.buf
+        views = [buffer]
+        columns = []
+        for layout in handle.columns:
+            data = buffer[layout.offset:layout.offset + layout.length]
+            views.append(data)
+            if layout.kind == "fixed":
+                columns.append(FixedWidthColumn(layout.width, data))
+            elif layout.kind == "offsets":
+                offsets = self._map_offsets(buffer, layout.offsets_offset, layout.rows, views)
+                char_offsets = None
+                if layout.char_offsets_offset >= 0:
+                    char_offsets = self._map_offsets(buffer, layout.char_offsets_offset, layout.rows, views)
+                columns.append(OffsetStringColumn(offsets, data, char_offsets))
+            elif layout.kind == "array":
+                typed = data.cast(layout.typecode)
+                views.append(typed)
+                columns.append(typed)
+            else:
+                columns.append(pickle.loads(data))
+        # 按创建的逆序释放：先派生视图，最后整块缓冲区
+        views.reverse()
+        return SharedBatch(RecordBatch(handle.schema, columns), shm, views)
+
+    @staticmethod
+    def _map_offsets(buffer: memoryview, position: int, rows: int, views: list[memoryview]) -> memoryview:
+        raw = buffer[position:position + (rows + 1) * 8]
+        offsets = raw.cast("q")
+        views.extend((raw, offsets))
+        return offsets
+
+
+class PickleTransport:
+    """以 pickle 传输整个批次（对比基准）"""
+
+    name = "pickle"
+
+    def send(self, batch: RecordBatch) -> RecordBatch:
+        return batch
+
+    def receive(self, batch: RecordBatch) -> SharedBatch:
+        return SharedBatch(batch)
+
+
+def get_transport(name: str) -> Union[SharedMemoryTransport, PickleTransport]:
+    """按名称获取传输方式"""
+    if name == "shared_memory":
+        return SharedMemoryTransport()
+    if name == "pickle":
+        return PickleTransport()
+    raise ValueError(f"Unknown transport: {name}, expected one of {TRANSPORTS}")
+
+
+# 子进程中的模板与传输方式，由进程池初始化函数设置
+_worker_state: dict[str, Any] = {}
+
+
+def _init_worker(template: dict[str, Any], transport: str) -> None:
+    from .template import DataTemplate
+
+    _worker_state["template"] = DataTemplate.from_dict(template)
+    _worker_state["transport"] = get_transport(transport)
+
+
+def _generate_chunk(start: int, stop: int, seed: object) -> Any:
+    batch = _worker_state["template"].generate_record_batch(start, stop, seed)
+    return _worker_state["transport"].send(batch)
+
+
+def generate_batches_in_processes(
+    template: Any,
+    count: int,
+    seed: object,
+    workers: Optional[int] = None,
+    chunk_size: int = 100_000,
+    transport: str = "shared_memory",
+) -> Iterator[RecordBatch]:
+    """
+    在子进程中按分块生成模板数据，按分块顺序逐个产出批次
+
+    产出的批次在迭代器前进到下一个分块时释放，需要保留时请先复制
+    （如 batch.to_records() 或格式化输出）。
+
+    Args:
+        template: DataTemplate 或模板JSON
+        count: 总行数
+        seed: 随机种子，结果与 DataTemplate.generate_record_batch 相同
+        workers: 进程数，默认为 CPU 数
+        chunk_size: 每个分块的行数
+        transport: "shared_memory" 或 "pickle"
+    """
+    from .template import DataTemplate
+
+    if isinstance(template, DataTemplate):
+        template = template.to_dict()
+    receiver = get_transport(transport)
+    chunks = [(start, min(start + chunk_size, count)) for start in range(0, count, chunk_size)]
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(template, transport)) as pool:
+        # 最多提前提交 2 × 进程数个分块，限制未取走的共享内存数量
+        ahead = 2 * workers
+        pending = [pool.submit(_generate_chunk, start, stop, seed) for start, stop in chunks[:ahead]]
+        submitted = len(pending)
+        try:
+            while pending:
+                shared = receiver.receive(pending.pop(0).result())
+                if submitted < len(chunks):
+                    pending.append(pool.submit(_generate_chunk, *chunks[submitted], seed))
+                    submitted += 1
+                try:
+                    yield shared.batch
+                finally:
+                    shared.close()
+        finally:
+            # 提前终止时释放已生成但未取走的共享内存
+            for future in pending:
+                future.cancel()
+            for future in pending:
+                if not future.cancelled() and future.exception() is None:
+                    receiver.receive(future.result()).close()
@@ -4,39 +4,83 @@ DataForge Generators Package
 This package contains all the data generators organized by category:
 - basic: Basic data types (names, IDs, etc.)
 - contact: Contact information (emails, phones, addresses)
+- numeric: Numbers and ages with configurable distributions
 - finance: Financial data (bank accounts, credit cards, etc.)
 - network: Network-related data (IPs, URLs, etc.)
 - datetime: Date and time data
 - text: Text and content generation
+
+Generator modules are not imported here. The manifest below is registered
+with the registry at package import time, and each module is imported on
+the first lookup of one of its generators.
 """
 
-# Import all generator modules to ensure registration
-try:
-    from . import basic
-except ImportError:
-    pass
-
-try:
-    from . import contact
-except ImportError:
-    pass
-
-try:
-    from . import finance
-except ImportError:
-    pass
-
-try:
-    from . import network
-except ImportError:
-    pass
-
-try:
-    from . import datetime
-except ImportError:
-    pass
-
-try:
-    from . import text
-except ImportError:
-    pass
+from typing import Any, Dict, List, Tuple
+
+# name -> ("module:Class", aliases); keep in sync with @register_generator
+BUILTIN_GENERATORS: Dict[str, Tuple[str, List[str]]] = {
+    "name": ("dataforge.generators.basic.name:ChineseNameGenerator", ["姓名", "中文姓名"]),
+    "idcard": ("dataforge.generators.basic.idcard:ChineseIDCardGenerator", ["身份证", "身份证号码"]),
+    "company_name": ("dataforge.generators.basic.company:ChineseCompanyNameGenerator", ["公司名称", "企业名称"]),
+    "uscc": ("dataforge.generators.basic.uscc:USCCGenerator", ["统一社会信用代码", "信用代码"]),
+    "phone": ("dataforge.generators.contact.phone:ChinesePhoneGenerator", ["手机", "手机号码", "移动电话"]),
+    "email": ("dataforge.generators.contact.email:EmailGenerator", ["邮箱", "电子邮箱", "邮件地址"]),
+    "address": ("dataforge.generators.contact.address:ChineseAddressGenerator", ["地址", "住址", "通讯地址"]),
+    "landline": ("dataforge.generators.contact.landline:LandlineGenerator", ["座机", "固话", "座机号码", "固定电话"]),
+    "fax": ("dataforge.generators.contact.landline:FaxNumberGenerator", ["传真", "传真号码"]),
+    "toll_free": ("dataforge.generators.contact.landline:TollFreeNumberGenerator", ["客服电话", "400电话", "免费电话"]),
+    "extension": ("dataforge.generators.contact.landline:ExtensionGenerator", ["分机号", "分机", "分机号码"]),
+    "integer": ("dataforge.generators.numeric.number:IntegerGenerator", ["整数", "整型"]),
+    "decimal": ("dataforge.generators.numeric.number:DecimalGenerator", ["小数", "浮点数"]),
+    "age": ("dataforge.generators.numeric.age:AgeGenerator", ["年龄"]),
+    "bank_card": ("dataforge.generators.finance.card:BankCardGenerator", ["银行卡", "银行卡号"]),
+    "credit_card": ("dataforge.generators.finance.card:CreditCardGenerator", ["信用卡", "信用卡号"]),
+    "iban": ("dataforge.generators.finance.iban:IBANGenerator", ["IBAN", "国际银行账号"]),
+    "stock_code": ("dataforge.generators.finance.market:StockCodeGenerator", ["股票代码", "证券代码"]),
+    "crypto_address": ("dataforge.generators.finance.crypto:CryptoAddressGenerator", ["加密货币地址", "钱包地址"]),
+    "finance_profile": ("dataforge.generators.finance.profile:FinanceProfileGenerator", ["金融档案", "财务画像"]),
+    "timestamp": ("dataforge.generators.datetime.timestamp:GenericTimestampGenerator", ["时间戳", "日期时间"]),
+    "date": ("dataforge.generators.datetime.timestamp:GenericDateGenerator", ["日期"]),
+    "duration": ("dataforge.generators.datetime.timestamp:GenericDurationGenerator", ["时长", "持续时间"]),
+    "datetime_range": (
+        "dataforge.generators.datetime.timestamp:GenericAdvancedDateTimeRangeGenerator",
+        ["时间范围", "日期范围", "时间段"],
+    ),
+    "trading_day": (
+        "dataforge.generators.datetime.trading_calendar:GenericTradingCalendarGenerator",
+        ["交易日", "交易日历"],
+    ),
+    "ip_address": ("dataforge.generators.network.ip:IPAddressGenerator", ["IP地址", "IP"]),
+    "ipv4": ("dataforge.generators.network.ip:IPv4AddressGenerator", ["IPv4地址", "IPv4"]),
+    "ipv6": ("dataforge.generators.network.ip:IPv6AddressGenerator", ["IPv6地址", "IPv6"]),
+    "mac_address": ("dataforge.generators.network.mac:MACAddressGenerator", ["MAC地址", "MAC", "物理地址"]),
+    "domain": ("dataforge.generators.network.web:DomainGenerator", ["域名", "网站域名"]),
+    "url": ("dataforge.generators.network.web:URLGenerator", ["网址", "链接", "URL"]),
+}
+
+
+# table name -> ("module:function", version[, extra source modules]); loaded by dataforge.core.preloader.
+# Extra source modules are fingerprinted with the builder's module, so editing the data they hold
+# invalidates the on-disk cache without a manual version bump.
+BUILTIN_TABLES: Dict[str, Tuple[Any, ...]] = {
+    "name.pools": ("dataforge.generators.basic.name:build_name_pools", 1),
+    "company.type_sampler": ("dataforge.generators.basic.company:build_company_type_sampler", 1),
+    "address.regions": ("dataforge.generators.contact.address:build_region_table", 1),
+    "geo.regions": ("dataforge.geo.shapes:build_geo_table", 1, ("dataforge.geo.outlines",)),
+    "landline.area_codes": ("dataforge.generators.contact.landline:build_area_code_table", 1),
+    "finance.bins": ("dataforge.generators.finance.card:build_bin_table", 1),
+    "datetime.trading_calendar": ("dataforge.generators.datetime.trading_calendar:build_trading_calendar", 1),
+    "network.ip_blocks": ("dataforge.generators.network.ip:build_ip_block_table", 1),
+}
+
+
+def register_builtin_generators(registry) -> None:
+    """Register the built-in generator manifest without importing generator modules"""
+    for name, (target, aliases) in BUILTIN_GENERATORS.items():
+        registry.register_lazy(name, target, aliases)
+
+
+def register_builtin_tables(preloader) -> None:
+    """Register the built-in lookup tables with a preloader"""
+    for name, (target, version, *sources) in BUILTIN_TABLES.items():
+        preloader.register(name, target, version, sources=sources[0] if sources else ())
@@ -3,10 +3,14 @@
 支持生成各种类型的中文公司名称
 """
 
-import random
-from typing import Optional
+import itertools
+from dataclasses import dataclass
+from typing import Any, Optional
 
+from dataforge.core.enumeration import MixedRadixSpace, RandomPermutation
 from dataforge.core.factory import register_generator
+from dataforge.core.plan import PlanCache
+from dataforge.core.preloader import get_table
 from dataforge.core.generator import (
     GenerationContext,
     GeneratorType,
@@ -14,10 +18,32 @@ from dataforge.core.generator import (
 )
 
 
+@dataclass(frozen=True)
+class CompanyNamePlan:
+    """公司名称生成计划"""
+
+    company_type: str
+    region: Optional[str]
+    size: str
+    style: str
+    include_region: bool
+    length: str
+    region_groups: tuple[tuple[str, ...], ...]  # 按规模可选的地区分组
+    modifiers: tuple[str, ...]
+    cores: tuple[str, ...]
+    suffixes: tuple[str, ...]
+    special_words: tuple[str, ...]
+    type_suffixes: tuple[str, ...]
+    type_cum_weights: tuple[float, ...]
+
+
 @register_generator("company_name", ["公司名称", "企业名称"])
 class ChineseCompanyNameGenerator(ValidatedDataGenerator):
     """中文公司名称生成器"""
 
+    # 生成计划 -> 名称组合空间
+    _space_cache = PlanCache(maxsize=64)
+
     # 地区前缀
     REGIONS = {
         "一线城市": ["北京", "上海", "广州", "深圳"],
@@ -91,110 +117,148 @@ class ChineseCompanyNameGenerator(ValidatedDataGenerator):
 
     def _setup(self) -> None:
         """配置生成器参数"""
-        self.company_type = self.parameters.get("type", "mixed")
-        self.region = self.parameters.get("region", None)
-        self.size = self.parameters.get("size", "medium")  # small, medium, large
-        self.style = self.parameters.get("style", "modern")  # traditional, modern, creative
-        self.include_region = self.parameters.get("include_region", True)
-        self.length = self.parameters.get("length", "medium")  # short, medium, long
-
-    def _get_region_prefix(self) -> str:
+        self._plan = self._plan_for(self.parameters)
+        self.company_type = self._plan.company_type
+        self.region = self._plan.region
+        self.size = self._plan.size
+        self.style = self._plan.style
+        self.include_region = self._plan.include_region
+        self.length = self._plan.length
+
+    def _build_plan(self, parameters: dict[str, Any]) -> CompanyNamePlan:
+        """编译公司名称生成计划"""
+        company_type = parameters.get("type", "mixed")
+        size = parameters.get("size", "medium")  # small, medium, large
+
+        # 根据公司规模选择地区分组
+        if size == "large":
+            region_types = ["一线城市", "全国"]
+        elif size == "medium":
+            region_types = ["一线城市", "新一线", "全国"]
+        else:
+            region_types = ["新一线", "二线城市"]
+
+        industry_data = self.INDUSTRY_WORDS.get(company_type, self.INDUSTRY_WORDS["mixed"])
+        # 公司类型后缀的累积权重采样表
+        type_suffixes, type_cum_weights = get_table("company.type_sampler")
+
+        return CompanyNamePlan(
+            company_type=company_type,
+            region=parameters.get("region", None),
+            size=size,
+            style=parameters.get("style", "modern"),  # traditional, modern, creative
+            include_region=parameters.get("include_region", True),
+            length=parameters.get("length", "medium"),  # short, medium, long
+            region_groups=tuple(tuple(self.REGIONS[region_type]) for region_type in region_types),
+            modifiers=tuple(industry_data["修饰词"]),
+            cores=tuple(industry_data["核心词"]),
+            suffixes=tuple(industry_data["后缀词"]),
+            special_words=tuple(self.SPECIAL_COMBINATIONS.get(company_type, [])),
+            type_suffixes=type_suffixes,
+            type_cum_weights=type_cum_weights,
+        )
+
+    def _get_region_prefix(self, plan: CompanyNamePlan) -> str:
         """获取地区前缀"""
-        if not self.include_region:
+        if not plan.include_region:
             return ""
         
-        if self.region:
-            # 如果指定了具体地区
-            if self.region in [item for sublist in self.REGIONS.values() for item in sublist]:
-                return self.region
-            else:
-                # 如果不在列表中，直接使用
-                return self.region
+        if plan.region:
+            # 指定了地区时直接使用
+            return plan.region
         
         # 根据公司规模选择地区
-        if self.size == "large":
-            region_type = random.choice(["一线城市", "全国"])
-        elif self.size == "medium":
-            region_type = random.choice(["一线城市", "新一线", "全国"])
-        else:
-            region_type = random.choice(["新一线", "二线城市"])
-        
-        return random.choice(self.REGIONS[region_type])
+        return self.rng.choice(self.rng.choice(plan.region_groups))
 
-    def _get_core_name(self) -> str:
+    def _get_core_name(self, plan: CompanyNamePlan) -> str:
         """获取公司核心名称"""
-        industry_data = self.INDUSTRY_WORDS.get(self.company_type, self.INDUSTRY_WORDS["mixed"])
-        
         # 根据长度选择组合方式
-        if self.length == "short":
+        if plan.length == "short":
             # 短名称：修饰词 + 核心词
-            modifier = random.choice(industry_data["修饰词"])
-            core = random.choice(industry_data["核心词"])
-            return modifier + core
-        elif self.length == "long":
+            return self.rng.choice(plan.modifiers) + self.rng.choice(plan.cores)
+        elif plan.length == "long":
             # 长名称：修饰词 + 核心词 + 后缀词
-            modifier = random.choice(industry_data["修饰词"])
-            core = random.choice(industry_data["核心词"])
-            suffix = random.choice(industry_data["后缀词"])
+            modifier = self.rng.choice(plan.modifiers)
+            core = self.rng.choice(plan.cores)
+            suffix = self.rng.choice(plan.suffixes)
             
             # 避免重复
             if core == suffix:
-                suffix = random.choice([w for w in industry_data["后缀词"] if w != core])
+                suffix = self.rng.choice([w for w in plan.suffixes if w != core])
             
             return modifier + core + suffix
         else:
             # 中等长度：核心词 + 后缀词 或 修饰词 + 核心词
-            if random.random() < 0.7:
-                core = random.choice(industry_data["核心词"])
-                suffix = random.choice(industry_data["后缀词"])
+            if self.rng.random() < 0.7:
+                core = self.rng.choice(plan.cores)
+                suffix = self.rng.choice(plan.suffixes)
                 return core + suffix if core != suffix else core
             else:
-                modifier = random.choice(industry_data["修饰词"])
-                core = random.choice(industry_data["核心词"])
-                return modifier + core
+                return self.rng.choice(plan.modifiers) + self.rng.choice(plan.cores)
 
-    def _add_special_elements(self, name: str) -> str:
+    def _add_special_elements(self, name: str, plan: CompanyNamePlan) -> str:
         """添加特殊元素"""
-        if self.style == "creative" and random.random() < 0.3:
+        if plan.style == "creative" and self.rng.random() < 0.3:
             # 创意风格，可能添加特殊组合
-            special_words = self.SPECIAL_COMBINATIONS.get(self.company_type, [])
-            if special_words and random.random() < 0.5:
-                special = random.choice(special_words)
-                return special + name
+            if plan.special_words and self.rng.random() < 0.5:
+                return self.rng.choice(plan.special_words) + name
         
         return name
 
-    def _get_company_type_suffix(self) -> str:
+    def _get_company_type_suffix(self, plan: CompanyNamePlan) -> str:
         """获取公司类型后缀"""
         # 根据权重随机选择
-        rand = random.random()
-        cumulative = 0
+        return self.rng.choices(plan.type_suffixes, cum_weights=plan.type_cum_weights)[0]
+
+    def _compose(self, plan: CompanyNamePlan) -> str:
+        """按计划生成一个公司名称"""
+        # 地区前缀
+        region_prefix = self._get_region_prefix(plan)
         
-        for company_type, weight in self.COMPANY_TYPES.items():
-            cumulative += weight
-            if rand <= cumulative:
-                return company_type
+        # 核心名称（可能添加特殊元素）
+        core_name = self._add_special_elements(self._get_core_name(plan), plan)
         
-        return "有限公司"  # 默认
+        # 组合完整名称：地区前缀 + 核心名称 + 公司类型后缀
+        return region_prefix + core_name + self._get_company_type_suffix(plan)
 
     def _generate_raw(self, context: Optional[GenerationContext] = None) -> str:
         """生成公司名称"""
-        # 地区前缀
-        region_prefix = self._get_region_prefix()
-        
-        # 核心名称
-        core_name = self._get_core_name()
-        
-        # 添加特殊元素
-        core_name = self._add_special_elements(core_name)
-        
-        # 公司类型后缀
-        type_suffix = self._get_company_type_suffix()
-        
-        # 组合完整名称
-        full_name = region_prefix + core_name + type_suffix
-        
-        return full_name
+        return self._compose(self._plan)
+
+    def _core_names(self, plan: CompanyNamePlan) -> list[str]:
+        """_get_core_name 可能产生的全部核心名称"""
+        short = [modifier + core for modifier in plan.modifiers for core in plan.cores]
+        if plan.length == "short":
+            return short
+        if plan.length == "long":
+            return [
+                modifier + core + suffix
+                for modifier in plan.modifiers
+                for core in plan.cores
+                for suffix in plan.suffixes
+                if suffix != core
+            ]
+        return [core + suffix if core != suffix else core for core in plan.cores for suffix in plan.suffixes] + short
+
+    def _build_name_space(self, plan: CompanyNamePlan) -> MixedRadixSpace:
+        if not plan.include_region:
+            regions: tuple[str, ...] = ("",)
+        elif plan.region:
+            regions = (plan.region,)
+        else:
+            regions = tuple(itertools.chain.from_iterable(plan.region_groups))
+        specials = ("",) + plan.special_words if plan.style == "creative" else ("",)
+        return MixedRadixSpace.build([regions, specials, self._core_names(plan), plan.type_suffixes])
+
+    def name_space(self, **kwargs) -> MixedRadixSpace:
+        """
+        当前参数下全部可能的公司名称构成的组合空间
+
+        地区前缀 × 特殊元素 × 核心名称 × 公司类型后缀，拼接结果相同的组合只计一次，
+        size 即最多能生成的不重复名称数量。kwargs 为参数覆盖。
+        """
+        plan = self._plan_with_overrides(kwargs)
+        return self._space_cache.get_or_build(plan, lambda: self._build_name_space(plan))
 
     def validate(self, data: str) -> bool:
         """验证公司名称格式"""
@@ -208,23 +272,71 @@ class ChineseCompanyNameGenerator(ValidatedDataGenerator):
         valid_endings = list(self.COMPANY_TYPES.keys())
         return any(data.endswith(ending) for ending in valid_endings)
 
-    def generate_batch(self, count: int, **kwargs) -> list[str]:
-        """批量生成公司名称"""
-        # 临时更新参数
-        original_params = self.parameters.copy()
-        self.parameters.update(kwargs)
-        self._setup()
-        
-        try:
-            names = []
-            for _ in range(count):
-                name = self.generate()
-                # 确保不重复
-                while name in names:
-                    name = self.generate()
-                names.append(name)
-            return names
-        finally:
-            # 恢复原始参数
-            self.parameters = original_params
-            self._setup()
+    def generate_batch(
+        self,
+        count: int,
+        context: Optional[GenerationContext] = None,
+        workers: int = 1,
+        executor: str = "thread",
+        seed: Optional[int] = None,
+        **kwargs,
+    ) -> list[str]:
+        """
+        批量生成公司名称
+
+        采样方式只由参数决定，与 count 无关：
+        - 默认逐条按计划生成并按生成顺序去重，分布（长度、地区、公司类型权重）与 generate 相同，名称不重复；
+          最多尝试 count * 10 个候选，count 接近组合空间大小（见 name_space）时可能凑不齐，此时报错。
+        - unique=False 时不去重，直接返回逐条生成的结果。
+        - exhaustive=True 时在组合空间上取随机置换并依次按混合进制解码：每个名称 O(1) 生成且保证不重复，
+          最多可取尽整个空间，但名称在空间中均匀分布，不再按类型权重采样。
+
+        kwargs 为仅对本次调用生效的参数覆盖（unique、exhaustive 除外），不修改实例状态，可并发调用。
+        seed 指定后结果可复现。设置了 pool_size 时默认不去重，没有参数覆盖时从取值池中采样。
+
+        Raises:
+            ValueError: 要求不重复而 count 超过当前参数下不重复名称的总数或候选不足，或同时设置了 pool_size
+        """
+        exhaustive = kwargs.pop("exhaustive", False)
+        unique = kwargs.pop("unique", not self.config.pool_size) or exhaustive
+        if unique and self.config.pool_size:
+            raise ValueError("pool_size cannot be combined with unique=True: pooled values repeat by design")
+        if self.value_pool is not None and not kwargs:
+            return super().generate_batch(count, context, workers=workers, executor=executor, seed=seed)
+
+        plan = self._plan_with_overrides(kwargs)
+
+        def produce(rows: int) -> list[str]:
+            return [self._validated(self._compose(plan)) for _ in range(rows)]
+
+        if not unique:
+            return self._run_batch(produce, count, workers=workers, executor=executor, seed=seed)
+
+        space = self.name_space(**kwargs)
+        if count > space.size:
+            raise ValueError(
+                f"Cannot generate {count} unique company names: only {space.size} exist for the current parameters"
+            )
+        if count <= 0:
+            return []
+        if exhaustive:
+            if seed is None:
+                seed = self.rng.getrandbits(64)
+            permutation = RandomPermutation(space.size, f"company_name:{seed}")
+            return [space.decode(permutation[index]) for index in range(count)]
+
+        names = self._run_unique_batch(
+            produce, count, max_attempts=count * 10, workers=workers, executor=executor, seed=seed
+        )
+        if len(names) < count:
+            raise ValueError(
+                f"Found only {len(names)} of {count} unique company names after {count * 10} attempts; "
+                "pass exhaustive=True to enumerate the name space"
+            )
+        return names
+
+def build_company_type_sampler() -> tuple[tuple[str, ...], tuple[float, ...]]:
+    """构建公司类型后缀的 (取值, 累积权重) 采样表（供预加载器缓存）"""
+    suffixes = tuple(ChineseCompanyNameGenerator.COMPANY_TYPES)
+    cum_weights = tuple(itertools.accumulate(ChineseCompanyNameGenerator.COMPANY_TYPES.values()))
+    return suffixes, cum_weights
@@ -3,9 +3,9 @@
 支持生成符合GB 11643-1999标准的18位身份证号码
 """
 
-import random
-from datetime import datetime, timedelta
-from typing import Optional, Tuple
+import re
+from datetime import date, datetime, timedelta
+from typing import Iterable, Optional, Tuple
 
 from dataforge.core.factory import register_generator
 from dataforge.core.generator import (
@@ -30,12 +30,21 @@ class ChineseIDCardGenerator(ValidatedDataGenerator):
         "台湾": "71", "香港": "81", "澳门": "82"
     }
 
+    # 省份代码 -> 省份名称（反向索引）
+    PROVINCE_NAMES = {code: name for name, code in PROVINCE_CODES.items()}
+
     # 校验码对应表
     CHECK_CODES = ['1', '0', 'X', '9', '8', '7', '6', '5', '4', '3', '2']
     
     # 权重系数
     WEIGHTS = [7, 9, 10, 5, 8, 4, 2, 1, 6, 3, 7, 9, 10, 5, 8, 4, 2]
 
+    # 格式校验正则
+    PATTERN = re.compile(r'^\d{17}[\dX]$')
+
+    # 输出固定为18位ASCII字符
+    fixed_width = 18
+
     @property
     def generator_type(self) -> GeneratorType:
         return GeneratorType.PERSON
@@ -75,21 +84,21 @@ class ChineseIDCardGenerator(ValidatedDataGenerator):
             province_code = self.PROVINCE_CODES[self.region]
         else:
             # 随机选择省份
-            province_code = random.choice(list(self.PROVINCE_CODES.values()))
+            province_code = self.rng.choice(list(self.PROVINCE_CODES.values()))
         
         # 生成市县代码（4位）
         if self.city:
             # 如果指定了城市，可以在这里添加城市代码映射
             # 现在简单生成随机代码
-            city_code = f"{random.randint(1, 99):02d}"
+            city_code = f"{self.rng.randint(1, 99):02d}"
         else:
-            city_code = f"{random.randint(1, 99):02d}"
+            city_code = f"{self.rng.randint(1, 99):02d}"
         
         if self.county:
             # 如果指定了县区，可以在这里添加县区代码映射
-            county_code = f"{random.randint(1, 99):02d}"
+            county_code = f"{self.rng.randint(1, 99):02d}"
         else:
-            county_code = f"{random.randint(1, 99):02d}"
+            county_code = f"{self.rng.randint(1, 99):02d}"
         
         return province_code + city_code + county_code
 
@@ -106,7 +115,7 @@ class ChineseIDCardGenerator(ValidatedDataGenerator):
         
         # 生成随机日期
         days_between = (end_date - start_date).days
-        random_days = random.randint(0, days_between)
+        random_days = self.rng.randint(0, days_between)
         random_date = start_date + timedelta(days=random_days)
         
         return random_date.strftime("%Y%m%d")
@@ -114,18 +123,18 @@ class ChineseIDCardGenerator(ValidatedDataGenerator):
     def _get_sequence_code(self, gender_digit: int) -> str:
         """获取顺序码（3位），最后一位表示性别"""
         # 前两位随机
-        first_two = random.randint(10, 99)
+        first_two = self.rng.randint(10, 99)
         
         # 第三位根据性别确定（奇数男性，偶数女性）
         if self.gender == "MALE":
             # 确保是奇数
-            third_digit = random.choice([1, 3, 5, 7, 9])
+            third_digit = self.rng.choice([1, 3, 5, 7, 9])
         elif self.gender == "FEMALE":
             # 确保是偶数
-            third_digit = random.choice([0, 2, 4, 6, 8])
+            third_digit = self.rng.choice([0, 2, 4, 6, 8])
         else:
             # 随机性别
-            third_digit = random.randint(0, 9)
+            third_digit = self.rng.randint(0, 9)
         
         return f"{first_two}{third_digit}"
 
@@ -133,7 +142,7 @@ class ChineseIDCardGenerator(ValidatedDataGenerator):
         """计算校验码"""
         if not self.valid:
             # 如果不需要有效的校验码，随机返回
-            return random.choice(self.CHECK_CODES)
+            return self.rng.choice(self.CHECK_CODES)
         
         # 计算加权和
         sum_val = sum(int(id_17[i]) * self.WEIGHTS[i] for i in range(17))
@@ -163,10 +172,8 @@ class ChineseIDCardGenerator(ValidatedDataGenerator):
 
     def validate(self, data: str) -> bool:
         """验证身份证号码"""
-        import re
-        
         # 基本格式检查
-        if not re.match(r'^\d{17}[\dX]$', data):
+        if not self.PATTERN.match(data):
             return False
         
         # 校验码验证
@@ -180,8 +187,27 @@ class ChineseIDCardGenerator(ValidatedDataGenerator):
         except (ValueError, IndexError):
             return False
 
-    def extract_info(self, idcard: str) -> dict:
-        """从身份证号码中提取信息"""
+    @staticmethod
+    def _parse_birth_date(birth_date: str) -> Optional[str]:
+        """解析8位出生日期，返回YYYY-MM-DD，非法日期返回None"""
+        try:
+            return datetime.strptime(birth_date, "%Y%m%d").strftime("%Y-%m-%d")
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _date_key(day: date) -> int:
+        """将日期编码为YYYYMMDD整数，便于按位相减计算周岁"""
+        return day.year * 10000 + day.month * 100 + day.day
+
+    def extract_info(self, idcard: str, reference_date: Optional[date] = None) -> dict:
+        """
+        从身份证号码中提取信息
+
+        Args:
+            idcard: 身份证号码
+            reference_date: 计算年龄的参考日期，默认为今天
+        """
         if not self.validate(idcard):
             return {"valid": False}
         
@@ -190,38 +216,77 @@ class ChineseIDCardGenerator(ValidatedDataGenerator):
         birth_date = idcard[6:14]
         gender_digit = int(idcard[16])
         
-        # 查找省份名称
-        province_name = None
-        for name, code in self.PROVINCE_CODES.items():
-            if code == province_code:
-                province_name = name
-                break
-        
-        # 解析出生日期
-        try:
-            birth_year = int(birth_date[:4])
-            birth_month = int(birth_date[4:6])
-            birth_day = int(birth_date[6:8])
-            birth_date_obj = datetime(birth_year, birth_month, birth_day)
-            
-            # 计算年龄
-            today = datetime.now()
-            age = today.year - birth_year
-            if today.month < birth_month or (today.month == birth_month and today.day < birth_day):
-                age -= 1
-        except ValueError:
-            birth_date_obj = None
+        # 解析出生日期并计算年龄
+        birth_date_str = self._parse_birth_date(birth_date)
+        if birth_date_str:
+            today = reference_date or date.today()
+            age = (self._date_key(today) - int(birth_date)) // 10000
+        else:
             age = None
         
-        # 判断性别
-        gender = "男" if gender_digit % 2 == 1 else "女"
-        
         return {
             "valid": True,
             "province_code": province_code,
-            "province_name": province_name,
-            "birth_date": birth_date_obj.strftime("%Y-%m-%d") if birth_date_obj else None,
+            "province_name": self.PROVINCE_NAMES.get(province_code),
+            "birth_date": birth_date_str,
             "age": age,
-            "gender": gender,
+            "gender": "男" if gender_digit % 2 == 1 else "女",
             "gender_code": gender_digit
         }
+
+    def extract_info_batch(
+        self,
+        idcards: Iterable[str],
+        reference_date: Optional[date] = None,
+        validate: bool = True,
+    ) -> dict[str, list]:
+        """
+        批量解析身份证号码，按列返回结果
+
+        所有号码共用同一个参考日期，出生日期按不同取值去重解析，
+        适合对大批量生成数据做统计分析。
+
+        Args:
+            idcards: 身份证号码序列
+            reference_date: 计算年龄的参考日期，默认为今天
+            validate: 是否校验号码，已知号码有效时可关闭以加速
+
+        Returns:
+            列名到列数据的映射，无效号码对应位置为None
+        """
+        idcards = list(idcards)
+        ref_key = self._date_key(reference_date or date.today())
+
+        if validate:
+            valid = [self.validate(idcard) for idcard in idcards]
+        else:
+            valid = [True] * len(idcards)
+
+        # 按列切片
+        province_codes = [idcard[:2] if ok else None for idcard, ok in zip(idcards, valid)]
+        birth_keys = [idcard[6:14] if ok else None for idcard, ok in zip(idcards, valid)]
+        gender_codes = [int(idcard[16]) if ok else None for idcard, ok in zip(idcards, valid)]
+
+        # 出生日期取值有限，每个取值只解析一次
+        parsed_dates = {key: self._parse_birth_date(key) for key in set(birth_keys) if key}
+        parsed_dates[None] = None
+        birth_dates = [parsed_dates[key] for key in birth_keys]
+
+        ages = [
+            (ref_key - int(key)) // 10000 if parsed else None
+            for key, parsed in zip(birth_keys, birth_dates)
+        ]
+
+        province_names = self.PROVINCE_NAMES
+        return {
+            "valid": valid,
+            "province_code": province_codes,
+            "province_name": [province_names.get(code) if code else None for code in province_codes],
+            "birth_date": birth_dates,
+            "age": ages,
+            "gender": [
+                None if code is None else ("男" if code % 2 == 1 else "女")
+                for code in gender_codes
+            ],
+            "gender_code": gender_codes,
+        }
@@ -3,10 +3,10 @@
 支持生成真实的中文姓名，包括性别、字数等参数控制
 """
 
-import random
 from typing import Optional
 
 from dataforge.core.factory import register_generator
+from dataforge.core.preloader import get_table
 from dataforge.core.generator import (
     GenerationContext,
     GeneratorType,
@@ -80,39 +80,24 @@ class ChineseNameGenerator(ValidatedDataGenerator):
         self.surname = self.parameters.get("surname", None)  # 指定姓氏
         self.given_name = self.parameters.get("given_name", None)  # 指定名字
 
+        # 选择名字字符池
+        pools = get_table("name.pools")
+        self._name_pool = pools.get(self.gender, pools["random"])
+
     def _generate_surname(self) -> str:
         """生成姓氏"""
         if self.surname:
             return self.surname
-        return random.choice(self.SURNAMES)
+        return self.rng.choice(self.SURNAMES)
 
     def _generate_given_name(self) -> str:
         """生成名字"""
         if self.given_name:
             return self.given_name
 
-        # 选择名字字符池
-        if self.gender == "male":
-            name_pool = self.MALE_NAMES
-        elif self.gender == "female":
-            name_pool = self.FEMALE_NAMES
-        else:  # random or neutral
-            name_pool = self.MALE_NAMES + self.FEMALE_NAMES + self.NEUTRAL_NAMES
-
-        # 生成指定长度的名字
-        if self.length == 1:
-            return random.choice(name_pool)
-        elif self.length == 2:
-            return random.choice(name_pool) + random.choice(name_pool)
-        elif self.length == 3:
-            return (
-                random.choice(name_pool)
-                + random.choice(name_pool)
-                + random.choice(name_pool)
-            )
-        else:
-            # 默认2个字
-            return random.choice(name_pool) + random.choice(name_pool)
+        # 生成指定长度的名字，默认2个字
+        length = self.length if self.length in (1, 2, 3) else 2
+        return "".join(self.rng.choices(self._name_pool, k=length))
 
     def _generate_raw(self, context: Optional[GenerationContext] = None) -> str:
         """生成中文姓名"""
@@ -127,3 +112,17 @@ class ChineseNameGenerator(ValidatedDataGenerator):
         # 检查是否为中文字符
         pattern = r"^[\u4e00-\u9fff]{2,4}$"
         return bool(re.match(pattern, data))
+
+
+def build_name_pools() -> dict[str, tuple[str, ...]]:
+    """构建按性别划分的名字字符池（供预加载器缓存）"""
+    return {
+        "male": tuple(ChineseNameGenerator.MALE_NAMES),
+        "female": tuple(ChineseNameGenerator.FEMALE_NAMES),
+        # random or neutral
+        "random": tuple(
+            ChineseNameGenerator.MALE_NAMES
+            + ChineseNameGenerator.FEMALE_NAMES
+            + ChineseNameGenerator.NEUTRAL_NAMES
+        ),
+    }
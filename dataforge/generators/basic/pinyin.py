@@ -0,0 +1,114 @@
+"""
+汉字拼音转写模块
+
+提供姓名生成器字符池中全部汉字的拼音（不带声调，ü 写作 v，姓氏取姓氏读音），
+用于由姓名派生邮箱用户名等拼音数据。整张表只有几百个字，直接内置，不依赖第三方拼音库。
+"""
+
+import functools
+import itertools
+import operator
+import sys
+from typing import NamedTuple, Optional, Sequence
+
+# 拼音:汉字（同音字写在一起）
+_PINYIN_GROUPS = """
+ai:爱 an:安 bai:白 bao:宝 bei:北贝 bin:斌 bo:博 cai:蔡财才彩 cao:曹草 chang:常昌 chao:超
+chen:陈辰 cheng:程成诚 chi:耻 chun:春 ci:词 cui:崔 da:达 dai:戴 dao:道 de:德 deng:邓
+di:地 dian:电 ding:丁 dong:董东冬 du:杜读 duan:段 fa:发 fan:范 fang:方芳 fei:飞
+feng:冯峰 fo:佛 fu:傅福富 gao:高 ge:歌 gong:龚功公 gu:顾 guang:光 gui:贵 guo:郭国 hai:海
+han:韩涵 hao:郝浩豪 he:何贺和 hong:洪红虹 hou:侯 hu:胡 hua:华花画 huan:欢 huang:黄 hui:辉慧
+jia:贾佳 jian:建健见 jiang:蒋姜江 jie:杰洁 jin:金 jing:静晶 jun:军俊君 kai:凯 kang:康
+kong:孔 lai:赖 le:乐 lei:雷磊蕾 li:李礼丽理 lian:廉 liang:梁亮 liao:廖 lin:林琳 ling:玲
+liu:刘 long:龙 lu:卢陆禄露 luo:罗 lv:吕 ma:马 mao:毛 mei:梅美 meng:孟梦 mi:蜜 min:敏
+ming:明 na:娜 nan:南 nian:念 ning:宁 niu:牛 pan:潘 peng:彭鹏 ping:平萍 qi:琪棋祈
+qian:钱倩 qiang:强 qin:秦琴 qing:情 qiu:邱秋求 ren:任人仁 rong:荣 rou:柔 sen:森 shan:山善
+shao:邵 shen:沈神 sheng:盛 shi:石史施识诗实 shou:寿 shu:书 shuo:说 si:思 song:宋 su:苏
+sun:孙 tan:谭 tang:唐 tao:涛 tian:田天甜 ting:婷听 wan:万 wang:王汪旺望 wei:魏韦伟薇
+wen:文雯温问闻 wu:吴武舞 xi:喜希 xia:夏霞 xian:仙 xiang:香想 xiao:萧孝 xie:谢写 xin:信欣馨心
+xing:兴星 xiong:熊雄 xiu:秀 xu:徐许 xue:薛学雪 ya:雅 yan:阎严燕艳 yang:杨 yao:姚瑶 ye:叶
+yi:义忆 yin:尹银音 ying:英莹颖 yong:勇 you:优 yu:于余宇雨玉 yuan:袁渊愿 yue:月悦 yun:云韵
+zeng:曾 zhang:张 zhao:赵 zhen:珍真 zheng:郑正 zhi:志智直知 zhong:钟中忠 zhou:周 zhu:朱珠
+zou:邹 zuan:钻
+"""
+
+PINYIN: dict[str, str] = {
+    char: reading
+    for reading, chars in (group.split(":") for group in _PINYIN_GROUPS.split())
+    for char in chars
+}
+
+
+# str.translate 用的转写表：名的拼音、名的首字母、删除表内的字（剩余部分即表外的字）
+_GIVEN_TABLE = str.maketrans(PINYIN)
+_INITIALS_TABLE = str.maketrans({char: reading[0] for char, reading in PINYIN.items()})
+_KNOWN_TABLE = str.maketrans(dict.fromkeys(PINYIN, None))
+
+# 码位 -> 拼音、首字母：整列按码位查表，省去为每个字创建单字字符串
+_CODEPOINT_READINGS = {ord(char): reading for char, reading in PINYIN.items()}
+_CODEPOINT_INITIALS = {ord(char): reading[0] for char, reading in PINYIN.items()}
+_UTF32 = "utf-32-le" if sys.byteorder == "little" else "utf-32-be"
+
+class NamePinyin(NamedTuple):
+    """姓名的拼音：姓、名和名的首字母（元组形式，可直接展开为格式化参数）"""
+
+    surname: str
+    given: str
+    initials: str
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def name_pinyin(name: str) -> Optional[NamePinyin]:
+    """
+    姓名转拼音（按完整姓名缓存，LRU 有界）
+
+    首字为姓，其余为名；表中没有的字跳过，姓或名无法转写时返回None。
+    """
+    surname = PINYIN.get(name[:1], "")
+    given = [PINYIN[char] for char in name[1:] if char in PINYIN]
+    if not surname or not given:
+        return None
+    return NamePinyin(surname, "".join(given), "".join(reading[0] for reading in given))
+
+
+def transliterate_column(names: Sequence[str], initials: bool = False) -> tuple[list[str], list[str]]:
+    """
+    整列姓名转拼音，返回 (姓, 名) 两列；initials 为True时第二列为名的首字母。
+    逐行与 name_pinyin 的结果一致，无法转写的行两列均为空串。
+
+    姓名长度相同时（姓名生成器的常见输出），整列拼成一个字符串并编码为 UTF-32，
+    按步长切出各行第 k 个字的码位逐列查表，不为每行切分姓名；
+    否则逐行按首字查表、其余部分用 str.translate 转写，只有例外行逐个转写。
+    大批量姓名大多互不相同，逐个经过 LRU 反而更慢，因此不经过 name_pinyin 的缓存。
+    """
+    lengths = set(map(len, names))
+    width = lengths.pop() if len(lengths) == 1 else 0
+    if width >= 2:
+        codepoints = memoryview("".join(names).encode(_UTF32)).cast("I")
+        given_table = _CODEPOINT_INITIALS if initials else _CODEPOINT_READINGS
+        try:
+            surnames = list(map(_CODEPOINT_READINGS.__getitem__, codepoints[0::width]))
+            givens = list(map(given_table.__getitem__, codepoints[1::width]))
+            for position in range(2, width):
+                givens = list(map(operator.add, givens, map(given_table.__getitem__, codepoints[position::width])))
+        except KeyError:  # 含表外的字，按一般情况处理
+            pass
+        else:
+            return surnames, givens
+
+    table = _INITIALS_TABLE if initials else _GIVEN_TABLE
+    rows = range(len(names))
+    heads = map(operator.getitem, names, itertools.repeat(slice(None, 1)))
+    tails = list(map(operator.getitem, names, itertools.repeat(slice(1, None))))
+    surnames = list(map(PINYIN.get, heads, itertools.repeat("")))
+    givens = list(map(str.translate, tails, itertools.repeat(table)))
+
+    # 名中含表外字的行（表外字会被 translate 原样保留）和姓名过短的行逐个转写
+    irregular = set(itertools.compress(rows, map(str.translate, tails, itertools.repeat(_KNOWN_TABLE))))
+    irregular.update(itertools.compress(rows, map(operator.not_, tails)))
+    for row in irregular:
+        converted = name_pinyin(names[row])
+        surnames[row], givens[row] = (converted.surname, converted[2 if initials else 1]) if converted else ("", "")
+    for row in itertools.compress(rows, map(operator.not_, surnames)):
+        givens[row] = ""
+    return surnames, givens
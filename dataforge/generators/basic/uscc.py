@@ -3,8 +3,9 @@
 支持生成符合GB 32100-2015标准的18位统一社会信用代码
 """
 
-import random
-from typing import Optional
+import re
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional
 
 from dataforge.core.factory import register_generator
 from dataforge.core.generator import (
@@ -14,6 +15,21 @@ from dataforge.core.generator import (
 )
 
 
+@dataclass(frozen=True)
+class USCCPlan:
+    """统一社会信用代码生成计划"""
+
+    org_type: str
+    region: Optional[str]
+    dept_code: Optional[str]
+    valid: bool
+    province: Optional[str]
+    city: Optional[str]
+    dept_codes: tuple[str, ...]  # 第1位候选
+    org_type_codes: tuple[str, ...]  # 第2位候选
+    province_codes: tuple[str, ...]  # 第3-4位候选
+
+
 @register_generator("uscc", ["统一社会信用代码", "信用代码"])
 class USCCGenerator(ValidatedDataGenerator):
     """统一社会信用代码生成器"""
@@ -54,8 +70,25 @@ class USCCGenerator(ValidatedDataGenerator):
         "陕西": "61", "甘肃": "62", "青海": "63", "宁夏": "64", "新疆": "65"
     }
 
+    # 省份代码 -> 省份名称（反向索引）
+    PROVINCE_NAMES = {code: name for name, code in PROVINCE_CODES.items()}
+
+    # 机构类别代码 -> 机构类别名称（各类别代码互不重复）
+    ORG_TYPE_NAMES = {
+        code: name for types in ORG_TYPE_CODES.values() for code, name in types.items()
+    }
+
     # 校验码字符集
     CHECK_CHARS = "0123456789ABCDEFGHJKLMNPQRTUWXY"
+
+    # 字符 -> 数值
+    CHAR_VALUES = {char: i for i, char in enumerate(CHECK_CHARS)}
+
+    # 格式校验正则
+    PATTERN = re.compile(r'^[0-9A-Z]{18}$')
+
+    # 输出固定为18位ASCII字符
+    fixed_width = 18
     
     # 加权因子
     WEIGHTS = [1, 3, 9, 27, 19, 26, 16, 17, 20, 29, 25, 13, 8, 24, 10, 30, 28]
@@ -70,73 +103,91 @@ class USCCGenerator(ValidatedDataGenerator):
 
     def _setup(self) -> None:
         """配置生成器参数"""
-        self.org_type = self.parameters.get("org_type", "enterprise")
-        self.region = self.parameters.get("region", None)
-        self.dept_code = self.parameters.get("dept_code", None)
-        self.valid = self.parameters.get("valid", True)
-        self.province = self.parameters.get("province", None)
-        self.city = self.parameters.get("city", None)
-
-    def _get_dept_code(self) -> str:
-        """获取登记管理部门代码（第1位）"""
-        if self.dept_code and self.dept_code in self.DEPT_CODES:
-            return self.dept_code
-        
-        # 根据机构类型选择合适的部门代码
-        if self.org_type == "enterprise":
-            return random.choice(["9", "1"])  # 工商或机构编制
-        elif self.org_type == "institution":
-            return random.choice(["1", "5"])  # 机构编制或民政
+        self._plan = self._plan_for(self.parameters)
+        self.org_type = self._plan.org_type
+        self.region = self._plan.region
+        self.dept_code = self._plan.dept_code
+        self.valid = self._plan.valid
+        self.province = self._plan.province
+        self.city = self._plan.city
+
+    def _build_plan(self, parameters: dict[str, Any]) -> USCCPlan:
+        """编译统一社会信用代码生成计划"""
+        org_type = parameters.get("org_type", "enterprise")
+        region = parameters.get("region", None)
+        dept_code = parameters.get("dept_code", None)
+        province = parameters.get("province", None)
+
+        # 登记管理部门代码候选（第1位）
+        if dept_code and dept_code in self.DEPT_CODES:
+            dept_codes = (dept_code,)
+        elif org_type == "enterprise":
+            dept_codes = ("9", "1")  # 工商或机构编制
+        elif org_type == "institution":
+            dept_codes = ("1", "5")  # 机构编制或民政
+        else:
+            dept_codes = tuple(self.DEPT_CODES)
+
+        # 机构类别代码候选（第2位）
+        org_type_codes = tuple(self.ORG_TYPE_CODES.get(org_type, self.ORG_TYPE_CODES["enterprise"]))
+
+        # 省份代码候选
+        if province and province in self.PROVINCE_CODES:
+            province_codes = (self.PROVINCE_CODES[province],)
+        elif region and region in self.PROVINCE_CODES:
+            province_codes = (self.PROVINCE_CODES[region],)
         else:
-            return random.choice(list(self.DEPT_CODES.keys()))
+            province_codes = tuple(self.PROVINCE_CODES.values())
+
+        return USCCPlan(
+            org_type=org_type,
+            region=region,
+            dept_code=dept_code,
+            valid=parameters.get("valid", True),
+            province=province,
+            city=parameters.get("city", None),
+            dept_codes=dept_codes,
+            org_type_codes=org_type_codes,
+            province_codes=province_codes,
+        )
 
-    def _get_org_type_code(self) -> str:
+    def _get_dept_code(self, plan: USCCPlan) -> str:
+        """获取登记管理部门代码（第1位）"""
+        return self.rng.choice(plan.dept_codes)
+
+    def _get_org_type_code(self, plan: USCCPlan) -> str:
         """获取机构类别代码（第2位）"""
-        org_types = self.ORG_TYPE_CODES.get(self.org_type, self.ORG_TYPE_CODES["enterprise"])
-        return random.choice(list(org_types.keys()))
+        return self.rng.choice(plan.org_type_codes)
 
-    def _get_region_code(self) -> str:
+    def _get_region_code(self, plan: USCCPlan) -> str:
         """获取登记管理机关行政区划码（第3-8位）"""
         # 选择省份代码
-        if self.province and self.province in self.PROVINCE_CODES:
-            province_code = self.PROVINCE_CODES[self.province]
-        elif self.region and self.region in self.PROVINCE_CODES:
-            province_code = self.PROVINCE_CODES[self.region]
-        else:
-            province_code = random.choice(list(self.PROVINCE_CODES.values()))
+        province_code = self.rng.choice(plan.province_codes)
         
         # 生成市县代码（4位）
-        city_code = f"{random.randint(1, 99):02d}{random.randint(1, 99):02d}"
+        city_code = f"{self.rng.randint(1, 99):02d}{self.rng.randint(1, 99):02d}"
         
         return province_code + city_code
 
     def _get_main_body_code(self) -> str:
         """获取主体标识码（第9-17位）"""
         # 生成9位组织机构代码
-        code_chars = []
-        for _ in range(9):
-            code_chars.append(random.choice(self.CHECK_CHARS))
-        return ''.join(code_chars)
+        return ''.join(self.rng.choices(self.CHECK_CHARS, k=9))
 
-    def _calculate_check_code(self, uscc_17: str) -> str:
+    def _calculate_check_code(self, uscc_17: str, plan: Optional[USCCPlan] = None) -> str:
         """计算校验码（第18位）"""
-        if not self.valid:
-            return random.choice(self.CHECK_CHARS)
-        
-        # 将字符转换为对应的数值
-        char_values = {}
-        for i, char in enumerate(self.CHECK_CHARS):
-            char_values[char] = i
+        if not (plan or self._plan).valid:
+            return self.rng.choice(self.CHECK_CHARS)
         
-        # 计算加权和
+        return self._compute_check_code(uscc_17)
+
+    def _compute_check_code(self, uscc_17: str) -> str:
+        """按GB 32100-2015计算校验码"""
+        # 计算加权和（不在字符集中的字符按0计）
+        char_values = self.CHAR_VALUES
         sum_val = 0
-        for i in range(17):
-            char = uscc_17[i]
-            if char in char_values:
-                sum_val += char_values[char] * self.WEIGHTS[i]
-            else:
-                # 如果字符不在字符集中，使用0
-                sum_val += 0
+        for char, weight in zip(uscc_17, self.WEIGHTS):
+            sum_val += char_values.get(char, 0) * weight
         
         # 计算校验码
         check_code_index = 31 - (sum_val % 31)
@@ -145,39 +196,34 @@ class USCCGenerator(ValidatedDataGenerator):
         
         return self.CHECK_CHARS[check_code_index]
 
-    def _generate_raw(self, context: Optional[GenerationContext] = None) -> str:
-        """生成统一社会信用代码"""
-        # 第1位：登记管理部门代码
-        dept_code = self._get_dept_code()
-        
-        # 第2位：机构类别代码
-        org_type_code = self._get_org_type_code()
-        
-        # 第3-8位：登记管理机关行政区划码
-        region_code = self._get_region_code()
-        
-        # 第9-17位：主体标识码
-        main_body_code = self._get_main_body_code()
-        
-        # 前17位
-        uscc_17 = dept_code + org_type_code + region_code + main_body_code
+    def _compose(self, plan: USCCPlan) -> str:
+        """按计划生成一个统一社会信用代码"""
+        # 第1位：登记管理部门代码；第2位：机构类别代码
+        # 第3-8位：登记管理机关行政区划码；第9-17位：主体标识码
+        uscc_17 = (
+            self._get_dept_code(plan)
+            + self._get_org_type_code(plan)
+            + self._get_region_code(plan)
+            + self._get_main_body_code()
+        )
         
         # 第18位：校验码
-        check_code = self._calculate_check_code(uscc_17)
-        
-        return uscc_17 + check_code
+        return uscc_17 + self._calculate_check_code(uscc_17, plan)
+
+    def _generate_raw(self, context: Optional[GenerationContext] = None) -> str:
+        """生成统一社会信用代码"""
+        return self._compose(self._plan)
 
     def validate(self, data: str) -> bool:
         """验证统一社会信用代码"""
-        import re
-        
         # 基本格式检查
-        if not re.match(r'^[0-9A-Z]{18}$', data):
+        if not self.PATTERN.match(data):
             return False
         
         # 检查字符集
+        char_values = self.CHAR_VALUES
         for char in data:
-            if char not in self.CHECK_CHARS:
+            if char not in char_values:
                 return False
         
         # 校验码验证
@@ -196,38 +242,55 @@ class USCCGenerator(ValidatedDataGenerator):
         dept_code = uscc[0]
         org_type_code = uscc[1]
         province_code = uscc[2:4]
-        region_code = uscc[2:8]
-        main_body_code = uscc[8:17]
-        check_code = uscc[17]
-        
-        # 解析信息
-        dept_name = self.DEPT_CODES.get(dept_code, "未知")
-        
-        # 查找机构类型
-        org_type_name = "未知"
-        for category, types in self.ORG_TYPE_CODES.items():
-            if org_type_code in types:
-                org_type_name = types[org_type_code]
-                break
-        
-        # 查找省份名称
-        province_name = None
-        for name, code in self.PROVINCE_CODES.items():
-            if code == province_code:
-                province_name = name
-                break
         
         return {
             "valid": True,
             "dept_code": dept_code,
-            "dept_name": dept_name,
+            "dept_name": self.DEPT_CODES.get(dept_code, "未知"),
             "org_type_code": org_type_code,
-            "org_type_name": org_type_name,
+            "org_type_name": self.ORG_TYPE_NAMES.get(org_type_code, "未知"),
             "province_code": province_code,
-            "province_name": province_name,
-            "region_code": region_code,
-            "main_body_code": main_body_code,
-            "check_code": check_code
+            "province_name": self.PROVINCE_NAMES.get(province_code),
+            "region_code": uscc[2:8],
+            "main_body_code": uscc[8:17],
+            "check_code": uscc[17]
+        }
+
+    def extract_info_batch(self, usccs: Iterable[str], validate: bool = True) -> dict[str, list]:
+        """
+        批量解析统一社会信用代码，按列返回结果
+
+        Args:
+            usccs: 统一社会信用代码序列
+            validate: 是否校验代码，已知代码有效时可关闭以加速
+
+        Returns:
+            列名到列数据的映射，无效代码对应位置为None
+        """
+        usccs = list(usccs)
+        if validate:
+            valid = [self.validate(uscc) for uscc in usccs]
+        else:
+            valid = [True] * len(usccs)
+
+        dept_codes = [uscc[0] if ok else None for uscc, ok in zip(usccs, valid)]
+        org_type_codes = [uscc[1] if ok else None for uscc, ok in zip(usccs, valid)]
+        province_codes = [uscc[2:4] if ok else None for uscc, ok in zip(usccs, valid)]
+
+        dept_names = self.DEPT_CODES
+        org_type_names = self.ORG_TYPE_NAMES
+        province_names = self.PROVINCE_NAMES
+        return {
+            "valid": valid,
+            "dept_code": dept_codes,
+            "dept_name": [dept_names.get(code, "未知") if code else None for code in dept_codes],
+            "org_type_code": org_type_codes,
+            "org_type_name": [org_type_names.get(code, "未知") if code else None for code in org_type_codes],
+            "province_code": province_codes,
+            "province_name": [province_names.get(code) if code else None for code in province_codes],
+            "region_code": [uscc[2:8] if ok else None for uscc, ok in zip(usccs, valid)],
+            "main_body_code": [uscc[8:17] if ok else None for uscc, ok in zip(usccs, valid)],
+            "check_code": [uscc[17] if ok else None for uscc, ok in zip(usccs, valid)],
         }
 
     def generate_by_company_name(self, company_name: str) -> str:
@@ -248,17 +311,9 @@ class USCCGenerator(ValidatedDataGenerator):
         elif "合作社" in company_name:
             inferred_type = "enterprise"  # 农民专业合作社也属于企业类
         
-        # 临时设置参数
-        original_region = self.region
-        original_org_type = self.org_type
+        # 推断的参数仅对本次调用生效，不修改实例状态
+        overrides = {"org_type": inferred_type}
+        if inferred_region:
+            overrides["region"] = inferred_region
         
-        try:
-            if inferred_region:
-                self.region = inferred_region
-            self.org_type = inferred_type
-            
-            return self.generate()
-        finally:
-            # 恢复原始参数
-            self.region = original_region
-            self.org_type = original_org_type
+        return self._validated(self._compose(self._plan_with_overrides(overrides)))
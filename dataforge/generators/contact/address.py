@@ -3,16 +3,45 @@
 支持生成中国大陆地区的详细地址信息
 """
 
+import functools
+import itertools
+import operator
 import random
-from typing import Optional, Dict, List
+import re
+from dataclasses import dataclass
+from typing import Any, Optional, Dict, Iterable, List
 
+from dataforge import geo
+from dataforge.core import sampling
 from dataforge.core.factory import register_generator
+from dataforge.core.preloader import get_table
 from dataforge.core.generator import (
     GenerationContext,
     GeneratorType,
     ValidatedDataGenerator,
 )
 
+# 直辖市：区即城市
+MUNICIPALITIES = ("北京市", "上海市", "天津市", "重庆市")
+
+
+@dataclass(frozen=True)
+class AddressPlan:
+    """地址生成计划"""
+
+    province: Optional[str]
+    city: Optional[str]
+    district: Optional[str]
+    detail_level: str
+    include_postal_code: bool
+    address_type: str
+    format_style: str
+    # (组件名, 前缀) 序列
+    layout: tuple[tuple[str, str], ...]
+    # 候选地区 (省份, 城市, 区县, 邮编前缀) 及其概率，区县为空串表示随机生成
+    regions: tuple[tuple[str, str, str, str], ...]
+    region_weights: tuple[float, ...]
+
 
 @register_generator("address", ["地址", "住址", "通讯地址"])
 class ChineseAddressGenerator(ValidatedDataGenerator):
@@ -42,6 +71,16 @@ class ChineseAddressGenerator(ValidatedDataGenerator):
         "常用词": ["人民", "建设", "解放", "和平", "友谊", "团结", "胜利", "光明", "新华", "文化", "学府", "科技", "工业", "商业", "金融", "花园", "公园", "广场", "中心"]
     }
 
+    # 随机区县名称：方位 + 地貌 + 后缀
+    DISTRICT_PREFIXES = ["东", "西", "南", "北", "中", "新", "老", "上", "下"]
+    DISTRICT_MIDDLES = ["城", "关", "郊", "山", "河", "湖"]
+    DISTRICT_SUFFIXES = ["区", "县", "市"]
+
+    # 建筑名称前缀
+    BUILDING_PREFIXES = [
+        "阳光", "花园", "金色", "银河", "星光", "海景", "山景", "湖景", "绿地", "蓝天", "彩虹", "梦想"
+    ]
+
     # 建筑类型
     BUILDING_TYPES = {
         "住宅": ["小区", "花园", "苑", "城", "家园", "公寓", "大厦", "广场", "中心", "新村"],
@@ -49,6 +88,9 @@ class ChineseAddressGenerator(ValidatedDataGenerator):
         "工业": ["工业园", "科技园", "开发区", "产业园", "厂区"]
     }
 
+    # 与 validate 等价的整体匹配，供批量验证使用（地址要素都是汉字，含要素即含汉字）
+    _ADDRESS_PATTERN = re.compile(r"(?=.*?[省市区县路街巷号室栋楼]).{5,200}", re.DOTALL)
+
     @property
     def generator_type(self) -> GeneratorType:
         return GeneratorType.CONTACT
@@ -62,13 +104,54 @@ class ChineseAddressGenerator(ValidatedDataGenerator):
 
     def _setup(self) -> None:
         """配置生成器参数"""
-        self.province = self.parameters.get("province", None)
-        self.city = self.parameters.get("city", None)
-        self.district = self.parameters.get("district", None)
-        self.detail_level = self.parameters.get("detail_level", "detailed")  # simple, detailed, full
-        self.include_postal_code = self.parameters.get("include_postal_code", False)
-        self.address_type = self.parameters.get("address_type", "residential")  # residential, commercial, industrial
-        self.format_style = self.parameters.get("format_style", "standard")  # standard, formal, casual
+        self._plan = self._plan_for(self.parameters)
+        self.province = self._plan.province
+        self.city = self._plan.city
+        self.district = self._plan.district
+        self.detail_level = self._plan.detail_level
+        self.include_postal_code = self._plan.include_postal_code
+        self.address_type = self._plan.address_type
+        self.format_style = self._plan.format_style
+
+        # 地区表
+        self._province_names = get_table("address.regions")["provinces"]
+        # 地址格式只取决于参数，在计划中一次性解析
+        self._layout = self._plan.layout
+
+    def _build_plan(self, parameters: dict[str, Any]) -> AddressPlan:
+        """编译地址生成计划"""
+        province = parameters.get("province", None)
+        city = parameters.get("city", None)
+        district = parameters.get("district", None)
+        detail_level = parameters.get("detail_level", "detailed")  # simple, detailed, full
+        include_postal_code = parameters.get("include_postal_code", False)
+        format_style = parameters.get("format_style", "standard")  # standard, formal, casual
+
+        # 候选地区：省份均匀选取（或为指定省份），城市在省内均匀选取（或为指定城市）
+        provinces = [province] if province in self.PROVINCES else list(self.PROVINCES)
+        regions, weights = [], []
+        for name in provinces:
+            info = self.PROVINCES[name]
+            cities = [city] if city in info["cities"] else info["cities"]
+            for selected in cities:
+                if name in MUNICIPALITIES:
+                    regions.append((name, name, selected, info["postal_prefix"]))
+                else:
+                    regions.append((name, selected, district or "", info["postal_prefix"]))
+                weights.append(1.0 / len(provinces) / len(cities))
+
+        return AddressPlan(
+            province=province,
+            city=city,
+            district=district,
+            detail_level=detail_level,
+            include_postal_code=include_postal_code,
+            address_type=parameters.get("address_type", "residential"),  # residential, commercial, industrial
+            format_style=format_style,
+            layout=self._address_layout(format_style, detail_level, include_postal_code),
+            regions=tuple(regions),
+            region_weights=tuple(weights),
+        )
 
     def _select_region(self) -> Dict[str, str]:
         """选择省市区"""
@@ -76,7 +159,7 @@ class ChineseAddressGenerator(ValidatedDataGenerator):
         if self.province and self.province in self.PROVINCES:
             selected_province = self.province
         else:
-            selected_province = random.choice(list(self.PROVINCES.keys()))
+            selected_province = self.rng.choice(self._province_names)
         
         province_info = self.PROVINCES[selected_province]
         
@@ -84,10 +167,10 @@ class ChineseAddressGenerator(ValidatedDataGenerator):
         if self.city and self.city in province_info["cities"]:
             selected_city = self.city
         else:
-            selected_city = random.choice(province_info["cities"])
+            selected_city = self.rng.choice(province_info["cities"])
         
         # 如果是直辖市，区就是城市
-        if selected_province in ["北京市", "上海市", "天津市", "重庆市"]:
+        if selected_province in MUNICIPALITIES:
             selected_district = selected_city
             selected_city = selected_province
         else:
@@ -95,9 +178,10 @@ class ChineseAddressGenerator(ValidatedDataGenerator):
             if self.district:
                 selected_district = self.district
             else:
-                district_suffixes = ["区", "县", "市"]
-                district_prefix = random.choice(["东", "西", "南", "北", "中", "新", "老", "上", "下"])
-                selected_district = district_prefix + random.choice(["城", "关", "郊", "山", "河", "湖"]) + random.choice(district_suffixes)
+                district_prefix = self.rng.choice(self.DISTRICT_PREFIXES)
+                selected_district = (
+                    district_prefix + self.rng.choice(self.DISTRICT_MIDDLES) + self.rng.choice(self.DISTRICT_SUFFIXES)
+                )
         
         return {
             "province": selected_province,
@@ -112,37 +196,41 @@ class ChineseAddressGenerator(ValidatedDataGenerator):
         elements = []
         
         # 可能添加方位
-        if random.random() < 0.4:
-            elements.append(random.choice(self.STREET_ELEMENTS["方位"]))
+        if self.rng.random() < 0.4:
+            elements.append(self.rng.choice(self.STREET_ELEMENTS["方位"]))
         
         # 添加主要名称
-        if random.random() < 0.3:
-            elements.append(random.choice(self.STREET_ELEMENTS["数字"]))
+        if self.rng.random() < 0.3:
+            elements.append(self.rng.choice(self.STREET_ELEMENTS["数字"]))
         
-        elements.append(random.choice(self.STREET_ELEMENTS["常用词"]))
+        elements.append(self.rng.choice(self.STREET_ELEMENTS["常用词"]))
         
         # 添加街道类型
-        street_type = random.choice(self.STREET_TYPES)
+        street_type = self.rng.choice(self.STREET_TYPES)
         
         return ''.join(elements) + street_type
 
+    def _building_types(self, address_type: str) -> List[str]:
+        """地址类型对应的建筑类型"""
+        return self.BUILDING_TYPES.get(
+            "住宅" if address_type == "residential" else
+            "商业" if address_type == "commercial" else "工业"
+        )
+
     def _generate_building_info(self) -> str:
         """生成建筑信息"""
-        building_types = self.BUILDING_TYPES.get(
-            "住宅" if self.address_type == "residential" else
-            "商业" if self.address_type == "commercial" else "工业"
-        )
+        building_types = self._building_types(self.address_type)
         
         # 生成建筑名称
-        building_prefix = random.choice(["阳光", "花园", "金色", "银河", "星光", "海景", "山景", "湖景", "绿地", "蓝天", "彩虹", "梦想"])
-        building_suffix = random.choice(building_types)
+        building_prefix = self.rng.choice(self.BUILDING_PREFIXES)
+        building_suffix = self.rng.choice(building_types)
         building_name = building_prefix + building_suffix
         
         # 添加楼栋和房间号
         if self.detail_level in ["detailed", "full"]:
-            building_num = random.randint(1, 30)
-            unit_num = random.randint(1, 6)
-            room_num = f"{random.randint(1, 30):02d}{random.randint(1, 8)}"
+            building_num = self.rng.randint(1, 30)
+            unit_num = self.rng.randint(1, 6)
+            room_num = f"{self.rng.randint(1, 30):02d}{self.rng.randint(1, 8)}"
             
             return f"{building_name}{building_num}号楼{unit_num}单元{room_num}室"
         else:
@@ -151,59 +239,39 @@ class ChineseAddressGenerator(ValidatedDataGenerator):
     def _generate_postal_code(self, postal_prefix: str) -> str:
         """生成邮政编码"""
         # 生成6位邮政编码
-        suffix = f"{random.randint(1000, 9999)}"
+        suffix = f"{self.rng.randint(1000, 9999)}"
         return postal_prefix + suffix
 
-    def _format_address(self, components: Dict[str, str]) -> str:
-        """格式化地址"""
-        if self.format_style == "formal":
+    @staticmethod
+    def _address_layout(
+        format_style: str, detail_level: str, include_postal_code: bool
+    ) -> tuple[tuple[str, str], ...]:
+        """按 format_style 和 detail_level 确定地址由哪些组件组成，返回 (组件名, 前缀) 序列"""
+        if format_style == "formal":
             # 正式格式：省份 城市 区县 街道 建筑
-            address_parts = [
-                components["province"],
-                components["city"],
-                components["district"],
-                components["street"],
-                components["building"]
-            ]
-            
-            if self.include_postal_code:
-                address_parts.append(f"邮编：{components['postal_code']}")
-                
-        elif self.format_style == "casual":
+            layout = ["province", "city", "district", "street", "building"]
+            if include_postal_code:
+                return tuple((key, "") for key in layout) + (("postal_code", "邮编："),)
+        elif format_style == "casual":
             # 简洁格式
-            address_parts = [
-                components["city"],
-                components["district"],
-                components["street"],
-                components["building"]
-            ]
+            layout = ["city", "district", "street", "building"]
         else:
-            # 标准格式
-            address_parts = []
-            
-            # 根据详细程度决定包含的信息
-            if self.detail_level == "simple":
-                address_parts = [components["city"], components["district"]]
-            elif self.detail_level == "detailed":
-                address_parts = [
-                    components["province"],
-                    components["city"],
-                    components["district"],
-                    components["street"]
-                ]
+            # 标准格式：根据详细程度决定包含的信息
+            if detail_level == "simple":
+                layout = ["city", "district"]
+            elif detail_level == "detailed":
+                layout = ["province", "city", "district", "street"]
             else:  # full
-                address_parts = [
-                    components["province"],
-                    components["city"],
-                    components["district"],
-                    components["street"],
-                    components["building"]
-                ]
+                layout = ["province", "city", "district", "street", "building"]
             
-            if self.include_postal_code and self.detail_level == "full":
-                address_parts.append(components["postal_code"])
+            if include_postal_code and detail_level == "full":
+                layout.append("postal_code")
         
-        return "".join(address_parts)
+        return tuple((key, "") for key in layout)
+
+    def _format_address(self, components: Dict[str, str]) -> str:
+        """格式化地址"""
+        return "".join(prefix + components[key] for key, prefix in self._layout)
 
     def _generate_raw(self, context: Optional[GenerationContext] = None) -> str:
         """生成地址"""
@@ -212,7 +280,7 @@ class ChineseAddressGenerator(ValidatedDataGenerator):
         
         # 生成街道
         street = self._generate_street_name()
-        street_number = random.randint(1, 999)
+        street_number = self.rng.randint(1, 999)
         full_street = f"{street}{street_number}号"
         
         # 生成建筑信息
@@ -233,6 +301,116 @@ class ChineseAddressGenerator(ValidatedDataGenerator):
         
         return self._format_address(components)
 
+    def _region_columns(self, plan: AddressPlan) -> tuple[tuple[str, ...], tuple[int, ...], tuple[str, ...]]:
+        """
+        按候选地区下标索引的扁平数组：格式中省/市/区县部分预先拼好的字符串、
+        区县是否随机生成（0/1）、邮编前缀（含格式中的标签）
+        """
+        prefixes = dict(plan.layout)
+        keys = [key for key, _ in plan.layout if key in ("province", "city", "district")]
+        heads, random_districts, postal_prefixes = [], [], []
+        for province, city, district, postal_prefix in plan.regions:
+            parts = {"province": province, "city": city, "district": district}
+            heads.append("".join(prefixes[key] + parts[key] for key in keys))
+            random_districts.append(0 if district or "district" not in prefixes else 1)
+            postal_prefixes.append(prefixes.get("postal_code", "") + postal_prefix)
+        return tuple(heads), tuple(random_districts), tuple(postal_prefixes)
+
+    def _compose_batch(self, plan: AddressPlan, count: int) -> list[str]:
+        """
+        批量生成地址，各组件的分布与逐条调用 _generate_raw 相同（概率量化到 1/65536）
+
+        地区一次查表得到候选地区下标，再按下标从扁平数组取出预先拼好的省市区；
+        街道、建筑各部分合并为联合查表整列采样，邮编数字用整块随机字节生成。
+        只生成格式中出现的组件，最后按格式顺序整列拼接，不为每行解析格式。
+        """
+        rng = self.rng
+        keys = [key for key, _ in plan.layout]
+        heads, random_districts, postal_prefixes = self._region_columns(plan)
+        regions = sampling.sample(rng, sampling.lane_table(range(len(plan.regions)), plan.region_weights), count)
+
+        # 区县紧跟在城市之后：随机区县乘以 0/1 标记，指定或直辖市的行为空串
+        districts = sampling.sample(
+            rng,
+            sampling.joint_table(
+                (self.DISTRICT_PREFIXES, None), (self.DISTRICT_MIDDLES, None), (self.DISTRICT_SUFFIXES, None)
+            ),
+            count,
+        )
+        columns: list[Any] = [
+            map(heads.__getitem__, regions),
+            map(operator.mul, districts, map(random_districts.__getitem__, regions)),
+        ]
+
+        if "street" in keys:
+            elements = self.STREET_ELEMENTS
+            street_heads = sampling.joint_table(
+                sampling.optional_part(elements["方位"], 0.4), sampling.optional_part(elements["数字"], 0.3)
+            )
+            street_names = sampling.joint_table((elements["常用词"], None), (self.STREET_TYPES, None))
+            columns.append(sampling.sample(rng, street_heads, count))
+            columns.append(sampling.sample(rng, street_names, count))
+            numbers = sampling.lane_table([f"{number}号" for number in range(1, 1000)])
+            columns.append(sampling.sample(rng, numbers, count))
+
+        if "building" in keys:
+            names = sampling.joint_table((self.BUILDING_PREFIXES, None), (self._building_types(plan.address_type), None))
+            columns.append(sampling.sample(rng, names, count))
+            if plan.detail_level in ["detailed", "full"]:
+                buildings = sampling.joint_table(
+                    ([f"{number}号楼" for number in range(1, 31)], None),
+                    ([f"{unit}单元" for unit in range(1, 7)], None),
+                )
+                rooms = sampling.joint_table(
+                    ([f"{floor:02d}" for floor in range(1, 31)], None),
+                    ([f"{room}室" for room in range(1, 9)], None),
+                )
+                columns.append(sampling.sample(rng, buildings, count))
+                columns.append(sampling.sample(rng, rooms, count))
+
+        if "postal_code" in keys:
+            # 4 位数字在 [1000, 9999] 中均匀：前两位 10~99，后两位 00~99
+            columns.append(map(postal_prefixes.__getitem__, regions))
+            columns.append(sampling.sample(rng, sampling.lane_table([f"{number}" for number in range(10, 100)]), count))
+            columns.append(sampling.sample(rng, sampling.lane_table([f"{number:02d}" for number in range(100)]), count))
+
+        return list(map("".join, zip(*columns)))
+
+    def _validated_batch(self, addresses: list[str]) -> list[str]:
+        """按配置整批验证，任一无效时抛出 ValueError"""
+        if self.config.validate:
+            invalid = next(itertools.filterfalse(self._ADDRESS_PATTERN.fullmatch, addresses), None)
+            if invalid is not None:
+                raise ValueError(f"Generated data failed validation: {invalid}")
+        return addresses
+
+    def generate_batch(
+        self,
+        count: int,
+        context: Optional[GenerationContext] = None,
+        workers: int = 1,
+        executor: str = "thread",
+        seed: Optional[int] = None,
+        **kwargs,
+    ) -> list[str]:
+        """
+        批量生成地址
+
+        每个分块由 _compose_batch 整列生成，不逐条组装；设置了取值池时从池中采样。
+        kwargs 为仅对本次调用生效的参数覆盖，不修改实例状态，可并发调用。
+        其余参数含义同 DataGenerator.generate_batch。
+        """
+        if self.value_pool is not None and not kwargs:
+            return super().generate_batch(count, context, workers=workers, executor=executor, seed=seed)
+        plan = self._plan_with_overrides(kwargs)
+        return self._run_batch(
+            lambda rows: self._validated_batch(self._compose_batch(plan, rows)),
+            count,
+            workers=workers,
+            executor=executor,
+            seed=seed,
+        )
+
     def validate(self, data: str) -> bool:
         """验证地址格式"""
         # 基本检查：包含中文字符，有一定长度
@@ -251,33 +429,98 @@ class ChineseAddressGenerator(ValidatedDataGenerator):
         return has_indicator
 
     def generate_coordinates(self, address: str) -> Dict[str, float]:
-        """生成地址对应的大概坐标（模拟）"""
-        # 这里只是示例，实际应用中需要使用地理编码服务
-        # 根据省份生成大概的坐标范围
-        coordinate_ranges = {
-            "北京市": {"lat": (39.4, 40.4), "lng": (115.7, 117.4)},
-            "上海市": {"lat": (30.7, 31.8), "lng": (120.9, 122.1)},
-            "广东省": {"lat": (20.2, 25.5), "lng": (109.7, 117.2)},
-            "江苏省": {"lat": (30.7, 35.3), "lng": (116.4, 121.9)},
-            "浙江省": {"lat": (27.0, 31.4), "lng": (118.0, 123.0)}
-        }
-        
-        # 简单的省份匹配
-        for province, coords in coordinate_ranges.items():
-            if province in address:
-                lat_range = coords["lat"]
-                lng_range = coords["lng"]
-                
-                lat = random.uniform(lat_range[0], lat_range[1])
-                lng = random.uniform(lng_range[0], lng_range[1])
-                
-                return {
-                    "latitude": round(lat, 6),
-                    "longitude": round(lng, 6)
-                }
-        
-        # 默认返回中国中心位置附近的坐标
-        return {
-            "latitude": round(random.uniform(35.0, 40.0), 6),
-            "longitude": round(random.uniform(103.0, 120.0), 6)
-        }
+        """生成地址对应的大概坐标（模拟），坐标均匀落在地址所在地区的简化轮廓内"""
+        lng, lat = geo.sample_point(self.rng, _coordinate_areas().shape_for(address))
+        return {"latitude": round(lat, 6), "longitude": round(lng, 6)}
+
+    def generate_coordinates_batch(
+        self, addresses: Iterable[str], seed: Optional[int] = None
+    ) -> list[Dict[str, float]]:
+        """
+        为一列地址生成坐标
+
+        整列一次识别地区并在各自的轮廓内采样，不逐条调用 generate_coordinates；
+        无法识别地区的地址取中国中部的默认范围。
+        """
+        addresses = list(addresses)
+        if seed is None:
+            return self._coordinates_batch(addresses)
+        with self._using_rng(random.Random(seed)):
+            return self._coordinates_batch(addresses)
+
+    def _coordinates_batch(self, addresses: list[str]) -> list[Dict[str, float]]:
+        lngs, lats = geo.sample_points(self.rng, _coordinate_areas().resolve(addresses))
+        # 保留6位小数：放大后取整再缩小，比 round(x, 6) 快
+        scale = itertools.repeat(1e6)
+        lats = map(operator.truediv, map(round, map(operator.mul, lats, scale)), scale)
+        lngs = map(operator.truediv, map(round, map(operator.mul, lngs, scale)), scale)
+        return [{"latitude": lat, "longitude": lng} for lat, lng in zip(lats, lngs)]
+
+
+# 无法识别地区时的坐标范围（中国中部），经度、纬度交替
+_FALLBACK_AREA = (103.0, 35.0, 120.0, 35.0, 120.0, 40.0, 103.0, 40.0)
+
+
+@dataclass(frozen=True)
+class CoordinateAreas:
+    """地址 -> 坐标采样范围的查找表"""
+
+    # 地区名（省份、城市、直辖市的区）-> 有轮廓的最具体的地区形状
+    shapes: Dict[str, geo.RegionShape]
+    # 地区名的各种长度，从短到长
+    widths: tuple[int, ...]
+    # 按长度从长到短排列的地区名，供子串查找
+    names: tuple[str, ...]
+    fallback: geo.RegionShape
+
+    def shape_for(self, address: str) -> geo.RegionShape:
+        """
+        地址所在地区的形状，无法识别时为默认范围
+
+        地址通常以省份或城市开头，先按开头几个字查表，再按子串查找。
+        """
+        for width in self.widths:
+            shape = self.shapes.get(address[:width])
+            if shape is not None:
+                return shape
+        return next((self.shapes[name] for name in self.names if name in address), self.fallback)
+
+    def resolve(self, addresses: list[str]) -> list[geo.RegionShape]:
+        """整列识别地址所在地区的形状：先按最短地区名的长度整列查表，未命中的行逐个调用 shape_for"""
+        prefixes = map(operator.getitem, addresses, itertools.repeat(slice(0, self.widths[0])))
+        resolved = list(map(self.shapes.get, prefixes))
+        for row in itertools.compress(range(len(addresses)), map(operator.not_, resolved)):
+            resolved[row] = self.shape_for(addresses[row])
+        return resolved
+
+
+@functools.lru_cache(maxsize=None)
+def _coordinate_areas() -> CoordinateAreas:
+    """构建坐标查找表：目前只有省级轮廓，城市和直辖市的区取所在省份的轮廓"""
+    outlines = get_table("geo.regions")["shapes"]
+    regions = get_table("address.regions")
+    shapes = {province: outlines[province] for province in regions["provinces"] if province in outlines}
+    for province, city, _ in regions["cities"]:
+        shape = outlines.get(city, outlines.get(province))
+        if shape is not None:
+            shapes.setdefault(city, shape)
+    return CoordinateAreas(
+        shapes,
+        tuple(sorted(set(map(len, shapes)))),
+        tuple(sorted(shapes, key=len, reverse=True)),
+        geo.build_shape("", [_FALLBACK_AREA]),
+    )
+
+
+def build_region_table() -> dict[str, tuple]:
+    """构建扁平化的地区表（供预加载器缓存）"""
+    provinces = ChineseAddressGenerator.PROVINCES
+    return {
+        "provinces": tuple(provinces),
+        # (省份, 城市, 邮编前缀)
+        "cities": tuple(
+            (province, city, info["postal_prefix"])
+            for province, info in provinces.items()
+            for city in info["cities"]
+        ),
+    }
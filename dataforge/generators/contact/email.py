@@ -1,17 +1,63 @@
 """
 电子邮箱地址生成器
-支持生成各种格式的电子邮箱地址
+支持生成各种格式的电子邮箱地址，拼音风格的用户名可由同一行的中文姓名派生
 """
 
+import dataclasses
 import random
-from typing import Optional
+import re
+import string
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional
 
+from dataforge.core import sampling
 from dataforge.core.factory import register_generator
 from dataforge.core.generator import (
     GenerationContext,
     GeneratorType,
     ValidatedDataGenerator,
 )
+from dataforge.core.preloader import get_table
+
+
+@dataclass(frozen=True)
+class EmailPlan:
+    """邮箱生成计划"""
+
+    domain_type: str
+    custom_domain: Optional[str]
+    username_style: str
+    include_numbers: bool
+    include_dots: bool
+    min_length: int
+    max_length: int
+    domains: tuple[str, ...]
+    name_field: Optional[str] = None
+
+
+def _random_digits_table(include_numbers: bool) -> tuple[str, ...]:
+    """随机用户名末尾数字的查表：以 0.6 的概率追加 1~3 位（位数均匀）随机数字"""
+    if not include_numbers:
+        return sampling.lane_table([""])
+    values, weights = [""], [0.4]
+    for digits in (1, 2, 3):
+        values.extend(f"{number:0{digits}d}" for number in range(10 ** digits))
+        weights.extend([0.2 / 10 ** digits] * 10 ** digits)
+    return sampling.lane_table(values, weights)
+
+
+# 用户名长度 -> 插入点位置查表（随机16位整数 -> [2, 长度 - 2] 中的位置）
+_dot_position_tables: dict[int, tuple[int, ...]] = {}
+
+
+def _dot_positions(lengths: set[int]) -> dict[int, tuple[int, ...]]:
+    """确保给定长度的插入点位置查表都已构建"""
+    for length in lengths - _dot_position_tables.keys():
+        span = max(2, length - 2) - 1
+        _dot_position_tables.setdefault(
+            length, tuple(2 + (lane * span >> sampling.LANE_BITS) for lane in range(sampling.LANES))
+        )
+    return _dot_position_tables
 
 
 @register_generator("email", ["邮箱", "电子邮箱", "邮件地址"])
@@ -60,6 +106,18 @@ class EmailGenerator(ValidatedDataGenerator):
         "separators": [".", "_", "-", ""]
     }
 
+    # 拼音用户名的格式：{0} 为姓，{1} 为名（pinyin）或名的首字母（pinyin_initials）
+    PINYIN_PATTERNS = {
+        "pinyin": ["{0}{1}", "{0}.{1}", "{0}_{1}", "{1}.{0}", "{1}{0}"],
+        "pinyin_initials": ["{0}{1}", "{1}{0}", "{0}.{1}", "{1}_{0}"],
+    }
+
+    # 未指定 name_field 时，在行上下文中依次查找的姓名字段名或生成器类型
+    NAME_KEYS = ("name", "姓名", "中文姓名")
+
+    # 与 validate 等价的整体匹配，供批量验证使用
+    _EMAIL_PATTERN = re.compile(r"(?!\.)(?!.*\.\.)[a-zA-Z0-9._%+-]+(?<!\.)@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+
     @property
     def generator_type(self) -> GeneratorType:
         return GeneratorType.CONTACT
@@ -68,143 +126,335 @@ class EmailGenerator(ValidatedDataGenerator):
     def supported_parameters(self) -> list[str]:
         return [
             "domain_type", "custom_domain", "username_style", 
-            "include_numbers", "include_dots", "min_length", "max_length"
+            "include_numbers", "include_dots", "min_length", "max_length", "name_field"
         ]
 
+    @property
+    def uses_context(self) -> bool:
+        """拼音风格需要读取同一行已生成的姓名"""
+        return self._plan.username_style in self.PINYIN_PATTERNS
+
     def _setup(self) -> None:
         """配置生成器参数"""
-        self.domain_type = self.parameters.get("domain_type", "common")
-        self.custom_domain = self.parameters.get("custom_domain", None)
-        self.username_style = self.parameters.get("username_style", "mixed")  # simple, mixed, business, random
-        self.include_numbers = self.parameters.get("include_numbers", True)
-        self.include_dots = self.parameters.get("include_dots", True)
-        self.min_length = self.parameters.get("min_length", 5)
-        self.max_length = self.parameters.get("max_length", 20)
-
-    def _get_domain(self) -> str:
+        self._plan = self._plan_for(self.parameters)
+        self.domain_type = self._plan.domain_type
+        self.custom_domain = self._plan.custom_domain
+        self.username_style = self._plan.username_style
+        self.include_numbers = self._plan.include_numbers
+        self.include_dots = self._plan.include_dots
+        self.min_length = self._plan.min_length
+        self.max_length = self._plan.max_length
+
+    def _build_plan(self, parameters: dict[str, Any]) -> EmailPlan:
+        """编译邮箱生成计划"""
+        domain_type = parameters.get("domain_type", "common")
+        return EmailPlan(
+            domain_type=domain_type,
+            custom_domain=parameters.get("custom_domain", None),
+            # simple, mixed, business, random, pinyin, pinyin_initials
+            username_style=parameters.get("username_style", "mixed"),
+            include_numbers=parameters.get("include_numbers", True),
+            include_dots=parameters.get("include_dots", True),
+            min_length=parameters.get("min_length", 5),
+            max_length=parameters.get("max_length", 20),
+            domains=tuple(self.EMAIL_DOMAINS.get(domain_type, self.EMAIL_DOMAINS["common"])),
+            name_field=parameters.get("name_field", None),
+        )
+
+    def _get_domain(self, plan: EmailPlan) -> str:
         """获取邮箱域名"""
-        if self.custom_domain:
-            return self.custom_domain
+        if plan.custom_domain:
+            return plan.custom_domain
         
-        domains = self.EMAIL_DOMAINS.get(self.domain_type, self.EMAIL_DOMAINS["common"])
-        return random.choice(domains)
+        return self.rng.choice(plan.domains)
 
-    def _generate_simple_username(self) -> str:
+    def _generate_simple_username(self, plan: EmailPlan) -> str:
         """生成简单用户名"""
-        base = random.choice(self.USERNAME_ELEMENTS["words"])
+        base = self.rng.choice(self.USERNAME_ELEMENTS["words"])
         
-        if self.include_numbers and random.random() < 0.7:
-            number = random.choice(self.USERNAME_ELEMENTS["numbers"])
-            separator = random.choice(self.USERNAME_ELEMENTS["separators"])
+        if plan.include_numbers and self.rng.random() < 0.7:
+            number = self.rng.choice(self.USERNAME_ELEMENTS["numbers"])
+            separator = self.rng.choice(self.USERNAME_ELEMENTS["separators"])
             return base + separator + number
         
         return base
 
-    def _generate_mixed_username(self) -> str:
+    def _generate_mixed_username(self, plan: EmailPlan) -> str:
         """生成混合用户名"""
         parts = []
         
         # 添加前缀（可选）
-        if random.random() < 0.3:
-            parts.append(random.choice(self.USERNAME_ELEMENTS["prefixes"]))
+        if self.rng.random() < 0.3:
+            parts.append(self.rng.choice(self.USERNAME_ELEMENTS["prefixes"]))
         
         # 添加主要词汇
-        parts.append(random.choice(self.USERNAME_ELEMENTS["words"]))
+        parts.append(self.rng.choice(self.USERNAME_ELEMENTS["words"]))
         
         # 添加第二个词汇（可选）
-        if random.random() < 0.5:
-            parts.append(random.choice(self.USERNAME_ELEMENTS["words"]))
+        if self.rng.random() < 0.5:
+            parts.append(self.rng.choice(self.USERNAME_ELEMENTS["words"]))
         
         # 添加数字（可选）
-        if self.include_numbers and random.random() < 0.8:
-            parts.append(random.choice(self.USERNAME_ELEMENTS["numbers"]))
+        if plan.include_numbers and self.rng.random() < 0.8:
+            parts.append(self.rng.choice(self.USERNAME_ELEMENTS["numbers"]))
         
         # 选择分隔符
-        separator = random.choice(self.USERNAME_ELEMENTS["separators"])
+        separator = self.rng.choice(self.USERNAME_ELEMENTS["separators"])
         username = separator.join(parts)
         
         return username
 
-    def _generate_business_username(self) -> str:
+    def _generate_business_username(self, plan: EmailPlan) -> str:
         """生成商务用户名"""
         business_prefixes = ["admin", "info", "contact", "support", "service", "sales", "hr", "finance"]
-        prefix = random.choice(business_prefixes)
+        prefix = self.rng.choice(business_prefixes)
         
-        if random.random() < 0.3:
+        if self.rng.random() < 0.3:
             # 添加部门或数字
-            suffix = random.choice(["dept", "team", "01", "02", "03"])
-            separator = random.choice([".", "_", "-"])
+            suffix = self.rng.choice(["dept", "team", "01", "02", "03"])
+            separator = self.rng.choice([".", "_", "-"])
             return prefix + separator + suffix
         
         return prefix
 
-    def _generate_random_username(self) -> str:
+    def _generate_random_username(self, plan: EmailPlan) -> str:
         """生成随机用户名"""
-        import string
-        
         # 生成随机字母组合
-        length = random.randint(self.min_length, min(self.max_length, 15))
-        chars = string.ascii_lowercase
-        
-        username = ''.join(random.choice(chars) for _ in range(length))
+        length = self.rng.randint(plan.min_length, min(plan.max_length, 15))
+        username = ''.join(self.rng.choices(string.ascii_lowercase, k=length))
         
         # 可能添加数字
-        if self.include_numbers and random.random() < 0.6:
-            numbers = ''.join(random.choice(string.digits) for _ in range(random.randint(1, 3)))
-            username += numbers
+        if plan.include_numbers and self.rng.random() < 0.6:
+            username += ''.join(self.rng.choices(string.digits, k=self.rng.randint(1, 3)))
         
         return username
 
-    def _generate_username(self) -> str:
+    def _random_name(self) -> str:
+        """上下文中没有姓名时，按姓名生成器的默认方式生成一个（单姓加两字名）"""
+        from dataforge.generators.basic.name import ChineseNameGenerator
+
+        pool = get_table("name.pools")["random"]
+        return self.rng.choice(ChineseNameGenerator.SURNAMES) + "".join(self.rng.choices(pool, k=2))
+
+    def _generate_pinyin_username(self, plan: EmailPlan, name: Optional[str]) -> str:
+        """由姓名的拼音生成用户名，姓名无法转写时退回混合用户名"""
+        from dataforge.generators.basic.pinyin import name_pinyin
+
+        converted = name_pinyin(name if name else self._random_name())
+        if converted is None:
+            return self._generate_mixed_username(plan)
+
+        pattern = self.rng.choice(self.PINYIN_PATTERNS[plan.username_style])
+        if plan.include_numbers and self.rng.random() < 0.5:
+            pattern += self.rng.choice(self.USERNAME_ELEMENTS["numbers"])
+        given = converted.initials if plan.username_style == "pinyin_initials" else converted.given
+        return pattern.format(converted.surname, given)
+
+    def _context_name(self, plan: EmailPlan, context: Optional[GenerationContext]) -> Optional[str]:
+        """从行上下文中取出本行已生成的姓名"""
+        if context is None or not context.related_data:
+            return None
+        for key in (plan.name_field,) if plan.name_field else self.NAME_KEYS:
+            value = context.related_data.get(key)
+            if isinstance(value, str) and value:
+                return value
+        return None
+
+    def _generate_username(self, plan: EmailPlan, name: Optional[str] = None) -> str:
         """生成用户名"""
-        if self.username_style == "simple":
-            username = self._generate_simple_username()
-        elif self.username_style == "business":
-            username = self._generate_business_username()
-        elif self.username_style == "random":
-            username = self._generate_random_username()
+        if plan.username_style in self.PINYIN_PATTERNS:
+            username = self._generate_pinyin_username(plan, name)
+        elif plan.username_style == "simple":
+            username = self._generate_simple_username(plan)
+        elif plan.username_style == "business":
+            username = self._generate_business_username(plan)
+        elif plan.username_style == "random":
+            username = self._generate_random_username(plan)
         else:  # mixed
-            username = self._generate_mixed_username()
+            username = self._generate_mixed_username(plan)
         
         # 确保长度在范围内
-        if len(username) < self.min_length:
+        if len(username) < plan.min_length:
             # 如果太短，添加数字
-            username += random.choice(self.USERNAME_ELEMENTS["numbers"])
-        elif len(username) > self.max_length:
-            # 如果太长，截断
-            username = username[:self.max_length]
+            username += self.rng.choice(self.USERNAME_ELEMENTS["numbers"])
+        elif len(username) > plan.max_length:
+            # 如果太长，截断（去掉截断后末尾的点）
+            username = username[:plan.max_length].rstrip(".")
         
         return username.lower()
 
-    def _add_dots_and_formatting(self, username: str) -> str:
-        """添加点和格式化"""
-        if not self.include_dots or len(username) < 6:
+    def _add_dots_and_formatting(self, username: str, plan: EmailPlan) -> str:
+        """添加点和格式化（拼音用户名保持原样）"""
+        if not plan.include_dots or len(username) < 6 or plan.username_style in self.PINYIN_PATTERNS:
             return username
         
-        # 随机在中间添加点
-        if random.random() < 0.3:
-            mid = len(username) // 2
-            # 避免在开头或结尾添加点
-            pos = random.randint(2, max(2, len(username) - 2))
-            username = username[:pos] + "." + username[pos:]
+        # 随机在中间添加点（避免在开头或结尾添加点）
+        if self.rng.random() < 0.3:
+            pos = self.rng.randint(2, max(2, len(username) - 2))
+            # 避免与已有的点相邻形成连续的点
+            if "." not in username[pos - 1:pos + 1]:
+                username = username[:pos] + "." + username[pos:]
         
         return username
 
-    def _generate_raw(self, context: Optional[GenerationContext] = None) -> str:
-        """生成电子邮箱地址"""
+    def _compose(self, plan: EmailPlan, name: Optional[str] = None) -> str:
+        """按计划生成一个邮箱地址，name 为拼音风格用户名所依据的姓名"""
         # 生成用户名
-        username = self._generate_username()
+        username = self._generate_username(plan, name)
         
         # 添加格式化
-        username = self._add_dots_and_formatting(username)
-        
-        # 获取域名
-        domain = self._get_domain()
+        username = self._add_dots_and_formatting(username, plan)
         
         # 组合完整邮箱
-        email = f"{username}@{domain}"
-        
-        return email
+        return f"{username}@{self._get_domain(plan)}"
+
+    def _batch_pinyin_usernames(self, plan: EmailPlan, count: int, names: Optional[list[str]]) -> list[str]:
+        """
+        批量生成拼音用户名
+
+        格式和末尾数字合并为一次查表得到格式串，再与姓、名两列拼音一起交给 str.format。
+        给定姓名时整列转写，无法转写的行退回混合用户名；未给定时直接按字符池采样拼音，不经过姓名。
+        """
+        from dataforge.generators.basic.name import ChineseNameGenerator
+        from dataforge.generators.basic.pinyin import PINYIN, transliterate_column
+
+        rng = self.rng
+        initials = plan.username_style == "pinyin_initials"
+        numbers = sampling.optional_part(self.USERNAME_ELEMENTS["numbers"], 0.5 if plan.include_numbers else 0)
+        patterns = sampling.sample(
+            rng, sampling.joint_table((self.PINYIN_PATTERNS[plan.username_style], None), numbers), count
+        )
+
+        if names is None:
+            pool = get_table("name.pools")["random"]
+            surname_table = sampling.lane_table([PINYIN[char] for char in ChineseNameGenerator.SURNAMES])
+            given_table = sampling.lane_table([PINYIN[char][0] if initials else PINYIN[char] for char in pool])
+            first, second = sampling.sample(rng, given_table, count), sampling.sample(rng, given_table, count)
+            surnames = sampling.sample(rng, surname_table, count)
+            return [
+                pattern.format(surname, head + tail)
+                for pattern, surname, head, tail in zip(patterns, surnames, first, second)
+            ]
+
+        surnames, givens = transliterate_column(names, initials=initials)
+        usernames = [pattern.format(surname, given) for pattern, surname, given in zip(patterns, surnames, givens)]
+        missing = [row for row, surname in enumerate(surnames) if not surname]
+        if missing:
+            fallback = self._batch_usernames(dataclasses.replace(plan, username_style="mixed"), len(missing))
+            for row, username in zip(missing, fallback):
+                usernames[row] = username
+        return usernames
+
+    def _batch_usernames(self, plan: EmailPlan, count: int, names: Optional[list[str]] = None) -> list[str]:
+        """按用户名风格批量生成用户名（未做长度调整），各部分合并为联合查表整列采样"""
+        if plan.username_style in self.PINYIN_PATTERNS:
+            return self._batch_pinyin_usernames(plan, count, names)
+
+        rng = self.rng
+        elements = self.USERNAME_ELEMENTS
+        number_share = 0.7 if plan.include_numbers else 0
+        if plan.username_style == "simple":
+            numbers = [sep + number for sep in elements["separators"] for number in elements["numbers"]]
+            table = sampling.joint_table((elements["words"], None), sampling.optional_part(numbers, number_share))
+            return sampling.sample(rng, table, count)
+
+        if plan.username_style == "business":
+            prefixes = ["admin", "info", "contact", "support", "service", "sales", "hr", "finance"]
+            suffixes = [sep + suffix for sep in (".", "_", "-") for suffix in ("dept", "team", "01", "02", "03")]
+            table = sampling.joint_table((prefixes, None), sampling.optional_part(suffixes, 0.3))
+            return sampling.sample(rng, table, count)
+
+        if plan.username_style == "random":
+            length_table = sampling.lane_table(range(plan.min_length, min(plan.max_length, 15) + 1))
+            letters = sampling.random_strings(rng, string.ascii_lowercase, sampling.sample(rng, length_table, count))
+            digits = sampling.sample(rng, _random_digits_table(plan.include_numbers), count)
+            return [letter + digit for letter, digit in zip(letters, digits)]
+
+        # mixed：同一行的各部分共用一个分隔符。4 个分隔符占随机整数的高 2 位，
+        # “前缀+主词”和“第二个词+数字”两次查表共用这 2 位，各自只需一次查表
+        separators = elements["separators"]
+        heads, tails = [], []
+        for sep in separators:
+            heads.append(
+                sampling.joint_table(
+                    sampling.optional_part([prefix + sep for prefix in elements["prefixes"]], 0.3),
+                    (elements["words"], None),
+                )
+            )
+            tails.append(
+                sampling.joint_table(
+                    sampling.optional_part([sep + word for word in elements["words"]], 0.5),
+                    sampling.optional_part(
+                        [sep + number for number in elements["numbers"]], 0.8 if plan.include_numbers else 0
+                    ),
+                )
+            )
+        key_bits = 2
+        head_lanes = sampling.draw_lanes(rng, count)
+        tail_lanes = sampling.share_key(rng, head_lanes, key_bits)
+        head_table = sampling.keyed_table(heads, key_bits)
+        tail_table = sampling.keyed_table(tails, key_bits)
+        return [head_table[head] + tail_table[tail] for head, tail in zip(head_lanes, tail_lanes)]
+
+    def _compose_batch(self, plan: EmailPlan, count: int, names: Optional[list[str]] = None) -> list[str]:
+        """
+        批量生成邮箱地址，分布与逐条调用 _compose 相同（概率量化到 1/16384 以内）
+
+        整列采样用户名和域名后整体拼接；长度调整只对命中的行逐个处理，插入点也按列完成。
+        names 为拼音风格逐行对应的姓名。
+        """
+        rng = self.rng
+        usernames = self._batch_usernames(plan, count, names)
+
+        # 长度调整：太短的补数字，太长的截断（去掉截断后末尾的点）
+        short_rows = [row for row, username in enumerate(usernames) if len(username) < plan.min_length]
+        if short_rows:
+            fillers = sampling.sample(rng, sampling.lane_table(self.USERNAME_ELEMENTS["numbers"]), len(short_rows))
+            for row, filler in zip(short_rows, fillers):
+                usernames[row] += filler
+        for row, username in enumerate(usernames):
+            if len(username) > plan.max_length:
+                usernames[row] = username[:plan.max_length].rstrip(".")
+
+        if plan.include_dots and plan.username_style not in self.PINYIN_PATTERNS:
+            self._insert_dots(usernames)
+
+        if plan.custom_domain:
+            suffix = "@" + plan.custom_domain
+            return [username + suffix for username in usernames]
+        domains = sampling.sample(rng, sampling.lane_table(["@" + domain for domain in plan.domains]), count)
+        return [username + domain for username, domain in zip(usernames, domains)]
+
+    def _insert_dots(self, usernames: list[str]) -> None:
+        """以 0.3 的概率在长度不小于6的用户名中间插入点（同 _add_dots_and_formatting），原地修改"""
+        rng = self.rng
+        hits = sampling.bernoulli_flags(rng, 0.3, len(usernames))
+        rows = [row for row, (username, hit) in enumerate(zip(usernames, hits)) if hit and len(username) >= 6]
+        if not rows:
+            return
+
+        # 插入位置在 [2, len - 2] 中均匀选取：按长度选择位置查表
+        position_tables = _dot_positions({len(usernames[row]) for row in rows})
+        for row, lane in zip(rows, sampling.draw_lanes(rng, len(rows))):
+            username = usernames[row]
+            position = position_tables[len(username)][lane]
+            # 避免与已有的点相邻形成连续的点
+            if "." not in username[position - 1:position + 1]:
+                usernames[row] = username[:position] + "." + username[position:]
+
+    def _validated_batch(self, emails: list[str]) -> list[str]:
+        """按配置整批验证，任一无效时抛出 ValueError"""
+        if self.config.validate:
+            invalid = next((email for email in emails if not self._EMAIL_PATTERN.fullmatch(email)), None)
+            if invalid is not None:
+                raise ValueError(f"Generated data failed validation: {invalid}")
+        return emails
+
+    def _generate_raw(self, context: Optional[GenerationContext] = None) -> str:
+        """生成电子邮箱地址"""
+        if self.uses_context:
+            return self._compose(self._plan, self._context_name(self._plan, context))
+        return self._compose(self._plan)
 
     def validate(self, data: str) -> bool:
         """验证电子邮箱格式"""
@@ -227,28 +477,64 @@ class EmailGenerator(ValidatedDataGenerator):
         
         return True
 
-    def generate_batch(self, count: int, **kwargs) -> list[str]:
-        """批量生成邮箱地址"""
-        # 临时更新参数
-        original_params = self.parameters.copy()
-        self.parameters.update(kwargs)
-        self._setup()
-        
-        try:
-            emails = set()  # 使用集合确保唯一性
-            while len(emails) < count:
-                email = self.generate()
-                emails.add(email)
-                
-                # 防止无限循环
-                if len(emails) > count * 10:  # 如果尝试次数过多，停止
-                    break
-            
-            return list(emails)[:count]
-        finally:
-            # 恢复原始参数
-            self.parameters = original_params
-            self._setup()
+    def generate_batch(
+        self,
+        count: int,
+        context: Optional[GenerationContext] = None,
+        workers: int = 1,
+        executor: str = "thread",
+        seed: Optional[int] = None,
+        **kwargs,
+    ) -> list[str]:
+        """
+        批量生成邮箱地址，由 _compose_batch 整批组装，不逐条生成
+
+        默认按生成顺序去重，并以新的候选补齐缺口，最多尝试 count * 10 个候选（候选不足时返回的数量可能少于 count）；
+        unique=False 时跳过去重直接返回组装结果，速度更快但可能重复。
+        kwargs 为仅对本次调用生效的参数覆盖（unique 除外），不修改实例状态，可并发调用。
+        workers/executor/seed 含义同 DataGenerator.generate_batch。设置了 pool_size 时默认不去重，
+        没有参数覆盖时从取值池中采样。
+
+        Raises:
+            ValueError: 同时要求不重复并设置了 pool_size
+        """
+        unique = kwargs.pop("unique", not self.config.pool_size)
+        if unique and self.config.pool_size:
+            raise ValueError("pool_size cannot be combined with unique=True: pooled values repeat by design")
+        if self.value_pool is not None and not kwargs:
+            return super().generate_batch(count, context, workers=workers, executor=executor, seed=seed)
+        plan = self._plan_with_overrides(kwargs)
+
+        def produce(rows: int) -> list[str]:
+            return self._validated_batch(self._compose_batch(plan, rows))
+
+        if not unique:
+            return self._run_batch(produce, count, workers=workers, executor=executor, seed=seed)
+        # 防止无限循环：最多尝试 count * 10 次
+        return self._run_unique_batch(
+            produce,
+            count,
+            max_attempts=count * 10,
+            workers=workers,
+            executor=executor,
+            seed=seed,
+        )
+
+    def generate_for_names(self, names: Iterable[str], seed: Optional[int] = None, **kwargs) -> list[str]:
+        """
+        为一列中文姓名逐个生成拼音邮箱地址（不去重）
+
+        整列一次转写和组装。用户名风格不是拼音风格时按 "pinyin" 生成；
+        kwargs 为仅对本次调用生效的参数覆盖。
+        """
+        plan = self._plan_with_overrides(kwargs)
+        if plan.username_style not in self.PINYIN_PATTERNS:
+            plan = dataclasses.replace(plan, username_style="pinyin")
+        names = list(names)
+        if seed is None:
+            return self._validated_batch(self._compose_batch(plan, len(names), names))
+        with self._using_rng(random.Random(seed)):
+            return self._validated_batch(self._compose_batch(plan, len(names), names))
 
     def generate_corporate_emails(self, company_domain: str, departments: list[str] = None) -> list[str]:
         """为企业生成邮箱地址"""
@@ -257,26 +543,11 @@ class EmailGenerator(ValidatedDataGenerator):
         
         emails = []
         for dept in departments:
-            # 设置企业邮箱参数
-            original_params = self.parameters.copy()
-            self.parameters.update({
-                "custom_domain": company_domain,
-                "username_style": "business"
-            })
-            self._setup()
+            # 生成部门邮箱
+            emails.append(f"{dept}@{company_domain}")
             
-            try:
-                # 生成部门邮箱
-                email = f"{dept}@{company_domain}"
-                emails.append(email)
-                
-                # 生成变体
-                if random.random() < 0.5:
-                    variant = f"{dept}.service@{company_domain}"
-                    emails.append(variant)
-                    
-            finally:
-                self.parameters = original_params
-                self._setup()
+            # 生成变体
+            if self.rng.random() < 0.5:
+                emails.append(f"{dept}.service@{company_domain}")
         
         return emails
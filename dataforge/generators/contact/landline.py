@@ -0,0 +1,729 @@
+"""
+中国固定电话号码生成器
+支持生成座机、传真、400/800 客服电话和分机号码
+
+区号表按省份和城市索引，每个区号带有本地号码位数（7位或8位）；
+同一行中已生成地址时，座机区号跟随地址所在的城市。
+"""
+
+import functools
+import itertools
+import operator
+import random
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional
+
+from dataforge.core import sampling
+from dataforge.core.factory import register_generator
+from dataforge.core.generator import (
+    GenerationContext,
+    GeneratorType,
+    ValidatedDataGenerator,
+)
+from dataforge.core.preloader import get_table
+
+# (省份, 城市, 区号, 本地号码位数)
+AREA_CODES = (
+    ("北京市", "北京市", "010", 8),
+    ("上海市", "上海市", "021", 8),
+    ("天津市", "天津市", "022", 8),
+    ("重庆市", "重庆市", "023", 8),
+    ("广东省", "广州市", "020", 8),
+    ("广东省", "深圳市", "0755", 8),
+    ("广东省", "珠海市", "0756", 7),
+    ("广东省", "汕头市", "0754", 8),
+    ("广东省", "佛山市", "0757", 8),
+    ("广东省", "韶关市", "0751", 7),
+    ("广东省", "湛江市", "0759", 7),
+    ("广东省", "肇庆市", "0758", 7),
+    ("广东省", "江门市", "0750", 7),
+    ("广东省", "茂名市", "0668", 7),
+    ("广东省", "惠州市", "0752", 7),
+    ("广东省", "梅州市", "0753", 7),
+    ("广东省", "汕尾市", "0660", 7),
+    ("广东省", "河源市", "0762", 7),
+    ("广东省", "阳江市", "0662", 7),
+    ("广东省", "清远市", "0763", 7),
+    ("广东省", "东莞市", "0769", 8),
+    ("广东省", "中山市", "0760", 8),
+    ("广东省", "潮州市", "0768", 7),
+    ("广东省", "揭阳市", "0663", 7),
+    ("广东省", "云浮市", "0766", 7),
+    ("江苏省", "南京市", "025", 8),
+    ("江苏省", "无锡市", "0510", 8),
+    ("江苏省", "徐州市", "0516", 8),
+    ("江苏省", "常州市", "0519", 8),
+    ("江苏省", "苏州市", "0512", 8),
+    ("江苏省", "南通市", "0513", 8),
+    ("江苏省", "连云港市", "0518", 7),
+    ("江苏省", "淮安市", "0517", 7),
+    ("江苏省", "盐城市", "0515", 8),
+    ("江苏省", "扬州市", "0514", 8),
+    ("江苏省", "镇江市", "0511", 8),
+    ("江苏省", "泰州市", "0523", 8),
+    ("江苏省", "宿迁市", "0527", 7),
+    ("浙江省", "杭州市", "0571", 8),
+    ("浙江省", "宁波市", "0574", 8),
+    ("浙江省", "温州市", "0577", 8),
+    ("浙江省", "嘉兴市", "0573", 8),
+    ("浙江省", "湖州市", "0572", 7),
+    ("浙江省", "绍兴市", "0575", 8),
+    ("浙江省", "金华市", "0579", 8),
+    ("浙江省", "衢州市", "0570", 7),
+    ("浙江省", "舟山市", "0580", 7),
+    ("浙江省", "台州市", "0576", 8),
+    ("浙江省", "丽水市", "0578", 7),
+    ("山东省", "济南市", "0531", 8),
+    ("山东省", "青岛市", "0532", 8),
+    ("山东省", "淄博市", "0533", 7),
+    ("山东省", "枣庄市", "0632", 7),
+    ("山东省", "东营市", "0546", 7),
+    ("山东省", "烟台市", "0535", 7),
+    ("山东省", "潍坊市", "0536", 7),
+    ("山东省", "济宁市", "0537", 7),
+    ("山东省", "泰安市", "0538", 7),
+    ("山东省", "威海市", "0631", 7),
+    ("山东省", "日照市", "0633", 7),
+    ("山东省", "临沂市", "0539", 7),
+    ("山东省", "德州市", "0534", 7),
+    ("山东省", "聊城市", "0635", 7),
+    ("山东省", "滨州市", "0543", 7),
+    ("山东省", "菏泽市", "0530", 7),
+    ("河南省", "郑州市", "0371", 8),
+    ("河南省", "开封市", "0378", 7),
+    ("河南省", "洛阳市", "0379", 8),
+    ("河南省", "平顶山市", "0375", 7),
+    ("河南省", "安阳市", "0372", 7),
+    ("河南省", "鹤壁市", "0392", 7),
+    ("河南省", "新乡市", "0373", 7),
+    ("河南省", "焦作市", "0391", 7),
+    ("河南省", "濮阳市", "0393", 7),
+    ("河南省", "许昌市", "0374", 7),
+    ("河南省", "漯河市", "0395", 7),
+    ("河南省", "三门峡市", "0398", 7),
+    ("河南省", "南阳市", "0377", 7),
+    ("河南省", "商丘市", "0370", 7),
+    ("河南省", "信阳市", "0376", 7),
+    ("河南省", "周口市", "0394", 7),
+    ("河南省", "驻马店市", "0396", 7),
+    ("河南省", "济源市", "0391", 7),
+    ("四川省", "成都市", "028", 8),
+    ("四川省", "自贡市", "0813", 7),
+    ("四川省", "攀枝花市", "0812", 7),
+    ("四川省", "泸州市", "0830", 7),
+    ("四川省", "德阳市", "0838", 7),
+    ("四川省", "绵阳市", "0816", 7),
+    ("四川省", "广元市", "0839", 7),
+    ("四川省", "遂宁市", "0825", 7),
+    ("四川省", "内江市", "0832", 7),
+    ("四川省", "乐山市", "0833", 7),
+    ("四川省", "南充市", "0817", 7),
+    ("四川省", "眉山市", "028", 8),
+    ("四川省", "宜宾市", "0831", 7),
+    ("四川省", "广安市", "0826", 7),
+    ("四川省", "达州市", "0818", 7),
+    ("四川省", "雅安市", "0835", 7),
+    ("四川省", "巴中市", "0827", 7),
+    ("四川省", "资阳市", "028", 8),
+    ("湖北省", "武汉市", "027", 8),
+    ("湖北省", "黄石市", "0714", 7),
+    ("湖北省", "十堰市", "0719", 7),
+    ("湖北省", "宜昌市", "0717", 7),
+    ("湖北省", "襄阳市", "0710", 7),
+    ("湖北省", "鄂州市", "0711", 7),
+    ("湖北省", "荆门市", "0724", 7),
+    ("湖北省", "孝感市", "0712", 7),
+    ("湖北省", "荆州市", "0716", 7),
+    ("湖北省", "黄冈市", "0713", 7),
+    ("湖北省", "咸宁市", "0715", 7),
+    ("湖北省", "随州市", "0722", 7),
+    ("湖南省", "长沙市", "0731", 8),
+    ("湖南省", "株洲市", "0731", 8),
+    ("湖南省", "湘潭市", "0731", 8),
+    ("湖南省", "衡阳市", "0734", 7),
+    ("湖南省", "邵阳市", "0739", 7),
+    ("湖南省", "岳阳市", "0730", 7),
+    ("湖南省", "常德市", "0736", 7),
+    ("湖南省", "张家界市", "0744", 7),
+    ("湖南省", "益阳市", "0737", 7),
+    ("湖南省", "郴州市", "0735", 7),
+    ("湖南省", "永州市", "0746", 7),
+    ("湖南省", "怀化市", "0745", 7),
+    ("湖南省", "娄底市", "0738", 7),
+)
+
+# 本地号码首位：0 为长途前缀，1 为特服号码，9 多用于全国统一服务号码
+LOCAL_LEADING_DIGITS = "2345678"
+
+DIGITS = "0123456789"
+
+ADDRESS_KEYS = ("address", "地址", "住址", "通讯地址")
+
+
+def _short_name(name: str) -> str:
+    """去掉行政区划后缀的简称，如 杭州市 -> 杭州"""
+    return name[:-1] if len(name) > 2 and name[-1] in "省市" else name
+
+
+def build_area_code_table() -> dict[str, Any]:
+    """构建区号表（供预加载器缓存）"""
+    provinces: dict[str, dict[tuple[str, int], None]] = {}
+    cities: dict[str, tuple[tuple[str, int], ...]] = {}
+    for province, city, code, length in AREA_CODES:
+        provinces.setdefault(province, {})[code, length] = None
+        cities[city] = ((code, length),)
+    return {
+        # 省份 -> 省内各城市的 (区号, 本地号码位数)，共用区号的城市只计一次
+        "provinces": {province: tuple(codes) for province, codes in provinces.items()},
+        # 城市 -> ((区号, 本地号码位数),)
+        "cities": cities,
+        # 区号 -> 本地号码位数
+        "lengths": {code: length for _, _, code, length in AREA_CODES},
+    }
+
+
+@dataclass(frozen=True)
+class AreaCodeIndex:
+    """地址 -> 区号的查找表"""
+
+    # 省份、城市全称 -> 候选 (区号, 本地号码位数)；直辖市的区与直辖市相同
+    provinces: Dict[str, tuple[tuple[str, int], ...]]
+    cities: Dict[str, tuple[tuple[str, int], ...]]
+    # 省份、城市名的各种长度，从长到短
+    province_widths: tuple[int, ...]
+    city_widths: tuple[int, ...]
+
+    def candidates_for(self, address: str) -> Optional[tuple[tuple[str, int], ...]]:
+        """
+        地址所在城市的区号；只识别出省份时为省内各城市的区号，都无法识别时返回None
+
+        地址以省份全称（可省略）和城市全称开头，如 浙江省杭州市… 或 杭州市…。
+        """
+        province = None
+        for width in self.province_widths:
+            province = self.provinces.get(address[:width])
+            if province is not None:
+                address = address[width:]
+                break
+        for width in self.city_widths:
+            city = self.cities.get(address[:width])
+            if city is not None:
+                return city
+        return province
+
+
+@functools.lru_cache(maxsize=None)
+def _area_code_index() -> AreaCodeIndex:
+    """构建地址查找表：城市取自区号表，直辖市的区取自地址生成器的地区表"""
+    table = get_table("landline.area_codes")
+    cities = dict(table["cities"])
+    for province, district, _ in get_table("address.regions")["cities"]:
+        if province in cities:
+            cities.setdefault(district, cities[province])
+    return AreaCodeIndex(
+        table["provinces"],
+        cities,
+        tuple(sorted(set(map(len, table["provinces"])), reverse=True)),
+        tuple(sorted(set(map(len, cities)), reverse=True)),
+    )
+
+
+def _digit_trie(codes: Iterable[str]) -> str:
+    """把一组数字串编译为按前缀共享的正则（如 0571|0574 -> 57[14]），比逐个列出的分支匹配快"""
+    groups: dict[str, list[str]] = {}
+    for code in codes:
+        groups.setdefault(code[:1], []).append(code[1:])
+    leaves = sorted(head for head, tails in groups.items() if tails == [""])
+    branches = [
+        head + (f"(?:{_digit_trie(filter(None, tails))})?" if "" in tails else _digit_trie(tails))
+        for head, tails in sorted(groups.items())
+        if tails != [""]
+    ]
+    if leaves:
+        branches.append(leaves[0] if len(leaves) == 1 else f"[{''.join(leaves)}]")
+    return branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+
+
+@functools.lru_cache(maxsize=None)
+def _landline_pattern() -> re.Pattern:
+    """与 LandlineGenerator.validate 等价的整体匹配：区号取自区号表，本地号码位数与区号对应"""
+    by_length: dict[int, list[str]] = {}
+    for code, length in get_table("landline.area_codes")["lengths"].items():
+        by_length.setdefault(length, []).append(code[1:])
+    alternatives = []
+    for length, codes in sorted(by_length.items()):
+        trunk = _digit_trie(codes)
+        alternatives.append(
+            rf"(?:0{trunk}[- ]?|\(0{trunk}\)|\+86-{trunk}-)[{LOCAL_LEADING_DIGITS}]\d{{{length - 1}}}"
+        )
+    return re.compile("|".join(alternatives))
+
+
+def _area_prefix(code: str, format_type: str) -> str:
+    """按格式排版区号部分（含与本地号码之间的分隔符）"""
+    if format_type == "plain":
+        return code
+    if format_type == "space":
+        return code + " "
+    if format_type == "parentheses":
+        return f"({code})"
+    if format_type == "international":
+        return f"+86-{code[1:]}-"
+    return code + "-"  # dash
+
+
+@dataclass(frozen=True)
+class LandlinePlan:
+    """座机号码生成计划"""
+
+    province: Optional[str]
+    city: Optional[str]
+    area_code: Optional[str]
+    format_type: str
+    follow_address: bool
+    address_field: Optional[str]
+    # 未跟随地址时的候选 (区号, 本地号码位数) 及其概率：省份均匀，省内城市均匀
+    candidates: tuple[tuple[str, int], ...]
+    candidate_weights: tuple[float, ...]
+    # 区号 -> 排版后的区号部分
+    prefixes: Dict[str, str]
+
+    @property
+    def follows_address(self) -> bool:
+        """未指定地区时区号跟随地址"""
+        return self.follow_address and not (self.area_code or self.city or self.province)
+
+
+@register_generator("landline", ["座机", "固话", "座机号码", "固定电话"])
+class LandlineGenerator(ValidatedDataGenerator):
+    """中国座机号码生成器"""
+
+    @property
+    def generator_type(self) -> GeneratorType:
+        return GeneratorType.CONTACT
+
+    @property
+    def supported_parameters(self) -> list[str]:
+        return ["province", "city", "area_code", "format_type", "follow_address", "address_field"]
+
+    @property
+    def uses_context(self) -> bool:
+        """未指定地区时，区号跟随同一行已生成的地址"""
+        return self._plan.follows_address
+
+    def _setup(self) -> None:
+        """配置生成器参数"""
+        self._plan = self._plan_for(self.parameters)
+        self.province = self._plan.province
+        self.city = self._plan.city
+        self.area_code = self._plan.area_code
+        self.format_type = self._plan.format_type
+
+    def _build_plan(self, parameters: dict[str, Any]) -> LandlinePlan:
+        """编译座机号码生成计划"""
+        table = get_table("landline.area_codes")
+        format_type = parameters.get("format_type", "dash")  # dash, plain, space, parentheses, international
+        province = parameters.get("province", None)
+        city = parameters.get("city", None)
+        area_code = parameters.get("area_code", None)
+
+        if area_code:
+            area_code = str(area_code).strip()
+            if not area_code.startswith("0"):
+                area_code = "0" + area_code
+            if area_code not in table["lengths"]:
+                raise ValueError(f"Unknown area code: {area_code}")
+            candidates, weights = [(area_code, table["lengths"][area_code])], [1.0]
+        else:
+            # 城市、省份可以用全称或简称；未知时忽略
+            names = {name: name for name in itertools.chain(table["provinces"], table["cities"])}
+            names.update((_short_name(name), name) for name in list(names))
+            city_codes = table["cities"].get(names.get(city, ""))
+            provinces = [names[province]] if names.get(province) in table["provinces"] else list(table["provinces"])
+            if city_codes:
+                candidates, weights = list(city_codes), [1.0]
+            else:
+                candidates, weights = [], []
+                for name in provinces:
+                    codes = table["provinces"][name]
+                    candidates.extend(codes)
+                    weights.extend([1.0 / len(provinces) / len(codes)] * len(codes))
+
+        return LandlinePlan(
+            province=province,
+            city=city,
+            area_code=area_code,
+            format_type=format_type,
+            follow_address=parameters.get("follow_address", True),
+            address_field=parameters.get("address_field", None),
+            candidates=tuple(candidates),
+            candidate_weights=tuple(weights),
+            prefixes={code: _area_prefix(code, format_type) for code in table["lengths"]},
+        )
+
+    def _context_address(self, plan: LandlinePlan, context: Optional[GenerationContext]) -> Optional[str]:
+        """从行上下文中取出本行已生成的地址"""
+        if context is None or not context.related_data:
+            return None
+        for key in (plan.address_field,) if plan.address_field else ADDRESS_KEYS:
+            value = context.related_data.get(key)
+            if isinstance(value, str) and value:
+                return value
+        return None
+
+    def _compose(self, plan: LandlinePlan, address: Optional[str] = None) -> str:
+        """逐条组装一个座机号码；给出地址时区号取该地址所在城市的区号"""
+        candidates = _area_code_index().candidates_for(address) if address else None
+        if candidates:
+            code, length = self.rng.choice(candidates)
+        else:
+            code, length = self.rng.choices(plan.candidates, plan.candidate_weights)[0]
+        # 首位在 2~8 之间
+        local = self.rng.randrange(2 * 10 ** (length - 1), 9 * 10 ** (length - 1))
+        return f"{plan.prefixes[code]}{local}"
+
+    def _compose_batch(self, plan: LandlinePlan, count: int, addresses: Optional[list[str]] = None) -> list[str]:
+        """
+        整列组装座机号码
+
+        区号按查表采样（给出地址时逐行取地址所在城市的候选区号，用随机16位整数在候选中均匀选取），
+        本地号码的首位查表、其余位由 random_strings 按各行位数一次生成。
+        """
+        rng = self.rng
+        picks = sampling.sample(rng, sampling.lane_table(plan.candidates, plan.candidate_weights), count)
+        if addresses is not None:
+            index = _area_code_index()
+            located = list(map(index.candidates_for, addresses))
+            lanes = sampling.draw_lanes(rng, count)
+            rows = range(count)
+            for row in itertools.compress(rows, located):
+                choices = located[row]
+                picks[row] = choices[lanes[row] * len(choices) >> sampling.LANE_BITS]
+
+        codes = map(operator.itemgetter(0), picks)
+        lengths = [length - 1 for _, length in picks]
+        heads = map(operator.add, map(plan.prefixes.__getitem__, codes), sampling.sample(
+            rng, sampling.lane_table(LOCAL_LEADING_DIGITS), count
+        ))
+        return list(map(operator.add, heads, sampling.random_strings(rng, DIGITS, lengths)))
+
+    def _validated_batch(self, numbers: list[str]) -> list[str]:
+        """按配置整批验证，任一无效时抛出 ValueError"""
+        if self.config.validate:
+            invalid = next(itertools.filterfalse(_landline_pattern().fullmatch, numbers), None)
+            if invalid is not None:
+                raise ValueError(f"Generated data failed validation: {invalid}")
+        return numbers
+
+    def _generate_raw(self, context: Optional[GenerationContext] = None) -> str:
+        """生成座机号码"""
+        if self.uses_context:
+            return self._compose(self._plan, self._context_address(self._plan, context))
+        return self._compose(self._plan)
+
+    def generate_batch(
+        self,
+        count: int,
+        context: Optional[GenerationContext] = None,
+        workers: int = 1,
+        executor: str = "thread",
+        seed: Optional[int] = None,
+        **kwargs,
+    ) -> list[str]:
+        """
+        批量生成座机号码
+
+        每个分块由 _compose_batch 整列生成；上下文中有地址时整批区号跟随该地址。
+        设置了取值池时从池中采样。kwargs 为仅对本次调用生效的参数覆盖。
+        其余参数含义同 DataGenerator.generate_batch。
+        """
+        if self.value_pool is not None and not kwargs:
+            return super().generate_batch(count, context, workers=workers, executor=executor, seed=seed)
+        plan = self._plan_with_overrides(kwargs)
+        address = self._context_address(plan, context) if plan.follows_address else None
+        return self._run_batch(
+            lambda rows: self._validated_batch(
+                self._compose_batch(plan, rows, None if address is None else [address] * rows)
+            ),
+            count,
+            workers=workers,
+            executor=executor,
+            seed=seed,
+        )
+
+    def generate_for_addresses(self, addresses: Iterable[str], seed: Optional[int] = None, **kwargs) -> list[str]:
+        """
+        为一列地址逐个生成区号一致的座机号码
+
+        地址无法识别时按参数指定的地区（默认全部地区）生成。kwargs 为仅对本次调用生效的参数覆盖。
+        """
+        plan = self._plan_with_overrides(kwargs)
+        addresses = list(addresses)
+        if seed is None:
+            return self._validated_batch(self._compose_batch(plan, len(addresses), addresses))
+        with self._using_rng(random.Random(seed)):
+            return self._validated_batch(self._compose_batch(plan, len(addresses), addresses))
+
+    def validate(self, data: str) -> bool:
+        """验证座机号码格式：区号已知，本地号码位数与区号对应"""
+        return bool(_landline_pattern().fullmatch(data))
+
+    def get_area_info(self, number: str) -> dict:
+        """获取座机号码的区号和所属地区"""
+        digits = re.sub(r"[\s\-()+]", "", number)
+        if digits.startswith("86"):
+            digits = "0" + digits[2:]
+        if not self.validate(number):
+            return {"valid": False}
+
+        lengths = get_table("landline.area_codes")["lengths"]
+        code = digits[:3] if digits[:3] in lengths else digits[:4]
+        return {
+            "valid": True,
+            "area_code": code,
+            "local_number": digits[len(code):],
+            "cities": [city for _, city, area_code, _ in AREA_CODES if area_code == code],
+        }
+
+
+@register_generator("fax", ["传真", "传真号码"])
+class FaxNumberGenerator(LandlineGenerator):
+    """传真号码生成器（传真号码即座机号码，参数和区号规则相同）"""
+
+
+@dataclass(frozen=True)
+class TollFreePlan:
+    """400/800 号码生成计划"""
+
+    prefix: Optional[str]
+    format_type: str
+    # 排版后的号码头，如 "400-"
+    heads: tuple[str, ...]
+    separator: str
+
+
+@register_generator("toll_free", ["客服电话", "400电话", "免费电话"])
+class TollFreeNumberGenerator(ValidatedDataGenerator):
+    """400/800 客服电话生成器"""
+
+    PREFIXES = ["400", "800"]
+
+    # 与 validate 等价的整体匹配
+    _TOLL_FREE_PATTERN = re.compile(r"(?:400|800)(?:\d{7}|-\d{3}-\d{4}| \d{3} \d{4})")
+
+    @property
+    def generator_type(self) -> GeneratorType:
+        return GeneratorType.CONTACT
+
+    @property
+    def supported_parameters(self) -> list[str]:
+        return ["prefix", "format_type"]
+
+    def _setup(self) -> None:
+        """配置生成器参数"""
+        self._plan = self._plan_for(self.parameters)
+        self.prefix = self._plan.prefix
+        self.format_type = self._plan.format_type
+
+    def _build_plan(self, parameters: dict[str, Any]) -> TollFreePlan:
+        """编译客服电话生成计划"""
+        prefix = parameters.get("prefix", None)  # 400, 800, None（随机）
+        format_type = parameters.get("format_type", "dash")  # dash, plain, space
+        separator = {"plain": "", "space": " "}.get(format_type, "-")
+        prefixes = [str(prefix)] if str(prefix) in self.PREFIXES else self.PREFIXES
+        return TollFreePlan(
+            prefix=prefix,
+            format_type=format_type,
+            heads=tuple(head + separator for head in prefixes),
+            separator=separator,
+        )
+
+    def _compose_batch(self, plan: TollFreePlan, count: int) -> list[str]:
+        """整列组装：号码头查表，7位号码一次生成后按 3+4 位切分"""
+        rng = self.rng
+        heads = sampling.sample(rng, sampling.lane_table(plan.heads), count)
+        digits = sampling.random_strings(rng, DIGITS, [7] * count)
+        if plan.separator:
+            middles = map(operator.getitem, digits, itertools.repeat(slice(0, 3)))
+            tails = map(operator.getitem, digits, itertools.repeat(slice(3, None)))
+            digits = map(operator.add, map(operator.add, middles, itertools.repeat(plan.separator)), tails)
+        return list(map(operator.add, heads, digits))
+
+    def _validated_batch(self, numbers: list[str]) -> list[str]:
+        """按配置整批验证，任一无效时抛出 ValueError"""
+        if self.config.validate:
+            invalid = next(itertools.filterfalse(self._TOLL_FREE_PATTERN.fullmatch, numbers), None)
+            if invalid is not None:
+                raise ValueError(f"Generated data failed validation: {invalid}")
+        return numbers
+
+    def _generate_raw(self, context: Optional[GenerationContext] = None) -> str:
+        """生成客服电话"""
+        plan = self._plan
+        digits = f"{self.rng.randrange(10 ** 7):07d}"
+        return f"{self.rng.choice(plan.heads)}{digits[:3]}{plan.separator}{digits[3:]}"
+
+    def generate_batch(
+        self,
+        count: int,
+        context: Optional[GenerationContext] = None,
+        workers: int = 1,
+        executor: str = "thread",
+        seed: Optional[int] = None,
+        **kwargs,
+    ) -> list[str]:
+        """
+        批量生成客服电话
+
+        每个分块由 _compose_batch 整列生成；设置了取值池时从池中采样。
+        kwargs 为仅对本次调用生效的参数覆盖，其余参数含义同 DataGenerator.generate_batch。
+        """
+        if self.value_pool is not None and not kwargs:
+            return super().generate_batch(count, context, workers=workers, executor=executor, seed=seed)
+        plan = self._plan_with_overrides(kwargs)
+        return self._run_batch(
+            lambda rows: self._validated_batch(self._compose_batch(plan, rows)),
+            count,
+            workers=workers,
+            executor=executor,
+            seed=seed,
+        )
+
+    def validate(self, data: str) -> bool:
+        """验证客服电话格式"""
+        return bool(self._TOLL_FREE_PATTERN.fullmatch(data))
+
+
+@dataclass(frozen=True)
+class ExtensionPlan:
+    """分机号码生成计划"""
+
+    length: int
+    with_number: bool
+    separator: str
+    # 带总机号码时使用的座机号码计划
+    landline: Optional[LandlinePlan]
+
+
+@register_generator("extension", ["分机号", "分机", "分机号码"])
+class ExtensionGenerator(LandlineGenerator):
+    """
+    分机号码生成器
+
+    默认只生成分机号（首位非0）；with_number 为True时在座机号码后接分机号，
+    如 010-12345678-8001，座机部分的参数与 LandlineGenerator 相同。
+    """
+
+    @property
+    def supported_parameters(self) -> list[str]:
+        return super().supported_parameters + ["length", "with_number", "separator"]
+
+    @property
+    def uses_context(self) -> bool:
+        return self._plan.with_number and self._plan.landline.follows_address
+
+    def _setup(self) -> None:
+        """配置生成器参数"""
+        self._plan = self._plan_for(self.parameters)
+        self.length = self._plan.length
+        self.with_number = self._plan.with_number
+        self.separator = self._plan.separator
+
+    def _build_plan(self, parameters: dict[str, Any]) -> ExtensionPlan:
+        """编译分机号码生成计划"""
+        length = int(parameters.get("length", 4))
+        if not 1 <= length <= 6:
+            raise ValueError(f"Extension length must be in 1..6, got {length}")
+        with_number = parameters.get("with_number", False)
+        return ExtensionPlan(
+            length=length,
+            with_number=with_number,
+            separator=parameters.get("separator", "-"),  # -, 转, " ext. "
+            landline=super()._build_plan(parameters) if with_number else None,
+        )
+
+    def _extension(self, plan: ExtensionPlan) -> str:
+        return str(self.rng.randrange(10 ** (plan.length - 1), 10 ** plan.length))
+
+    def _compose_extensions(self, plan: ExtensionPlan, count: int) -> list[str]:
+        """整列生成分机号：首位查表，其余位一次生成"""
+        firsts = sampling.sample(self.rng, sampling.lane_table("123456789"), count)
+        return list(map(operator.add, firsts, sampling.random_strings(self.rng, DIGITS, [plan.length - 1] * count)))
+
+    def _compose_batch(self, plan: ExtensionPlan, count: int, addresses: Optional[list[str]] = None) -> list[str]:
+        """整列组装：带总机号码时座机号码、分隔符和分机号三列拼接"""
+        if not plan.with_number:
+            return self._compose_extensions(plan, count)
+        numbers = super()._compose_batch(plan.landline, count, addresses)
+        numbers = map(operator.add, numbers, itertools.repeat(plan.separator))
+        return list(map(operator.add, numbers, self._compose_extensions(plan, count)))
+
+    def _validated_batch(self, numbers: list[str], plan: Optional[ExtensionPlan] = None) -> list[str]:
+        """按配置整批验证（按本次调用的计划），任一无效时抛出 ValueError"""
+        if self.config.validate:
+            invalid = next(itertools.filterfalse(functools.partial(self._valid, plan or self._plan), numbers), None)
+            if invalid is not None:
+                raise ValueError(f"Generated data failed validation: {invalid}")
+        return numbers
+
+    def _generate_raw(self, context: Optional[GenerationContext] = None) -> str:
+        """生成分机号码"""
+        plan = self._plan
+        if not plan.with_number:
+            return self._extension(plan)
+        address = self._context_address(plan.landline, context) if self.uses_context else None
+        return f"{self._compose(plan.landline, address)}{plan.separator}{self._extension(plan)}"
+
+    def generate_batch(
+        self,
+        count: int,
+        context: Optional[GenerationContext] = None,
+        workers: int = 1,
+        executor: str = "thread",
+        seed: Optional[int] = None,
+        **kwargs,
+    ) -> list[str]:
+        """批量生成分机号码，参数含义同 LandlineGenerator.generate_batch"""
+        if self.value_pool is not None and not kwargs:
+            return super(LandlineGenerator, self).generate_batch(
+                count, context, workers=workers, executor=executor, seed=seed
+            )
+        plan = self._plan_with_overrides(kwargs)
+        address = None
+        if plan.with_number and plan.landline.follows_address:
+            address = self._context_address(plan.landline, context)
+        return self._run_batch(
+            lambda rows: self._validated_batch(
+                self._compose_batch(plan, rows, None if address is None else [address] * rows), plan
+            ),
+            count,
+            workers=workers,
+            executor=executor,
+            seed=seed,
+        )
+
+    def generate_for_addresses(self, addresses: Iterable[str], seed: Optional[int] = None, **kwargs) -> list[str]:
+        """为一列地址逐个生成带总机号码的分机号码，总机区号与地址一致"""
+        plan = self._plan_with_overrides({"with_number": True, **kwargs})
+        addresses = list(addresses)
+        if seed is None:
+            return self._validated_batch(self._compose_batch(plan, len(addresses), addresses), plan)
+        with self._using_rng(random.Random(seed)):
+            return self._validated_batch(self._compose_batch(plan, len(addresses), addresses), plan)
+
+    def validate(self, data: str) -> bool:
+        """验证分机号码：纯数字分机号，或座机号码 + 分隔符 + 分机号"""
+        return self._valid(self._plan, data)
+
+    def _valid(self, plan: ExtensionPlan, data: str) -> bool:
+        if not plan.with_number:
+            return data.isdigit() and len(data) == plan.length and data[0] != "0"
+        number, separator, extension = data.rpartition(plan.separator)
+        return (
+            bool(separator)
+            and extension.isdigit()
+            and len(extension) == plan.length
+            and extension[0] != "0"
+            and bool(_landline_pattern().fullmatch(number))
+        )
@@ -3,8 +3,7 @@
 支持生成符合中国三大运营商号段规则的手机号码
 """
 
-import random
-from typing import Optional
+from typing import Callable, Optional
 
 from dataforge.core.factory import register_generator
 from dataforge.core.generator import (
@@ -60,6 +59,20 @@ class ChinesePhoneGenerator(ValidatedDataGenerator):
         self.format_type = self.parameters.get("format_type", "plain")  # plain, dash, space, international
         self.include_country_code = self.parameters.get("include_country_code", False)
 
+        # 号段和格式只取决于参数，在此一次性解析
+        self._prefixes = self._filter_by_generation(self._get_carrier_prefixes())
+        if not self._prefixes:
+            # 如果过滤后没有可用号段，使用默认号段
+            self._prefixes = ["138", "139", "186", "188"]
+        self._formatter = self._number_formatter()
+
+    @property
+    def fixed_width(self) -> Optional[int]:
+        """无格式且不带国家代码时输出固定为11位数字"""
+        if self.format_type == "plain" and not self.include_country_code:
+            return 11
+        return None
+
     def _get_carrier_prefixes(self) -> list[str]:
         """根据运营商获取号段"""
         if self.carrier == "mobile":
@@ -99,12 +112,12 @@ class ChinesePhoneGenerator(ValidatedDataGenerator):
         """生成8位后缀"""
         # 避免生成全相同数字
         while True:
-            suffix = f"{random.randint(10000000, 99999999)}"
+            suffix = f"{self.rng.randint(10000000, 99999999)}"
             # 检查是否为连续数字或全相同数字
             if not (len(set(suffix)) == 1 or self._is_sequential(suffix)):
                 return suffix
             # 如果生成了不合适的号码，重新生成（但避免无限循环）
-            if random.random() < 0.9:  # 90%的概率接受，避免完全循环
+            if self.rng.random() < 0.9:  # 90%的概率接受，避免完全循环
                 return suffix
 
     def _is_sequential(self, number: str) -> bool:
@@ -114,55 +127,50 @@ class ChinesePhoneGenerator(ValidatedDataGenerator):
                 return False
         return True
 
-    def _format_number(self, number: str) -> str:
-        """格式化手机号码"""
-        if self.include_country_code:
-            number = "+86" + number
-        
+    def _number_formatter(self) -> Callable[[str], str]:
+        """按 format_type 和 include_country_code 选择格式化函数"""
         if self.format_type == "dash":
             # 例：138-1234-5678 或 +86-138-1234-5678
-            if number.startswith("+86"):
-                return f"{number[:3]}-{number[3:6]}-{number[6:10]}-{number[10:]}"
-            else:
-                return f"{number[:3]}-{number[3:7]}-{number[7:]}"
+            if self.include_country_code:
+                return lambda number: f"+86-{number[:3]}-{number[3:7]}-{number[7:]}"
+            return lambda number: f"{number[:3]}-{number[3:7]}-{number[7:]}"
         elif self.format_type == "space":
             # 例：138 1234 5678 或 +86 138 1234 5678
-            if number.startswith("+86"):
-                return f"{number[:3]} {number[3:6]} {number[6:10]} {number[10:]}"
-            else:
-                return f"{number[:3]} {number[3:7]} {number[7:]}"
+            if self.include_country_code:
+                return lambda number: f"+86 {number[:3]} {number[3:7]} {number[7:]}"
+            return lambda number: f"{number[:3]} {number[3:7]} {number[7:]}"
         elif self.format_type == "international":
             # 例：+86 138 1234 5678
-            if not number.startswith("+86"):
-                number = "+86" + number
-            return f"{number[:3]} {number[3:6]} {number[6:10]} {number[10:]}"
+            return lambda number: f"+86 {number[:3]} {number[3:7]} {number[7:]}"
+        elif self.include_country_code:
+            return lambda number: "+86" + number
         else:
             # 默认无格式：13812345678
-            return number
+            return lambda number: number
+
+    def _format_number(self, number: str) -> str:
+        """格式化手机号码"""
+        return self._formatter(number)
 
     def _generate_raw(self, context: Optional[GenerationContext] = None) -> str:
         """生成手机号码"""
-        # 获取可用号段
-        prefixes = self._get_carrier_prefixes()
-        
-        # 根据制式过滤
-        prefixes = self._filter_by_generation(prefixes)
-        
-        if not prefixes:
-            # 如果过滤后没有可用号段，使用默认号段
-            prefixes = ["138", "139", "186", "188"]
-        
-        # 选择前缀
-        prefix = random.choice(prefixes)
-        
-        # 生成后缀
-        suffix = self._generate_suffix()
-        
-        # 组合完整号码
-        full_number = prefix + suffix
-        
-        # 格式化
-        return self._format_number(full_number)
+        # 选择前缀，生成后缀并格式化
+        return self._formatter(self.rng.choice(self._prefixes) + self._generate_suffix())
+
+    def _specialize(self) -> Callable[[Optional[GenerationContext]], str]:
+        """号段和格式函数绑定为局部变量的单条生成函数"""
+        if self.config.pool_size:
+            return super()._specialize()
+
+        prefixes = self._prefixes
+        formatter = self._formatter
+        generate_suffix = self._generate_suffix
+        validated = self._validated
+
+        def generate(context: Optional[GenerationContext] = None) -> str:
+            return validated(formatter(self.rng.choice(prefixes) + generate_suffix()))
+
+        return generate
 
     def validate(self, data: str) -> bool:
         """验证手机号码格式"""
@@ -0,0 +1,26 @@
+"""
+Date and Time Generators
+
+This module contains generators for date and time data:
+- Timestamps and datetimes in several formats and precisions
+- Dates, durations and datetime ranges
+- Exchange trading days
+"""
+
+# Import all datetime generators to ensure registration
+try:
+    from .timestamp import (
+        GenericTimestampGenerator,
+        GenericEnhancedTimestampGenerator,
+        GenericAdvancedTimestampGenerator,
+        GenericDateGenerator,
+        GenericDurationGenerator,
+        GenericAdvancedDateTimeRangeGenerator,
+    )
+except ImportError:
+    pass
+
+try:
+    from .trading_calendar import GenericTradingCalendarGenerator
+except ImportError:
+    pass
@@ -0,0 +1,487 @@
+"""
+Epoch 时间运算与格式化
+
+时间在生成过程中始终是整数 epoch（秒、毫秒、微秒或纳秒），格式化时不逐行调用 strftime：
+格式串按指令拆分为“日期段”“时刻段”和“小数段”，日期段预先为范围内的每一天格式化一次，
+时刻段为一天中的每一秒格式化一次，整列格式化只需整除/取余、查表和拼接。
+
+时区的 UTC 偏移按 UTC 日预先查表（见 UTCOffsets），夏令时等偏移切换按切换时刻精确处理，
+偏移不变的范围（如 2020 年以后的 Asia/Shanghai）仍按固定偏移整列平移。
+"""
+
+import bisect
+import functools
+import itertools
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from typing import Any, Optional, Sequence, Union
+
+SECONDS_PER_DAY = 86400
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# 精度名称 -> 每秒的单位数
+UNITS = {"seconds": 1, "milliseconds": 10 ** 3, "microseconds": 10 ** 6, "nanoseconds": 10 ** 9}
+
+# 预设格式；%f 输出与精度相同位数的小数
+DATETIME_FORMATS = {
+    "ISO": "%Y-%m-%dT%H:%M:%S",
+    "SQL": "%Y-%m-%d %H:%M:%S",
+    "CN": "%Y年%m月%d日 %H时%M分%S秒",
+    "US": "%m/%d/%Y %I:%M:%S %p",
+    "COMPACT": "%Y%m%d%H%M%S",
+}
+DATE_FORMATS = {
+    "ISO": "%Y-%m-%d",
+    "CN": "%Y年%m月%d日",
+    "COMPACT": "%Y%m%d",
+    "SLASH": "%Y/%m/%d",
+    "US": "%m/%d/%Y",
+}
+
+# 解析时尝试的格式（ISO 格式由 datetime.fromisoformat 处理）
+_PARSE_FORMATS = (
+    ("%Y年%m月%d日 %H时%M分%S秒", False),
+    ("%Y年%m月%d日 %H:%M:%S", False),
+    ("%Y年%m月%d日", True),
+    ("%Y/%m/%d %H:%M:%S", False),
+    ("%Y/%m/%d", True),
+    ("%m/%d/%Y %I:%M:%S %p", False),
+    ("%m/%d/%Y", True),
+    ("%Y%m%d%H%M%S", False),
+    ("%Y%m%d", True),
+)
+
+_DAY_DIRECTIVES = frozenset("aAwdbBmyYjUWGuVxCgeDFh")
+_TIME_DIRECTIVES = frozenset("HIpMSXRTr")
+_DIRECTIVE = re.compile(r"%(?::z|.)")
+_OFFSET = re.compile(r"(?:UTC|GMT)?([+-])(\d{1,2})(?::?(\d{2}))?")
+
+# 系统缺少时区数据库时使用的固定偏移
+_FALLBACK_ZONES = {"Asia/Shanghai": 8, "Asia/Chongqing": 8, "Asia/Hong_Kong": 8, "Asia/Taipei": 8, "PRC": 8}
+
+# 有序列的取值：None、"sorted"（有序）或 "monotonic"（严格递增）
+ORDERS = (None, "sorted", "monotonic")
+
+_UTC_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def upper_choice(value: Any, default: str) -> str:
+    """取值类参数（如 format）的大写形式，未指定时为 default"""
+    return str(value).upper() if value else default
+
+
+def resolve_order(parameters: dict[str, Any]) -> Optional[str]:
+    """
+    解析 order 参数
+
+    Raises:
+        ValueError: 取值不是 sorted/monotonic
+    """
+    order = parameters.get("order")
+    order = str(order).lower() if order else None
+    if order not in ORDERS:
+        raise ValueError(f"order must be one of sorted/monotonic, got {order}")
+    return order
+
+
+def resolve_timezone(name: Optional[str]) -> tzinfo:
+    """
+    解析时区：UTC、固定偏移（如 "+08:00"、"UTC+8"）或 IANA 时区名
+
+    Raises:
+        ValueError: 时区未知
+    """
+    if name is None or name.upper() in ("UTC", "Z", "GMT"):
+        return timezone.utc
+    match = _OFFSET.fullmatch(name)
+    if match:
+        sign, hours, minutes = match.groups()
+        offset = timedelta(hours=int(hours), minutes=int(minutes or 0))
+        return timezone(-offset if sign == "-" else offset)
+    try:
+        from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+    except ImportError:
+        ZoneInfo, ZoneInfoNotFoundError = None, LookupError
+    try:
+        if ZoneInfo is None:
+            raise ZoneInfoNotFoundError(name)
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError) as e:
+        if name in _FALLBACK_ZONES:
+            return timezone(timedelta(hours=_FALLBACK_ZONES[name]), name)
+        raise ValueError(f"Unknown timezone: {name}") from e
+
+
+@dataclass(frozen=True)
+class UTCOffsets:
+    """
+    时区在一段时间内的 UTC 偏移（秒）
+
+    daily[i] 为第 first_day + i 个 UTC 日内的偏移，当天有偏移切换时为None；
+    moments 为范围内各次切换的时刻（Unix 秒数），values[k] 为第 k 次切换前（k == len(moments) 时为最后一次切换后）的偏移。
+    范围外按最近的偏移外推。names 为各偏移的时区缩写，供 %Z 使用。
+    """
+
+    first_day: int
+    daily: tuple[Optional[int], ...]
+    moments: tuple[int, ...]
+    values: tuple[int, ...]
+    names: tuple[tuple[int, str], ...]
+
+    @property
+    def fixed(self) -> Optional[int]:
+        """范围内偏移不变时为该偏移，否则为None"""
+        return self.values[0] if len(self.values) == 1 else None
+
+    def offset(self, seconds: int) -> int:
+        """Unix 秒数所在时刻的偏移：按 UTC 日查表，切换当天按切换时刻二分查找"""
+        index = seconds // SECONDS_PER_DAY - self.first_day
+        daily = self.daily[index] if 0 <= index < len(self.daily) else None
+        return self.values[bisect.bisect_right(self.moments, seconds)] if daily is None else daily
+
+    def offsets(self, seconds: Sequence[int]) -> list[int]:
+        """整列取偏移"""
+        fixed = self.fixed
+        if fixed is not None:
+            return [fixed] * len(seconds)
+        offset = self.offset
+        return [offset(value) for value in seconds]
+
+    def local_day(self, seconds: int) -> int:
+        """Unix 秒数在本地时间的 epoch 天数"""
+        return (seconds + self.offset(seconds)) // SECONDS_PER_DAY
+
+    def local_to_epoch(self, local_seconds: int) -> int:
+        """
+        本地时间（以墙上时间的 Unix 秒数表示）对应的 Unix 秒数
+
+        与 datetime 的 fold=0 相同：重复的时刻取较早的一个，夏令时跳过的时刻按切换前的偏移换算。
+        """
+        before = self.offset(local_seconds - SECONDS_PER_DAY)
+        after = self.offset(local_seconds + SECONDS_PER_DAY)
+        for offset in (before, after):
+            if self.offset(local_seconds - offset) == offset:
+                return local_seconds - offset
+        return local_seconds - before
+
+
+def fixed_offsets(utc_offset: int, zone_name: str = "") -> UTCOffsets:
+    """固定偏移的 UTCOffsets"""
+    return UTCOffsets(0, (), (), (utc_offset,), ((utc_offset, zone_name),))
+
+
+@functools.lru_cache(maxsize=64)
+def utc_offsets(zone: tzinfo, first_day: int, last_day: int) -> UTCOffsets:
+    """
+    时区在 [first_day, last_day] 各 UTC 日（epoch 天数）的偏移表
+
+    每天零点（UTC）取一次偏移，前后两天不同时在当天内二分查找切换时刻（假定一天内至多切换一次）。
+    """
+    def at(seconds: int) -> datetime:
+        return (_UTC_EPOCH + timedelta(seconds=seconds)).astimezone(zone)
+
+    def seconds_offset(moment: datetime) -> int:
+        return int(moment.utcoffset().total_seconds())
+
+    starts = [at(day * SECONDS_PER_DAY) for day in range(first_day, last_day + 2)]
+    offsets = [seconds_offset(moment) for moment in starts]
+    names = {}
+    for moment, offset in zip(starts, offsets):
+        names.setdefault(offset, moment.tzname() or str(zone))
+    if len(names) == 1:
+        return fixed_offsets(offsets[0], names[offsets[0]])
+
+    daily: list[Optional[int]] = []
+    moments, values = [], [offsets[0]]
+    for day, (offset, following) in enumerate(zip(offsets, offsets[1:]), first_day):
+        if offset == following:
+            daily.append(offset)
+            continue
+        low, high = day * SECONDS_PER_DAY, (day + 1) * SECONDS_PER_DAY
+        while low < high:
+            middle = (low + high) // 2
+            if seconds_offset(at(middle)) == offset:
+                low = middle + 1
+            else:
+                high = middle
+        daily.append(None)
+        moments.append(low)
+        values.append(following)
+    return UTCOffsets(first_day, tuple(daily), tuple(moments), tuple(values), tuple(names.items()))
+
+
+def format_offset(seconds: int, colon: bool = True) -> str:
+    """UTC 偏移的文本形式，如 +08:00"""
+    sign = "-" if seconds < 0 else "+"
+    hours, minutes = divmod(abs(seconds) // 60, 60)
+    return f"{sign}{hours:02d}:{minutes:02d}" if colon else f"{sign}{hours:02d}{minutes:02d}"
+
+
+def parse_datetime(value: Any) -> tuple[datetime, bool]:
+    """
+    解析时间，返回 (datetime, 是否只有日期)
+
+    支持 datetime/date、整数（秒级 Unix 时间戳）、ISO 字符串、中文格式和常见的斜杠/紧凑格式。
+    无时区的结果表示所在时区的本地时间。
+
+    Raises:
+        ValueError: 无法解析
+    """
+    if isinstance(value, datetime):
+        return value, False
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day), True
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return datetime.fromtimestamp(value, timezone.utc), False
+    if not isinstance(value, str):
+        raise ValueError(f"Cannot parse datetime: {value!r}")
+    text = value.strip()
+    if text.isdigit() and len(text) not in (8, 14):
+        return datetime.fromtimestamp(int(text), timezone.utc), False
+    try:
+        return datetime.fromisoformat(text), len(text) in (8, 10)
+    except ValueError:
+        pass
+    for pattern, date_only in _PARSE_FORMATS:
+        try:
+            return datetime.strptime(text, pattern), date_only
+        except ValueError:
+            continue
+    raise ValueError(f"Cannot parse datetime: {value!r}")
+
+
+def epoch_seconds(moment: datetime, offsets: UTCOffsets) -> int:
+    """datetime 对应的 Unix 秒数；无时区时按 offsets 所在时区的本地时间计算（舍去小数秒）"""
+    if moment.tzinfo is not None and moment.utcoffset() is not None:
+        return int(moment.timestamp() // 1)
+    days = moment.toordinal() - EPOCH_ORDINAL
+    return offsets.local_to_epoch(days * SECONDS_PER_DAY + moment.hour * 3600 + moment.minute * 60 + moment.second)
+
+
+def local_day(seconds: int, utc_offset: int) -> int:
+    """Unix 秒数在本地时间（固定偏移）的 epoch 天数"""
+    return (seconds + utc_offset) // SECONDS_PER_DAY
+
+
+def day_to_date(day: int) -> date:
+    return date.fromordinal(EPOCH_ORDINAL + day)
+
+
+def date_to_day(value: date) -> int:
+    return value.toordinal() - EPOCH_ORDINAL
+
+
+@functools.lru_cache(maxsize=64)
+def _day_table(pattern: str, first_day: int, last_day: int) -> tuple[str, ...]:
+    """[first_day, last_day] 每一天按 pattern（只含日期指令）格式化的结果"""
+    return tuple(day_to_date(day).strftime(pattern) for day in range(first_day, last_day + 1))
+
+
+@functools.lru_cache(maxsize=16)
+def _second_table(pattern: str) -> tuple[str, ...]:
+    """一天中每一秒按 pattern（只含时刻指令）格式化的结果"""
+    return tuple(
+        time(hour, minute, second).strftime(pattern)
+        for hour in range(24)
+        for minute in range(60)
+        for second in range(60)
+    )
+
+
+def _fraction_renderer(pieces: Sequence[str], digits: int) -> Any:
+    """小数段（%f 与字面文本）的 str.format 模板的 format 方法"""
+    template = "".join(
+        "{0:0%dd}" % digits if piece == "%f" else piece.replace("{", "{{").replace("}", "}}") for piece in pieces
+    )
+    return template.format
+
+
+@dataclass(frozen=True)
+class EpochFormatter:
+    """
+    整数 epoch 的格式化器
+
+    segments 中每段为 (类别, 查表)：类别为 "day" 时以本地日期相对 first_day 的天数查表，
+    "second" 时以一天中的秒数查表，"fraction" 时以秒以下的单位数查表（查表为None时按模板格式化），
+    "offset" 时以 UTC 偏移查表（偏移在范围内变化时的 %z/%Z）。
+    """
+
+    unit: int
+    first_day: int
+    last_day: int
+    offsets: UTCOffsets
+    segments: tuple[tuple[str, Any], ...]
+
+    @property
+    def utc_offset(self) -> Optional[int]:
+        """固定的 UTC 偏移，范围内偏移变化时为None"""
+        return self.offsets.fixed
+
+    def _local(self, value: int) -> tuple[int, int]:
+        """(相对 first_day 零点的本地时间, UTC 偏移)"""
+        offset = self.offsets.offset(value // self.unit)
+        return value + (offset - self.first_day * SECONDS_PER_DAY) * self.unit, offset
+
+    def covers(self, value: int) -> bool:
+        """value 的本地日期是否在查表范围内"""
+        local, _ = self._local(value)
+        return 0 <= local // self.unit < (self.last_day - self.first_day + 1) * SECONDS_PER_DAY
+
+    def format(self, value: int) -> str:
+        """格式化一个 epoch 值"""
+        local, offset = self._local(value)
+        seconds, fraction = divmod(local, self.unit)
+        day, second = divmod(seconds, SECONDS_PER_DAY)
+        keys = {"day": day, "second": second, "fraction": fraction, "offset": offset}
+        return "".join(table(keys[kind]) if callable(table) else table[keys[kind]] for kind, table in self.segments)
+
+    def format_many(self, values: Sequence[int], base: int = 0) -> list[str]:
+        """整列格式化 values（各加上 base），与逐个调用 format 的结果相同"""
+        if not values:
+            return []
+        kinds = {kind for kind, _ in self.segments}
+        unit = self.unit
+        keys = {}
+        fixed = self.offsets.fixed
+        if fixed is not None:
+            shift = (fixed - self.first_day * SECONDS_PER_DAY) * unit + base
+            local = [value + shift for value in values] if shift else values
+        else:
+            epochs = [value + base for value in values] if base else values
+            offsets = self.offsets.offsets([value // unit for value in epochs] if unit != 1 else epochs)
+            shift = -self.first_day * SECONDS_PER_DAY
+            local = [value + (offset + shift) * unit for value, offset in zip(epochs, offsets)]
+            keys["offset"] = offsets
+        if "fraction" in kinds:
+            keys["fraction"] = [value % unit for value in local]
+        seconds = [value // unit for value in local] if unit != 1 else local
+        if "day" in kinds:
+            keys["day"] = [value // SECONDS_PER_DAY for value in seconds]
+        if "second" in kinds:
+            keys["second"] = [value % SECONDS_PER_DAY for value in seconds]
+
+        texts = [""] * len(values)
+        for kind, table in self.segments:
+            render = table if callable(table) else table.__getitem__
+            texts = [text + render(key) for text, key in zip(texts, keys[kind])]
+        return texts
+
+
+def _segment_kind(directive: str) -> Optional[str]:
+    letter = directive[-1]
+    if letter in _DAY_DIRECTIVES:
+        return "day"
+    if letter in _TIME_DIRECTIVES:
+        return "second"
+    if letter == "f":
+        return "fraction"
+    if letter in "zZ":
+        return "offset"
+    return None
+
+
+def _offset_text(directive: str, utc_offset: int, zone_name: str) -> str:
+    """%z/%:z/%Z 的文本"""
+    if directive == "%Z":
+        return zone_name or ("UTC" if utc_offset == 0 else format_offset(utc_offset))
+    return format_offset(utc_offset, colon=directive == "%:z")
+
+
+def build_formatter(
+    pattern: str,
+    unit: int,
+    first_day: int,
+    last_day: int,
+    utc_offset: Union[int, UTCOffsets],
+    zone_name: str = "",
+) -> EpochFormatter:
+    """
+    编译 strftime 风格的格式串
+
+    utc_offset 为固定偏移（秒，zone_name 为其 %Z 文本）或 UTCOffsets。偏移固定时 %z/%:z/%Z 替换为常量，
+    否则按偏移查表；%f 输出与精度相同位数的小数（秒级精度时为空）。
+    相邻的同类指令及其间的字面文本合并为一段，每段一张查表。
+
+    Raises:
+        ValueError: 格式串含不支持的指令（如 %c）
+    """
+    offsets = utc_offset if isinstance(utc_offset, UTCOffsets) else fixed_offsets(utc_offset, zone_name)
+    digits = len(str(unit)) - 1
+    constants = {"%%": "%"}
+    if offsets.fixed is not None:
+        fixed_name = offsets.names[0][1]
+        for directive in ("%z", "%:z", "%Z"):
+            constants[directive] = _offset_text(directive, offsets.fixed, fixed_name)
+
+    segments: list[list[Any]] = []  # [类别, 片段列表]
+    pending = ""
+    position = 0
+    for match in itertools.chain(_DIRECTIVE.finditer(pattern), [None]):
+        literal = pattern[position:match.start() if match else len(pattern)]
+        pending += literal
+        if match is None:
+            break
+        position = match.end()
+        directive = match.group()
+        if directive in constants:
+            pending += constants[directive]
+            continue
+        kind = _segment_kind(directive)
+        if kind is None:
+            raise ValueError(f"Unsupported format directive: {directive}")
+        if kind == "fraction" and not digits:
+            continue
+        if segments and segments[-1][0] == kind:
+            segments[-1][1].extend([pending, directive])
+        else:
+            segments.append([kind, [pending, directive]])
+        pending = ""
+    if not segments:
+        segments.append(["day", []])
+    segments[-1][1].append(pending)
+
+    compiled = []
+    for kind, pieces in segments:
+        pieces = [piece for piece in pieces if piece]
+        if kind == "fraction":
+            render = _fraction_renderer(pieces, digits)
+            compiled.append((kind, tuple(map(render, range(unit))) if unit <= 1000 else render))
+            continue
+        if kind == "offset":
+            table = {
+                offset: "".join(
+                    _offset_text(piece, offset, name) if _DIRECTIVE.fullmatch(piece) else piece for piece in pieces
+                )
+                for offset, name in offsets.names
+            }
+            compiled.append((kind, table))
+            continue
+        # strftime 的字面文本需要转义 %
+        text = "".join(piece if _DIRECTIVE.fullmatch(piece) else piece.replace("%", "%%") for piece in pieces)
+        table = _day_table(text, first_day, last_day) if kind == "day" else _second_table(text)
+        compiled.append((kind, table))
+    return EpochFormatter(unit, first_day, last_day, offsets, tuple(compiled))
+
+
+def format_duration(seconds: int, style: str = "CN") -> str:
+    """
+    时长的文本形式
+
+    Args:
+        seconds: 秒数（非负）
+        style: "CN"（3天12小时5分钟）、"ISO"（P3DT12H5M）或 "CLOCK"（84:05:00）
+    """
+    days, rest = divmod(seconds, SECONDS_PER_DAY)
+    hours, rest = divmod(rest, 3600)
+    minutes, secs = divmod(rest, 60)
+    if style == "CLOCK":
+        return f"{days * 24 + hours:02d}:{minutes:02d}:{secs:02d}"
+    if style == "ISO":
+        clock = "".join(f"{value}{unit}" for value, unit in ((hours, "H"), (minutes, "M"), (secs, "S")) if value)
+        if not clock:
+            return f"P{days}D" if days else "PT0S"
+        return (f"P{days}DT" if days else "PT") + clock
+    parts = [(days, "天"), (hours, "小时"), (minutes, "分钟"), (secs, "秒")]
+    text = "".join(f"{value}{unit}" for value, unit in parts if value)
+    return text or "0秒"
@@ -0,0 +1,641 @@
+"""
+时间戳、日期、时长和时间范围生成器
+
+所有生成器都在整数 epoch 上采样：一列偏移量由整块随机字节一次取出（见 sampling.random_below），
+加上起点即为 epoch 列；需要文本时由 EpochFormatter 按预先格式化的日期/时刻查表整列拼接。
+order 参数可以生成有序（"sorted"）或严格递增（"monotonic"）的列，用作时间序列测试数据。
+"""
+
+import itertools
+import operator
+import re
+from array import array
+from dataclasses import dataclass
+from datetime import datetime, timedelta, tzinfo
+from typing import Any, Optional, Sequence, Union
+
+from dataforge.core import sampling
+from dataforge.core.factory import register_generator
+from dataforge.core.generator import (
+    GenerationContext,
+    GeneratorType,
+    ValidatedDataGenerator,
+)
+
+from .epoch import (
+    DATE_FORMATS,
+    DATETIME_FORMATS,
+    SECONDS_PER_DAY,
+    UNITS,
+    EpochFormatter,
+    UTCOffsets,
+    build_formatter,
+    date_to_day,
+    epoch_seconds,
+    format_duration,
+    parse_datetime,
+    resolve_order,
+    resolve_timezone,
+    upper_choice,
+    utc_offsets,
+)
+
+DEFAULT_START = "2020-01-01"
+DEFAULT_END = "2025-12-31"
+DEFAULT_TIMEZONE = "Asia/Shanghai"
+
+# 时长的输出格式
+DURATION_STYLES = ("SECONDS", "CN", "ISO", "CLOCK")
+_DURATION_PATTERNS = {
+    "CN": re.compile(r"(?:\d+天)?(?:\d+小时)?(?:\d+分钟)?(?:\d+秒)?"),
+    "ISO": re.compile(r"P(?:\d+D)?(?:T(?:\d+H)?(?:\d+M)?(?:\d+S)?)?"),
+    "CLOCK": re.compile(r"\d{2,}:[0-5]\d:[0-5]\d"),
+}
+
+# 时间范围的输出格式 -> (时间格式, 开头, 分隔符, 结尾)
+RANGE_FORMATS = {
+    "RANGE": (DATETIME_FORMATS["SQL"], "", " 至 ", ""),
+    "ISO": (DATETIME_FORMATS["ISO"], "", "/", ""),
+    "SQL": (DATETIME_FORMATS["SQL"], "BETWEEN '", "' AND '", "'"),
+    "CN": (DATETIME_FORMATS["CN"], "", " 至 ", ""),
+    "US": (DATETIME_FORMATS["US"], "", " - ", ""),
+    "DATE": (DATE_FORMATS["ISO"], "", " 至 ", ""),
+}
+_RANGE_SEPARATORS = re.compile(r" 至 | - |' AND '")
+
+
+@dataclass(frozen=True)
+class TimeWindow:
+    """参数解析出的时间范围：[start, end] 为 Unix 秒数（含两端）"""
+
+    start: int
+    end: int
+    zone: tzinfo
+    # end 参数只有日期（范围延伸到当天结束）
+    end_of_day: bool
+
+    def offsets(self, extra_seconds: int = 0) -> UTCOffsets:
+        """时区在 [start, end + extra_seconds] 内的偏移表"""
+        return utc_offsets(
+            self.zone, self.start // SECONDS_PER_DAY - 1, (self.end + extra_seconds) // SECONDS_PER_DAY + 1
+        )
+
+
+def resolve_window(parameters: dict[str, Any], start_key: str = "start_date", end_key: str = "end_date") -> TimeWindow:
+    """
+    解析时间范围参数
+
+    relative_to 为 "TODAY" 时范围为今天零点加上 offset_days/offset_hours/offset_minutes 后的一整天，
+    为 "NOW" 时为当前时间加上偏移的时刻；否则为 [start_date, end_date]，只有日期的 end_date 包含当天。
+    相对时间在编译生成计划时确定。
+
+    Raises:
+        ValueError: 时间无法解析或范围为空
+    """
+    zone = resolve_timezone(parameters.get("timezone", DEFAULT_TIMEZONE))
+    relative_to = parameters.get("relative_to")
+    if relative_to:
+        relative_to = str(relative_to).upper()
+        if relative_to not in ("TODAY", "NOW"):
+            raise ValueError(f"relative_to must be TODAY or NOW, got {relative_to}")
+        now = datetime.now(zone).replace(tzinfo=None, microsecond=0)
+        reference = now.replace(hour=0, minute=0, second=0) if relative_to == "TODAY" else now
+        start = reference + timedelta(
+            days=parameters.get("offset_days", 0),
+            hours=parameters.get("offset_hours", 0),
+            minutes=parameters.get("offset_minutes", 0),
+        )
+        end, end_of_day = start, relative_to == "TODAY"
+    else:
+        start, _ = parse_datetime(parameters.get(start_key) or DEFAULT_START)
+        end, end_of_day = parse_datetime(parameters.get(end_key) or DEFAULT_END)
+
+    # 带时区的输入转换为本地时间，只用于确定本地日期范围；偏移表多覆盖前后各一天
+    local = [moment.astimezone(zone).replace(tzinfo=None) if moment.tzinfo else moment for moment in (start, end)]
+    first_day, last_day = (date_to_day(moment.date()) for moment in local)
+    offsets = utc_offsets(zone, first_day - 1, last_day + 2)
+    start_seconds = epoch_seconds(start, offsets)
+    if end_of_day:
+        # 只有日期时到次日零点前一秒（夏令时切换当天不是 86400 秒）
+        end_seconds = epoch_seconds(end + timedelta(days=1), offsets) - 1
+    else:
+        end_seconds = epoch_seconds(end, offsets)
+    if start_seconds > end_seconds:
+        raise ValueError(f"start ({start}) must not be later than end ({end})")
+    return TimeWindow(start_seconds, end_seconds, zone, end_of_day)
+
+
+class EpochGenerator(ValidatedDataGenerator):
+    """在整数 epoch 上采样的生成器基类"""
+
+    @property
+    def generator_type(self) -> GeneratorType:
+        return GeneratorType.DATETIME
+
+    def _below(self, bound: int) -> int:
+        """[0, bound) 上的一个随机整数，与 sampling.random_below 逐个取值相同"""
+        return int.from_bytes(self.rng.randbytes(8), "little") % bound
+
+    def _offsets(
+        self,
+        bound: int,
+        count: int,
+        order: Optional[str],
+        workers: int = 1,
+        executor: str = "thread",
+        seed: Optional[int] = None,
+    ) -> list[int]:
+        """
+        count 个 [0, bound) 上的随机偏移量
+
+        order 为 "sorted" 时整列排序；为 "monotonic" 时严格递增：在 [0, bound - count] 上采样并排序后，
+        第 i 个加上 i。排序在分块拼接之后进行，与 workers 无关。
+
+        Raises:
+            ValueError: 严格递增时 count 大于 bound
+        """
+        if order == "monotonic":
+            if count > bound:
+                raise ValueError(f"cannot draw {count} strictly increasing values from {bound} candidates")
+            bound -= count - 1
+        offsets = self._run_batch(
+            lambda rows: sampling.random_below(self.rng, bound, rows),
+            count,
+            workers=workers,
+            executor=executor,
+            seed=seed,
+        )
+        if order is not None:
+            offsets.sort()
+        if order == "monotonic":
+            offsets = list(map(operator.add, offsets, range(count)))
+        return offsets
+
+
+@dataclass(frozen=True)
+class TimestampPlan:
+    """时间戳生成计划"""
+
+    # 每秒的单位数
+    unit: int
+    # epoch 范围（以 unit 计，含两端）
+    start: int
+    end: int
+    format_type: str
+    # 格式串（UNIX 输出时为None）
+    pattern: Optional[str]
+    formatter: Optional[EpochFormatter]
+    order: Optional[str]
+
+    @property
+    def width(self) -> int:
+        return self.end - self.start + 1
+
+
+@register_generator("timestamp", ["时间戳", "日期时间"])
+class GenericTimestampGenerator(EpochGenerator):
+    """
+    时间戳生成器
+
+    输出 Unix 时间戳（秒/毫秒/微秒/纳秒）或 ISO、SQL、中文、美式、紧凑和自定义格式的时间文本。
+    """
+
+    @property
+    def supported_parameters(self) -> list[str]:
+        return [
+            "start_date", "end_date", "precision", "format", "output_format", "custom_format", "timezone",
+            "timezone_aware", "relative_to", "offset_days", "offset_hours", "offset_minutes", "order",
+        ]
+
+    def _setup(self) -> None:
+        """配置生成器参数"""
+        self._plan = self._plan_for(self.parameters)
+        self.precision = self.parameters.get("precision", "seconds")
+        self.format_type = self._plan.format_type
+
+    def _build_plan(self, parameters: dict[str, Any]) -> TimestampPlan:
+        """编译时间戳生成计划"""
+        precision = str(parameters.get("precision", "seconds")).lower()
+        if precision not in UNITS:
+            raise ValueError(f"Unknown precision: {precision}, expected one of {list(UNITS)}")
+        unit = UNITS[precision]
+        window = resolve_window(parameters)
+        start = window.start * unit
+        end = window.end * unit + (unit - 1 if window.end_of_day else 0)
+
+        format_type = upper_choice(parameters.get("format") or parameters.get("output_format"), "UNIX")
+        if format_type in ("UNIX", "INTEGER"):
+            return TimestampPlan(unit, start, end, "UNIX", None, None, resolve_order(parameters))
+        if format_type == "CUSTOM":
+            pattern = parameters.get("custom_format") or DATETIME_FORMATS["SQL"]
+        elif format_type == "DATE":
+            pattern = DATE_FORMATS["ISO"]
+        elif format_type in DATETIME_FORMATS:
+            pattern = DATETIME_FORMATS[format_type]
+            if unit > 1 and format_type in ("ISO", "SQL"):
+                pattern += ".%f"
+            if format_type == "ISO" and parameters.get("timezone_aware", parameters.get("include_timezone", False)):
+                pattern += "%:z"
+        else:
+            raise ValueError(f"Unknown format: {format_type}")
+        offsets = window.offsets()
+        formatter = build_formatter(
+            pattern, unit, offsets.local_day(window.start), offsets.local_day(window.end), offsets
+        )
+        return TimestampPlan(unit, start, end, format_type, pattern, formatter, resolve_order(parameters))
+
+    def _generate_raw(self, context: Optional[GenerationContext] = None) -> Union[int, str]:
+        """生成一个时间戳"""
+        plan = self._plan
+        value = plan.start + self._below(plan.width)
+        return plan.formatter.format(value) if plan.formatter else value
+
+    def _epochs(
+        self, plan: TimestampPlan, count: int, workers: int, executor: str, seed: Optional[int]
+    ) -> list[int]:
+        offsets = self._offsets(plan.width, count, plan.order, workers, executor, seed)
+        return list(map(operator.add, offsets, itertools.repeat(plan.start)))
+
+    def generate_epochs(
+        self,
+        count: int,
+        workers: int = 1,
+        executor: str = "thread",
+        seed: Optional[int] = None,
+        **kwargs,
+    ) -> array:
+        """
+        批量生成 epoch 列，返回 array("q")（int64，单位由 precision 决定）
+
+        参数相同时与 format 为 UNIX 的 generate_batch 结果逐值相同。
+        """
+        plan = self._plan_with_overrides(kwargs)
+        return array("q", self._epochs(plan, count, workers, executor, seed))
+
+    def generate_batch(
+        self,
+        count: int,
+        context: Optional[GenerationContext] = None,
+        workers: int = 1,
+        executor: str = "thread",
+        seed: Optional[int] = None,
+        **kwargs,
+    ) -> list[Union[int, str]]:
+        """
+        批量生成时间戳
+
+        先整列生成 epoch，需要文本时整列查表格式化；设置了取值池时从池中采样（不排序）。
+        kwargs 为仅对本次调用生效的参数覆盖，其余参数含义同 DataGenerator.generate_batch。
+        """
+        if self.value_pool is not None and not kwargs:
+            return super().generate_batch(count, context, workers=workers, executor=executor, seed=seed)
+        plan = self._plan_with_overrides(kwargs)
+        if plan.formatter is None:
+            return self._epochs(plan, count, workers, executor, seed)
+        # 起点并入格式化时的平移量，省去一次整列加法
+        offsets = self._offsets(plan.width, count, plan.order, workers, executor, seed)
+        return plan.formatter.format_many(offsets, base=plan.start)
+
+    def validate(self, data: Union[int, str]) -> bool:
+        """验证时间戳：非负整数、数字字符串或可解析的时间文本"""
+        if isinstance(data, bool):
+            return False
+        if isinstance(data, int):
+            return data >= 0
+        if not isinstance(data, str):
+            return False
+        if _parses(data):
+            return True
+        pattern = self._plan.pattern
+        if pattern is None:
+            return False
+        try:
+            datetime.strptime(data, pattern.replace("%:z", "%z"))
+            return True
+        except ValueError:
+            return False
+
+
+def _parses(text: str) -> bool:
+    try:
+        parse_datetime(_trim_fraction(text))
+        return True
+    except ValueError:
+        return False
+
+
+_LONG_FRACTION = re.compile(r"(\.\d{6})\d+")
+
+
+def _trim_fraction(text: str) -> str:
+    """纳秒时间文本的小数截断到微秒，便于 datetime 解析"""
+    return _LONG_FRACTION.sub(r"\1", text, count=1)
+
+
+@dataclass(frozen=True)
+class DatePlan:
+    """日期生成计划"""
+
+    # 起始日期（epoch 天数）和候选天数
+    first_day: int
+    days: int
+    format_type: str
+    # 各候选日期的文本
+    table: tuple[str, ...]
+    order: Optional[str]
+
+
+@register_generator("date", ["日期"])
+class GenericDateGenerator(EpochGenerator):
+    """日期生成器，支持 ISO、中文、紧凑、斜杠、美式和自定义格式"""
+
+    @property
+    def supported_parameters(self) -> list[str]:
+        return ["start_date", "end_date", "format", "custom_format", "order"]
+
+    def _setup(self) -> None:
+        """配置生成器参数"""
+        self._plan = self._plan_for(self.parameters)
+        self.format_type = self._plan.format_type
+
+    def _build_plan(self, parameters: dict[str, Any]) -> DatePlan:
+        """编译日期生成计划"""
+        start, _ = parse_datetime(parameters.get("start_date") or DEFAULT_START)
+        end, _ = parse_datetime(parameters.get("end_date") or DEFAULT_END)
+        first_day, last_day = date_to_day(start.date()), date_to_day(end.date())
+        if first_day > last_day:
+            raise ValueError(f"start_date ({start.date()}) must not be later than end_date ({end.date()})")
+        format_type = upper_choice(parameters.get("format"), "ISO")
+        if format_type == "CUSTOM":
+            pattern = parameters.get("custom_format") or DATE_FORMATS["ISO"]
+        elif format_type in DATE_FORMATS:
+            pattern = DATE_FORMATS[format_type]
+        else:
+            raise ValueError(f"Unknown format: {format_type}")
+        formatter = build_formatter(pattern, 1, first_day, last_day, 0)
+        if [kind for kind, _ in formatter.segments] != ["day"]:
+            raise ValueError(f"date format must only contain date directives, got {pattern}")
+        return DatePlan(
+            first_day, last_day - first_day + 1, format_type, formatter.segments[0][1], resolve_order(parameters)
+        )
+
+    def _generate_raw(self, context: Optional[GenerationContext] = None) -> str:
+        """生成一个日期"""
+        plan = self._plan
+        return plan.table[self._below(plan.days)]
+
+    def generate_batch(
+        self,
+        count: int,
+        context: Optional[GenerationContext] = None,
+        workers: int = 1,
+        executor: str = "thread",
+        seed: Optional[int] = None,
+        **kwargs,
+    ) -> list[str]:
+        """
+        批量生成日期：整列采样天数偏移后直接查表
+
+        kwargs 为仅对本次调用生效的参数覆盖，其余参数含义同 DataGenerator.generate_batch。
+        """
+        if self.value_pool is not None and not kwargs:
+            return super().generate_batch(count, context, workers=workers, executor=executor, seed=seed)
+        plan = self._plan_with_overrides(kwargs)
+        offsets = self._offsets(plan.days, count, plan.order, workers, executor, seed)
+        return list(map(plan.table.__getitem__, offsets))
+
+    def validate(self, data: str) -> bool:
+        """验证日期文本"""
+        return isinstance(data, str) and (data in self._plan.table or _parses(data))
+
+
+@dataclass(frozen=True)
+class DurationPlan:
+    """时长生成计划"""
+
+    min_seconds: int
+    max_seconds: int
+    style: str
+
+
+@register_generator("duration", ["时长", "持续时间"])
+class GenericDurationGenerator(EpochGenerator):
+    """时长生成器：秒数，或中文（1小时30分钟）、ISO 8601（PT1H30M）、时钟（01:30:00）格式"""
+
+    @property
+    def supported_parameters(self) -> list[str]:
+        return ["min_seconds", "max_seconds", "format"]
+
+    def _setup(self) -> None:
+        """配置生成器参数"""
+        self._plan = self._plan_for(self.parameters)
+        self.format_type = self._plan.style
+
+    def _build_plan(self, parameters: dict[str, Any]) -> DurationPlan:
+        """编译时长生成计划"""
+        low = int(parameters.get("min_seconds", 60))
+        high = int(parameters.get("max_seconds", SECONDS_PER_DAY))
+        if not 0 <= low <= high:
+            raise ValueError(f"duration range must satisfy 0 <= min_seconds <= max_seconds, got [{low}, {high}]")
+        style = upper_choice(parameters.get("format"), "SECONDS")
+        if style not in DURATION_STYLES:
+            raise ValueError(f"Unknown format: {style}, expected one of {DURATION_STYLES}")
+        return DurationPlan(low, high, style)
+
+    def _format(self, plan: DurationPlan, seconds: Sequence[int]) -> list[Union[int, str]]:
+        if plan.style == "SECONDS":
+            return list(seconds)
+        return list(map(format_duration, seconds, itertools.repeat(plan.style)))
+
+    def _generate_raw(self, context: Optional[GenerationContext] = None) -> Union[int, str]:
+        """生成一个时长"""
+        plan = self._plan
+        return self._format(plan, [plan.min_seconds + self._below(plan.max_seconds - plan.min_seconds + 1)])[0]
+
+    def generate_batch(
+        self,
+        count: int,
+        context: Optional[GenerationContext] = None,
+        workers: int = 1,
+        executor: str = "thread",
+        seed: Optional[int] = None,
+        **kwargs,
+    ) -> list[Union[int, str]]:
+        """
+        批量生成时长
+
+        kwargs 为仅对本次调用生效的参数覆盖，其余参数含义同 DataGenerator.generate_batch。
+        """
+        if self.value_pool is not None and not kwargs:
+            return super().generate_batch(count, context, workers=workers, executor=executor, seed=seed)
+        plan = self._plan_with_overrides(kwargs)
+        offsets = self._offsets(plan.max_seconds - plan.min_seconds + 1, count, None, workers, executor, seed)
+        return self._format(plan, map(operator.add, offsets, itertools.repeat(plan.min_seconds)))
+
+    def validate(self, data: Union[int, str]) -> bool:
+        """验证时长：非负整数或任一文本格式"""
+        if isinstance(data, bool):
+            return False
+        if isinstance(data, int):
+            return data >= 0
+        return isinstance(data, str) and bool(data) and any(
+            pattern.fullmatch(data) for pattern in _DURATION_PATTERNS.values()
+        )
+
+
+@dataclass(frozen=True)
+class RangePlan:
+    """时间范围生成计划"""
+
+    # 起点的范围（Unix 秒数，含两端）
+    start: int
+    end: int
+    # 时长的范围（秒，含两端）；固定时长时两者相等
+    min_duration: int
+    max_duration: int
+    format_type: str
+    formatter: Optional[EpochFormatter]
+    prefix: str
+    separator: str
+    suffix: str
+    order: Optional[str]
+
+
+@register_generator("datetime_range", ["时间范围", "日期范围", "时间段"])
+class GenericAdvancedDateTimeRangeGenerator(EpochGenerator):
+    """
+    时间范围生成器
+
+    起点取 start_datetime（固定）或在 [start_date, end_date] 内随机；时长由 duration_days/duration_hours/
+    duration_minutes 固定，否则在 [min_duration, max_duration] 秒内随机。
+    """
+
+    @property
+    def supported_parameters(self) -> list[str]:
+        return [
+            "start_datetime", "start_date", "end_date", "duration_days", "duration_hours", "duration_minutes",
+            "min_duration", "max_duration", "format", "timezone", "include_timezone", "order",
+        ]
+
+    def _setup(self) -> None:
+        """配置生成器参数"""
+        self._plan = self._plan_for(self.parameters)
+        self.format_type = self._plan.format_type
+
+    def _build_plan(self, parameters: dict[str, Any]) -> RangePlan:
+        """编译时间范围生成计划"""
+        if parameters.get("start_datetime"):
+            fixed = parameters["start_datetime"]
+            window = resolve_window({**parameters, "start_date": fixed, "end_date": fixed})
+        else:
+            window = resolve_window(parameters)
+
+        keys = ("duration_days", "duration_hours", "duration_minutes")
+        if any(key in parameters for key in keys):
+            duration = int(timedelta(
+                days=parameters.get("duration_days", 0),
+                hours=parameters.get("duration_hours", 0),
+                minutes=parameters.get("duration_minutes", 0),
+            ).total_seconds())
+            min_duration = max_duration = duration
+        else:
+            min_duration = int(parameters.get("min_duration", 3600))
+            max_duration = int(parameters.get("max_duration", 7 * SECONDS_PER_DAY))
+        if not 0 <= min_duration <= max_duration:
+            raise ValueError(f"duration range must satisfy 0 <= min <= max, got [{min_duration}, {max_duration}]")
+
+        format_type = upper_choice(parameters.get("format"), "RANGE")
+        if format_type == "DURATION":
+            return RangePlan(
+                window.start, window.end, min_duration, max_duration, format_type, None, "", "", "",
+                resolve_order(parameters),
+            )
+        if format_type not in RANGE_FORMATS:
+            raise ValueError(f"Unknown format: {format_type}")
+        pattern, prefix, separator, suffix = RANGE_FORMATS[format_type]
+        if format_type == "ISO" and parameters.get("include_timezone", parameters.get("timezone_aware", False)):
+            pattern += "%:z"
+        offsets = window.offsets(max_duration)
+        formatter = build_formatter(
+            pattern, 1, offsets.local_day(window.start), offsets.local_day(window.end + max_duration), offsets
+        )
+        return RangePlan(
+            window.start, window.end, min_duration, max_duration, format_type, formatter, prefix, separator, suffix,
+            resolve_order(parameters),
+        )
+
+    def _compose(self, plan: RangePlan, starts: Sequence[int], durations: Sequence[int]) -> list[str]:
+        """由起点列和时长列组装文本"""
+        if plan.formatter is None:
+            return list(map(format_duration, durations))
+        ends = plan.formatter.format_many(list(map(operator.add, starts, durations)))
+        texts = map(operator.add, plan.formatter.format_many(starts), itertools.repeat(plan.separator))
+        texts = map(operator.add, texts, ends)
+        if plan.prefix:
+            texts = map(operator.add, itertools.repeat(plan.prefix), texts)
+        if plan.suffix:
+            texts = map(operator.add, texts, itertools.repeat(plan.suffix))
+        return list(texts)
+
+    def _generate_raw(self, context: Optional[GenerationContext] = None) -> str:
+        """生成一个时间范围"""
+        plan = self._plan
+        start = plan.start + self._below(plan.end - plan.start + 1)
+        duration = plan.min_duration + self._below(plan.max_duration - plan.min_duration + 1)
+        return self._compose(plan, [start], [duration])[0]
+
+    def generate_batch(
+        self,
+        count: int,
+        context: Optional[GenerationContext] = None,
+        workers: int = 1,
+        executor: str = "thread",
+        seed: Optional[int] = None,
+        **kwargs,
+    ) -> list[str]:
+        """
+        批量生成时间范围：起点列和时长列分别整列采样后一次格式化
+
+        kwargs 为仅对本次调用生效的参数覆盖，其余参数含义同 DataGenerator.generate_batch。
+        """
+        if self.value_pool is not None and not kwargs:
+            return super().generate_batch(count, context, workers=workers, executor=executor, seed=seed)
+        plan = self._plan_with_overrides(kwargs)
+        starts = self._offsets(plan.end - plan.start + 1, count, plan.order, workers, executor, seed)
+        starts = list(map(operator.add, starts, itertools.repeat(plan.start)))
+        if plan.min_duration == plan.max_duration:
+            durations = [plan.min_duration] * count
+        else:
+            duration_seed = None if seed is None else f"{seed}:duration"
+            durations = self._offsets(
+                plan.max_duration - plan.min_duration + 1, count, None, workers, executor, duration_seed
+            )
+            durations = list(map(operator.add, durations, itertools.repeat(plan.min_duration)))
+        return self._compose(plan, starts, durations)
+
+    def validate(self, data: str) -> bool:
+        """验证时间范围：两个可解析的时间且起点不晚于终点；单个时间或时长文本也视为有效"""
+        if not isinstance(data, str) or not data:
+            return False
+        if _DURATION_PATTERNS["CN"].fullmatch(data):
+            return True
+        text = data.removeprefix("BETWEEN '").removesuffix("'")
+        parts = _RANGE_SEPARATORS.split(text)
+        if len(parts) == 1 and "T" in text:
+            # ISO 8601 时间间隔以 "/" 分隔（美式日期本身含 "/"，只在 ISO 文本中按 "/" 拆分）
+            parts = text.split("/")
+        if len(parts) > 2:
+            return False
+        try:
+            moments = [parse_datetime(_trim_fraction(part))[0] for part in parts]
+        except ValueError:
+            return False
+        if len(moments) == 2:
+            start, end = (moment.replace(tzinfo=None) for moment in moments)
+            return start <= end
+        return True
+
+
+# 示例代码中使用的名称
+GenericEnhancedTimestampGenerator = GenericTimestampGenerator
+GenericAdvancedTimestampGenerator = GenericTimestampGenerator
@@ -0,0 +1,188 @@
+"""
+交易日历生成器
+按沪深交易所休市安排生成交易日、休市日或普通日期
+"""
+
+import bisect
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Optional
+
+from dataforge.core.factory import register_generator
+from dataforge.core.generator import GenerationContext
+from dataforge.core.preloader import get_table
+
+from .epoch import DATE_FORMATS, build_formatter, date_to_day, parse_datetime, resolve_order, upper_choice
+from .timestamp import EpochGenerator
+
+# 沪深交易所工作日休市日期（周末均休市，不再列出），格式为 "MMDD" 或 "MMDD-MMDD"
+EXCHANGE_HOLIDAYS = {
+    2020: "0101 0124-0131 0406 0501 0504-0505 0625-0626 1001-1002 1005-1008",
+    2021: "0101 0211-0212 0215-0217 0405 0503-0505 0614 0920-0921 1001 1004-1007",
+    2022: "0103 0131-0204 0404-0405 0502-0504 0603 0912 1003-1007",
+    2023: "0102 0123-0127 0405 0501-0503 0622-0623 0929 1002-1006",
+    2024: "0101 0209 0212-0216 0404-0405 0501-0503 0610 0916-0917 1001-1004 1007",
+    2025: "0101 0128-0131 0203-0204 0404 0501-0502 0505 0602 1001-1003 1006-1008",
+    2026: "0101-0102 0216-0220 0223 0406 0501 0504-0505 0619 0925 1001-1002 1005-1007",
+}
+
+DAY_TYPES = ("TRADING", "HOLIDAY", "ALL")
+
+
+@dataclass(frozen=True)
+class TradingCalendar:
+    """
+    交易日历
+
+    日期均为 epoch 天数。EXCHANGE_HOLIDAYS 未覆盖的年份只按周末休市计算。
+    """
+
+    # 工作日休市日期（有序）
+    holidays: tuple[int, ...]
+
+    def is_trading_day(self, day: int) -> bool:
+        # 1970-01-01 是星期四
+        if (day + 3) % 7 >= 5:
+            return False
+        index = bisect.bisect_left(self.holidays, day)
+        return index == len(self.holidays) or self.holidays[index] != day
+
+    def trading_days(self, first_day: int, last_day: int) -> list[int]:
+        """[first_day, last_day] 内的交易日"""
+        return [day for day in range(first_day, last_day + 1) if self.is_trading_day(day)]
+
+    def next_trading_day(self, day: int) -> int:
+        """day 之后（不含）的第一个交易日"""
+        day += 1
+        while not self.is_trading_day(day):
+            day += 1
+        return day
+
+    def previous_trading_day(self, day: int) -> int:
+        """day 之前（不含）的最后一个交易日"""
+        day -= 1
+        while not self.is_trading_day(day):
+            day -= 1
+        return day
+
+    def shift(self, day: int, count: int) -> int:
+        """从 day 起向后（count 为负时向前）数 count 个交易日"""
+        step = self.next_trading_day if count >= 0 else self.previous_trading_day
+        for _ in range(abs(count)):
+            day = step(day)
+        return day
+
+
+def build_trading_calendar() -> TradingCalendar:
+    """构建交易日历（供预加载器缓存）"""
+    holidays = []
+    for year, spec in EXCHANGE_HOLIDAYS.items():
+        for item in spec.split():
+            first, _, last = item.partition("-")
+            first_day = date_to_day(date(year, int(first[:2]), int(first[2:])))
+            last_day = date_to_day(date(year, int(last[:2]), int(last[2:]))) if last else first_day
+            holidays.extend(range(first_day, last_day + 1))
+    return TradingCalendar(tuple(sorted(holidays)))
+
+
+@dataclass(frozen=True)
+class TradingDayPlan:
+    """交易日生成计划"""
+
+    day_type: str
+    format_type: str
+    # 候选日期的文本
+    table: tuple[str, ...]
+    order: Optional[str]
+
+
+@register_generator("trading_day", ["交易日", "交易日历"])
+class GenericTradingCalendarGenerator(EpochGenerator):
+    """
+    交易日生成器
+
+    day_type 为 TRADING 时生成交易日，HOLIDAY 时生成休市日（include_weekends 为 False 时只含工作日休市），
+    ALL 时生成范围内的任意日期。
+    """
+
+    @property
+    def supported_parameters(self) -> list[str]:
+        return ["start_date", "end_date", "day_type", "include_weekends", "format", "custom_format", "order"]
+
+    def _setup(self) -> None:
+        """配置生成器参数"""
+        self._plan = self._plan_for(self.parameters)
+        self.day_type = self._plan.day_type
+        self.format_type = self._plan.format_type
+
+    def _build_plan(self, parameters: dict[str, Any]) -> TradingDayPlan:
+        """编译交易日生成计划：候选日期按日期排序并预先格式化"""
+        start, _ = parse_datetime(parameters.get("start_date") or "2024-01-01")
+        end, _ = parse_datetime(parameters.get("end_date") or "2024-12-31")
+        first_day, last_day = date_to_day(start.date()), date_to_day(end.date())
+        day_type = upper_choice(parameters.get("day_type"), "TRADING")
+        if day_type not in DAY_TYPES:
+            raise ValueError(f"Unknown day_type: {day_type}, expected one of {DAY_TYPES}")
+
+        calendar: TradingCalendar = get_table("datetime.trading_calendar")
+        days = range(first_day, last_day + 1)
+        if day_type == "TRADING":
+            candidates = [day for day in days if calendar.is_trading_day(day)]
+        elif day_type == "HOLIDAY":
+            include_weekends = parameters.get("include_weekends", True)
+            candidates = [
+                day for day in days
+                if not calendar.is_trading_day(day) and (include_weekends or (day + 3) % 7 < 5)
+            ]
+        else:
+            candidates = list(days)
+        if not candidates:
+            raise ValueError(f"no {day_type.lower()} days between {start.date()} and {end.date()}")
+
+        format_type = upper_choice(parameters.get("format"), "ISO")
+        if format_type == "CUSTOM":
+            pattern = parameters.get("custom_format") or DATE_FORMATS["ISO"]
+        elif format_type in DATE_FORMATS:
+            pattern = DATE_FORMATS[format_type]
+        else:
+            raise ValueError(f"Unknown format: {format_type}")
+        formatter = build_formatter(pattern, 1, first_day, last_day, 0)
+        if [kind for kind, _ in formatter.segments] != ["day"]:
+            raise ValueError(f"date format must only contain date directives, got {pattern}")
+        texts = formatter.segments[0][1]
+        table = tuple(texts[day - first_day] for day in candidates)
+        return TradingDayPlan(day_type, format_type, table, resolve_order(parameters))
+
+    def _generate_raw(self, context: Optional[GenerationContext] = None) -> str:
+        """生成一个日期"""
+        plan = self._plan
+        return plan.table[self._below(len(plan.table))]
+
+    def generate_batch(
+        self,
+        count: int,
+        context: Optional[GenerationContext] = None,
+        workers: int = 1,
+        executor: str = "thread",
+        seed: Optional[int] = None,
+        **kwargs,
+    ) -> list[str]:
+        """
+        批量生成日期：整列采样候选日期下标后查表
+
+        kwargs 为仅对本次调用生效的参数覆盖，其余参数含义同 DataGenerator.generate_batch。
+        """
+        if self.value_pool is not None and not kwargs:
+            return super().generate_batch(count, context, workers=workers, executor=executor, seed=seed)
+        plan = self._plan_with_overrides(kwargs)
+        indexes = self._offsets(len(plan.table), count, plan.order, workers, executor, seed)
+        return list(map(plan.table.__getitem__, indexes))
+
+    def validate(self, data: str) -> bool:
+        """验证日期属于候选日期"""
+        return isinstance(data, str) and data in self._plan.table
+
+    def is_trading_day(self, value: str) -> bool:
+        """判断日期文本是否为交易日"""
+        moment, _ = parse_datetime(value)
+        return get_table("datetime.trading_calendar").is_trading_day(date_to_day(moment.date()))
@@ -0,0 +1,36 @@
+"""
+Finance Generators
+
+This module contains generators for financial data:
+- Bank card and credit card numbers with Luhn check digits
+- IBANs with mod-97 check digits
+- A-share stock codes
+- Cryptocurrency addresses
+- Personal finance profiles
+"""
+
+# Import all finance generators to ensure registration
+try:
+    from .card import BankCardGenerator, CreditCardGenerator
+except ImportError:
+    pass
+
+try:
+    from .iban import IBANGenerator
+except ImportError:
+    pass
+
+try:
+    from .market import StockCodeGenerator
+except ImportError:
+    pass
+
+try:
+    from .crypto import CryptoAddressGenerator
+except ImportError:
+    pass
+
+try:
+    from .profile import FinanceProfileGenerator
+except ImportError:
+    pass
@@ -0,0 +1,354 @@
+"""
+银行卡和信用卡生成器
+
+卡号在整数上整列生成：每种发卡标识（BIN 或卡组织号段）对应一个连续的整数区间，
+一次取出整块随机数后按区间取模得到不含校验位的号码，再由 checksum.append_luhn 整列追加校验位。
+"""
+
+import functools
+import itertools
+import operator
+import re
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Iterable, Optional, Sequence, Union
+
+from dataforge.core import sampling
+from dataforge.core.factory import register_generator
+from dataforge.core.generator import (
+    GenerationContext,
+    GeneratorType,
+    ValidatedDataGenerator,
+)
+from dataforge.core.preloader import get_table
+
+from .checksum import append_luhn, luhn_valid_batch
+
+# 银行代码 -> (银行名称, SWIFT代码, 发卡量权重)
+BANKS = {
+    "ICBC": ("中国工商银行", "ICBKCNBJ", 20),
+    "CCB": ("中国建设银行", "PCBCCNBJ", 18),
+    "ABC": ("中国农业银行", "ABOCCNBJ", 18),
+    "BOC": ("中国银行", "BKCHCNBJ", 14),
+    "PSBC": ("中国邮政储蓄银行", "PSBCCNBJ", 10),
+    "CMB": ("招商银行", "CMBCCNBS", 8),
+    "BOCOM": ("交通银行", "COMMCNSH", 7),
+    "CIB": ("兴业银行", "FJIBCNBA", 5),
+}
+
+# (银行代码, 卡种, BIN, 卡号长度)
+BIN_TABLE = (
+    ("ICBC", "debit", "622202", 19), ("ICBC", "debit", "621226", 19), ("ICBC", "debit", "622208", 19),
+    ("ICBC", "credit", "625330", 16), ("ICBC", "credit", "427020", 16),
+    ("CCB", "debit", "621700", 19), ("CCB", "debit", "436742", 19), ("CCB", "debit", "622280", 19),
+    ("CCB", "credit", "436728", 16), ("CCB", "credit", "625965", 16),
+    ("ABC", "debit", "622848", 19), ("ABC", "debit", "622845", 19),
+    ("ABC", "credit", "622836", 16), ("ABC", "credit", "625996", 16),
+    ("BOC", "debit", "621661", 19), ("BOC", "debit", "621785", 19), ("BOC", "debit", "456351", 19),
+    ("BOC", "credit", "625907", 16), ("BOC", "credit", "622760", 16),
+    ("PSBC", "debit", "621799", 19), ("PSBC", "debit", "622188", 19),
+    ("PSBC", "credit", "625919", 16),
+    ("CMB", "debit", "622588", 16), ("CMB", "debit", "621483", 16),
+    ("CMB", "credit", "439225", 16), ("CMB", "credit", "622575", 16),
+    ("BOCOM", "debit", "622262", 19), ("BOCOM", "debit", "622260", 19),
+    ("BOCOM", "credit", "622252", 16),
+    ("CIB", "debit", "622909", 18), ("CIB", "debit", "622908", 18),
+    ("CIB", "credit", "625087", 16),
+)
+
+CARD_TYPES = {"debit": "借记卡", "credit": "信用卡"}
+_CARD_TYPE_ALIASES = {"借记卡": "debit", "储蓄卡": "debit", "信用卡": "credit", "贷记卡": "credit"}
+
+# 卡组织 -> (名称, 号段 [(起, 止)]（同一号段内起止位数相同）, 卡号长度, CVV位数, 权重)
+CARD_SCHEMES = {
+    "visa": ("Visa", [("4", "4")], 16, 3, 35),
+    "mastercard": ("MasterCard", [("51", "55"), ("2221", "2720")], 16, 3, 25),
+    "unionpay": ("UnionPay", [("62", "62")], 16, 3, 25),
+    "amex": ("American Express", [("34", "34"), ("37", "37")], 15, 4, 8),
+    "jcb": ("JCB", [("3528", "3589")], 16, 3, 5),
+    "discover": ("Discover", [("6011", "6011"), ("644", "649"), ("65", "65")], 16, 3, 2),
+}
+
+# 有效期距今的月数范围
+EXPIRY_MONTHS = 60
+
+
+@dataclass(frozen=True)
+class CardRange:
+    """一个发卡号段：不含校验位的号码取 [base, base + span)"""
+
+    base: int
+    span: int
+    # 不含校验位的位数
+    digits: int
+    # 号段的附加字段（银行名称、卡种等）
+    info: tuple[tuple[str, Any], ...]
+    cvv_digits: int = 3
+
+
+@dataclass(frozen=True)
+class CardPlan:
+    """卡号生成计划"""
+
+    ranges: tuple[CardRange, ...]
+    # 号段下标的采样查表
+    lanes: tuple[int, ...]
+    # 有效期候选（MM/YY）
+    expiry_dates: tuple[str, ...]
+    # 只输出该字段（为None时输出完整记录）
+    field: Optional[str]
+    spaced: bool
+
+
+def card_range(prefix_low: str, prefix_high: str, length: int, info: dict[str, Any], cvv_digits: int = 3) -> CardRange:
+    """号段 [prefix_low, prefix_high] 开头、共 length 位（含校验位）的卡号区间"""
+    scale = 10 ** (length - 1 - len(prefix_low))
+    return CardRange(
+        base=int(prefix_low) * scale,
+        span=(int(prefix_high) - int(prefix_low) + 1) * scale,
+        digits=length - 1,
+        info=tuple(info.items()),
+        cvv_digits=cvv_digits,
+    )
+
+
+def build_bin_table() -> dict[str, Any]:
+    """构建按 (银行代码, 卡种) 索引的 BIN 表（供预加载器缓存）"""
+    index: dict[tuple[str, str], list[tuple[str, int]]] = {}
+    for bank_code, card_type, prefix, length in BIN_TABLE:
+        index.setdefault((bank_code, card_type), []).append((prefix, length))
+    return {
+        "index": {key: tuple(rows) for key, rows in index.items()},
+        "lengths": {(prefix, length) for _, _, prefix, length in BIN_TABLE},
+        "bank_codes": {**{code: code for code in BANKS}, **{name: code for code, (name, _, _) in BANKS.items()}},
+    }
+
+
+def expiry_dates(today: Optional[date] = None, months: int = EXPIRY_MONTHS) -> tuple[str, ...]:
+    """今后 1 到 months 个月的有效期（MM/YY）"""
+    today = today or date.today()
+    start = today.year * 12 + today.month
+    return tuple(f"{month % 12 + 1:02d}/{month // 12 % 100:02d}" for month in range(start, start + months))
+
+
+def _spaced(number: str) -> str:
+    return " ".join(number[index:index + 4] for index in range(0, len(number), 4))
+
+
+class CardGenerator(ValidatedDataGenerator):
+    """
+    卡号生成器基类
+
+    默认输出记录（字典），field 参数指定字段名时只输出该字段，便于作为模板中的一列。
+    """
+
+    # 记录的字段（依次为卡号、号段附加字段、有效期等）
+    FIELDS: tuple[str, ...] = ()
+
+    @property
+    def generator_type(self) -> GeneratorType:
+        return GeneratorType.FINANCE
+
+    def _setup(self) -> None:
+        """配置生成器参数"""
+        self._plan = self._plan_for(self.parameters)
+        self.field = self._plan.field
+
+    def _ranges(self, parameters: dict[str, Any]) -> list[tuple[CardRange, float]]:
+        """参数对应的号段及其权重"""
+        raise NotImplementedError
+
+    def _build_plan(self, parameters: dict[str, Any]) -> CardPlan:
+        """编译卡号生成计划"""
+        field = parameters.get("field")
+        if field is not None and field not in self.FIELDS:
+            raise ValueError(f"Unknown field: {field}, expected one of {self.FIELDS}")
+        ranges = self._ranges(parameters)
+        return CardPlan(
+            ranges=tuple(card for card, _ in ranges),
+            lanes=sampling.lane_table(range(len(ranges)), [weight for _, weight in ranges]),
+            expiry_dates=expiry_dates(),
+            field=field,
+            spaced=parameters.get("format", "plain") == "spaced",
+        )
+
+    def _columns(self, plan: CardPlan, count: int) -> dict[str, list]:
+        """整列生成各字段"""
+        indexes = sampling.sample(self.rng, plan.lanes, count)
+        ranges = plan.ranges
+        bases = tuple(card.base for card in ranges)
+        spans = tuple(card.span for card in ranges)
+        bodies = list(map(
+            operator.add,
+            map(bases.__getitem__, indexes),
+            map(operator.mod, sampling.random_below(self.rng, 1 << 64, count), map(spans.__getitem__, indexes)),
+        ))
+        numbers = list(map(str, append_luhn(bodies, max(card.digits for card in ranges))))
+        columns = {"card_number": list(map(_spaced, numbers)) if plan.spaced else numbers}
+        infos = [dict(card.info) for card in ranges]
+        for key in infos[0]:
+            values = tuple(info[key] for info in infos)
+            columns[key] = list(map(values.__getitem__, indexes))
+        columns["expiry_date"] = sampling.sample(self.rng, sampling.lane_table(plan.expiry_dates), count)
+        if "cvv" in self.FIELDS:
+            moduli = tuple(10 ** card.cvv_digits for card in ranges)
+            templates = tuple(f"{{:0{card.cvv_digits}d}}" for card in ranges)
+            cvvs = map(operator.mod, sampling.random_below(self.rng, 1 << 64, count), map(moduli.__getitem__, indexes))
+            columns["cvv"] = list(map(str.format, map(templates.__getitem__, indexes), cvvs))
+        return columns
+
+    def _records(self, plan: CardPlan, count: int) -> Union[list[dict[str, str]], list[str]]:
+        """整列生成后按需组装为记录"""
+        columns = self._columns(plan, count)
+        if plan.field is not None:
+            return columns[plan.field]
+        keys = tuple(columns)
+        return list(map(dict, map(zip, itertools.repeat(keys), zip(*columns.values()))))
+
+    def _validated_batch(self, records: list, plan: CardPlan) -> list:
+        """按配置整批验证卡号（按本次调用的计划），任一无效时抛出 ValueError"""
+        if self.config.validate and plan.field in (None, "card_number"):
+            invalid = next(itertools.compress(records, map(operator.not_, self.validate_batch(records))), None)
+            if invalid is not None:
+                raise ValueError(f"Generated data failed validation: {invalid}")
+        return records
+
+    def _generate_raw(self, context: Optional[GenerationContext] = None) -> Union[dict[str, str], str]:
+        """生成一条记录"""
+        return self._records(self._plan, 1)[0]
+
+    def generate_batch(
+        self,
+        count: int,
+        context: Optional[GenerationContext] = None,
+        workers: int = 1,
+        executor: str = "thread",
+        seed: Optional[int] = None,
+        **kwargs,
+    ) -> list:
+        """
+        批量生成卡号记录
+
+        每个分块整列生成卡号和各字段；设置了取值池时从池中采样。
+        kwargs 为仅对本次调用生效的参数覆盖，其余参数含义同 DataGenerator.generate_batch。
+        """
+        if self.value_pool is not None and not kwargs:
+            return super().generate_batch(count, context, workers=workers, executor=executor, seed=seed)
+        plan = self._plan_with_overrides(kwargs)
+        return self._run_batch(
+            lambda rows: self._validated_batch(self._records(plan, rows), plan),
+            count,
+            workers=workers,
+            executor=executor,
+            seed=seed,
+        )
+
+    def _known_prefix(self, numbers: Sequence[str]) -> list[bool]:
+        """卡号是否属于已知号段"""
+        raise NotImplementedError
+
+    def validate_batch(self, values: Iterable[Any]) -> list[bool]:
+        """
+        整列验证卡号：Luhn 校验位正确且属于已知号段
+
+        values 的元素可以是卡号（可含空格）或含 card_number 字段的记录；用于大批量的数据质量检查。
+        """
+        numbers = [value.get("card_number") if isinstance(value, dict) else value for value in values]
+        numbers = [number.replace(" ", "") if isinstance(number, str) else None for number in numbers]
+        known = self._known_prefix([number or "" for number in numbers])
+        return list(map(operator.and_, luhn_valid_batch(numbers), known))
+
+    def validate(self, data: Any) -> bool:
+        """验证卡号或卡号记录；只输出其他字段时不做验证"""
+        if self._plan.field not in (None, "card_number"):
+            return True
+        return self.validate_batch([data])[0]
+
+
+@register_generator("bank_card", ["银行卡", "银行卡号"])
+class BankCardGenerator(CardGenerator):
+    """
+    银行卡生成器
+
+    按 BIN 表生成国内银行的借记卡和信用卡号，bank 可以是银行代码（如 ICBC）或名称，card_type 为 debit/credit。
+    """
+
+    FIELDS = ("card_number", "bank_name", "bank_code", "card_type", "expiry_date")
+
+    @property
+    def supported_parameters(self) -> list[str]:
+        return ["bank", "card_type", "field", "format"]
+
+    def _ranges(self, parameters: dict[str, Any]) -> list[tuple[CardRange, float]]:
+        table = get_table("finance.bins")
+        bank = parameters.get("bank")
+        if bank is not None and bank not in table["bank_codes"]:
+            raise ValueError(f"Unknown bank: {bank}, expected one of {list(BANKS)}")
+        card_type = parameters.get("card_type")
+        card_type = _CARD_TYPE_ALIASES.get(card_type, card_type)
+        if card_type is not None and card_type not in CARD_TYPES:
+            raise ValueError(f"Unknown card_type: {card_type}, expected debit or credit")
+        bank_codes = [table["bank_codes"][bank]] if bank is not None else list(BANKS)
+        card_types = [card_type] if card_type is not None else list(CARD_TYPES)
+
+        ranges = []
+        for bank_code in bank_codes:
+            bank_name, _, bank_weight = BANKS[bank_code]
+            for kind in card_types:
+                bins = table["index"].get((bank_code, kind), ())
+                info = {"bank_name": bank_name, "bank_code": bank_code, "card_type": CARD_TYPES[kind]}
+                ranges.extend(
+                    (card_range(prefix, prefix, length, info), bank_weight / len(bins)) for prefix, length in bins
+                )
+        if not ranges:
+            raise ValueError(f"no BIN for bank={bank}, card_type={card_type}")
+        return ranges
+
+    def _known_prefix(self, numbers: Sequence[str]) -> list[bool]:
+        lengths = get_table("finance.bins")["lengths"]
+        return [(number[:6], len(number)) in lengths for number in numbers]
+
+
+@register_generator("credit_card", ["信用卡", "信用卡号"])
+class CreditCardGenerator(CardGenerator):
+    """
+    信用卡生成器
+
+    按卡组织号段生成 Visa、MasterCard、银联、American Express、JCB 和 Discover 卡号，并附带有效期和 CVV。
+    """
+
+    FIELDS = ("card_number", "card_type", "expiry_date", "cvv")
+
+    @property
+    def supported_parameters(self) -> list[str]:
+        return ["card_type", "field", "format"]
+
+    def _ranges(self, parameters: dict[str, Any]) -> list[tuple[CardRange, float]]:
+        card_type = parameters.get("card_type")
+        card_type = card_type.lower() if isinstance(card_type, str) else card_type
+        if card_type is not None and card_type not in CARD_SCHEMES:
+            raise ValueError(f"Unknown card_type: {card_type}, expected one of {list(CARD_SCHEMES)}")
+        schemes = [card_type] if card_type is not None else list(CARD_SCHEMES)
+
+        ranges = []
+        for scheme in schemes:
+            name, prefixes, length, cvv_digits, weight = CARD_SCHEMES[scheme]
+            cards = [card_range(low, high, length, {"card_type": name}, cvv_digits) for low, high in prefixes]
+            total = sum(card.span for card in cards)
+            # 各号段按区间大小分配权重，使卡号在卡组织的全部号段上均匀
+            ranges.extend((card, weight * card.span / total) for card in cards)
+        return ranges
+
+    def _known_prefix(self, numbers: Sequence[str]) -> list[bool]:
+        return list(map(bool, map(_scheme_pattern().fullmatch, numbers)))
+
+
+@functools.lru_cache(maxsize=None)
+def _scheme_pattern() -> "re.Pattern[str]":
+    """匹配各卡组织号段和长度的正则"""
+    alternatives = []
+    for _, prefixes, length, _, _ in CARD_SCHEMES.values():
+        for low, high in prefixes:
+            heads = "|".join(str(prefix) for prefix in range(int(low), int(high) + 1))
+            alternatives.append(f"(?:{heads})\\d{{{length - len(low)}}}")
+    return re.compile("|".join(alternatives))
@@ -0,0 +1,115 @@
+"""
+金融号码的校验算法（整列计算）
+
+Luhn（卡号）：号码作为整数每次取低4位，以 10**4 项的查表得到这4位的 Luhn 加权和，
+按列做 divmod、查表和累加，每4位数字只需几次C层 map，而不是逐位循环。
+mod-97（IBAN）：字母按 A=10 ... Z=35 用 str.translate 整列展开为数字后以整数取模。
+"""
+
+import functools
+import itertools
+import operator
+import string
+from typing import Any, Iterable, Sequence
+
+LUHN_CHUNK = 10 ** 4
+
+# Luhn 加倍后的各位数字之和
+_DOUBLED = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
+
+# 各号码对应的校验位：以加权和（0-199）查表
+_CHECK_DIGITS = tuple((10 - total % 10) % 10 for total in range(200))
+
+_IBAN_DIGITS = str.maketrans({letter: str(value) for value, letter in enumerate(string.ascii_uppercase, 10)})
+
+
+@functools.lru_cache(maxsize=2)
+def _luhn_chunk_table(double_lowest: bool) -> tuple[int, ...]:
+    """4位数字块的 Luhn 加权和；double_lowest 表示最低位（以及倒数第3位）加倍"""
+    even, odd = (_DOUBLED, range(10)) if double_lowest else (range(10), _DOUBLED)
+    return tuple(
+        even[d0] + odd[d1] + even[d2] + odd[d3]
+        for d3, d2, d1, d0 in itertools.product(range(10), repeat=4)
+    )
+
+
+def luhn_sums(numbers: Sequence[int], digits: int, double_lowest: bool) -> list[int]:
+    """
+    整列计算 Luhn 加权和
+
+    Args:
+        numbers: 非负整数
+        digits: 号码的最大位数
+        double_lowest: 最低位是否加倍（计算校验位时为 True，校验完整号码时为 False）
+    """
+    table = _luhn_chunk_table(double_lowest)
+    rest, sums = list(numbers), None
+    for _ in range(-(-digits // 4)):
+        chunks = map(table.__getitem__, map(operator.mod, rest, itertools.repeat(LUHN_CHUNK)))
+        sums = list(chunks) if sums is None else list(map(operator.add, sums, chunks))
+        rest = list(map(operator.floordiv, rest, itertools.repeat(LUHN_CHUNK)))
+    return sums if sums is not None else [0] * len(rest)
+
+
+def luhn_check_digits(bodies: Sequence[int], digits: int) -> list[int]:
+    """整列计算校验位：bodies 为不含校验位的号码，digits 为其最大位数"""
+    return list(map(_CHECK_DIGITS.__getitem__, luhn_sums(bodies, digits, True)))
+
+
+def append_luhn(bodies: Sequence[int], digits: int) -> list[int]:
+    """在每个号码末尾追加 Luhn 校验位"""
+    tens = map(operator.mul, bodies, itertools.repeat(10))
+    return list(map(operator.add, tens, luhn_check_digits(bodies, digits)))
+
+
+def luhn_check_digit(body: str) -> str:
+    """计算一个号码（数字串，不含校验位）的校验位"""
+    return str(luhn_check_digits([int(body)], len(body))[0])
+
+
+def _digit_flags(values: Sequence[Any]) -> list[bool]:
+    return [isinstance(value, str) and value.isascii() and value.isdecimal() for value in values]
+
+
+def luhn_valid_batch(numbers: Iterable[Any]) -> list[bool]:
+    """整列校验 Luhn：非数字串（含空串和非字符串）视为无效"""
+    numbers = list(numbers)
+    if not numbers:
+        return []
+    flags = _digit_flags(numbers)
+    values = [int(number) if flag else 0 for number, flag in zip(numbers, flags)]
+    digits = max(len(number) if flag else 0 for number, flag in zip(numbers, flags))
+    remainders = map(operator.mod, luhn_sums(values, digits, False), itertools.repeat(10))
+    return list(map(operator.and_, flags, map(operator.not_, remainders)))
+
+
+def luhn_valid(number: Any) -> bool:
+    """校验一个号码的 Luhn 校验位"""
+    return luhn_valid_batch([number])[0]
+
+
+def iban_numbers(texts: Iterable[str]) -> list[int]:
+    """IBAN（或其片段）整列转换为 mod-97 使用的整数：字母按 A=10 ... Z=35 展开"""
+    return list(map(int, map(str.translate, texts, itertools.repeat(_IBAN_DIGITS))))
+
+
+def mod97(text: str) -> int:
+    """IBAN 片段展开为整数后对 97 取模"""
+    return iban_numbers([text])[0] % 97
+
+
+def iban_valid_batch(ibans: Iterable[Any]) -> list[bool]:
+    """
+    整列校验 IBAN 的 mod-97 校验位（不检查各国长度）
+
+    空格被忽略；格式为两位国家字母、两位校验数字和字母数字的 BBAN。
+    """
+    ibans = [iban.replace(" ", "") if isinstance(iban, str) else "" for iban in ibans]
+    flags = [
+        len(iban) >= 5 and iban.isascii() and iban.isalnum() and iban.isupper()
+        and iban[:2].isalpha() and iban[2:4].isdecimal()
+        for iban in ibans
+    ]
+    rearranged = [iban[4:] + iban[:4] if flag else "0" for iban, flag in zip(ibans, flags)]
+    remainders = map(operator.mod, iban_numbers(rearranged), itertools.repeat(97))
+    return list(map(operator.and_, flags, map(operator.eq, remainders, itertools.repeat(1))))
@@ -0,0 +1,219 @@
+"""
+加密货币地址生成器
+生成带校验的比特币地址（P2PKH、P2SH 的 Base58Check 和 P2WPKH 的 Bech32）与以太坊地址
+"""
+
+import hashlib
+import itertools
+import re
+from dataclasses import dataclass
+from typing import Any, Optional, Union
+
+from dataforge.core.factory import register_generator
+from dataforge.core.generator import (
+    GenerationContext,
+    GeneratorType,
+    ValidatedDataGenerator,
+)
+
+BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+_BASE58_VALUES = {char: value for value, char in enumerate(BASE58_ALPHABET)}
+
+BECH32_ALPHABET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+_BECH32_GENERATORS = (0x3B6A57B2, 0x26508E6D, 0x1EA119FA, 0x3D4233DD, 0x2A1462B3)
+
+# 比特币地址格式 -> 版本字节（Bech32 为None）
+BTC_FORMATS = {"p2pkh": b"\x00", "p2sh": b"\x05", "bech32": None}
+
+FIELDS = ("btc_address", "eth_address")
+
+# 以太坊地址只校验格式：EIP-55 大小写校验需要 Keccak-256，标准库的 sha3_256 与之不同，因此生成全小写地址
+_ETH_PATTERN = re.compile(r"0x[0-9a-fA-F]{40}")
+
+# 公钥哈希的字节数
+HASH_SIZE = 20
+
+
+def base58check(payload: bytes) -> str:
+    """Base58Check 编码：附加两次 SHA-256 的前4字节作为校验"""
+    data = payload + hashlib.sha256(hashlib.sha256(payload).digest()).digest()[:4]
+    value = int.from_bytes(data, "big")
+    chars = []
+    while value:
+        value, digit = divmod(value, 58)
+        chars.append(BASE58_ALPHABET[digit])
+    zeros = len(data) - len(data.lstrip(b"\x00"))
+    return "1" * zeros + "".join(reversed(chars))
+
+
+def base58check_decode(text: str) -> Optional[bytes]:
+    """Base58Check 解码，字符或校验无效时返回None"""
+    value = 0
+    for char in text:
+        digit = _BASE58_VALUES.get(char)
+        if digit is None:
+            return None
+        value = value * 58 + digit
+    zeros = len(text) - len(text.lstrip("1"))
+    size = (value.bit_length() + 7) // 8
+    data = b"\x00" * zeros + value.to_bytes(size, "big")
+    payload, checksum = data[:-4], data[-4:]
+    if len(data) < 5 or hashlib.sha256(hashlib.sha256(payload).digest()).digest()[:4] != checksum:
+        return None
+    return payload
+
+
+def _bech32_polymod(values: list[int]) -> int:
+    checksum = 1
+    for value in values:
+        top = checksum >> 25
+        checksum = (checksum & 0x1FFFFFF) << 5 ^ value
+        for bit, generator in enumerate(_BECH32_GENERATORS):
+            if top >> bit & 1:
+                checksum ^= generator
+    return checksum
+
+
+def _bech32_expand(hrp: str) -> list[int]:
+    return [ord(char) >> 5 for char in hrp] + [0] + [ord(char) & 31 for char in hrp]
+
+
+def _to_5bit(data: bytes) -> list[int]:
+    value = int.from_bytes(data, "big")
+    bits = len(data) * 8
+    padding = -bits % 5
+    value <<= padding
+    return [(value >> shift) & 31 for shift in range(bits + padding - 5, -1, -5)]
+
+
+def bech32_address(program: bytes, hrp: str = "bc") -> str:
+    """见证版本为0的 Bech32 地址（BIP 173）"""
+    data = [0] + _to_5bit(program)
+    polymod = _bech32_polymod(_bech32_expand(hrp) + data + [0] * 6) ^ 1
+    checksum = [(polymod >> 5 * (5 - index)) & 31 for index in range(6)]
+    return hrp + "1" + "".join(BECH32_ALPHABET[value] for value in data + checksum)
+
+
+def bech32_valid(text: str, hrp: str = "bc") -> bool:
+    """校验 Bech32 地址的字符集和校验和"""
+    text = text.lower()
+    head, separator, body = text.rpartition("1")
+    if head != hrp or not separator or len(body) < 7 or any(char not in BECH32_ALPHABET for char in body):
+        return False
+    return _bech32_polymod(_bech32_expand(hrp) + [BECH32_ALPHABET.index(char) for char in body]) == 1
+
+
+def btc_address_valid(text: str) -> bool:
+    """校验比特币地址（Base58Check 或 Bech32）"""
+    if text[:3].lower() == "bc1":
+        return bech32_valid(text)
+    payload = base58check_decode(text)
+    return payload is not None and len(payload) == HASH_SIZE + 1 and payload[:1] in (b"\x00", b"\x05")
+
+
+@dataclass(frozen=True)
+class CryptoPlan:
+    """加密货币地址生成计划"""
+
+    btc_format: str
+    field: Optional[str]
+
+
+@register_generator("crypto_address", ["加密货币地址", "钱包地址"])
+class CryptoAddressGenerator(ValidatedDataGenerator):
+    """
+    加密货币地址生成器
+
+    btc_format 为 p2pkh（1开头）、p2sh（3开头）或 bech32（bc1开头）；地址由随机的公钥哈希编码而来，带有效校验。
+    默认输出含比特币和以太坊地址的记录（字典），field 指定字段名时只输出该字段。
+    """
+
+    @property
+    def generator_type(self) -> GeneratorType:
+        return GeneratorType.FINANCE
+
+    @property
+    def supported_parameters(self) -> list[str]:
+        return ["btc_format", "field"]
+
+    def _setup(self) -> None:
+        """配置生成器参数"""
+        self._plan = self._plan_for(self.parameters)
+        self.btc_format = self._plan.btc_format
+        self.field = self._plan.field
+
+    def _build_plan(self, parameters: dict[str, Any]) -> CryptoPlan:
+        """编译加密货币地址生成计划"""
+        btc_format = str(parameters.get("btc_format", "p2pkh")).lower()
+        if btc_format not in BTC_FORMATS:
+            raise ValueError(f"Unknown btc_format: {btc_format}, expected one of {list(BTC_FORMATS)}")
+        field = parameters.get("field")
+        if field is not None and field not in FIELDS:
+            raise ValueError(f"Unknown field: {field}, expected one of {FIELDS}")
+        return CryptoPlan(btc_format, field)
+
+    def _hashes(self, count: int) -> list[bytes]:
+        """count 个随机的20字节哈希（一次取出整块随机字节后切分）"""
+        data = self.rng.randbytes(HASH_SIZE * count)
+        return [data[start:start + HASH_SIZE] for start in range(0, HASH_SIZE * count, HASH_SIZE)]
+
+    def _columns(self, plan: CryptoPlan, count: int) -> dict[str, list[str]]:
+        """整列生成各字段"""
+        columns = {}
+        if plan.field in (None, "btc_address"):
+            version = BTC_FORMATS[plan.btc_format]
+            hashes = self._hashes(count)
+            if version is None:
+                columns["btc_address"] = list(map(bech32_address, hashes))
+            else:
+                columns["btc_address"] = list(map(base58check, map(version.__add__, hashes)))
+        if plan.field in (None, "eth_address"):
+            digits = self.rng.randbytes(HASH_SIZE * count).hex()
+            size = 2 * HASH_SIZE
+            columns["eth_address"] = ["0x" + digits[start:start + size] for start in range(0, size * count, size)]
+        return columns
+
+    def _records(self, plan: CryptoPlan, count: int) -> Union[list[dict[str, str]], list[str]]:
+        columns = self._columns(plan, count)
+        if plan.field is not None:
+            return columns[plan.field]
+        return list(map(dict, map(zip, itertools.repeat(FIELDS), zip(*columns.values()))))
+
+    def _generate_raw(self, context: Optional[GenerationContext] = None) -> Union[dict[str, str], str]:
+        """生成一条记录"""
+        return self._records(self._plan, 1)[0]
+
+    def generate_batch(
+        self,
+        count: int,
+        context: Optional[GenerationContext] = None,
+        workers: int = 1,
+        executor: str = "thread",
+        seed: Optional[int] = None,
+        **kwargs,
+    ) -> list:
+        """
+        批量生成地址记录
+
+        kwargs 为仅对本次调用生效的参数覆盖，其余参数含义同 DataGenerator.generate_batch。
+        """
+        if self.value_pool is not None and not kwargs:
+            return super().generate_batch(count, context, workers=workers, executor=executor, seed=seed)
+        plan = self._plan_with_overrides(kwargs)
+        return self._run_batch(
+            lambda rows: self._records(plan, rows),
+            count,
+            workers=workers,
+            executor=executor,
+            seed=seed,
+        )
+
+    def validate(self, data: Any) -> bool:
+        """验证地址记录，或单个比特币/以太坊地址"""
+        if isinstance(data, dict):
+            return all(self.validate(data[key]) for key in FIELDS if key in data) and any(key in data for key in FIELDS)
+        if not isinstance(data, str):
+            return False
+        if data.startswith("0x"):
+            return bool(_ETH_PATTERN.fullmatch(data))
+        return btc_address_valid(data)
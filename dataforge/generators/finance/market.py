@@ -0,0 +1,178 @@
+"""
+股票代码生成器
+按沪深北交易所各板块的代码号段生成A股代码、证券简称和交易所
+"""
+
+import itertools
+import operator
+from dataclasses import dataclass
+from typing import Any, Optional, Union
+
+from dataforge.core import sampling
+from dataforge.core.factory import register_generator
+from dataforge.core.generator import (
+    GenerationContext,
+    GeneratorType,
+    ValidatedDataGenerator,
+)
+
+# 交易所代码 -> (交易所名称, [(板块, 代码起, 代码止, 上市公司数（约数）)])
+MARKETS = {
+    "SH": ("上海证券交易所", [("主板", 600000, 605999, 1700), ("科创板", 688000, 689999, 580)]),
+    "SZ": ("深圳证券交易所", [("主板", 1, 3999, 1500), ("创业板", 300000, 301999, 1350)]),
+    "BJ": ("北京证券交易所", [("北交所", 830000, 839999, 130), ("北交所", 870000, 873999, 60), ("北交所", 920000, 920999, 70)]),
+}
+_MARKET_ALIASES = {"上海": "SH", "深圳": "SZ", "北京": "BJ", **{name: code for code, (name, _) in MARKETS.items()}}
+
+# 证券简称：字号（两字）+ 行业
+NAME_HEADS = "华中国东长恒金海新天宏永大兴万鑫鼎瑞光远安通盛康"
+NAME_TAILS = "信达源泰联盛创宇昌丰阳和正德利凯"
+NAME_INDUSTRIES = (
+    "科技", "股份", "电子", "医药", "能源", "银行", "证券", "地产", "传媒", "环保",
+    "材料", "智能", "电气", "食品", "化工", "汽车", "物流", "建设", "矿业", "药业",
+)
+STOCK_NAMES = tuple(
+    head + tail + industry for head, tail, industry in itertools.product(NAME_HEADS, NAME_TAILS, NAME_INDUSTRIES)
+)
+
+FIELDS = ("code", "symbol", "name", "market", "board")
+
+# 代码 -> 简称的打散乘数（与简称个数互素），同一代码总是对应同一简称
+_NAME_MULTIPLIER = 2654435761
+
+
+@dataclass(frozen=True)
+class StockPlan:
+    """股票代码生成计划"""
+
+    # (交易所代码, 交易所名称, 板块, 代码起, 号段大小)
+    segments: tuple[tuple[str, str, str, int, int], ...]
+    lanes: tuple[int, ...]
+    field: Optional[str]
+
+
+def stock_name(code: Union[int, str]) -> str:
+    """代码对应的证券简称"""
+    return STOCK_NAMES[int(code) * _NAME_MULTIPLIER % len(STOCK_NAMES)]
+
+
+@register_generator("stock_code", ["股票代码", "证券代码"])
+class StockCodeGenerator(ValidatedDataGenerator):
+    """
+    股票代码生成器
+
+    market 为 SH/SZ/BJ（或上海/深圳/北京），board 为主板、科创板、创业板或北交所；
+    默认输出记录（字典），field 指定字段名时只输出该字段。
+    """
+
+    @property
+    def generator_type(self) -> GeneratorType:
+        return GeneratorType.FINANCE
+
+    @property
+    def supported_parameters(self) -> list[str]:
+        return ["market", "board", "field"]
+
+    def _setup(self) -> None:
+        """配置生成器参数"""
+        self._plan = self._plan_for(self.parameters)
+        self.market = self.parameters.get("market")
+        self.board = self.parameters.get("board")
+        self.field = self._plan.field
+
+    def _build_plan(self, parameters: dict[str, Any]) -> StockPlan:
+        """编译股票代码生成计划：候选号段按上市公司数加权"""
+        market = parameters.get("market")
+        market = _MARKET_ALIASES.get(market, market.upper() if isinstance(market, str) else market)
+        if market is not None and market not in MARKETS:
+            raise ValueError(f"Unknown market: {market}, expected one of {list(MARKETS)}")
+        board = parameters.get("board")
+        field = parameters.get("field")
+        if field is not None and field not in FIELDS:
+            raise ValueError(f"Unknown field: {field}, expected one of {FIELDS}")
+
+        segments, weights = [], []
+        for code, (name, boards) in MARKETS.items():
+            for board_name, low, high, listed in boards:
+                if market in (None, code) and board in (None, board_name):
+                    segments.append((code, name, board_name, low, high - low + 1))
+                    weights.append(listed)
+        if not segments:
+            raise ValueError(f"no stock codes for market={market}, board={board}")
+        return StockPlan(tuple(segments), sampling.lane_table(range(len(segments)), weights), field)
+
+    def _columns(self, plan: StockPlan, count: int) -> dict[str, list[str]]:
+        """整列生成各字段"""
+        indexes = sampling.sample(self.rng, plan.lanes, count)
+        lows = tuple(segment[3] for segment in plan.segments)
+        sizes = tuple(segment[4] for segment in plan.segments)
+        numbers = list(map(
+            operator.add,
+            map(lows.__getitem__, indexes),
+            map(operator.mod, sampling.random_below(self.rng, 1 << 64, count), map(sizes.__getitem__, indexes)),
+        ))
+        codes = list(map("{:06d}".format, numbers))
+        suffixes = tuple("." + segment[0] for segment in plan.segments)
+        scrambled = map(operator.mul, numbers, itertools.repeat(_NAME_MULTIPLIER))
+        name_keys = map(operator.mod, scrambled, itertools.repeat(len(STOCK_NAMES)))
+        columns = {
+            "code": codes,
+            "symbol": list(map(operator.add, codes, map(suffixes.__getitem__, indexes))),
+            "name": list(map(STOCK_NAMES.__getitem__, name_keys)),
+        }
+        for key, position in (("market", 1), ("board", 2)):
+            values = tuple(segment[position] for segment in plan.segments)
+            columns[key] = list(map(values.__getitem__, indexes))
+        return columns
+
+    def _records(self, plan: StockPlan, count: int) -> Union[list[dict[str, str]], list[str]]:
+        columns = self._columns(plan, count)
+        if plan.field is not None:
+            return columns[plan.field]
+        return list(map(dict, map(zip, itertools.repeat(FIELDS), zip(*columns.values()))))
+
+    def _generate_raw(self, context: Optional[GenerationContext] = None) -> Union[dict[str, str], str]:
+        """生成一条记录"""
+        return self._records(self._plan, 1)[0]
+
+    def generate_batch(
+        self,
+        count: int,
+        context: Optional[GenerationContext] = None,
+        workers: int = 1,
+        executor: str = "thread",
+        seed: Optional[int] = None,
+        **kwargs,
+    ) -> list:
+        """
+        批量生成股票代码记录
+
+        kwargs 为仅对本次调用生效的参数覆盖，其余参数含义同 DataGenerator.generate_batch。
+        """
+        if self.value_pool is not None and not kwargs:
+            return super().generate_batch(count, context, workers=workers, executor=executor, seed=seed)
+        plan = self._plan_with_overrides(kwargs)
+        return self._run_batch(
+            lambda rows: self._records(plan, rows),
+            count,
+            workers=workers,
+            executor=executor,
+            seed=seed,
+        )
+
+    def validate(self, data: Any) -> bool:
+        """验证股票代码（可带 .SH/.SZ/.BJ 后缀）或记录"""
+        if self._plan.field not in (None, "code", "symbol"):
+            return True
+        code = data.get("symbol") if isinstance(data, dict) else data
+        if not isinstance(code, str):
+            return False
+        code, _, suffix = code.partition(".")
+        if len(code) != 6 or not code.isascii() or not code.isdecimal():
+            return False
+        number = int(code)
+        return any(
+            low <= number <= high and suffix in ("", market)
+            for market, (_, boards) in MARKETS.items()
+            for _, low, high, _ in boards
+        )
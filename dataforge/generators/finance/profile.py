@@ -0,0 +1,167 @@
+"""
+金融档案生成器
+生成年收入、信用评分、投资偏好和风险承受能力，投资偏好与风险承受能力相关
+"""
+
+import itertools
+import math
+import operator
+from dataclasses import dataclass
+from typing import Any, Optional, Union
+
+from dataforge.core import sampling
+from dataforge.core.distributions import Distribution, build_distribution, sample_values
+from dataforge.core.factory import register_generator
+from dataforge.core.generator import (
+    GenerationContext,
+    GeneratorType,
+    ValidatedDataGenerator,
+)
+
+# 风险承受能力 -> (权重, {投资偏好: 条件权重})
+RISK_PROFILES = {
+    "保守型": (15, {"银行存款": 5, "国债": 4, "货币基金": 3}),
+    "稳健型": (30, {"银行理财": 4, "债券基金": 4, "国债": 2, "保险": 2}),
+    "平衡型": (30, {"混合基金": 4, "指数基金": 3, "银行理财": 2, "黄金": 1}),
+    "成长型": (17, {"股票型基金": 4, "股票": 4, "指数基金": 2}),
+    "进取型": (8, {"股票": 5, "期货": 2, "私募基金": 2, "加密货币": 1}),
+}
+INVESTMENT_PREFERENCES = frozenset(
+    preference for _, preferences in RISK_PROFILES.values() for preference in preferences
+)
+
+# 信用评分范围（参照芝麻信用分）
+CREDIT_SCORE_RANGE = (350, 950)
+
+FIELDS = ("annual_income", "credit_score", "investment_preference", "risk_tolerance")
+
+
+@dataclass(frozen=True)
+class ProfilePlan:
+    """金融档案生成计划"""
+
+    min_income: int
+    max_income: int
+    # 年收入（元）的对数正态分布
+    income: Distribution
+    credit_score: Distribution
+    # (风险承受能力, 投资偏好) 的联合采样查表
+    preferences: tuple[tuple[str, str], ...]
+    field: Optional[str]
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+@register_generator("finance_profile", ["金融档案", "财务画像"])
+class FinanceProfileGenerator(ValidatedDataGenerator):
+    """
+    金融档案生成器
+
+    年收入服从截断到 [min_income, max_income] 的对数正态分布（中位数 median_income），取整到百元；
+    信用评分服从截断正态分布。默认输出记录（字典），field 指定字段名时只输出该字段。
+    """
+
+    @property
+    def generator_type(self) -> GeneratorType:
+        return GeneratorType.FINANCE
+
+    @property
+    def supported_parameters(self) -> list[str]:
+        return ["min_income", "max_income", "median_income", "income_sigma", "credit_mean", "credit_std", "field"]
+
+    def _setup(self) -> None:
+        """配置生成器参数"""
+        self._plan = self._plan_for(self.parameters)
+        self.field = self._plan.field
+
+    def _build_plan(self, parameters: dict[str, Any]) -> ProfilePlan:
+        """编译金融档案生成计划"""
+        low = int(parameters.get("min_income", 30000))
+        high = int(parameters.get("max_income", 2000000))
+        if not 0 < low < high:
+            raise ValueError(f"income range must satisfy 0 < min_income < max_income, got [{low}, {high}]")
+        field = parameters.get("field")
+        if field is not None and field not in FIELDS:
+            raise ValueError(f"Unknown field: {field}, expected one of {FIELDS}")
+        income = build_distribution(
+            "lognormal", low, high,
+            median=parameters.get("median_income", 120000), sigma=parameters.get("income_sigma", 0.7),
+        )
+        score_low, score_high = CREDIT_SCORE_RANGE
+        credit_score = build_distribution(
+            "normal", score_low, score_high + 1,
+            mean=parameters.get("credit_mean", 680), std=parameters.get("credit_std", 80),
+        )
+        pairs, weights = [], []
+        for risk, (risk_weight, preferences) in RISK_PROFILES.items():
+            total = sum(preferences.values())
+            for preference, weight in preferences.items():
+                pairs.append((risk, preference))
+                weights.append(risk_weight * weight / total)
+        return ProfilePlan(low, high, income, credit_score, sampling.lane_table(pairs, weights), field)
+
+    def _columns(self, plan: ProfilePlan, count: int) -> dict[str, list]:
+        """整列生成各字段"""
+        incomes = map(round, sample_values(self.rng, plan.income, count), itertools.repeat(-2))
+        # 取整到百元后仍限制在收入范围内
+        incomes = map(max, map(int, incomes), itertools.repeat(plan.min_income))
+        incomes = map(min, incomes, itertools.repeat(plan.max_income))
+        pairs = sampling.sample(self.rng, plan.preferences, count)
+        return {
+            "annual_income": list(incomes),
+            "credit_score": list(map(math.floor, sample_values(self.rng, plan.credit_score, count))),
+            "investment_preference": list(map(operator.itemgetter(1), pairs)),
+            "risk_tolerance": list(map(operator.itemgetter(0), pairs)),
+        }
+
+    def _records(self, plan: ProfilePlan, count: int) -> Union[list[dict[str, Any]], list]:
+        columns = self._columns(plan, count)
+        if plan.field is not None:
+            return columns[plan.field]
+        return list(map(dict, map(zip, itertools.repeat(FIELDS), zip(*columns.values()))))
+
+    def _generate_raw(self, context: Optional[GenerationContext] = None) -> Union[dict[str, Any], int, str]:
+        """生成一条记录"""
+        return self._records(self._plan, 1)[0]
+
+    def generate_batch(
+        self,
+        count: int,
+        context: Optional[GenerationContext] = None,
+        workers: int = 1,
+        executor: str = "thread",
+        seed: Optional[int] = None,
+        **kwargs,
+    ) -> list:
+        """
+        批量生成金融档案
+
+        kwargs 为仅对本次调用生效的参数覆盖，其余参数含义同 DataGenerator.generate_batch。
+        """
+        if self.value_pool is not None and not kwargs:
+            return super().generate_batch(count, context, workers=workers, executor=executor, seed=seed)
+        plan = self._plan_with_overrides(kwargs)
+        return self._run_batch(
+            lambda rows: self._records(plan, rows),
+            count,
+            workers=workers,
+            executor=executor,
+            seed=seed,
+        )
+
+    def validate(self, data: Any) -> bool:
+        """验证金融档案记录"""
+        plan = self._plan
+        if plan.field is not None:
+            data = {plan.field: data}
+        if not isinstance(data, dict):
+            return False
+        checks = {
+            "annual_income": lambda value: _is_int(value) and plan.min_income <= value <= plan.max_income,
+            "credit_score": lambda value: _is_int(value) and CREDIT_SCORE_RANGE[0] <= value <= CREDIT_SCORE_RANGE[1],
+            "investment_preference": INVESTMENT_PREFERENCES.__contains__,
+            "risk_tolerance": RISK_PROFILES.__contains__,
+        }
+        return all(key in data and checks[key](data[key]) for key in checks if plan.field in (None, key))
@@ -0,0 +1,24 @@
+"""
+Network Generators
+
+This module contains generators for network data:
+- IPv4 and IPv6 addresses sampled as integers from CIDR-constrained address spaces
+- MAC addresses
+- Domain names and URLs
+"""
+
+# Import all network generators to ensure registration
+try:
+    from .ip import IPAddressGenerator, IPv4AddressGenerator, IPv6AddressGenerator
+except ImportError:
+    pass
+
+try:
+    from .mac import MACAddressGenerator
+except ImportError:
+    pass
+
+try:
+    from .web import DomainGenerator, URLGenerator
+except ImportError:
+    pass
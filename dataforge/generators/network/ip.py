@@ -0,0 +1,434 @@
+"""
+IP 地址生成器
+
+地址以整数（IPv4 为 uint32，IPv6 为 uint128）整列生成：候选地址空间为若干互不相交的整数区间，
+CIDR 约束和保留地址的排除在编译计划时以区间运算完成；采样时整列随机数经二分（bisect，C层）定位
+所在区间后平移即得地址，不需要拒绝采样。IPv4 由 65536 项的查表整列格式化，IPv6 由 struct 整列拆分为8组。
+"""
+
+import bisect
+import functools
+import ipaddress
+import itertools
+import operator
+import struct
+from array import array
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional, Sequence, Union
+
+from dataforge.core import sampling
+from dataforge.core.factory import register_generator
+from dataforge.core.generator import (
+    GenerationContext,
+    GeneratorType,
+    ValidatedDataGenerator,
+)
+from dataforge.core.preloader import get_table
+
+# IPv4 特殊用途地址（RFC 6890），公网地址排除这些区间
+IPV4_RESERVED = (
+    "0.0.0.0/8", "10.0.0.0/8", "100.64.0.0/10", "127.0.0.0/8", "169.254.0.0/16", "172.16.0.0/12",
+    "192.0.0.0/24", "192.0.2.0/24", "192.88.99.0/24", "192.168.0.0/16", "198.18.0.0/15",
+    "198.51.100.0/24", "203.0.113.0/24", "224.0.0.0/4", "240.0.0.0/4",
+)
+IPV4_PRIVATE = ("10.0.0.0/8", "172.16.0.0/12", "192.168.0.0/16")
+
+# IPv6 全球单播地址及其中的特殊用途地址；私有地址为唯一本地地址
+IPV6_GLOBAL = ("2000::/3",)
+IPV6_RESERVED = ("2001::/23", "2001:db8::/32", "2002::/16")
+IPV6_PRIVATE = ("fc00::/7",)
+
+# 国内运营商 -> (地址占比权重, IPv4 地址块)
+CHINA_ISP_BLOCKS = {
+    "中国电信": (40, (
+        "58.32.0.0/13", "61.128.0.0/10", "113.64.0.0/10", "116.224.0.0/12", "180.96.0.0/11",
+        "183.0.0.0/10", "202.96.0.0/12", "219.128.0.0/11", "222.64.0.0/11",
+    )),
+    "中国联通": (25, (
+        "60.0.0.0/11", "61.48.0.0/13", "112.224.0.0/11", "123.112.0.0/12", "125.32.0.0/12", "221.192.0.0/11",
+    )),
+    "中国移动": (28, (
+        "36.128.0.0/10", "111.0.0.0/10", "112.0.0.0/10", "117.128.0.0/10", "120.192.0.0/10", "183.192.0.0/10",
+        "223.64.0.0/11",
+    )),
+    "中国教育网": (3, ("59.64.0.0/12", "166.111.0.0/16", "202.112.0.0/13")),
+    "阿里云": (2, ("39.96.0.0/13", "47.92.0.0/14")),
+    "腾讯云": (2, ("49.232.0.0/14", "81.68.0.0/14")),
+}
+_ISP_ALIASES = {
+    "telecom": "中国电信", "电信": "中国电信",
+    "unicom": "中国联通", "联通": "中国联通",
+    "mobile": "中国移动", "移动": "中国移动",
+    "cernet": "中国教育网", "教育网": "中国教育网",
+    "aliyun": "阿里云", "tencent": "腾讯云",
+}
+
+ADDRESS_TYPES = ("PUBLIC", "PRIVATE", "CHINA", "ANY")
+_TYPE_ALIASES = {"公网": "PUBLIC", "内网": "PRIVATE", "私有": "PRIVATE", "国内": "CHINA"}
+
+_IPV6_GROUPS = struct.Struct(">8H")
+
+
+def cidr_interval(cidr: str) -> tuple[int, int]:
+    """CIDR 对应的整数区间 [start, end)（编译计划时使用，不在逐行生成中构造 ipaddress 对象）"""
+    network = ipaddress.ip_network(cidr, strict=False)
+    start = int(network.network_address)
+    return start, start + network.num_addresses
+
+
+# 有序、互不相交的半开区间 [start, end) 列表
+Intervals = list[tuple[int, int]]
+
+
+def merge_intervals(intervals: Iterable[tuple[int, int]]) -> Intervals:
+    """合并重叠或相邻的区间"""
+    merged: list[tuple[int, int]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        elif start < end:
+            merged.append((start, end))
+    return merged
+
+
+def subtract_intervals(intervals: Iterable[tuple[int, int]], removed: Iterable[tuple[int, int]]) -> Intervals:
+    """从区间中去掉 removed 覆盖的部分"""
+    removed = merge_intervals(removed)
+    result = []
+    for start, end in merge_intervals(intervals):
+        for cut_start, cut_end in removed:
+            if cut_end <= start or cut_start >= end:
+                continue
+            if cut_start > start:
+                result.append((start, cut_start))
+            start = max(start, cut_end)
+            if start >= end:
+                break
+        if start < end:
+            result.append((start, end))
+    return result
+
+
+def intersect_intervals(intervals: Iterable[tuple[int, int]], allowed: Iterable[tuple[int, int]]) -> Intervals:
+    """区间与 allowed 的交集"""
+    allowed = merge_intervals(allowed)
+    return [
+        (max(start, low), min(end, high))
+        for start, end in merge_intervals(intervals)
+        for low, high in allowed
+        if max(start, low) < min(end, high)
+    ]
+
+
+def build_ip_block_table() -> dict[str, Any]:
+    """构建各类地址和国内运营商地址块的整数区间表（供预加载器缓存）"""
+
+    def intervals(cidrs: Iterable[str]) -> Intervals:
+        return merge_intervals(map(cidr_interval, cidrs))
+
+    return {
+        "reserved": {4: intervals(IPV4_RESERVED), 6: intervals(IPV6_RESERVED)},
+        "private": {4: intervals(IPV4_PRIVATE), 6: intervals(IPV6_PRIVATE)},
+        "global": {4: [(0, 1 << 32)], 6: intervals(IPV6_GLOBAL)},
+        "isps": {name: (weight, intervals(cidrs)) for name, (weight, cidrs) in CHINA_ISP_BLOCKS.items()},
+    }
+
+
+@dataclass(frozen=True)
+class AddressSpace:
+    """
+    候选地址空间：互不相交且有序的区间 [starts[i], starts[i] + sizes[i])
+
+    lanes 为None时所有地址等概率（按累计长度二分定位区间）；否则先按 lanes 查表选区间，再在区间内均匀取值。
+    """
+
+    starts: tuple[int, ...]
+    sizes: tuple[int, ...]
+    # 各区间末端的累计长度
+    cumulative: tuple[int, ...]
+    lanes: Optional[tuple[int, ...]] = None
+
+    @property
+    def total(self) -> int:
+        return self.cumulative[-1]
+
+    def __contains__(self, value: int) -> bool:
+        index = bisect.bisect_right(self.starts, value) - 1
+        return index >= 0 and value < self.starts[index] + self.sizes[index]
+
+
+def address_space(blocks: Sequence[tuple[int, int, float]]) -> AddressSpace:
+    """
+    由 (起, 止, 每个地址的权重) 构建地址空间
+
+    各区间的权重相同时为精确的均匀采样，否则区间按 长度 × 权重 加权选取。
+
+    Raises:
+        ValueError: 地址空间为空
+    """
+    blocks = sorted(block for block in blocks if block[0] < block[1])
+    if not blocks:
+        raise ValueError("address space is empty")
+    starts = tuple(start for start, _, _ in blocks)
+    sizes = tuple(end - start for start, end, _ in blocks)
+    densities = {density for _, _, density in blocks}
+    lanes = None
+    if len(densities) > 1:
+        weights = [size * density for size, (_, _, density) in zip(sizes, blocks)]
+        lanes = sampling.lane_table(range(len(blocks)), weights)
+    return AddressSpace(starts, sizes, tuple(itertools.accumulate(sizes)), lanes)
+
+
+def sample_addresses(rng: Any, space: AddressSpace, count: int) -> list[int]:
+    """从地址空间整列采样 count 个地址"""
+    if space.lanes is None:
+        offsets = sampling.random_below(rng, space.total, count)
+        indexes = map(bisect.bisect_right, itertools.repeat(space.cumulative), offsets)
+        # 第 i 个区间内的偏移量 r 对应地址 starts[i] + r - (cumulative[i] - sizes[i])
+        shifts = tuple(start - end + size for start, end, size in zip(space.starts, space.cumulative, space.sizes))
+        return list(map(operator.add, offsets, map(shifts.__getitem__, indexes)))
+    indexes = sampling.sample(rng, space.lanes, count)
+    bound = 1 << 128 if max(space.sizes) > 1 << 64 else 1 << 64
+    offsets = map(operator.mod, sampling.random_below(rng, bound, count), map(space.sizes.__getitem__, indexes))
+    return list(map(operator.add, map(space.starts.__getitem__, indexes), offsets))
+
+
+@functools.lru_cache(maxsize=1)
+def _ipv4_halves() -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """IPv4 高16位（"a.b."）和低16位（"c.d"）的文本查表"""
+    high = tuple(f"{value >> 8}.{value & 255}." for value in range(1 << 16))
+    low = tuple(f"{value >> 8}.{value & 255}" for value in range(1 << 16))
+    return high, low
+
+
+def format_ipv4(values: Sequence[int]) -> list[str]:
+    """整列格式化 IPv4 地址（点分十进制）"""
+    high, low = _ipv4_halves()
+    heads = map(high.__getitem__, map(operator.rshift, values, itertools.repeat(16)))
+    tails = map(low.__getitem__, map(operator.and_, values, itertools.repeat(0xFFFF)))
+    return list(map(operator.add, heads, tails))
+
+
+def _compress_ipv6(text: str) -> str:
+    """按 RFC 5952 把最长（至少两组）的连续全零组压缩为 "::" """
+    groups = text.split(":")
+    best_start, best_length, start = -1, 1, None
+    for index, group in enumerate(groups + ["x"]):
+        if group == "0":
+            start = index if start is None else start
+        elif start is not None:
+            if index - start > best_length:
+                best_start, best_length = start, index - start
+            start = None
+    if best_start < 0:
+        return text
+    return ":".join(groups[:best_start]) + "::" + ":".join(groups[best_start + best_length:])
+
+
+def format_ipv6(values: Sequence[int]) -> list[str]:
+    """整列格式化 IPv6 地址（RFC 5952 压缩格式）；只有含连续全零组的地址逐个压缩"""
+    packed = map(int.to_bytes, values, itertools.repeat(16), itertools.repeat("big"))
+    texts = list(map("%x:%x:%x:%x:%x:%x:%x:%x".__mod__, map(_IPV6_GROUPS.unpack, packed)))
+    for index, text in enumerate(texts):
+        if ":0:0" in ":" + text:
+            texts[index] = _compress_ipv6(text)
+    return texts
+
+
+def parse_ipv4(text: str) -> Optional[int]:
+    """解析点分十进制 IPv4 地址，格式无效时返回None"""
+    parts = text.split(".")
+    if len(parts) != 4 or not all(part.isascii() and part.isdecimal() and len(part) <= 3 for part in parts):
+        return None
+    octets = [int(part) for part in parts]
+    if max(octets) > 255 or any(len(part) > 1 and part[0] == "0" for part in parts):
+        return None
+    return octets[0] << 24 | octets[1] << 16 | octets[2] << 8 | octets[3]
+
+
+def parse_ipv6(text: str) -> Optional[int]:
+    """解析 IPv6 地址，格式无效时返回None"""
+    try:
+        return int(ipaddress.IPv6Address(text))
+    except ValueError:
+        return None
+
+
+@dataclass(frozen=True)
+class IPPlan:
+    """IP 地址生成计划"""
+
+    version: int
+    address_type: str
+    space: AddressSpace
+    # "TEXT" 或 "INTEGER"
+    output: str
+
+
+@register_generator("ip_address", ["IP地址", "IP"])
+class IPAddressGenerator(ValidatedDataGenerator):
+    """
+    IP 地址生成器
+
+    version 为 4 或 6；type 为 PUBLIC（排除保留地址的公网地址）、PRIVATE（私有地址）、
+    CHINA（按运营商加权的国内 IPv4 地址块，可用 isp 指定运营商）或 ANY；cidr 进一步限定地址范围。
+    format 为 INTEGER 时输出整数。
+    """
+
+    DEFAULT_VERSION = 4
+
+    @property
+    def generator_type(self) -> GeneratorType:
+        return GeneratorType.NETWORK
+
+    @property
+    def supported_parameters(self) -> list[str]:
+        return ["version", "type", "cidr", "isp", "format"]
+
+    def _setup(self) -> None:
+        """配置生成器参数"""
+        self._plan = self._plan_for(self.parameters)
+        self.version = self._plan.version
+        self.address_type = self._plan.address_type
+
+    def _build_plan(self, parameters: dict[str, Any]) -> IPPlan:
+        """编译 IP 地址生成计划：地址空间由区间的交、差运算得到"""
+        version = str(parameters.get("version", self.DEFAULT_VERSION)).lower().removeprefix("ipv")
+        if version not in ("4", "6"):
+            raise ValueError(f"version must be 4 or 6, got {parameters.get('version')}")
+        version = int(version)
+        address_type = str(parameters.get("type", "PUBLIC"))
+        address_type = _TYPE_ALIASES.get(address_type, address_type.upper())
+        if address_type not in ADDRESS_TYPES:
+            raise ValueError(f"Unknown type: {address_type}, expected one of {ADDRESS_TYPES}")
+        isp = parameters.get("isp")
+        isp = _ISP_ALIASES.get(str(isp).lower(), isp) if isp is not None else None
+        if isp is not None and (isp not in CHINA_ISP_BLOCKS or address_type != "CHINA"):
+            raise ValueError(f"isp requires type CHINA and one of {list(CHINA_ISP_BLOCKS)}, got {isp}")
+
+        table = get_table("network.ip_blocks")
+        if address_type == "CHINA":
+            if version != 4:
+                raise ValueError("type CHINA only supports IPv4")
+            blocks = []
+            for name, (weight, intervals) in table["isps"].items():
+                if isp in (None, name):
+                    size = sum(end - start for start, end in intervals)
+                    blocks.extend((start, end, weight / size) for start, end in intervals)
+        else:
+            if address_type == "ANY":
+                intervals = [(0, 1 << (32 if version == 4 else 128))]
+            elif address_type == "PRIVATE":
+                intervals = table["private"][version]
+            else:
+                intervals = subtract_intervals(table["global"][version], table["reserved"][version])
+            blocks = [(start, end, 1.0) for start, end in intervals]
+
+        cidr = parameters.get("cidr")
+        if cidr:
+            cidrs = [cidr] if isinstance(cidr, str) else list(cidr)
+            allowed = [cidr_interval(item) for item in cidrs]
+            if any(ipaddress.ip_network(item, strict=False).version != version for item in cidrs):
+                raise ValueError(f"cidr {cidr} does not match IP version {version}")
+            blocks = [
+                (low, high, density)
+                for start, end, density in blocks
+                for low, high in intersect_intervals([(start, end)], allowed)
+            ]
+        if not blocks:
+            raise ValueError(f"no {address_type} IPv{version} addresses in cidr {cidr}")
+
+        output = str(parameters.get("format", "TEXT")).upper()
+        if output not in ("TEXT", "INTEGER"):
+            raise ValueError(f"Unknown format: {output}, expected TEXT or INTEGER")
+        return IPPlan(version, address_type, address_space(blocks), output)
+
+    def _sample(self, plan: IPPlan, count: int) -> list[int]:
+        values = sample_addresses(self.rng, plan.space, count)
+        if self.config.validate and values:
+            # 地址由区间平移得到，只需确认整列落在地址空间的范围内
+            space = plan.space
+            if min(values) < space.starts[0] or max(values) >= space.starts[-1] + space.sizes[-1]:
+                raise ValueError("Generated data failed validation: address outside the address space")
+        return values
+
+    def _format(self, plan: IPPlan, values: list[int]) -> list[Union[str, int]]:
+        if plan.output == "INTEGER":
+            return values
+        return format_ipv4(values) if plan.version == 4 else format_ipv6(values)
+
+    def _generate_raw(self, context: Optional[GenerationContext] = None) -> Union[str, int]:
+        """生成一个地址"""
+        plan = self._plan
+        return self._format(plan, self._sample(plan, 1))[0]
+
+    def generate_batch(
+        self,
+        count: int,
+        context: Optional[GenerationContext] = None,
+        workers: int = 1,
+        executor: str = "thread",
+        seed: Optional[int] = None,
+        **kwargs,
+    ) -> list[Union[str, int]]:
+        """
+        批量生成 IP 地址：整列采样整数后整列格式化
+
+        kwargs 为仅对本次调用生效的参数覆盖，其余参数含义同 DataGenerator.generate_batch。
+        """
+        if self.value_pool is not None and not kwargs:
+            return super().generate_batch(count, context, workers=workers, executor=executor, seed=seed)
+        plan = self._plan_with_overrides(kwargs)
+        return self._run_batch(
+            lambda rows: self._format(plan, self._sample(plan, rows)),
+            count,
+            workers=workers,
+            executor=executor,
+            seed=seed,
+        )
+
+    def generate_integers(
+        self,
+        count: int,
+        workers: int = 1,
+        executor: str = "thread",
+        seed: Optional[int] = None,
+        **kwargs,
+    ) -> Union[array, list[int]]:
+        """
+        批量生成整数地址：IPv4 返回 array("I")（uint32），IPv6 返回 int 列表（uint128）
+
+        参数相同时与 format 为 INTEGER 的 generate_batch 结果逐值相同。
+        """
+        plan = self._plan_with_overrides(kwargs)
+        values = self._run_batch(
+            lambda rows: self._sample(plan, rows), count, workers=workers, executor=executor, seed=seed
+        )
+        return array("I", values) if plan.version == 4 else values
+
+    def validate(self, data: Union[str, int]) -> bool:
+        """验证地址格式，并检查地址属于计划的地址空间"""
+        plan = self._plan
+        if isinstance(data, bool):
+            return False
+        if isinstance(data, int):
+            value = data
+        elif isinstance(data, str):
+            value = parse_ipv4(data) if plan.version == 4 else parse_ipv6(data)
+        else:
+            return False
+        return value is not None and value in plan.space
+
+
+@register_generator("ipv4", ["IPv4地址", "IPv4"])
+class IPv4AddressGenerator(IPAddressGenerator):
+    """IPv4 地址生成器"""
+
+    DEFAULT_VERSION = 4
+
+
+@register_generator("ipv6", ["IPv6地址", "IPv6"])
+class IPv6AddressGenerator(IPAddressGenerator):
+    """IPv6 地址生成器"""
+
+    DEFAULT_VERSION = 6
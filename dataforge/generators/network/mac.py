@@ -0,0 +1,168 @@
+"""
+MAC 地址生成器
+
+地址以48位整数整列生成：随机地址的组播位和本地管理位以整列按位运算设置，指定厂商时高24位取自厂商的 OUI。
+格式化把地址拆成三个16位分组，每组查 65536 项的文本表后拼接。
+"""
+
+import functools
+import itertools
+import operator
+import re
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from dataforge.core import sampling
+from dataforge.core.factory import register_generator
+from dataforge.core.generator import (
+    GenerationContext,
+    GeneratorType,
+    ValidatedDataGenerator,
+)
+
+# 厂商 -> (市场占比权重, OUI 列表)
+VENDOR_OUIS = {
+    "华为": (30, (0x00E0FC, 0x286ED4, 0x001882, 0x48DB50)),
+    "小米": (18, (0x640980, 0xF8A45F, 0x286C07)),
+    "苹果": (18, (0xF01898, 0x3C0754, 0xA4B197, 0x001451)),
+    "中兴": (10, (0x001E73, 0x34E0CF, 0x8C14B4)),
+    "普联": (12, (0x50C7BF, 0xF4F26D, 0x14CF92)),
+    "思科": (12, (0x00000C, 0x001B54, 0x58AC78)),
+}
+_VENDOR_ALIASES = {
+    "huawei": "华为", "xiaomi": "小米", "apple": "苹果", "zte": "中兴",
+    "tp-link": "普联", "tplink": "普联", "cisco": "思科",
+}
+
+# 分隔符：":"（00:1a:2b:3c:4d:5e）、"-"（00-1A-2B-3C-4D-5E）、"."（思科风格 001a.2b3c.4d5e）或 ""
+SEPARATORS = (":", "-", ".", "")
+
+# 首字节的组播位和本地管理位在48位整数中的位置
+MULTICAST_BIT = 1 << 40
+LOCAL_BIT = 1 << 41
+
+_MAC_PATTERN = re.compile(
+    r"[0-9a-fA-F]{2}([:-]?)[0-9a-fA-F]{2}(\1[0-9a-fA-F]{2}){4}|[0-9a-fA-F]{4}\.[0-9a-fA-F]{4}\.[0-9a-fA-F]{4}"
+)
+
+
+@dataclass(frozen=True)
+class MACPlan:
+    """MAC 地址生成计划"""
+
+    separator: str
+    uppercase: bool
+    local: bool
+    # 指定厂商时为 OUI 的查表，否则为None
+    ouis: Optional[tuple[int, ...]]
+
+
+@functools.lru_cache(maxsize=8)
+def _group_table(separator: str, uppercase: bool) -> tuple[str, ...]:
+    """16位分组的文本查表；思科风格为4位十六进制，其余为两个字节以分隔符连接"""
+    digits = "{:04X}" if uppercase else "{:04x}"
+    if separator == ".":
+        return tuple(map(digits.format, range(1 << 16)))
+    byte = "{:02X}" if uppercase else "{:02x}"
+    return tuple(byte.format(value >> 8) + separator + byte.format(value & 255) for value in range(1 << 16))
+
+
+def format_macs(values: list[int], separator: str = ":", uppercase: bool = False) -> list[str]:
+    """整列格式化48位整数的 MAC 地址"""
+    table = _group_table(separator, uppercase)
+    glue = itertools.repeat(separator)
+    groups = []
+    for shift in (32, 16, 0):
+        segments = map(operator.and_, map(operator.rshift, values, itertools.repeat(shift)), itertools.repeat(0xFFFF))
+        groups.append(map(table.__getitem__, segments))
+    return list(map("".join, zip(groups[0], glue, groups[1], glue, groups[2])))
+
+
+@register_generator("mac_address", ["MAC地址", "MAC", "物理地址"])
+class MACAddressGenerator(ValidatedDataGenerator):
+    """
+    MAC 地址生成器
+
+    vendor 指定厂商（华为、小米、苹果、中兴、普联、思科，或 "any" 按市场占比混合）时使用厂商的 OUI，
+    否则生成随机的单播地址，local 为True时设置本地管理位。separator 为 ":"、"-"、"." 或 ""，uppercase 控制大小写。
+    """
+
+    @property
+    def generator_type(self) -> GeneratorType:
+        return GeneratorType.NETWORK
+
+    @property
+    def supported_parameters(self) -> list[str]:
+        return ["vendor", "separator", "uppercase", "local"]
+
+    def _setup(self) -> None:
+        """配置生成器参数"""
+        self._plan = self._plan_for(self.parameters)
+        self.separator = self._plan.separator
+        self.uppercase = self._plan.uppercase
+
+    def _build_plan(self, parameters: dict[str, Any]) -> MACPlan:
+        """编译 MAC 地址生成计划"""
+        separator = parameters.get("separator", ":")
+        if separator not in SEPARATORS:
+            raise ValueError(f"Unknown separator: {separator!r}, expected one of {SEPARATORS}")
+        vendor = parameters.get("vendor")
+        vendor = _VENDOR_ALIASES.get(str(vendor).lower(), vendor) if vendor is not None else None
+        ouis = None
+        if vendor is not None:
+            if vendor != "any" and vendor not in VENDOR_OUIS:
+                raise ValueError(f"Unknown vendor: {vendor}, expected one of {list(VENDOR_OUIS)} or 'any'")
+            values, weights = [], []
+            for name, (share, prefixes) in VENDOR_OUIS.items():
+                if vendor in ("any", name):
+                    values.extend(prefixes)
+                    weights.extend([share / len(prefixes)] * len(prefixes))
+            ouis = sampling.lane_table(values, weights)
+        local = bool(parameters.get("local", False))
+        return MACPlan(separator, bool(parameters.get("uppercase", separator == "-")), local, ouis)
+
+    def _integers(self, plan: MACPlan, count: int) -> list[int]:
+        """整列生成48位整数地址"""
+        if plan.ouis is not None:
+            prefixes = map(operator.lshift, sampling.sample(self.rng, plan.ouis, count), itertools.repeat(24))
+            return list(map(operator.or_, prefixes, sampling.random_below(self.rng, 1 << 24, count)))
+        # 清除组播位，按 local 设置本地管理位
+        mask = (1 << 48) - 1 - MULTICAST_BIT - LOCAL_BIT
+        values = map(operator.and_, sampling.random_below(self.rng, 1 << 48, count), itertools.repeat(mask))
+        return list(map(operator.or_, values, itertools.repeat(LOCAL_BIT if plan.local else 0)))
+
+    def _addresses(self, plan: MACPlan, count: int) -> list[str]:
+        return format_macs(self._integers(plan, count), plan.separator, plan.uppercase)
+
+    def _generate_raw(self, context: Optional[GenerationContext] = None) -> str:
+        """生成一个 MAC 地址"""
+        return self._addresses(self._plan, 1)[0]
+
+    def generate_batch(
+        self,
+        count: int,
+        context: Optional[GenerationContext] = None,
+        workers: int = 1,
+        executor: str = "thread",
+        seed: Optional[int] = None,
+        **kwargs,
+    ) -> list[str]:
+        """
+        批量生成 MAC 地址
+
+        kwargs 为仅对本次调用生效的参数覆盖，其余参数含义同 DataGenerator.generate_batch。
+        """
+        if self.value_pool is not None and not kwargs:
+            return super().generate_batch(count, context, workers=workers, executor=executor, seed=seed)
+        plan = self._plan_with_overrides(kwargs)
+        return self._run_batch(
+            lambda rows: self._addresses(plan, rows),
+            count,
+            workers=workers,
+            executor=executor,
+            seed=seed,
+        )
+
+    def validate(self, data: Any) -> bool:
+        """验证 MAC 地址格式（任一常见分隔风格）"""
+        return isinstance(data, str) and _MAC_PATTERN.fullmatch(data) is not None
@@ -0,0 +1,268 @@
+"""
+域名和 URL 生成器
+
+域名由拼音音节或常用词组成的主体加顶级域名构成，URL 在域名前后拼接协议、子域名、路径和查询参数；
+各部分都按查表整列采样后整列拼接。
+"""
+
+import itertools
+import operator
+import re
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence
+
+from dataforge.core import sampling
+from dataforge.core.factory import register_generator
+from dataforge.core.generator import (
+    GenerationContext,
+    GeneratorType,
+    ValidatedDataGenerator,
+)
+
+# 域名主体的组成部分：拼音音节和常见英文词
+DOMAIN_WORDS = (
+    "hua", "xin", "tian", "long", "feng", "yun", "jia", "bao", "mei", "kang", "zhi", "tong", "sheng", "hong",
+    "jin", "hai", "shan", "xing", "cheng", "fang", "ming", "rui", "tai", "heng", "guang", "wei", "kai", "yi",
+    "le", "da", "an", "yu", "tech", "cloud", "data", "soft", "link", "hub", "shop", "mall", "go", "net",
+    "smart", "zone", "info", "media", "home", "star",
+)
+# 主体末尾的数字后缀
+DOMAIN_SUFFIXES = ("", "360", "365", "8", "88", "168", "123", "666", "2024")
+DOMAIN_SUFFIX_WEIGHTS = (85, 2, 2, 2, 2, 2, 2, 2, 1)
+
+# 顶级域名 -> 权重
+TLDS = {
+    ".com": 40, ".cn": 22, ".com.cn": 10, ".net": 8, ".org": 4, ".net.cn": 3,
+    ".top": 4, ".xyz": 3, ".io": 3, ".cc": 3,
+}
+
+# 子域名 -> 权重（"" 表示无子域名）
+SUBDOMAINS = {"www.": 45, "": 30, "m.": 8, "api.": 5, "blog.": 3, "shop.": 3, "mail.": 3, "news.": 3}
+
+# URL 路径的组成部分
+PATH_WORDS = (
+    "news", "product", "article", "user", "detail", "list", "search", "about", "help", "api", "v1", "static",
+    "images", "docs", "blog", "category", "item", "order", "cart", "login",
+)
+# URL 查询参数模板，依次填入一个随机数
+QUERY_TEMPLATES = ("", "?id={}", "?page={}", "?uid={}&from=share", "?ref=wechat&t={}")
+QUERY_TEMPLATE_WEIGHTS = (0, 35, 25, 20, 20)
+
+_DOMAIN_PATTERN = re.compile(r"(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z]{2,}")
+_URL_PATTERN = re.compile(r"https?://([^/?#:]+)(?::\d+)?(?:/[^?#\s]*)?(?:\?[^#\s]*)?")
+
+
+@dataclass(frozen=True)
+class DomainPlan:
+    """域名生成计划"""
+
+    # 域名主体的首词、次词（可带数字后缀）、顶级域名和子域名的查表
+    heads: tuple[str, ...]
+    tails: tuple[str, ...]
+    tlds: tuple[str, ...]
+    subdomains: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class URLPlan:
+    """URL 生成计划"""
+
+    schemes: tuple[str, ...]
+    # 固定域名时为None
+    domain: Optional[DomainPlan]
+    fixed_domain: Optional[str]
+    paths: tuple[str, ...]
+    queries: tuple[str, ...]
+
+
+def _weighted(parameter: Any, table: dict[str, float], name: str) -> tuple[list[str], list[float]]:
+    """参数指定的取值（字符串或列表）及其权重；未指定时取整个表"""
+    if parameter is None:
+        return list(table), list(table.values())
+    values = [parameter] if isinstance(parameter, str) else list(parameter)
+    if not values:
+        raise ValueError(f"{name} must not be empty")
+    return values, [table.get(value, 1.0) for value in values]
+
+
+def domain_plan(parameters: dict[str, Any], subdomain_default: Optional[str] = None) -> DomainPlan:
+    """编译域名生成计划：tld 为顶级域名或其列表，subdomain 为子域名（如 "www"）或其列表，"" 表示不加"""
+    tlds, tld_weights = _weighted(parameters.get("tld"), TLDS, "tld")
+    tlds = [tld if tld.startswith(".") else "." + tld for tld in tlds]
+    subdomain = parameters.get("subdomain", subdomain_default)
+    if subdomain is None:
+        subdomains, subdomain_weights = list(SUBDOMAINS), list(SUBDOMAINS.values())
+    else:
+        subdomains = [subdomain] if isinstance(subdomain, str) else list(subdomain)
+        subdomains = [value + "." if value and not value.endswith(".") else value for value in subdomains]
+        subdomain_weights = None
+    return DomainPlan(
+        heads=sampling.lane_table(DOMAIN_WORDS),
+        tails=sampling.joint_table((DOMAIN_WORDS, None), (DOMAIN_SUFFIXES, DOMAIN_SUFFIX_WEIGHTS)),
+        tlds=sampling.lane_table(tlds, tld_weights),
+        subdomains=sampling.lane_table(subdomains, subdomain_weights),
+    )
+
+
+def sample_domains(rng: Any, plan: DomainPlan, count: int) -> list[str]:
+    """按计划整列生成域名"""
+    domains = map(operator.add, sampling.sample(rng, plan.subdomains, count), sampling.sample(rng, plan.heads, count))
+    domains = map(operator.add, domains, sampling.sample(rng, plan.tails, count))
+    return list(map(operator.add, domains, sampling.sample(rng, plan.tlds, count)))
+
+
+@register_generator("domain", ["域名", "网站域名"])
+class DomainGenerator(ValidatedDataGenerator):
+    """
+    域名生成器
+
+    tld 指定顶级域名（如 ".cn" 或列表，默认按使用占比混合）；subdomain 指定子域名（如 "www"，"" 表示不加，默认随机）。
+    """
+
+    @property
+    def generator_type(self) -> GeneratorType:
+        return GeneratorType.NETWORK
+
+    @property
+    def supported_parameters(self) -> list[str]:
+        return ["tld", "subdomain"]
+
+    def _setup(self) -> None:
+        """配置生成器参数"""
+        self._plan = self._plan_for(self.parameters)
+
+    def _build_plan(self, parameters: dict[str, Any]) -> DomainPlan:
+        """编译域名生成计划"""
+        return domain_plan(parameters, subdomain_default="")
+
+    def _generate_raw(self, context: Optional[GenerationContext] = None) -> str:
+        """生成一个域名"""
+        return sample_domains(self.rng, self._plan, 1)[0]
+
+    def generate_batch(
+        self,
+        count: int,
+        context: Optional[GenerationContext] = None,
+        workers: int = 1,
+        executor: str = "thread",
+        seed: Optional[int] = None,
+        **kwargs,
+    ) -> list[str]:
+        """
+        批量生成域名
+
+        kwargs 为仅对本次调用生效的参数覆盖，其余参数含义同 DataGenerator.generate_batch。
+        """
+        if self.value_pool is not None and not kwargs:
+            return super().generate_batch(count, context, workers=workers, executor=executor, seed=seed)
+        plan = self._plan_with_overrides(kwargs)
+        return self._run_batch(
+            lambda rows: sample_domains(self.rng, plan, rows),
+            count,
+            workers=workers,
+            executor=executor,
+            seed=seed,
+        )
+
+    def validate(self, data: Any) -> bool:
+        """验证域名格式"""
+        return isinstance(data, str) and len(data) <= 253 and _DOMAIN_PATTERN.fullmatch(data) is not None
+
+
+@register_generator("url", ["网址", "链接", "URL"])
+class URLGenerator(ValidatedDataGenerator):
+    """
+    URL 生成器
+
+    scheme 为 https、http 或None（按占比混合）；domain 指定固定域名，否则随机生成（tld、subdomain 同域名生成器）；
+    path_depth 为路径的最大层数，query_probability 为带查询参数的概率。
+    """
+
+    @property
+    def generator_type(self) -> GeneratorType:
+        return GeneratorType.NETWORK
+
+    @property
+    def supported_parameters(self) -> list[str]:
+        return ["scheme", "domain", "tld", "subdomain", "path_depth", "query_probability"]
+
+    def _setup(self) -> None:
+        """配置生成器参数"""
+        self._plan = self._plan_for(self.parameters)
+
+    def _build_plan(self, parameters: dict[str, Any]) -> URLPlan:
+        """编译 URL 生成计划：路径的各层合成一张查表"""
+        scheme = parameters.get("scheme")
+        if scheme is None:
+            schemes = sampling.lane_table(["https://", "http://"], [85, 15])
+        elif scheme in ("http", "https"):
+            schemes = sampling.lane_table([scheme + "://"])
+        else:
+            raise ValueError(f"Unknown scheme: {scheme}, expected http or https")
+
+        fixed_domain = parameters.get("domain")
+        domain = None if fixed_domain else domain_plan(parameters)
+
+        path_depth = int(parameters.get("path_depth", 3))
+        if not 0 <= path_depth <= 3:
+            raise ValueError(f"path_depth must be in 0..3, got {path_depth}")
+        segments = ["/" + word for word in PATH_WORDS]
+        # 各层存在的概率逐层递减；没有路径时不加 ".html" 后缀
+        parts = [sampling.optional_part(segments, 0.9 * 0.7 ** level) for level in range(path_depth)]
+        paths = sampling.joint_table(*parts, (["", ".html", "/"], [70, 15, 15])) if parts else sampling.lane_table([""])
+        paths = tuple("" if path == ".html" else path for path in paths)
+
+        query_probability = float(parameters.get("query_probability", 0.3))
+        if not 0 <= query_probability <= 1:
+            raise ValueError(f"query_probability must be in 0..1, got {query_probability}")
+        weights = [1 - query_probability] + [query_probability * weight / 100 for weight in QUERY_TEMPLATE_WEIGHTS[1:]]
+        queries = sampling.lane_table(QUERY_TEMPLATES, weights)
+        return URLPlan(schemes, domain, fixed_domain, paths, queries)
+
+    def _urls(self, plan: URLPlan, count: int) -> list[str]:
+        """整列生成 URL"""
+        if plan.domain is None:
+            domains: Sequence[str] = list(itertools.repeat(plan.fixed_domain, count))
+        else:
+            domains = sample_domains(self.rng, plan.domain, count)
+        urls = map(operator.add, sampling.sample(self.rng, plan.schemes, count), domains)
+        urls = map(operator.add, urls, sampling.sample(self.rng, plan.paths, count))
+        numbers = sampling.random_below(self.rng, 100000, count)
+        queries = map(str.format, sampling.sample(self.rng, plan.queries, count), numbers)
+        return list(map(operator.add, urls, queries))
+
+    def _generate_raw(self, context: Optional[GenerationContext] = None) -> str:
+        """生成一个 URL"""
+        return self._urls(self._plan, 1)[0]
+
+    def generate_batch(
+        self,
+        count: int,
+        context: Optional[GenerationContext] = None,
+        workers: int = 1,
+        executor: str = "thread",
+        seed: Optional[int] = None,
+        **kwargs,
+    ) -> list[str]:
+        """
+        批量生成 URL
+
+        kwargs 为仅对本次调用生效的参数覆盖，其余参数含义同 DataGenerator.generate_batch。
+        """
+        if self.value_pool is not None and not kwargs:
+            return super().generate_batch(count, context, workers=workers, executor=executor, seed=seed)
+        plan = self._plan_with_overrides(kwargs)
+        return self._run_batch(
+            lambda rows: self._urls(plan, rows),
+            count,
+            workers=workers,
+            executor=executor,
+            seed=seed,
+        )
+
+    def validate(self, data: Any) -> bool:
+        """验证 URL 格式：http(s) 协议，主机为合法域名"""
+        if not isinstance(data, str):
+            return False
+        match = _URL_PATTERN.fullmatch(data)
+        return match is not None and _DOMAIN_PATTERN.fullmatch(match.group(1)) is not None
@@ -0,0 +1,18 @@
+"""
+Numeric generators
+
+This module contains generators for numeric data:
+- Integers and decimals with configurable distributions
+- Ages
+"""
+
+# Import all numeric generators to ensure registration
+try:
+    from .number import IntegerGenerator, DecimalGenerator
+except ImportError:
+    pass
+
+try:
+    from .age import AgeGenerator
+except ImportError:
+    pass
@@ -0,0 +1,38 @@
+"""
+年龄生成器
+默认按第七次全国人口普查的年龄结构生成，也支持数值生成器的全部分布
+"""
+
+from dataclasses import replace
+from typing import Any
+
+from dataforge.core.factory import register_generator
+
+from .number import IntegerGenerator, NumberPlan
+
+# 第七次全国人口普查（2020年）5岁组人口，单位百万（约数）；最后一组为100岁及以上，按100-110岁计
+CENSUS_AGE_BINS = tuple(range(0, 105, 5)) + (110,)
+CENSUS_AGE_WEIGHTS = (
+    77.9, 90.2, 85.3, 72.7, 74.9, 91.9, 124.1, 99.0, 93.0, 114.2,
+    121.2, 101.4, 73.4, 74.0, 49.6, 31.0, 20.4, 10.8, 3.8, 0.9, 0.1,
+)
+
+
+@register_generator("age", ["年龄"])
+class AgeGenerator(IntegerGenerator):
+    """年龄生成器"""
+
+    DEFAULT_MIN = 0
+    DEFAULT_MAX = 100
+    DEFAULT_DISTRIBUTION = "census"
+
+    def _number_plan(self, low: Any, high: Any, name: str, options: dict[str, Any]) -> NumberPlan:
+        if low < 0:
+            raise ValueError(f"age must not be negative, got min={low}")
+        if name == "census":
+            # 普查年龄结构截断到 [min, max] 后作为经验直方图
+            plan = super()._number_plan(
+                low, high, "histogram", {"bins": CENSUS_AGE_BINS, "weights": CENSUS_AGE_WEIGHTS}
+            )
+            return replace(plan, distribution_name=name)
+        return super()._number_plan(low, high, name, options)
@@ -0,0 +1,271 @@
+"""
+数值生成器
+支持按均匀、正态、对数正态、Zipf 和经验直方图分布生成整数和小数
+
+分布以分位数函数表示（见 dataforge.core.distributions），逐条生成与批量生成消耗相同的随机数，
+指定相同的随机数生成器时结果逐值相同。generate_column 把整列写入 array（整数为 int64，小数为 float64），
+安装了 NumPy 时 generate_ndarray 直接在 NumPy 中整列采样。
+"""
+
+import itertools
+import math
+import operator
+from array import array
+from dataclasses import dataclass, replace
+from typing import Any, Optional, Union
+
+from dataforge.core.distributions import Distribution, build_distribution, numpy_generator, sample_values
+from dataforge.core.factory import register_generator
+from dataforge.core.generator import (
+    GenerationContext,
+    GeneratorType,
+    ValidatedDataGenerator,
+)
+from dataforge.core.parallel import DEFAULT_CHUNK_SIZE
+
+INT64_MIN = -(2 ** 63)
+INT64_MAX = 2 ** 63 - 1
+
+# 传给 build_distribution 的分布参数
+DISTRIBUTION_PARAMETERS = ("mean", "std", "median", "sigma", "exponent", "bins", "weights")
+
+
+@dataclass(frozen=True)
+class NumberPlan:
+    """数值生成计划"""
+
+    # 取值范围（含两端）
+    low: Union[int, float]
+    high: Union[int, float]
+    distribution_name: str
+    distribution: Distribution
+    # 整数取 floor(x + shift)：正态和对数正态分布为0.5（即四舍五入到最近的整数），其余为0
+    shift: float
+    # 小数位数，整数为None
+    precision: Optional[int]
+
+
+class NumberGenerator(ValidatedDataGenerator):
+    """数值生成器基类，子类决定取值是整数还是小数"""
+
+    # generate_column 使用的 array 类型码
+    typecode = "d"
+    DEFAULT_MIN: Union[int, float] = 0
+    DEFAULT_MAX: Union[int, float] = 100
+    DEFAULT_DISTRIBUTION = "uniform"
+
+    @property
+    def generator_type(self) -> GeneratorType:
+        return GeneratorType.NUMERIC
+
+    @property
+    def supported_parameters(self) -> list[str]:
+        return ["min", "max", "distribution", *DISTRIBUTION_PARAMETERS]
+
+    def _setup(self) -> None:
+        """配置生成器参数"""
+        self._plan = self._plan_for(self.parameters)
+        self.min_value = self._plan.low
+        self.max_value = self._plan.high
+        self.distribution = self._plan.distribution_name
+
+    def _build_plan(self, parameters: dict[str, Any]) -> NumberPlan:
+        """编译数值生成计划"""
+        low = parameters.get("min", self.DEFAULT_MIN)
+        high = parameters.get("max", self.DEFAULT_MAX)
+        if low > high:
+            raise ValueError(f"min ({low}) must not be greater than max ({high})")
+        name = parameters.get("distribution", self.DEFAULT_DISTRIBUTION)
+        options = {key: parameters[key] for key in DISTRIBUTION_PARAMETERS if key in parameters}
+        return self._number_plan(low, high, name, options)
+
+    def _number_plan(self, low: Any, high: Any, name: str, options: dict[str, Any]) -> NumberPlan:
+        raise NotImplementedError
+
+    def _value(self, plan: NumberPlan, sample: float) -> Union[int, float]:
+        """由分布的一个取值得到输出值"""
+        raise NotImplementedError
+
+    def _values(self, plan: NumberPlan, samples: list[float]) -> list:
+        """整列转换分布的取值，与逐个调用 _value 的结果相同"""
+        raise NotImplementedError
+
+    def _sample(self, plan: NumberPlan, count: int) -> list:
+        return self._values(plan, sample_values(self.rng, plan.distribution, count))
+
+    def _validated_batch(self, plan: NumberPlan, values: list) -> list:
+        """按配置整批验证：只需比较整列的最小值和最大值"""
+        if self.config.validate and values and (min(values) < plan.low or max(values) > plan.high):
+            invalid = next(value for value in values if not plan.low <= value <= plan.high)
+            raise ValueError(f"Generated data failed validation: {invalid}")
+        return values
+
+    def _generate_raw(self, context: Optional[GenerationContext] = None) -> Union[int, float]:
+        """按分布生成一个数值"""
+        plan = self._plan
+        return self._value(plan, plan.distribution.quantile(self.rng.random()))
+
+    def generate_batch(
+        self,
+        count: int,
+        context: Optional[GenerationContext] = None,
+        workers: int = 1,
+        executor: str = "thread",
+        seed: Optional[int] = None,
+        **kwargs,
+    ) -> list:
+        """
+        批量生成数值
+
+        每个分块的随机数一次取出后整列求分位数；设置了取值池时从池中采样。
+        kwargs 为仅对本次调用生效的参数覆盖，其余参数含义同 DataGenerator.generate_batch。
+        """
+        if self.value_pool is not None and not kwargs:
+            return super().generate_batch(count, context, workers=workers, executor=executor, seed=seed)
+        plan = self._plan_with_overrides(kwargs)
+        return self._run_batch(
+            lambda rows: self._validated_batch(plan, self._sample(plan, rows)),
+            count,
+            workers=workers,
+            executor=executor,
+            seed=seed,
+        )
+
+    def generate_column(
+        self,
+        count: int,
+        workers: int = 1,
+        executor: str = "thread",
+        seed: Optional[int] = None,
+    ) -> array:
+        """
+        批量生成一列数值，直接写入 array（整数为 int64，小数为 float64）
+
+        参数相同时与 generate_batch 的结果逐值相同；按块写入，临时的 Python 数值对象不会超过一个块。
+        可以用 numpy.frombuffer 等不复制地转换为其他数组类型。
+        """
+        if self.value_pool is not None:
+            return array(self.typecode, self.generate_batch(count, workers=workers, executor=executor, seed=seed))
+        plan = self._plan
+        typecode = self.typecode
+
+        def produce(rows: int) -> list[array]:
+            part = array(typecode)
+            for offset in range(0, rows, DEFAULT_CHUNK_SIZE):
+                size = min(DEFAULT_CHUNK_SIZE, rows - offset)
+                part.extend(self._validated_batch(plan, self._sample(plan, size)))
+            return [part]
+
+        column = array(typecode)
+        for part in self._run_batch(produce, count, workers=workers, executor=executor, seed=seed):
+            column.extend(part)
+        return column
+
+    def generate_ndarray(self, count: int, seed: Optional[object] = None, **kwargs) -> Any:
+        """
+        在 NumPy 中整列采样，返回 numpy 数组（整数为 int64，小数为 float64）
+
+        与 generate_batch 使用不同的随机数据流，同一种子的结果不同。
+        kwargs 为仅对本次调用生效的参数覆盖。
+
+        Raises:
+            ImportError: 未安装 numpy
+        """
+        generator = numpy_generator(self.rng.getrandbits(64) if seed is None else seed)
+        plan = self._plan_with_overrides(kwargs)
+        return self._ndarray(plan, plan.distribution.sample_numpy(generator, count))
+
+    def _ndarray(self, plan: NumberPlan, samples: Any) -> Any:
+        raise NotImplementedError
+
+    def validate(self, data: Union[int, float]) -> bool:
+        """验证数值在范围内"""
+        plan = self._plan
+        return isinstance(data, (int, float)) and not isinstance(data, bool) and plan.low <= data <= plan.high
+
+
+@register_generator("integer", ["整数", "整型"])
+class IntegerGenerator(NumberGenerator):
+    """整数生成器（取值在 int64 范围内）"""
+
+    typecode = "q"
+
+    def _number_plan(self, low: Any, high: Any, name: str, options: dict[str, Any]) -> NumberPlan:
+        if low != int(low) or high != int(high):
+            raise ValueError(f"integer range must have integer bounds, got [{low}, {high}]")
+        low, high = int(low), int(high)
+        if low < INT64_MIN or high > INT64_MAX:
+            raise ValueError(f"integer range must be within int64, got [{low}, {high}]")
+        shift = 0.5 if name in ("normal", "lognormal") else 0.0
+        if name == "histogram" and options.get("bins"):
+            # 最后一组含右端点：整数 k 对应 [k, k + 1)，右端点加1后 max 与其他分布一样可以取到
+            bins = list(options["bins"])
+            options = {**options, "bins": [*bins[:-1], bins[-1] + 1]}
+        # floor(x + shift) 落在 [low, high] 内的 x 构成 [low - shift, high + 1 - shift)
+        distribution = build_distribution(name, low - shift, high + 1 - shift, **options)
+        return NumberPlan(low, high, name, distribution, shift, None)
+
+    def _value(self, plan: NumberPlan, sample: float) -> int:
+        # 浮点误差可能使取值恰好越过区间端点，截断到范围内
+        return min(max(math.floor(sample + plan.shift), plan.low), plan.high)
+
+    def _values(self, plan: NumberPlan, samples: list[float]) -> list[int]:
+        if plan.shift:
+            samples = map(operator.add, samples, itertools.repeat(plan.shift))
+        values = map(max, map(math.floor, samples), itertools.repeat(plan.low))
+        return list(map(min, values, itertools.repeat(plan.high)))
+
+    def _ndarray(self, plan: NumberPlan, samples: Any) -> Any:
+        import numpy as np
+
+        return np.clip(np.floor(samples + plan.shift), plan.low, plan.high).astype(np.int64)
+
+    def validate(self, data: int) -> bool:
+        """验证整数在范围内"""
+        return isinstance(data, int) and super().validate(data)
+
+
+@register_generator("decimal", ["小数", "浮点数"])
+class DecimalGenerator(NumberGenerator):
+    """小数生成器，按 precision 保留小数位数"""
+
+    typecode = "d"
+    DEFAULT_MIN = 0.0
+    DEFAULT_MAX = 1.0
+
+    @property
+    def supported_parameters(self) -> list[str]:
+        return [*super().supported_parameters, "precision"]
+
+    def _build_plan(self, parameters: dict[str, Any]) -> NumberPlan:
+        plan = super()._build_plan(parameters)
+        precision = parameters.get("precision", 2)
+        if precision is not None and (not isinstance(precision, int) or precision < 0):
+            raise ValueError(f"precision must be a non-negative integer, got {precision}")
+        return replace(plan, precision=precision)
+
+    def _number_plan(self, low: Any, high: Any, name: str, options: dict[str, Any]) -> NumberPlan:
+        if name == "zipf":
+            raise ValueError("zipf distribution only supports integer generators")
+        low, high = float(low), float(high)
+        # 上界不含，min == max 时退化为常数
+        distribution = build_distribution(name, low, high if high > low else math.nextafter(low, math.inf), **options)
+        return NumberPlan(low, high, name, distribution, 0.0, None)
+
+    def _value(self, plan: NumberPlan, sample: float) -> float:
+        if plan.precision is not None:
+            sample = round(sample, plan.precision)
+        return min(max(sample, plan.low), plan.high)
+
+    def _values(self, plan: NumberPlan, samples: list[float]) -> list[float]:
+        if plan.precision is not None:
+            samples = map(round, samples, itertools.repeat(plan.precision))
+        values = map(max, samples, itertools.repeat(plan.low))
+        return list(map(min, values, itertools.repeat(plan.high)))
+
+    def _ndarray(self, plan: NumberPlan, samples: Any) -> Any:
+        import numpy as np
+
+        if plan.precision is not None:
+            samples = np.round(samples, plan.precision)
+        return np.clip(samples, plan.low, plan.high).astype(np.float64)
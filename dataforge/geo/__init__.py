@@ -0,0 +1,17 @@
+"""
+DataForge 地理模块
+
+内置省级行政区的简化轮廓，提供地区内均匀的坐标采样和按坐标定位地区的网格索引。
+"""
+
+from .shapes import GridIndex, RegionShape, build_shape, sample_point, sample_points, triangulate, uniform_floats
+
+__all__ = [
+    "GridIndex",
+    "RegionShape",
+    "build_shape",
+    "sample_point",
+    "sample_points",
+    "triangulate",
+    "uniform_floats",
+]
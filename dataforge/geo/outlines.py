@@ -0,0 +1,104 @@
+"""
+省级行政区简化轮廓
+
+每个地区由一个或多个环组成（岛屿为单独的环，不含洞），每个环为经度、纬度交替的
+扁平整数序列，单位为 1/OUTLINE_SCALE 度。轮廓经过大幅简化（每个环十几到四十个顶点），
+相邻省份尽量共用边界顶点，只用于生成落在对应地区内的模拟坐标，不适合精确的地理判断。
+
+键为地区全称；以后加入地级市轮廓时直接以城市名为键，地址定位会优先使用更具体的轮廓。
+"""
+
+OUTLINE_SCALE = 100
+
+OUTLINES: dict[str, tuple[tuple[int, ...], ...]] = {
+    "北京市": (
+        (
+            11543, 3995, 11552, 3962, 11584, 3955, 11623, 3944, 11643, 3945, 11670, 3960, 11690, 3970,
+            11725, 4005, 11740, 4025, 11725, 4055, 11750, 4065, 11720, 4085, 11695, 4072, 11670, 4105,
+            11645, 4090, 11615, 4078, 11575, 4058, 11590, 4035, 11545, 4015,
+        ),
+    ),
+    "上海市": (
+        (
+            12088, 3102, 12100, 3072, 12145, 3068, 12195, 3085, 12195, 3105, 12175, 3130, 12135, 3148,
+            12115, 3148, 12095, 3135,
+        ),
+        # 崇明岛
+        (12130, 3170, 12160, 3155, 12195, 3150, 12185, 3170, 12145, 3182),
+    ),
+    "广东省": (
+        (
+            10975, 2150, 11020, 2025, 11055, 2030, 11050, 2110, 11100, 2150, 11200, 2175, 11300, 2210,
+            11355, 2220, 11420, 2250, 11490, 2260, 11550, 2270, 11650, 2295, 11720, 2355, 11690, 2420,
+            11600, 2470, 11570, 2460, 11540, 2480, 11470, 2510, 11430, 2530, 11395, 2545, 11350, 2545,
+            11300, 2550, 11240, 2515, 11210, 2480, 11150, 2460, 11130, 2370, 11070, 2300, 11040, 2260,
+            10995, 2190,
+        ),
+    ),
+    "江苏省": (
+        (
+            11640, 3440, 11700, 3455, 11770, 3455, 11810, 3465, 11840, 3505, 11920, 3505, 11945, 3475,
+            12030, 3430, 12085, 3310, 12135, 3240, 12195, 3195, 12140, 3190, 12110, 3178, 12115, 3148,
+            12095, 3135, 12088, 3102, 12045, 3095, 11990, 3115, 11935, 3125, 11920, 3155, 11875, 3165,
+            11845, 3210, 11880, 3245, 11830, 3275, 11790, 3320, 11775, 3370, 11705, 3410, 11655, 3425,
+        ),
+    ),
+    "浙江省": (
+        (
+            11810, 2960, 11805, 2920, 11830, 2875, 11845, 2825, 11880, 2805, 11910, 2760, 11960, 2765,
+            12020, 2715, 12060, 2720, 12095, 2775, 12140, 2830, 12175, 2890, 12200, 2960, 12170, 3005,
+            12125, 3030, 12080, 3025, 12095, 3060, 12100, 3072, 12088, 3102, 12045, 3095, 11990, 3115,
+            11935, 3125, 11920, 3095, 11920, 3060, 11890, 3030, 11835, 2990,
+        ),
+        # 舟山群岛
+        (12195, 3005, 12215, 2990, 12240, 2995, 12245, 3015, 12220, 3025, 12200, 3020),
+    ),
+    "山东省": (
+        (
+            11640, 3440, 11700, 3455, 11770, 3455, 11810, 3465, 11840, 3505, 11920, 3505, 11945, 3520,
+            11990, 3560, 12030, 3600, 12070, 3625, 12100, 3660, 12160, 3680, 12215, 3690, 12260, 3720,
+            12245, 3745, 12200, 3755, 12155, 3745, 12100, 3760, 12070, 3780, 12030, 3765, 11990, 3730,
+            11930, 3715, 11895, 3740, 11910, 3785, 11880, 3815, 11810, 3815, 11770, 3800, 11720, 3785,
+            11680, 3785, 11640, 3750, 11590, 3700, 11545, 3675, 11535, 3610, 11595, 3595, 11595, 3555,
+            11525, 3525, 11505, 3495, 11560, 3455, 11615, 3460,
+        ),
+    ),
+    "河南省": (
+        (
+            11040, 3460, 11120, 3480, 11180, 3505, 11250, 3510, 11300, 3540, 11360, 3580, 11400, 3630,
+            11440, 3615, 11490, 3610, 11535, 3610, 11595, 3595, 11595, 3555, 11525, 3525, 11505, 3495,
+            11560, 3455, 11615, 3460, 11640, 3440, 11655, 3425, 11640, 3395, 11590, 3390, 11560, 3340,
+            11540, 3290, 11590, 3260, 11585, 3195, 11540, 3175, 11490, 3185, 11440, 3170, 11380, 3185,
+            11345, 3230, 11270, 3240, 11215, 3240, 11150, 3260, 11100, 3320, 11060, 3335, 11100, 3380,
+            11060, 3420,
+        ),
+    ),
+    "四川省": (
+        (
+            9740, 3220, 9770, 3290, 9850, 3335, 9950, 3310, 10050, 3270, 10120, 3320, 10170, 3380,
+            10220, 3430, 10270, 3410, 10320, 3380, 10380, 3330, 10440, 3320, 10510, 3290, 10560, 3270,
+            10640, 3280, 10710, 3240, 10800, 3210, 10850, 3180, 10780, 3100, 10730, 3080, 10670, 3020,
+            10600, 2980, 10560, 2930, 10570, 2860, 10590, 2820, 10530, 2790, 10450, 2780, 10400, 2700,
+            10330, 2620, 10270, 2620, 10210, 2610, 10140, 2610, 10100, 2670, 10070, 2780, 10010, 2840,
+            9940, 2820, 9910, 2900, 9890, 3050, 9860, 3120, 9840, 3200,
+        ),
+    ),
+    "湖北省": (
+        (
+            10840, 3050, 10880, 2990, 10915, 2940, 10940, 2945, 10990, 2950, 11060, 2970, 11130, 2990,
+            11200, 2965, 11270, 2940, 11310, 2945, 11360, 2925, 11395, 2905, 11460, 2940, 11540, 2980,
+            11610, 2980, 11590, 3030, 11575, 3080, 11575, 3125, 11540, 3175, 11490, 3185, 11440, 3170,
+            11380, 3185, 11345, 3230, 11270, 3240, 11215, 3240, 11150, 3260, 11100, 3320, 11060, 3335,
+            11010, 3300, 10950, 3290, 10960, 3250, 11015, 3185, 11010, 3130, 10955, 3095, 10900, 3070,
+        ),
+    ),
+    "湖南省": (
+        (
+            10940, 2945, 10990, 2950, 11060, 2970, 11130, 2990, 11200, 2965, 11270, 2940, 11310, 2945,
+            11360, 2925, 11395, 2905, 11415, 2850, 11410, 2780, 11390, 2720, 11420, 2640, 11395, 2595,
+            11395, 2545, 11350, 2545, 11300, 2550, 11240, 2515, 11210, 2480, 11170, 2475, 11130, 2510,
+            11100, 2590, 11040, 2595, 10980, 2610, 10940, 2600, 10890, 2650, 10920, 2700, 10880, 2720,
+            10920, 2780, 10935, 2830, 10930, 2880,
+        ),
+    ),
+}
@@ -0,0 +1,220 @@
+"""
+地区形状：三角剖分采样与网格空间索引
+
+每个地区的轮廓预先剖分为三角形，采样时按面积加权选取三角形，再在三角形内均匀取点，
+因此生成的坐标在地区内（经纬度平面上）均匀分布，不需要拒绝采样。
+整列采样时随机数一次取出，选三角形、查顶点和取点都由 map 在C层完成。
+"""
+
+import bisect
+import itertools
+import math
+import operator
+import random
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Iterable, Optional, Sequence
+
+from dataforge.core.sampling import uniform_floats
+
+from .outlines import OUTLINE_SCALE, OUTLINES
+
+_AREA = operator.attrgetter("area")
+_CUM_AREAS = operator.attrgetter("cum_areas")
+_TRIANGLES = operator.attrgetter("triangles")
+_REAL = operator.attrgetter("real")
+_IMAG = operator.attrgetter("imag")
+
+
+@dataclass(frozen=True)
+class RegionShape:
+    """地区形状：轮廓和预先计算的三角剖分"""
+
+    name: str
+    # 各环的 (经度列, 纬度列)
+    rings: tuple[tuple[tuple[float, ...], tuple[float, ...]], ...]
+    # (西, 南, 东, 北)
+    bbox: tuple[float, float, float, float]
+    # 各三角形的顶点 A 及边向量 AB、AC，以复数（经度 + 纬度j）表示，两个坐标轴一起计算
+    triangles: tuple[tuple[complex, complex, complex], ...]
+    # 三角形面积的累积和，最后一项为无穷大，保证二分查找不越界
+    cum_areas: tuple[float, ...]
+    area: float
+
+    def contains(self, lng: float, lat: float) -> bool:
+        """点是否在地区内（射线法，边界上的点不保证判定结果）"""
+        west, south, east, north = self.bbox
+        if not (west <= lng <= east and south <= lat <= north):
+            return False
+        return any(_ring_contains(xs, ys, lng, lat) for xs, ys in self.rings)
+
+
+def _ring_contains(xs: Sequence[float], ys: Sequence[float], x: float, y: float) -> bool:
+    inside = False
+    x0, y0 = xs[-1], ys[-1]
+    for x1, y1 in zip(xs, ys):
+        if (y1 > y) != (y0 > y) and x < (x0 - x1) * (y - y1) / (y0 - y1) + x1:
+            inside = not inside
+        x0, y0 = x1, y1
+    return inside
+
+
+def _cross(xs: Sequence[float], ys: Sequence[float], a: int, b: int, c: int) -> float:
+    """向量 ab 与 ac 的叉积，逆时针为正"""
+    return (xs[b] - xs[a]) * (ys[c] - ys[a]) - (ys[b] - ys[a]) * (xs[c] - xs[a])
+
+
+def triangulate(xs: Sequence[float], ys: Sequence[float]) -> list[tuple[int, int, int]]:
+    """
+    简单多边形的耳切法三角剖分，返回逆时针的顶点下标三元组
+
+    环的方向不限；共线的顶点直接去掉。多边形自相交时抛出 ValueError。
+    """
+    remaining = list(range(len(xs)))
+    signed_area = sum(xs[i - 1] * ys[i] - xs[i] * ys[i - 1] for i in remaining)
+    if signed_area < 0:
+        remaining.reverse()
+
+    triangles = []
+    while len(remaining) > 3:
+        size = len(remaining)
+        for k in range(size):
+            a, b, c = remaining[k - 1], remaining[k], remaining[(k + 1) % size]
+            turn = _cross(xs, ys, a, b, c)
+            if turn == 0:
+                del remaining[k]
+                break
+            if turn < 0:
+                continue
+            # 耳朵内不能有其他顶点
+            if any(
+                _cross(xs, ys, a, b, m) >= 0 and _cross(xs, ys, b, c, m) >= 0 and _cross(xs, ys, c, a, m) >= 0
+                for m in remaining
+                if m not in (a, b, c)
+            ):
+                continue
+            triangles.append((a, b, c))
+            del remaining[k]
+            break
+        else:
+            raise ValueError("polygon is not simple")
+    if len(remaining) == 3 and _cross(xs, ys, *remaining) > 0:
+        triangles.append(tuple(remaining))
+    return triangles
+
+
+def build_shape(name: str, rings: Iterable[Sequence[float]]) -> RegionShape:
+    """
+    由轮廓构建地区形状
+
+    Args:
+        name: 地区名称
+        rings: 各环的坐标，经度、纬度交替
+    """
+    columns = tuple((tuple(ring[0::2]), tuple(ring[1::2])) for ring in rings)
+    if not columns:
+        raise ValueError(f"region {name} has no outline")
+
+    triangles = []
+    areas = []
+    for xs, ys in columns:
+        points = list(map(complex, xs, ys))
+        for a, b, c in triangulate(xs, ys):
+            triangles.append((points[a], points[b] - points[a], points[c] - points[a]))
+            areas.append(_cross(xs, ys, a, b, c) / 2)
+
+    cum_areas = list(itertools.accumulate(areas))
+    return RegionShape(
+        name,
+        columns,
+        (
+            min(min(xs) for xs, _ in columns),
+            min(min(ys) for _, ys in columns),
+            max(max(xs) for xs, _ in columns),
+            max(max(ys) for _, ys in columns),
+        ),
+        tuple(triangles),
+        tuple(cum_areas[:-1]) + (math.inf,),
+        cum_areas[-1],
+    )
+
+
+def sample_points(rng: random.Random, shapes: Sequence[RegionShape]) -> tuple[list[float], list[float]]:
+    """
+    为每行在对应的地区内均匀采样一个点，返回 (经度列, 纬度列)
+
+    三角形按面积加权选取；三角形内取 A + s(1-w)·AB + sw·AC，其中 s 为均匀随机数的平方根、
+    w 为均匀随机数，点在三角形内均匀分布。各行的地区可以不同：
+    累积面积和三角形都按行取自该行的地区，不需要按地区分组。
+    """
+    count = len(shapes)
+    if not count:
+        return [], []
+    uniforms = uniform_floats(rng, 3 * count)
+    picks = map(operator.mul, uniforms[:count], map(_AREA, shapes))
+    indexes = map(bisect.bisect_right, map(_CUM_AREAS, shapes), picks)
+    triangles = list(map(operator.getitem, map(_TRIANGLES, shapes), indexes))
+    origins, first_edges, second_edges = (list(map(operator.itemgetter(part), triangles)) for part in range(3))
+
+    scales = list(map(math.sqrt, uniforms[count:2 * count]))
+    second = list(map(operator.mul, scales, uniforms[2 * count:]))
+    first = map(operator.sub, scales, second)
+    points = list(
+        map(
+            operator.add,
+            origins,
+            map(operator.add, map(operator.mul, first, first_edges), map(operator.mul, second, second_edges)),
+        )
+    )
+    return list(map(_REAL, points)), list(map(_IMAG, points))
+
+
+def sample_point(rng: random.Random, shape: RegionShape) -> tuple[float, float]:
+    """在地区内均匀采样一个点，返回 (经度, 纬度)；逐个采样时比整列采样开销小"""
+    origin, first_edge, second_edge = shape.triangles[bisect.bisect_right(shape.cum_areas, rng.random() * shape.area)]
+    scale = math.sqrt(rng.random())
+    second = scale * rng.random()
+    point = origin + (scale - second) * first_edge + second * second_edge
+    return point.real, point.imag
+
+
+class GridIndex:
+    """
+    规则网格空间索引
+
+    每个格子记录外接矩形与之相交的地区，定位一个点时只对所在格子的候选地区
+    做点在多边形内判断。
+    """
+
+    def __init__(self, shapes: Iterable[RegionShape], cell_size: float = 1.0):
+        self.cell_size = cell_size
+        cells = defaultdict(list)
+        for shape in shapes:
+            west, south, east, north = shape.bbox
+            for column in range(math.floor(west / cell_size), math.floor(east / cell_size) + 1):
+                for row in range(math.floor(south / cell_size), math.floor(north / cell_size) + 1):
+                    cells[column, row].append(shape)
+        self.cells: dict[tuple[int, int], tuple[RegionShape, ...]] = {
+            key: tuple(candidates) for key, candidates in cells.items()
+        }
+
+    def locate(self, lng: float, lat: float) -> Optional[str]:
+        """点所在的地区名称，不在任何地区内时返回None"""
+        key = (math.floor(lng / self.cell_size), math.floor(lat / self.cell_size))
+        for shape in self.cells.get(key, ()):
+            if shape.contains(lng, lat):
+                return shape.name
+        return None
+
+    def locate_many(self, lngs: Iterable[float], lats: Iterable[float]) -> list[Optional[str]]:
+        """逐点定位一列坐标"""
+        return list(map(self.locate, lngs, lats))
+
+
+def build_geo_table() -> dict[str, object]:
+    """构建内置地区的形状和网格索引（供预加载器缓存）"""
+    shapes = {
+        name: build_shape(name, ([value / OUTLINE_SCALE for value in ring] for ring in rings))
+        for name, rings in OUTLINES.items()
+    }
+    return {"shapes": shapes, "index": GridIndex(shapes.values())}
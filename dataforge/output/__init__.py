@@ -0,0 +1,20 @@
+"""
+DataForge 输出模块
+"""
+
+from .dataset_cache import DatasetCache, DatasetCacheStats, dataset_key
+from .formatter import OutputFormatter
+from .job import GenerationJob, resume
+from .pipeline import GenerationPipeline, PipelineStats, StageStats
+
+__all__ = [
+    "OutputFormatter",
+    "GenerationJob",
+    "resume",
+    "DatasetCache",
+    "DatasetCacheStats",
+    "dataset_key",
+    "GenerationPipeline",
+    "PipelineStats",
+    "StageStats",
+]
@@ -0,0 +1,322 @@
+"""
+数据集缓存模块
+
+按 (模板, 种子, 行数, 格式, 分块大小, 库版本) 的哈希对生成好的输出文件做内容寻址缓存。
+相同输入的数据集逐字节相同（见 GenerationJob），命中时直接检出缓存文件，不再重新生成。
+
+缓存目录结构::
+
+    <cache_dir>/datasets-f1/ab/abcdef....csv
+
+条目按最近使用时间（mtime，命中时刷新）做 LRU 淘汰，总大小不超过 max_bytes；
+单个超过 max_bytes 的数据集不缓存，直接移到输出路径。
+检出时依次尝试 reflink（写时复制）、硬链接和普通复制；缓存文件设为只读，
+避免通过硬链接检出的文件被修改后污染缓存。
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from dataclasses import dataclass
+from typing import Any, Optional, Union
+
+from dataforge.core.preloader import default_cache_dir
+from dataforge.core.template import DataTemplate
+
+from .job import GenerationJob
+
+# 缓存键/目录布局版本，修改键的组成或存储结构时递增
+CACHE_FORMAT = 1
+
+DEFAULT_MAX_BYTES = 1024 ** 3
+
+# Linux FICLONE ioctl，用于在支持的文件系统（btrfs、xfs等）上做 reflink
+_FICLONE = 0x40049409
+
+
+@dataclass
+class DatasetCacheStats:
+    """数据集缓存统计"""
+
+    hits: int = 0
+    misses: int = 0
+    bypassed: int = 0
+    evictions: int = 0
+    # 超过缓存上限而未缓存的数据集数
+    oversized: int = 0
+
+
+def dataset_key(
+    template: Union[DataTemplate, dict[str, Any]],
+    seed: Union[int, str],
+    count: int,
+    format_type: str,
+    chunk_size: int,
+    table_name: str = "generated_data",
+) -> str:
+    """计算数据集的缓存键（SHA-256 十六进制串）"""
+    from dataforge import __version__
+
+    if isinstance(template, DataTemplate):
+        template = template.to_dict()
+    payload = {
+        "cache_format": CACHE_FORMAT,
+        "version": __version__,
+        "template": template,
+        "seed": seed,
+        "count": count,
+        "format": format_type,
+        "chunk_size": chunk_size,
+        "table_name": table_name,
+    }
+    canonical = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _reflink(src: str, dst: str) -> bool:
+    try:
+        import fcntl
+    except ImportError:
+        return False
+
+    try:
+        with open(src, "rb") as s, open(dst, "wb") as d:
+            fcntl.ioctl(d.fileno(), _FICLONE, s.fileno())
+        return True
+    except OSError:
+        if os.path.exists(dst):
+            os.unlink(dst)
+        return False
+
+
+class DatasetCache:
+    """内容寻址的数据集缓存"""
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        enabled: Optional[bool] = None,
+    ):
+        """
+        初始化数据集缓存
+
+        Args:
+            cache_dir: 缓存根目录，默认为 default_cache_dir()
+            max_bytes: 缓存总大小上限，默认由 DATAFORGE_DATASET_CACHE_MAX_BYTES 决定（1 GiB）
+            enabled: 是否启用缓存，默认由 DATAFORGE_DATASET_CACHE 环境变量决定（默认开启）
+        """
+        if enabled is None:
+            enabled = os.environ.get("DATAFORGE_DATASET_CACHE", "1").lower() not in ("0", "false", "no")
+        if max_bytes is None:
+            max_bytes = int(os.environ.get("DATAFORGE_DATASET_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES))
+
+        self.root = os.path.join(cache_dir or default_cache_dir(), f"datasets-f{CACHE_FORMAT}")
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.stats = DatasetCacheStats()
+        self._lock = threading.Lock()
+
+    def _entry_path(self, key: str, format_type: str) -> str:
+        return os.path.join(self.root, key[:2], f"{key}.{format_type}")
+
+    def lookup(self, key: str, format_type: str) -> Optional[str]:
+        """查找缓存条目，命中时刷新其最近使用时间并返回路径"""
+        path = self._entry_path(key, format_type)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def store(self, key: str, format_type: str, source: str) -> str:
+        """
+        将生成好的文件存入缓存并按需淘汰旧条目
+
+        Args:
+            key: 缓存键
+            format_type: 输出格式（用作文件扩展名）
+            source: 生成好的文件
+
+        Returns:
+            缓存条目路径
+        """
+        path = self._entry_path(key, format_type)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        shutil.copyfile(source, tmp_path)
+        os.chmod(tmp_path, 0o444)
+        os.replace(tmp_path, path)
+        self.evict(keep=path)
+        return path
+
+    def checkout(self, entry: str, destination: str) -> str:
+        """
+        将缓存条目检出到目标路径
+
+        Returns:
+            使用的方式："reflink"、"hardlink" 或 "copy"
+        """
+        directory = os.path.dirname(os.path.abspath(destination))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = os.path.join(directory, f".{os.path.basename(destination)}.{os.getpid()}.tmp")
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+        if _reflink(entry, tmp_path):
+            method = "reflink"
+        else:
+            try:
+                os.link(entry, tmp_path)
+                method = "hardlink"
+            except OSError:
+                shutil.copyfile(entry, tmp_path)
+                method = "copy"
+        os.replace(tmp_path, destination)
+        return method
+
+    def entries(self) -> list[tuple[str, int, float]]:
+        """列出缓存条目 (路径, 字节数, 最近使用时间)"""
+        result = []
+        if not os.path.isdir(self.root):
+            return result
+        for prefix in os.listdir(self.root):
+            directory = os.path.join(self.root, prefix)
+            if len(prefix) != 2 or not os.path.isdir(directory):  # 跳过进行中的生成任务目录
+                continue
+            for name in os.listdir(directory):
+                if name.endswith(".tmp"):
+                    continue
+                path = os.path.join(directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue  # 已被其他进程淘汰
+                result.append((path, stat.st_size, stat.st_mtime))
+        return result
+
+    def usage(self) -> tuple[int, int]:
+        """返回 (条目数, 总字节数)"""
+        entries = self.entries()
+        return len(entries), sum(size for _, size, _ in entries)
+
+    def evict(self, keep: Optional[str] = None) -> int:
+        """
+        按最近使用时间淘汰条目直至总大小不超过上限，返回淘汰的条目数
+
+        Args:
+            keep: 不淘汰的条目（如刚存入、尚未检出的条目）
+        """
+        entries = sorted(self.entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            evicted += 1
+        with self._lock:
+            self.stats.evictions += evicted
+        return evicted
+
+    def clear(self) -> None:
+        """清空缓存"""
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def generate(
+        self,
+        template: Union[DataTemplate, dict[str, Any]],
+        count: int,
+        seed: Union[int, str],
+        output: str,
+        format_type: str = "csv",
+        chunk_size: int = 100_000,
+        table_name: str = "generated_data",
+        use_cache: bool = True,
+    ) -> bool:
+        """
+        生成数据集到 output，命中缓存时直接检出
+
+        Args:
+            template: 模板或模板JSON
+            count: 行数
+            seed: 随机种子
+            output: 输出文件路径
+            format_type: "csv"、"ndjson" 或 "sql"
+            chunk_size: 分块大小（影响 SQL 输出的语句划分，因此计入缓存键）
+            table_name: SQL 输出的表名
+            use_cache: 为False时跳过缓存（相当于命令行的 --no-cache）
+
+        Returns:
+            是否命中缓存
+        """
+        if isinstance(template, DataTemplate):
+            template = template.to_dict()
+
+        if not (use_cache and self.enabled):
+            with self._lock:
+                self.stats.bypassed += 1
+            self._run_job(template, count, seed, output, format_type, chunk_size, table_name)
+            return False
+
+        key = dataset_key(template, seed, count, format_type, chunk_size, table_name)
+        entry = self.lookup(key, format_type)
+        if entry is not None:
+            with self._lock:
+                self.stats.hits += 1
+            self.checkout(entry, output)
+            return True
+
+        with self._lock:
+            self.stats.misses += 1
+        os.makedirs(self.root, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=self.root, prefix=".job-") as job_dir:
+            result = self._run_job(
+                template, count, seed, os.path.join(job_dir, "output"), format_type, chunk_size, table_name
+            )
+            if os.path.getsize(result) > self.max_bytes:
+                # 单个数据集超过缓存上限：存入后会被立即淘汰，因此不缓存
+                with self._lock:
+                    self.stats.oversized += 1
+                output = os.path.abspath(output)
+                os.makedirs(os.path.dirname(output), exist_ok=True)
+                shutil.move(result, output)
+                return False
+            entry = self.store(key, format_type, result)
+            self.checkout(entry, output)
+        return False
+
+    @staticmethod
+    def _run_job(
+        template: dict[str, Any],
+        count: int,
+        seed: Union[int, str],
+        output: str,
+        format_type: str,
+        chunk_size: int,
+        table_name: str,
+    ) -> str:
+        output = os.path.abspath(output)
+        os.makedirs(os.path.dirname(output), exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=os.path.dirname(output), prefix=".dataforge-job-") as job_dir:
+            job = GenerationJob.create(
+                job_dir,
+                template,
+                count,
+                seed,
+                chunk_size=chunk_size,
+                format_type=format_type,
+                output=os.path.basename(output),
+                table_name=table_name,
+            )
+            os.replace(job.run(), output)
+        return output
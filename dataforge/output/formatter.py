@@ -0,0 +1,253 @@
+"""
+输出格式化模块
+
+将记录批次（RecordBatch）或字典记录列表格式化为 JSON、NDJSON、CSV、SQL、XML 文本。
+记录批次按列直接输出，不为每行创建 dict；format_chunk_bytes 对定长列
+（FixedWidthColumn）整块解码后切片，跳过逐值的转义和编码，整个分块只编码一次；
+CSV 中整列无需引用的变长字符串列（OffsetStringColumn）同样直接切片输出。
+CSV、NDJSON 和 SQL 支持按分块输出：分块逐个格式化后直接拼接，
+结果与一次性格式化全部记录相同，适合流式写文件。
+"""
+
+import csv
+import io
+import json
+import re
+import xml.etree.ElementTree as ET
+from typing import Any, Iterable, Iterator, Optional, Sequence, Union
+
+from dataforge.core.record_batch import FixedWidthColumn, OffsetStringColumn, RecordBatch
+
+
+class OutputFormatter:
+    """输出格式化器"""
+
+    FORMATS = ("json", "ndjson", "csv", "sql", "xml")
+
+    # 支持分块拼接的格式
+    CHUNKED_FORMATS = ("ndjson", "csv", "sql")
+
+    def __init__(self, table_name: str = "generated_data", csv_delimiter: str = ","):
+        """
+        初始化格式化器
+
+        Args:
+            table_name: SQL 输出的表名
+            csv_delimiter: CSV 分隔符
+        """
+        self.table_name = table_name
+        self.csv_delimiter = csv_delimiter
+
+    def format(
+        self,
+        records: Union[RecordBatch, Sequence[dict[str, Any]]],
+        format_type: str,
+        pretty: bool = False,
+    ) -> str:
+        """
+        格式化全部记录
+
+        Args:
+            records: 记录批次或字典记录列表
+            format_type: 输出格式
+            pretty: JSON 是否缩进
+
+        Returns:
+            格式化后的文本
+        """
+        format_type = format_type.lower()
+        if format_type == "json":
+            if pretty:
+                if isinstance(records, RecordBatch):
+                    records = records.to_records()
+                return json.dumps(list(records), ensure_ascii=False, indent=2, default=str)
+            names, rows = self._rows(records, None)
+            return "[" + ", ".join(self._json_objects(names, rows)) + "]"
+        if format_type == "xml":
+            return self._format_xml(*self._rows(records, None))
+        if format_type in self.CHUNKED_FORMATS:
+            return self.format_chunk(records, format_type, first=True)
+        raise ValueError(f"Unsupported output format: {format_type}, expected one of {self.FORMATS}")
+
+    def format_chunk(
+        self,
+        records: Union[RecordBatch, Sequence[dict[str, Any]]],
+        format_type: str,
+        fields: Optional[Sequence[str]] = None,
+        first: bool = True,
+    ) -> str:
+        """
+        格式化一个分块
+
+        Args:
+            records: 分块中的记录批次或字典记录
+            format_type: "csv"、"ndjson" 或 "sql"
+            fields: 字典记录的字段顺序，默认取第一条记录的键（记录批次使用其模式）
+            first: 是否为第一个分块（CSV 表头只在第一个分块输出）
+
+        Returns:
+            分块文本
+        """
+        format_type = format_type.lower()
+        if format_type not in self.CHUNKED_FORMATS:
+            raise ValueError(f"Format {format_type} cannot be written in chunks, expected one of {self.CHUNKED_FORMATS}")
+        names, rows = self._rows(records, fields)
+
+        if format_type == "ndjson":
+            return "".join(item + "\n" for item in self._json_objects(names, rows))
+        if format_type == "csv":
+            return self._format_csv(names, rows, header=first)
+        return self._format_sql(names, rows)
+
+    def format_chunk_bytes(
+        self,
+        records: Union[RecordBatch, Sequence[dict[str, Any]]],
+        format_type: str,
+        fields: Optional[Sequence[str]] = None,
+        first: bool = True,
+    ) -> bytes:
+        """
+        格式化一个分块并输出 UTF-8 字节，结果与 format_chunk(...).encode("utf-8") 相同
+
+        记录批次中只含字母数字的定长列无需转义，直接按列交错拼接。
+        """
+        format_type = format_type.lower()
+        if not isinstance(records, RecordBatch) or not any(
+            isinstance(column, FixedWidthColumn) for column in records.columns
+        ):
+            return self.format_chunk(records, format_type, fields=fields, first=first).encode("utf-8")
+        if format_type not in self.CHUNKED_FORMATS:
+            raise ValueError(f"Format {format_type} cannot be written in chunks, expected one of {self.CHUNKED_FORMATS}")
+        if not len(records):
+            return self.format_chunk(records, format_type, first=first).encode("utf-8")
+
+        names = records.names
+        if format_type == "csv":
+            cell = self._csv_cell if len(names) > 1 else self._csv_single_cell
+            row_open, separator, row_close = "", self.csv_delimiter, "\r\n"
+            keys = [""] * len(names)
+            quote = ""
+        elif format_type == "ndjson":
+            cell = lambda value: json.dumps(value, ensure_ascii=False, default=str)
+            row_open, separator, row_close = "{", ", ", "}\n"
+            keys = [json.dumps(name, ensure_ascii=False) + ": " for name in names]
+            quote = '"'
+        else:
+            cell = self.sql_literal
+            row_open, separator, row_close = "(", ", ", "),\n"
+            keys = [""] * len(names)
+            quote = "'"
+
+        # 每列的前缀（分隔符、键、引号）、值和后缀
+        prefixes, suffixes, cells = [], [], []
+        for i, column in enumerate(records.columns):
+            prefix = (row_open if i == 0 else separator) + keys[i]
+            if isinstance(column, FixedWidthColumn) and column.is_alnum():
+                # 只含字母数字，任何格式下都无需转义，整块解码后直接切片
+                prefixes.append(prefix + quote)
+                suffixes.append(quote)
+                cells.append(list(column))
+            elif format_type == "csv" and len(names) > 1 and self._csv_plain(column):
+                # 整列都不含需要引用的字符，值原样输出
+                prefixes.append(prefix)
+                suffixes.append("")
+                cells.append(list(column))
+            else:
+                prefixes.append(prefix)
+                suffixes.append("")
+                cells.append([cell(value) for value in column])
+
+        # 按列交错填充片段列表（切片赋值在C层完成），整个分块只 join 和编码一次
+        rows = len(records)
+        stride = 3 * len(cells) + 1
+        parts: list = [row_close] * (rows * stride)
+        for i, column_cells in enumerate(cells):
+            parts[3 * i::stride] = [prefixes[i]] * rows
+            parts[3 * i + 1::stride] = column_cells
+            parts[3 * i + 2::stride] = [suffixes[i]] * rows
+
+        if format_type == "csv":
+            if first:
+                parts.insert(0, self._format_csv(names, (), header=True))
+        elif format_type == "sql":
+            parts[-1] = ");\n"
+            parts.insert(0, f"INSERT INTO {self.table_name} ({', '.join(names)}) VALUES\n")
+        return "".join(parts).encode("utf-8")
+
+    def _csv_cell(self, value: Any) -> str:
+        """按 csv.QUOTE_MINIMAL 规则输出单元格"""
+        if value is None:
+            return ""
+        text = value if isinstance(value, str) else str(value)
+        if self.csv_delimiter in text or '"' in text or "\r" in text or "\n" in text:
+            return '"' + text.replace('"', '""') + '"'
+        return text
+
+    def _csv_plain(self, column: Any) -> bool:
+        """变长字符串列是否整列都无需 CSV 引用（在编码后的缓冲区上一次性检查）"""
+        if not isinstance(column, OffsetStringColumn):
+            return False
+        special = (self.csv_delimiter, '"', "\r", "\n")
+        pattern = re.compile(b"|".join(re.escape(char.encode("utf-8")) for char in special))
+        return pattern.search(column.data) is None
+
+    def _csv_single_cell(self, value: Any) -> str:
+        """单字段行的单元格：空值需要写成 \"\"，否则会被读成空行"""
+        return self._csv_cell(value) or '""'
+
+    @staticmethod
+    def _rows(
+        records: Union[RecordBatch, Sequence[dict[str, Any]]],
+        fields: Optional[Sequence[str]],
+    ) -> tuple[Sequence[str], Iterable[tuple]]:
+        """统一为 (字段名, 行元组) 形式，记录批次直接按列迭代，不创建 dict"""
+        if isinstance(records, RecordBatch):
+            return records.names, records.rows()
+        if fields is None:
+            fields = list(records[0]) if records else []
+        return fields, (tuple(record.get(name) for name in fields) for record in records)
+
+    @staticmethod
+    def _json_objects(names: Sequence[str], rows: Iterable[tuple]) -> Iterator[str]:
+        """逐行输出与 json.dumps(dict) 相同的 JSON 对象文本"""
+        dumps = json.dumps
+        keys = [dumps(name, ensure_ascii=False) + ": " for name in names]
+        for row in rows:
+            yield "{" + ", ".join(
+                key + dumps(value, ensure_ascii=False, default=str) for key, value in zip(keys, row)
+            ) + "}"
+
+    def _format_csv(self, names: Sequence[str], rows: Iterable[tuple], header: bool) -> str:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, delimiter=self.csv_delimiter)
+        if header:
+            writer.writerow(names)
+        writer.writerows(rows)
+        return buffer.getvalue()
+
+    @staticmethod
+    def sql_literal(value: Any) -> str:
+        """将值转换为 SQL 字面量"""
+        if value is None:
+            return "NULL"
+        if isinstance(value, bool):
+            return "TRUE" if value else "FALSE"
+        if isinstance(value, (int, float)):
+            return repr(value)
+        return "'" + str(value).replace("'", "''") + "'"
+
+    def _format_sql(self, names: Sequence[str], rows: Iterable[tuple]) -> str:
+        literal = self.sql_literal
+        values = ["(" + ", ".join(map(literal, row)) + ")" for row in rows]
+        if not values:
+            return ""
+        return f"INSERT INTO {self.table_name} ({', '.join(names)}) VALUES\n" + ",\n".join(values) + ";\n"
+
+    def _format_xml(self, names: Sequence[str], rows: Iterable[tuple]) -> str:
+        root = ET.Element("data")
+        for row in rows:
+            record = ET.SubElement(root, "record")
+            for key, value in zip(names, row):
+                field = ET.SubElement(record, key)
+                field.text = str(value)
+        return ET.tostring(root, encoding="unicode", xml_declaration=True)
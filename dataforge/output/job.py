@@ -0,0 +1,233 @@
+"""
+可断点续跑的生成任务
+
+任务目录结构::
+
+    job_dir/
+        manifest.json        任务清单：模板、种子、分块大小、已完成分块及其字节数/偏移
+        chunks/00000012.part 已提交的分块（临时文件写完后 rename 提交）
+        <output>             全部分块完成后按顺序拼接的输出文件
+
+分块 k 的内容只由 (模板, 种子, k) 和 dataforge 版本决定（见 DataTemplate.generate_range），
+因此中断后续跑得到的输出与一次跑完的输出逐字节相同。升级后不能接着旧版本生成的分块续跑。
+"""
+
+import json
+import os
+import shutil
+import time
+from typing import Any, Callable, Optional, Union
+
+from dataforge.core.template import DataTemplate
+
+from .formatter import OutputFormatter
+
+MANIFEST_NAME = "manifest.json"
+CHUNK_DIR = "chunks"
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """写入临时文件并 fsync 后 rename，保证 path 要么是旧内容要么是完整的新内容"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class GenerationJob:
+    """可断点续跑的分块生成任务"""
+
+    def __init__(self, job_dir: str, manifest: dict[str, Any]):
+        self.job_dir = job_dir
+        self.manifest = manifest
+        self.template = DataTemplate.from_dict(manifest["template"])
+        self.formatter = OutputFormatter(table_name=manifest.get("table_name", "generated_data"))
+
+    @classmethod
+    def create(
+        cls,
+        job_dir: str,
+        template: Union[DataTemplate, dict[str, Any]],
+        count: int,
+        seed: Union[int, str],
+        chunk_size: int = 100_000,
+        format_type: str = "csv",
+        output: Optional[str] = None,
+        table_name: str = "generated_data",
+    ) -> "GenerationJob":
+        """
+        创建新任务并写入清单
+
+        Raises:
+            FileExistsError: 目录中已存在任务清单
+            ValueError: 参数无效
+        """
+        from dataforge import __version__
+
+        if format_type not in OutputFormatter.CHUNKED_FORMATS:
+            raise ValueError(f"Job output format must be one of {OutputFormatter.CHUNKED_FORMATS}, got {format_type}")
+        if chunk_size <= 0 or count < 0:
+            raise ValueError("chunk_size must be positive and count non-negative")
+        if os.path.exists(os.path.join(job_dir, MANIFEST_NAME)):
+            raise FileExistsError(f"Job already exists in {job_dir}, use resume()")
+
+        if isinstance(template, DataTemplate):
+            template = template.to_dict()
+        # 模板必须可解析，尽早暴露未知生成器等错误
+        DataTemplate.from_dict(template)
+
+        manifest = {
+            "version": __version__,
+            "template": template,
+            "seed": seed,
+            "count": count,
+            "chunk_size": chunk_size,
+            "format": format_type,
+            "table_name": table_name,
+            "output": output or f"output.{format_type}",
+            "completed": {},  # 分块序号 -> {"rows": 行数, "bytes": 字节数}
+            "offsets": None,  # 完成后各分块在输出文件中的起始偏移
+            "finished": False,
+        }
+        os.makedirs(job_dir, exist_ok=True)
+        job = cls(job_dir, manifest)
+        job._save_manifest()
+        return job
+
+    @classmethod
+    def load(cls, job_dir: str, restart: bool = False) -> "GenerationJob":
+        """
+        读取已有任务
+
+        未完成的任务由其他版本的 dataforge 生成过分块时，新旧分块拼接后不再与一次跑完的输出相同：
+        restart 为True时丢弃已提交的分块，从分块 0 重新生成，否则报错。
+
+        Raises:
+            ValueError: 已提交分块的生成版本与当前版本不同且 restart 为False
+        """
+        from dataforge import __version__
+
+        with open(os.path.join(job_dir, MANIFEST_NAME), "r", encoding="utf-8") as f:
+            job = cls(job_dir, json.load(f))
+        manifest = job.manifest
+        if manifest.get("version") == __version__ or manifest["finished"]:
+            return job
+        if manifest["completed"] and not restart:
+            raise ValueError(
+                f"Job in {job_dir} was started with dataforge {manifest.get('version')}, "
+                f"current version is {__version__}; resume with restart=True to regenerate all chunks"
+            )
+        manifest["completed"] = {}
+        manifest["version"] = __version__
+        shutil.rmtree(os.path.join(job_dir, CHUNK_DIR), ignore_errors=True)
+        job._save_manifest()
+        return job
+
+    @property
+    def chunk_count(self) -> int:
+        """分块总数"""
+        count, chunk_size = self.manifest["count"], self.manifest["chunk_size"]
+        return (count + chunk_size - 1) // chunk_size
+
+    @property
+    def output_path(self) -> str:
+        """输出文件路径"""
+        return os.path.join(self.job_dir, self.manifest["output"])
+
+    def pending_chunks(self) -> list[int]:
+        """尚未提交（或分块文件已损坏）的分块序号"""
+        pending = []
+        for index in range(self.chunk_count):
+            info = self.manifest["completed"].get(str(index))
+            path = self._chunk_path(index)
+            if info is None or not os.path.exists(path) or os.path.getsize(path) != info["bytes"]:
+                pending.append(index)
+        return pending
+
+    def run(
+        self,
+        max_chunks: Optional[int] = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> Optional[str]:
+        """
+        生成未完成的分块，全部完成后拼接输出文件
+
+        Args:
+            max_chunks: 本次最多生成的分块数（用于分段执行）
+            progress: 每提交一个分块后回调 (已完成分块数, 分块总数)
+
+        Returns:
+            输出文件路径；还有未完成的分块时返回None
+        """
+        if self.manifest["finished"] and os.path.exists(self.output_path):
+            return self.output_path
+
+        pending = self.pending_chunks()
+        for done, index in enumerate(pending):
+            if max_chunks is not None and done >= max_chunks:
+                return None
+            self._run_chunk(index)
+            if progress:
+                progress(self.chunk_count - len(pending) + done + 1, self.chunk_count)
+
+        return self._finalize()
+
+    def _run_chunk(self, index: int) -> None:
+        chunk_size = self.manifest["chunk_size"]
+        start = index * chunk_size
+        stop = min(start + chunk_size, self.manifest["count"])
+
+        batch = self.template.generate_record_batch(start, stop, self.manifest["seed"])
+        data = self.formatter.format_chunk_bytes(batch, self.manifest["format"], first=index == 0)
+
+        # 先提交分块文件，再记录到清单；崩溃时最多重做这一个分块
+        os.makedirs(os.path.join(self.job_dir, CHUNK_DIR), exist_ok=True)
+        _write_atomic(self._chunk_path(index), data)
+        self.manifest["completed"][str(index)] = {"rows": stop - start, "bytes": len(data)}
+        self._save_manifest()
+
+    def _finalize(self) -> str:
+        offsets = []
+        offset = 0
+        tmp_path = f"{self.output_path}.tmp"
+        with open(tmp_path, "wb") as out:
+            for index in range(self.chunk_count):
+                offsets.append(offset)
+                with open(self._chunk_path(index), "rb") as chunk:
+                    shutil.copyfileobj(chunk, out, 1024 * 1024)
+                offset += self.manifest["completed"][str(index)]["bytes"]
+            out.flush()
+            os.fsync(out.fileno())
+        os.replace(tmp_path, self.output_path)
+
+        self.manifest["offsets"] = offsets
+        self.manifest["finished"] = True
+        self.manifest["finished_at"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+        self._save_manifest()
+
+        shutil.rmtree(os.path.join(self.job_dir, CHUNK_DIR), ignore_errors=True)
+        return self.output_path
+
+    def _chunk_path(self, index: int) -> str:
+        return os.path.join(self.job_dir, CHUNK_DIR, f"{index:08d}.part")
+
+    def _save_manifest(self) -> None:
+        data = json.dumps(self.manifest, ensure_ascii=False, indent=2).encode("utf-8")
+        _write_atomic(os.path.join(self.job_dir, MANIFEST_NAME), data)
+
+
+def resume(job_dir: str, progress: Optional[Callable[[int, int], None]] = None, restart: bool = False) -> str:
+    """
+    续跑任务：跳过已提交的分块，完成剩余分块并拼接输出
+
+    restart 含义同 GenerationJob.load。
+
+    Returns:
+        输出文件路径
+
+    Raises:
+        ValueError: 任务由其他版本开始且 restart 为False
+    """
+    return GenerationJob.load(job_dir, restart=restart).run(progress=progress)
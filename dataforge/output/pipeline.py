@@ -0,0 +1,318 @@
+"""
+生成流水线
+
+生成、格式化和写盘三个阶段通过有界队列连接，各阶段并发执行::
+
+    生成线程 ×N --(RecordBatch)--> 格式化线程 ×M --(字节)--> 写入线程
+
+同时在途的分块数受信号量限制（背压）：写入跟不上时生成线程会等待，
+内存占用不会随数据量增长。写入线程按分块序号重排后用 writelines 批量写出，
+输出与 GenerationJob 相同的分块产生的文件逐字节相同。
+
+每个阶段统计忙碌时间，利用率 = 忙碌时间 / (线程数 × 总耗时)，
+利用率接近 1 的阶段即为瓶颈，可据此调整各阶段的线程数。
+"""
+
+import itertools
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, Union
+
+from dataforge.core.record_batch import RecordBatch
+from dataforge.core.template import DataTemplate
+
+from .formatter import OutputFormatter
+
+# 等待队列/信号量时检查停止标志的间隔（秒）
+_POLL_INTERVAL = 0.1
+
+
+@dataclass
+class StageStats:
+    """单个阶段的统计"""
+
+    name: str
+    workers: int
+    busy_seconds: float = 0.0
+    items: int = 0
+
+    def utilization(self, elapsed: float) -> float:
+        """阶段利用率（0~1）"""
+        if elapsed <= 0:
+            return 0.0
+        return min(1.0, self.busy_seconds / (self.workers * elapsed))
+
+
+@dataclass
+class PipelineStats:
+    """流水线运行统计"""
+
+    rows: int = 0
+    bytes: int = 0
+    elapsed: float = 0.0
+    stages: dict[str, StageStats] = field(default_factory=dict)
+
+    @property
+    def bottleneck(self) -> Optional[str]:
+        """利用率最高的阶段"""
+        if not self.stages:
+            return None
+        return max(self.stages.values(), key=lambda stage: stage.utilization(self.elapsed)).name
+
+    def report(self) -> str:
+        """可读的统计摘要"""
+        lines = [f"{self.rows} rows, {self.bytes} bytes in {self.elapsed:.2f}s (bottleneck: {self.bottleneck})"]
+        for stage in self.stages.values():
+            lines.append(
+                f"  {stage.name:<8} workers={stage.workers} items={stage.items} "
+                f"busy={stage.busy_seconds:.2f}s utilization={stage.utilization(self.elapsed):.0%}"
+            )
+        return "\n".join(lines)
+
+
+class GenerationPipeline:
+    """生成/格式化/写入流水线"""
+
+    def __init__(
+        self,
+        template: Union[DataTemplate, dict[str, Any]],
+        format_type: str = "csv",
+        chunk_size: int = 10_000,
+        generator_workers: int = 1,
+        formatter_workers: int = 1,
+        queue_size: int = 4,
+        table_name: str = "generated_data",
+    ):
+        """
+        初始化流水线
+
+        Args:
+            template: 模板或模板JSON
+            format_type: "csv"、"ndjson" 或 "sql"
+            chunk_size: 每个分块的行数
+            generator_workers: 生成线程数
+            formatter_workers: 格式化线程数
+            queue_size: 每个队列的容量；在途分块数上限为其两倍
+            table_name: SQL 输出的表名
+        """
+        if format_type not in OutputFormatter.CHUNKED_FORMATS:
+            raise ValueError(f"Pipeline output format must be one of {OutputFormatter.CHUNKED_FORMATS}, got {format_type}")
+        if chunk_size <= 0 or generator_workers <= 0 or formatter_workers <= 0 or queue_size <= 0:
+            raise ValueError("chunk_size, worker counts and queue_size must be positive")
+
+        self.template = template if isinstance(template, DataTemplate) else DataTemplate.from_dict(template)
+        self.format_type = format_type
+        self.chunk_size = chunk_size
+        self.generator_workers = generator_workers
+        self.formatter_workers = formatter_workers
+        self.queue_size = queue_size
+        self.formatter = OutputFormatter(table_name=table_name)
+
+    def run(
+        self,
+        count: int,
+        seed: Union[int, str],
+        output: str,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> PipelineStats:
+        """
+        生成 count 行数据写入 output
+
+        Args:
+            count: 行数
+            seed: 随机种子
+            output: 输出文件路径（写完后原子替换）
+            progress: 每写出一个分块后回调 (已写分块数, 分块总数)
+
+        Returns:
+            运行统计
+        """
+        chunk_count = (count + self.chunk_size - 1) // self.chunk_size
+        stats = PipelineStats(
+            rows=count,
+            stages={
+                "generate": StageStats("generate", self.generator_workers),
+                "format": StageStats("format", self.formatter_workers),
+                "write": StageStats("write", 1),
+            },
+        )
+        run = _PipelineRun(self, count, seed, chunk_count, stats, progress)
+
+        started = time.perf_counter()
+        tmp_path = f"{output}.tmp"
+        try:
+            with open(tmp_path, "wb") as out:
+                run.execute(out)
+                out.flush()
+                os.fsync(out.fileno())
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        os.replace(tmp_path, output)
+        stats.elapsed = time.perf_counter() - started
+        return stats
+
+
+class _PipelineRun:
+    """一次流水线运行的共享状态"""
+
+    def __init__(
+        self,
+        pipeline: GenerationPipeline,
+        count: int,
+        seed: Union[int, str],
+        chunk_count: int,
+        stats: PipelineStats,
+        progress: Optional[Callable[[int, int], None]],
+    ):
+        self.pipeline = pipeline
+        self.count = count
+        self.seed = seed
+        self.chunk_count = chunk_count
+        self.stats = stats
+        self.progress = progress
+
+        self.batch_queue: "queue.Queue[tuple[int, RecordBatch]]" = queue.Queue(pipeline.queue_size)
+        self.bytes_queue: "queue.Queue[tuple[int, bytes]]" = queue.Queue(pipeline.queue_size)
+        # 先占名额再领取分块序号，保证最小的未写出分块总在处理中，重排缓冲不会死锁
+        self.slots = threading.Semaphore(pipeline.queue_size * 2)
+        self.indices = itertools.count()
+        self.index_lock = threading.Lock()
+        self.stats_lock = threading.Lock()
+        self.stop = threading.Event()
+        self.errors: list[BaseException] = []
+
+    def execute(self, out) -> None:
+        pipeline = self.pipeline
+        generators = [
+            threading.Thread(target=self._guard, args=(self._generate,), name=f"dataforge-generate-{i}", daemon=True)
+            for i in range(pipeline.generator_workers)
+        ]
+        formatters = [
+            threading.Thread(target=self._guard, args=(self._format,), name=f"dataforge-format-{i}", daemon=True)
+            for i in range(pipeline.formatter_workers)
+        ]
+        for thread in generators + formatters:
+            thread.start()
+
+        try:
+            self._guard(self._write, out)
+        finally:
+            self.stop.set()
+            for thread in generators + formatters:
+                thread.join()
+        if self.errors:
+            raise self.errors[0]
+
+    def _guard(self, stage: Callable, *args) -> None:
+        try:
+            stage(*args)
+        except BaseException as e:  # 任一阶段出错都终止整条流水线
+            self.errors.append(e)
+            self.stop.set()
+
+    def _put(self, target: queue.Queue, item: Any) -> bool:
+        while not self.stop.is_set():
+            try:
+                target.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, source: queue.Queue) -> Any:
+        while not self.stop.is_set():
+            try:
+                return source.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+        return None
+
+    def _record(self, stage: str, busy: float, items: int) -> None:
+        with self.stats_lock:
+            self.stats.stages[stage].busy_seconds += busy
+            self.stats.stages[stage].items += items
+
+    def _generate(self) -> None:
+        pipeline = self.pipeline
+        busy = 0.0
+        items = 0
+        try:
+            while not self.stop.is_set():
+                if not self.slots.acquire(timeout=_POLL_INTERVAL):
+                    continue
+                with self.index_lock:
+                    index = next(self.indices)
+                if index >= self.chunk_count:
+                    self.slots.release()
+                    break
+
+                started = time.perf_counter()
+                start = index * pipeline.chunk_size
+                batch = pipeline.template.generate_record_batch(
+                    start, min(start + pipeline.chunk_size, self.count), self.seed
+                )
+                busy += time.perf_counter() - started
+                items += 1
+                if not self._put(self.batch_queue, (index, batch)):
+                    break
+        finally:
+            self._record("generate", busy, items)
+
+    def _format(self) -> None:
+        pipeline = self.pipeline
+        busy = 0.0
+        items = 0
+        try:
+            while True:
+                item = self._get(self.batch_queue)
+                if item is None:
+                    break
+                index, batch = item
+
+                started = time.perf_counter()
+                data = pipeline.formatter.format_chunk_bytes(batch, pipeline.format_type, first=index == 0)
+                busy += time.perf_counter() - started
+                items += 1
+                if not self._put(self.bytes_queue, (index, data)):
+                    break
+        finally:
+            self._record("format", busy, items)
+
+    def _write(self, out) -> None:
+        pending: dict[int, bytes] = {}
+        next_index = 0
+        busy = 0.0
+        written = 0
+        try:
+            while next_index < self.chunk_count:
+                item = self._get(self.bytes_queue)
+                if item is None:
+                    return
+                pending[item[0]] = item[1]
+
+                # 按序收集所有已就绪的分块，一次 writelines 写出
+                batch = []
+                while next_index in pending:
+                    batch.append(pending.pop(next_index))
+                    next_index += 1
+                if not batch:
+                    continue
+
+                started = time.perf_counter()
+                out.writelines(batch)
+                busy += time.perf_counter() - started
+                written += sum(len(data) for data in batch)
+                for _ in batch:
+                    self.slots.release()
+                if self.progress:
+                    self.progress(next_index, self.chunk_count)
+        finally:
+            self.stats.bytes = written
+            self._record("write", busy, next_index)
+
+        # 所有分块已写出，通知格式化线程退出
+        self.stop.set()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+线程池批量生成扩展性基准
+
+对内置生成器分别以 1/2/4/8 个线程执行 generate_batch，输出吞吐量与加速比。
+在 free-threaded 构建（如 python3.13t）上线程可以并行；
+在启用GIL的构建上 executor="thread" 会退化为串行，曲线应基本持平。
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dataforge import default_factory
+from dataforge.core.parallel import gil_enabled
+
+
+def bench(generator_type: str, count: int, worker_counts: list[int], repeat: int) -> None:
+    generator = default_factory.create_generator_simple(generator_type)
+    generator.generate_batch(1000, seed=0)  # 预热
+
+    baseline = None
+    print(f"\n{generator_type} ({count} 条)")
+    print(f"{'workers':>8} {'秒':>8} {'条/秒':>12} {'加速比':>8}")
+    for workers in worker_counts:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            generator.generate_batch(count, workers=workers, executor="thread", seed=42)
+            best = min(best, time.perf_counter() - start)
+        baseline = baseline or best
+        print(f"{workers:>8} {best:>8.3f} {count / best:>12,.0f} {baseline / best:>8.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--generators", nargs="+", default=["idcard", "phone", "name", "address"])
+    args = parser.parse_args()
+
+    print(f"Python {sys.version.split()[0]}，GIL {'启用' if gil_enabled() else '关闭'}，CPU {os.cpu_count()}")
+    for generator_type in args.generators:
+        bench(generator_type, args.count, args.workers, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
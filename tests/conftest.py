@@ -0,0 +1,21 @@
+"""
+测试公共配置
+
+预加载表和数据集缓存写入临时目录，不污染开发者的 ~/.cache/dataforge。
+"""
+
+import os
+
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def isolated_cache_dir(tmp_path_factory):
+    """整个测试会话的 DATAFORGE_CACHE_DIR 指向临时目录（子进程通过环境变量继承）"""
+    previous = os.environ.get("DATAFORGE_CACHE_DIR")
+    os.environ["DATAFORGE_CACHE_DIR"] = str(tmp_path_factory.mktemp("dataforge-cache"))
+    yield os.environ["DATAFORGE_CACHE_DIR"]
+    if previous is None:
+        os.environ.pop("DATAFORGE_CACHE_DIR", None)
+    else:
+        os.environ["DATAFORGE_CACHE_DIR"] = previous
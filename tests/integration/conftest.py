@@ -0,0 +1,14 @@
+"""
+集成测试配置
+
+导出和模板脚本把文件写入当前目录，在 pytest 下切换到临时目录运行，避免在仓库根目录留下生成文件。
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def run_in_tmp_path(tmp_path, monkeypatch):
+    """每个集成测试在独立的临时目录中运行"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
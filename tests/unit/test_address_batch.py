@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+地址批量生成测试
+"""
+
+import random
+import statistics
+from collections import Counter
+
+import pytest
+
+from dataforge.core.factory import default_factory
+
+
+def _stats(addresses):
+    provinces = Counter(address[:3] for address in addresses)
+    return (
+        statistics.mean(map(len, addresses)),
+        sum("号楼" in address for address in addresses) / len(addresses),
+        sum("邮编" in address for address in addresses) / len(addresses),
+        provinces.get("广东省", 0) / len(addresses),
+        provinces.get("北京市", 0) / len(addresses),
+    )
+
+
+@pytest.mark.parametrize(
+    "parameters",
+    [
+        {},
+        {"detail_level": "simple"},
+        {"format_style": "formal", "include_postal_code": True},
+        {"detail_level": "full", "include_postal_code": True, "address_type": "industrial"},
+        {"format_style": "casual", "province": "北京市"},
+    ],
+)
+def test_batch_matches_single_distribution(parameters):
+    """整列组装的地址全部有效，长度和各组件比例与逐条生成一致"""
+    generator = default_factory.create_generator_simple("address", **parameters)
+    with generator._using_rng(random.Random(11)):
+        single = [generator.generate() for _ in range(20000)]
+        batch = generator._compose_batch(generator._plan, 20000)
+
+    assert all(generator.validate(address) for address in batch)
+    assert all(bool(generator._ADDRESS_PATTERN.fullmatch(address)) for address in batch)
+    for expected, actual in zip(_stats(single), _stats(batch)):
+        assert actual == pytest.approx(expected, rel=0.05, abs=0.01)
+
+
+def test_fixed_region_and_overrides():
+    """指定地区时直辖市的区即城市；参数覆盖只作用于本次调用"""
+    generator = default_factory.create_generator_simple("address", province="上海市", city="浦东新区")
+    addresses = generator.generate_batch(200, seed=3, format_style="formal")
+
+    assert all(address.startswith("上海市上海市浦东新区") for address in addresses)
+    assert generator.format_style == "standard"
+    assert generator.generate_batch(200, seed=3, format_style="formal") == addresses
+
+    generator = default_factory.create_generator_simple("address", province="广东省", district="南山区")
+    assert all(address.startswith("广东省") and "南山区" in address for address in generator.generate_batch(200))
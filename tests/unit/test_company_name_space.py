@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+公司名称组合空间测试
+"""
+
+import pytest
+
+from dataforge.core.enumeration import MixedRadixSpace, RandomPermutation
+from dataforge.core.factory import default_factory
+
+
+def test_space_merges_ambiguous_segments():
+    """含前缀关系的段与下一段合并去重，size 为不重复拼接结果的确切数量"""
+    space = MixedRadixSpace.build([["北京", "上海"], ["", "AI"], ["科技", "AI科技"], ["有限公司"]])
+    decoded = [space.decode(index) for index in range(space.size)]
+    assert len(set(decoded)) == len(decoded) == space.size == 2 * 3
+    assert space.segments[0] == ("北京", "上海")
+
+
+def test_random_permutation_is_bijection():
+    for size in (1, 2, 7, 1000, 4097):
+        permutation = RandomPermutation(size, seed=5)
+        assert sorted(permutation[index] for index in range(size)) == list(range(size))
+    assert [RandomPermutation(1000, 1)[i] for i in range(10)] != [RandomPermutation(1000, 2)[i] for i in range(10)]
+
+
+@pytest.mark.parametrize(
+    "parameters",
+    [{}, {"length": "short"}, {"length": "long", "type": "tech"}, {"style": "creative", "type": "finance"}],
+)
+def test_space_covers_single_generation(parameters):
+    """逐条生成的名称都在组合空间内"""
+    generator = default_factory.create_generator_simple("company_name", **parameters)
+    space = generator.name_space()
+    if space.size > 200_000:
+        pytest.skip("space too large to enumerate in a unit test")
+    names = {space.decode(index) for index in range(space.size)}
+    assert len(names) == space.size
+    assert all(generator.generate() in names for _ in range(2000))
+
+
+def test_exhaustive_batch_exhausts_space():
+    """exhaustive 批量生成可以取尽整个空间，超出时报错"""
+    generator = default_factory.create_generator_simple("company_name", include_region=False)
+    size = generator.name_space().size
+    names = generator.generate_batch(size, seed=3, exhaustive=True)
+    assert len(set(names)) == size
+    assert generator.generate_batch(10, seed=3, exhaustive=True) == names[:10]
+    assert all(generator.validate(name) for name in names)
+
+    with pytest.raises(ValueError, match="unique company names"):
+        generator.generate_batch(size + 1, exhaustive=True)
+    with pytest.raises(ValueError, match="unique company names"):
+        generator.generate_batch(size + 1)
+
+
+def test_default_batch_is_unique_and_keeps_type_weights():
+    """默认批量生成不重复，公司类型后缀仍按权重采样；采样方式与 count 无关"""
+    generator = default_factory.create_generator_simple("company_name", type="tech")
+    names = generator.generate_batch(5000, seed=1)
+    assert len(set(names)) == 5000
+    assert generator.generate_batch(5000, seed=1, workers=4) == names
+    group_share = sum(name.endswith("集团有限公司") for name in names) / len(names)
+    assert group_share == pytest.approx(generator.COMPANY_TYPES["集团有限公司"], abs=0.015)
+
+    # 批量大小变化时同一种子的结果互为前缀
+    small = default_factory.create_generator_simple("company_name", include_region=False)
+    size = small.name_space().size
+    assert small.generate_batch(size // 2 + 10, seed=2, unique=False)[:50] == small.generate_batch(
+        50, seed=2, unique=False
+    )
+
+    repeated = generator.generate_batch(5000, seed=1, unique=False)
+    assert sum(name.endswith("集团有限公司") for name in repeated) / 5000 == pytest.approx(group_share, abs=0.015)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+数据集缓存测试
+"""
+
+import os
+
+from dataforge.output.dataset_cache import DatasetCache, dataset_key
+
+TEMPLATE = {
+    "name": "用户信息模板",
+    "fields": [
+        {"name": "姓名", "generator": "name"},
+        {"name": "手机号", "generator": "phone"},
+    ],
+}
+
+
+def read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_hit_returns_identical_output(tmp_path):
+    """第二次生成命中缓存，输出与跳过缓存重新生成的结果一致"""
+    cache = DatasetCache(cache_dir=str(tmp_path / "cache"))
+    first, second, fresh = (str(tmp_path / name) for name in ("a.csv", "b.csv", "c.csv"))
+
+    assert cache.generate(TEMPLATE, 500, 42, first, chunk_size=100) is False
+    assert cache.generate(TEMPLATE, 500, 42, second, chunk_size=100) is True
+    assert cache.generate(TEMPLATE, 500, 42, fresh, chunk_size=100, use_cache=False) is False
+
+    assert read(first) == read(second) == read(fresh)
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.bypassed) == (1, 1, 1)
+    assert cache.usage()[0] == 1
+
+
+def test_key_depends_on_inputs():
+    """种子、行数、格式或模板不同时缓存键不同"""
+    base = dataset_key(TEMPLATE, 1, 10, "csv", 100)
+    assert base == dataset_key(TEMPLATE, 1, 10, "csv", 100)
+    assert base != dataset_key(TEMPLATE, 2, 10, "csv", 100)
+    assert base != dataset_key(TEMPLATE, 1, 11, "csv", 100)
+    assert base != dataset_key(TEMPLATE, 1, 10, "sql", 100)
+    assert base != dataset_key({"fields": TEMPLATE["fields"][:1]}, 1, 10, "csv", 100)
+
+
+def test_lru_eviction(tmp_path):
+    """超过大小上限时淘汰最久未使用的条目"""
+    cache = DatasetCache(cache_dir=str(tmp_path / "cache"))
+    cache.generate(TEMPLATE, 200, "old", str(tmp_path / "old.csv"))
+    old_entry = cache.entries()[0][0]
+    os.utime(old_entry, (0, 0))
+
+    cache.max_bytes = os.path.getsize(old_entry) + 10
+    cache.generate(TEMPLATE, 200, "new", str(tmp_path / "new.csv"))
+
+    assert cache.stats.evictions == 1
+    assert not os.path.exists(old_entry)
+    assert cache.usage()[0] == 1
+    assert os.path.exists(tmp_path / "old.csv")
+
+
+def test_oversized_dataset_is_not_cached(tmp_path):
+    """单个数据集超过大小上限时不缓存，输出照常生成，已有条目不被淘汰"""
+    cache = DatasetCache(cache_dir=str(tmp_path / "cache"))
+    cache.generate(TEMPLATE, 10, 1, str(tmp_path / "small.csv"))
+    cache.max_bytes = os.path.getsize(cache.entries()[0][0]) + 10
+
+    output, fresh = str(tmp_path / "big.csv"), str(tmp_path / "fresh.csv")
+    assert cache.generate(TEMPLATE, 500, 1, output) is False
+    cache.generate(TEMPLATE, 500, 1, fresh, use_cache=False)
+    assert read(output) == read(fresh)
+    assert (cache.stats.oversized, cache.stats.evictions) == (1, 0)
+    assert cache.usage()[0] == 1
+
+    tiny = DatasetCache(cache_dir=str(tmp_path / "tiny"), max_bytes=100)
+    assert tiny.generate(TEMPLATE, 500, 1, str(tmp_path / "out.csv")) is False
+    assert read(tmp_path / "out.csv") == read(fresh)
+    assert tiny.usage()[0] == 0
+
+
+def test_store_keeps_new_entry(tmp_path):
+    """存入的条目本身超过上限时也不被淘汰，直至检出"""
+    cache = DatasetCache(cache_dir=str(tmp_path / "cache"), max_bytes=1)
+    source = tmp_path / "source.csv"
+    source.write_bytes(b"a,b\n1,2\n")
+    entry = cache.store("ab" * 32, "csv", str(source))
+    assert os.path.exists(entry)
+    cache.checkout(entry, str(tmp_path / "out.csv"))
+    assert read(tmp_path / "out.csv") == b"a,b\n1,2\n"
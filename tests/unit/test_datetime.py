@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+时间戳、日期、时长、时间范围和交易日生成器测试
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from dataforge.core.factory import default_factory
+from dataforge.core.sampling import random_below
+from dataforge.generators.datetime.epoch import build_formatter, date_to_day, format_duration, local_day
+from dataforge.generators.datetime.trading_calendar import build_trading_calendar
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    ["%Y-%m-%d %H:%M:%S", "%Y年%m月%d日 %H时%M分%S秒", "%m/%d/%Y %I:%M:%S %p", "%a %j %Y%m%d%H%M%S"],
+)
+def test_formatter_matches_strftime(pattern):
+    offset = 8 * 3600
+    zone = timezone(timedelta(seconds=offset))
+    values = random_below(random.Random(1), 10 ** 9, 2000)
+    values = [1_500_000_000 + value for value in values]
+    formatter = build_formatter(pattern, 1, local_day(min(values), offset), local_day(max(values), offset), offset)
+    expected = [datetime.fromtimestamp(value, zone).strftime(pattern) for value in values]
+    assert formatter.format_many(values) == expected
+    assert formatter.format(values[0]) == expected[0]
+
+
+def test_random_below_matches_single_draws():
+    rng = random.Random(2)
+    column = random_below(rng, 1000, 500)
+    rng = random.Random(2)
+    assert column == [int.from_bytes(rng.randbytes(8), "little") % 1000 for _ in range(500)]
+
+
+def test_timestamp_batch_matches_single_and_precision():
+    generator = default_factory.create_generator_simple("timestamp", format="ISO", precision="milliseconds")
+    with generator._using_rng(random.Random(3)):
+        single = [generator.generate() for _ in range(500)]
+    with generator._using_rng(random.Random(3)):
+        assert generator.generate_batch(500) == single
+    assert all(len(value) == 23 and value[19] == "." for value in single)
+
+    epochs = default_factory.create_generator_simple("时间戳", precision="milliseconds").generate_epochs(1000, seed=4)
+    assert epochs.typecode == "q"
+    assert 1577808000000 <= min(epochs) and max(epochs) < 1767196800000
+
+    aware = generator.generate_batch(10, seed=5, timezone_aware=True, timezone="UTC")
+    assert all(value.endswith("+00:00") and generator.validate(value) for value in aware)
+
+
+@pytest.mark.parametrize(
+    "zone_name, start, end",
+    [
+        ("Asia/Shanghai", "1988-01-01", "1988-12-31"),
+        ("Asia/Shanghai", "1980-01-01", "1995-12-31"),
+        ("America/New_York", "2024-01-01", "2024-12-31"),
+    ],
+)
+def test_timestamp_across_utc_offset_changes(zone_name, start, end):
+    """范围内有夏令时切换时按各时刻的偏移换算和格式化，与 zoneinfo 一致"""
+    zoneinfo = pytest.importorskip("zoneinfo")
+    try:
+        zone = zoneinfo.ZoneInfo(zone_name)
+    except zoneinfo.ZoneInfoNotFoundError:
+        pytest.skip("timezone database not available")
+    generator = default_factory.create_generator_simple(
+        "timestamp", start_date=start, end_date=end, timezone=zone_name
+    )
+    first = datetime.fromisoformat(start).replace(tzinfo=zone)
+    last = (datetime.fromisoformat(end) + timedelta(days=1)).replace(tzinfo=zone)
+    assert (generator._plan.start, generator._plan.end) == (int(first.timestamp()), int(last.timestamp()) - 1)
+
+    epochs = generator.generate_batch(5000, seed=1)
+    pattern = "%Y-%m-%d %H:%M:%S%z %Z"
+    texts = generator.generate_batch(5000, seed=1, format="CUSTOM", custom_format=pattern)
+    assert texts == [datetime.fromtimestamp(value, zone).strftime(pattern) for value in epochs]
+
+    ranges = default_factory.create_generator_simple(
+        "datetime_range", start_date=start, end_date=end, timezone=zone_name, format="ISO", include_timezone=True
+    )
+    assert all(ranges.validate(value) for value in ranges.generate_batch(200, seed=2))
+
+
+def test_timestamp_order():
+    generator = default_factory.create_generator_simple(
+        "timestamp", start_date="2024-01-01 00:00:00", end_date="2024-01-01 00:16:39", format="SQL"
+    )
+    values = generator.generate_batch(1000, seed=1, order="sorted", workers=4)
+    assert values == sorted(values)
+    monotonic = generator.generate_batch(1000, seed=1, order="monotonic")
+    assert len(set(monotonic)) == 1000 and monotonic[0] == "2024-01-01 00:00:00"
+    with pytest.raises(ValueError):
+        generator.generate_batch(1001, order="monotonic")
+
+
+def test_date_duration_and_range():
+    dates = default_factory.create_generator_simple("日期", start_date="2024-02-28", end_date="2024-03-01", format="CN")
+    assert set(dates.generate_batch(300, seed=1)) == {"2024年02月28日", "2024年02月29日", "2024年03月01日"}
+
+    assert format_duration(90061) == "1天1小时1分钟1秒"
+    assert format_duration(302400, "ISO") == "P3DT12H"
+    assert format_duration(90061, "CLOCK") == "25:01:01"
+    durations = default_factory.create_generator_simple("duration", format="ISO", min_seconds=0, max_seconds=10)
+    assert all(durations.validate(value) for value in durations.generate_batch(100, seed=1))
+
+    ranges = default_factory.create_generator_simple(
+        "datetime_range", start_datetime="2024-03-01 09:00:00", duration_days=3, duration_hours=12, format="SQL"
+    )
+    assert ranges.generate() == "BETWEEN '2024-03-01 09:00:00' AND '2024-03-04 21:00:00'"
+    for format_type in ("RANGE", "ISO", "US", "DATE"):
+        values = ranges.generate_batch(20, seed=2, start_datetime=None, format=format_type)
+        assert all(ranges.validate(value) for value in values)
+    assert not ranges.validate("2024-03-05 至 2024-03-01")
+
+
+def test_trading_days():
+    calendar = build_trading_calendar()
+    spring_festival = date_to_day(datetime(2024, 2, 12).date())
+    assert not calendar.is_trading_day(spring_festival)
+    assert calendar.next_trading_day(spring_festival) == date_to_day(datetime(2024, 2, 19).date())
+    assert calendar.shift(calendar.previous_trading_day(spring_festival), 1) == spring_festival + 7
+
+    generator = default_factory.create_generator_simple("交易日", start_date="2024-02-01", end_date="2024-02-29")
+    values = set(generator.generate_batch(500, seed=1))
+    assert len(values) == 15 and "2024-02-09" not in values and "2024-02-10" not in values
+    assert generator.is_trading_day("2024-02-19") and not generator.validate("2024-02-12")
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+邮箱批量组装测试
+"""
+
+import random
+import statistics
+
+import pytest
+
+from dataforge.core import sampling
+from dataforge.core.factory import default_factory
+
+
+def test_lane_tables():
+    """查表按权重划分，共用键的两列随机数高位相同"""
+    table = sampling.lane_table(["a", "b"], [3, 1])
+    assert abs(table.count("a") / sampling.LANES - 0.75) < 1e-4
+
+    rng = random.Random(1)
+    lanes = sampling.draw_lanes(rng, 1000)
+    shared = sampling.share_key(rng, lanes, 2)
+    assert [lane >> 14 for lane in lanes] == [lane >> 14 for lane in shared]
+    assert list(lanes) != list(shared)
+
+    strings = sampling.random_strings(rng, "xyz", [0, 3, 5])
+    assert [len(value) for value in strings] == [0, 3, 5]
+    assert set("".join(strings)) <= set("xyz")
+
+
+def _stats(emails):
+    usernames = [email.split("@")[0] for email in emails]
+    return (
+        statistics.mean(map(len, usernames)),
+        sum("." in username for username in usernames) / len(usernames),
+        sum(any(char.isdigit() for char in username) for username in usernames) / len(usernames),
+    )
+
+
+@pytest.mark.parametrize("style", ["mixed", "simple", "business", "random"])
+def test_batch_matches_single_distribution(style):
+    """批量组装的邮箱全部有效，长度、含点和含数字的比例与逐条生成一致"""
+    generator = default_factory.create_generator_simple("email", username_style=style)
+    with generator._using_rng(random.Random(7)):
+        single = [generator._compose(generator._plan) for _ in range(20000)]
+        batch = generator._compose_batch(generator._plan, 20000)
+
+    assert all(generator.validate(email) for email in batch)
+    for expected, actual in zip(_stats(single), _stats(batch)):
+        assert actual == pytest.approx(expected, rel=0.05, abs=0.01)
+
+
+def test_unique_batch_with_overrides():
+    generator = default_factory.create_generator_simple("email")
+    emails = generator.generate_batch(5000, seed=1, custom_domain="example.com", unique=True)
+    assert len(set(emails)) == 5000
+    assert all(email.endswith("@example.com") for email in emails)
+    assert generator.generate_batch(5000, seed=1, custom_domain="example.com", unique=True) == emails
+
+
+def test_default_batch_is_unique():
+    """默认去重：用户名取值较少时也不返回重复的邮箱"""
+    generator = default_factory.create_generator_simple("email", username_style="business", custom_domain="a.com")
+    emails = generator.generate_batch(100, seed=1)
+    assert len(set(emails)) == len(emails)
+    assert generator.generate_batch(100, seed=1, unique=False) != emails
+
+
+def test_batch_without_uniqueness_is_composed_directly():
+    """unique=False 时直接返回整批组装的结果"""
+    generator = default_factory.create_generator_simple("email")
+    with generator._using_rng(random.Random(3)):
+        expected = generator._compose_batch(generator._plan, 3000)
+    with generator._using_rng(random.Random(3)):
+        assert generator.generate_batch(3000, unique=False) == expected
+    emails = generator.generate_batch(3000, seed=1, unique=False)
+    assert len(emails) == 3000 and all(generator.validate(email) for email in emails)
+    assert generator.generate_batch(3000, seed=1, workers=3, unique=False) == emails
+
+
+def test_long_usernames():
+    """超过255个字符的用户名也能调整长度和插入点"""
+    generator = default_factory.create_generator_simple("email")
+    emails = generator.generate_for_names(["张" + "伟" * 100], seed=1)
+    assert len(emails) == 1 and generator.validate(emails[0])
+    assert len(emails[0].split("@")[0]) <= 20
+
+    generator = default_factory.create_generator_simple("email", username_style="random", max_length=400)
+    with generator._using_rng(random.Random(5)):
+        usernames = ["a" * 300] * 200
+        generator._insert_dots(usernames)
+    assert any("." in username for username in usernames)
+    assert all(2 <= username.find(".") <= 298 for username in usernames if "." in username)
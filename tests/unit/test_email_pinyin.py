@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+拼音邮箱测试
+"""
+
+import random
+
+import pytest
+
+from dataforge.core.factory import default_factory
+from dataforge.core.template import DataTemplate
+from dataforge.generators.basic.name import ChineseNameGenerator
+from dataforge.generators.basic.pinyin import PINYIN, name_pinyin, transliterate_column
+
+
+def test_table_covers_name_pools():
+    """姓名生成器字符池中的每个字都有拼音"""
+    pools = (
+        ChineseNameGenerator.SURNAMES
+        + ChineseNameGenerator.MALE_NAMES
+        + ChineseNameGenerator.FEMALE_NAMES
+        + ChineseNameGenerator.NEUTRAL_NAMES
+    )
+    assert set(pools) <= PINYIN.keys()
+    assert all(reading.isascii() and reading.isalpha() for reading in PINYIN.values())
+
+
+def test_name_pinyin():
+    assert name_pinyin("张伟") == ("zhang", "wei", "w")
+    assert name_pinyin("曾国明") == ("zeng", "guoming", "gm")
+    assert name_pinyin("X伟") is None
+    assert name_pinyin("李") is None
+
+
+@pytest.mark.parametrize("initials", [False, True])
+def test_transliterate_column_matches_single(initials):
+    """整列转写与逐个转写一致，含表外字和长度不一的姓名"""
+    generator = default_factory.create_generator_simple("name")
+    with generator._using_rng(random.Random(3)):
+        names = [generator.generate() for _ in range(2000)]
+
+    for column in (names, names + ["X伟", "张a", "李", "", "王小明", "欧阳娜娜"]):
+        expected = [
+            (converted.surname, converted[2 if initials else 1]) if converted else ("", "")
+            for converted in map(name_pinyin, column)
+        ]
+        assert list(zip(*transliterate_column(column, initials=initials))) == expected
+
+
+def test_template_email_follows_name():
+    """同一行的邮箱由该行姓名的拼音派生"""
+    template = DataTemplate.from_dict(
+        [
+            {"name": "姓名", "generator": "name"},
+            {"name": "邮箱", "generator": "email", "parameters": {"username_style": "pinyin"}},
+        ]
+    )
+    for row in template.generate_range(0, 200, seed=5):
+        converted = name_pinyin(row["姓名"])
+        username = row["邮箱"].split("@")[0]
+        assert converted.surname in username and converted.given in username
+
+
+def test_generate_for_names():
+    generator = default_factory.create_generator_simple("email", username_style="pinyin_initials")
+    names = ["张伟", "李娜", "X伟"] * 100
+    emails = generator.generate_for_names(names, seed=1, include_numbers=False, custom_domain="example.com")
+
+    assert len(emails) == len(names)
+    assert all(generator.validate(email) for email in emails)
+    assert {email.split("@")[0] for email in emails[0::3]} <= {"zhangw", "wzhang", "zhang.w", "w_zhang"}
+    assert generator.generate_for_names(names, seed=1, include_numbers=False, custom_domain="example.com") == emails
+
+
+def test_unique_batch_without_names():
+    generator = default_factory.create_generator_simple("email", username_style="pinyin")
+    emails = generator.generate_batch(3000, seed=2, unique=True)
+    assert len(set(emails)) == 3000
+    assert all(generator.validate(email) for email in emails)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+批量解析测试
+验证 extract_info_batch 与逐个调用 extract_info 的结果一致
+"""
+
+from datetime import date
+
+from dataforge.generators.basic.idcard import ChineseIDCardGenerator
+from dataforge.generators.basic.uscc import USCCGenerator
+
+
+def _rows(columns: dict) -> list[dict]:
+    """按列结果转为逐行结果；无效行只保留 valid 字段，与 extract_info 的返回一致"""
+    rows = [dict(zip(columns, values)) for values in zip(*columns.values())]
+    return [row if row["valid"] else {"valid": False} for row in rows]
+
+
+def _with_invalid(values: list[str]) -> list[str]:
+    """在有效值之间插入各种无效输入：校验码错误、长度错误、非法字符"""
+    first = values[0]
+    wrong_check = first[:-1] + ("0" if first[-1] != "0" else "1")
+    return [*values, wrong_check, first[:-1], first.lower() + "!", "", "X" * 18]
+
+
+def test_idcard_batch_matches_per_row():
+    """身份证批量解析的每一列与逐个解析一致"""
+    generator = ChineseIDCardGenerator()
+    reference = date(2026, 1, 1)
+    idcards = _with_invalid(generator.generate_batch(300, seed=1))
+
+    columns = generator.extract_info_batch(idcards, reference_date=reference)
+    expected = [generator.extract_info(idcard, reference_date=reference) for idcard in idcards]
+
+    assert set(columns) == set(expected[0])
+    assert _rows(columns) == expected
+    assert not any(columns["valid"][-5:])
+
+
+def test_uscc_batch_matches_per_row():
+    """统一社会信用代码批量解析的每一列与逐个解析一致"""
+    generator = USCCGenerator()
+    usccs = _with_invalid(generator.generate_batch(300, seed=1))
+
+    columns = generator.extract_info_batch(usccs)
+    expected = [generator.extract_info(uscc) for uscc in usccs]
+
+    assert set(columns) == set(expected[0])
+    assert _rows(columns) == expected
+    assert not any(columns["valid"][-5:])
+
+    # 关闭校验时有效代码的解析结果不变
+    valid = usccs[:300]
+    assert _rows(generator.extract_info_batch(valid, validate=False)) == expected[:300]
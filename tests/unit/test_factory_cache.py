@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+生成器实例缓存测试
+验证 GeneratorFactory.get_generator 的键规范化、LRU淘汰与失效
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from dataforge.core.factory import GeneratorConfig, GeneratorFactory, default_registry
+
+
+def _factory(cache_size=128):
+    return GeneratorFactory(default_registry, cache_size=cache_size)
+
+
+def test_cache_hit_on_alias_and_reordered_parameters():
+    """别名和参数顺序不同的请求命中同一实例"""
+    factory = _factory()
+    first = factory.get_generator(GeneratorConfig("idcard", {"gender": "male", "region": "北京"}))
+    second = factory.get_generator(GeneratorConfig("身份证", {"region": "北京", "gender": "male"}))
+
+    assert first is second
+    info = factory.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    # create_generator 始终返回新实例
+    assert factory.create_generator(GeneratorConfig("idcard", {})) is not first
+
+
+def test_lru_eviction_and_invalidate():
+    """超出容量时淘汰最久未使用的实例，invalidate 可按类型清除"""
+    factory = _factory(cache_size=2)
+    name_gen = factory.get_generator_simple("name", gender="male")
+    factory.get_generator_simple("phone")
+    factory.get_generator_simple("name", gender="male")  # 刷新 name
+    factory.get_generator_simple("email")  # 淘汰 phone
+
+    assert factory.cache_info().currsize == 2
+    assert factory.get_generator_simple("name", gender="male") is name_gen
+
+    assert factory.invalidate("姓名") == 1
+    assert factory.get_generator_simple("name", gender="male") is not name_gen
+    assert factory.invalidate() == 2
+    assert factory.cache_info().currsize == 0
+
+
+def test_cached_instance_isolated_from_caller_parameters():
+    """调用方后续修改参数字典不影响缓存实例"""
+    factory = _factory()
+    parameters = {"birth_date_range": ["1990-01-01", "1990-12-31"]}
+    generator = factory.get_generator(GeneratorConfig("idcard", parameters))
+    parameters["birth_date_range"][1] = "2000-12-31"
+
+    assert generator.parameters["birth_date_range"][1] == "1990-12-31"
+    assert factory.get_generator(GeneratorConfig("idcard", {"birth_date_range": ("1990-01-01", "1990-12-31")})) is generator
+
+
+def test_concurrent_lookups_share_one_instance():
+    """并发获取同一配置只保留一个缓存实例"""
+    factory = _factory()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        generators = list(pool.map(lambda _: factory.get_generator_simple("address", detail_level="full"), range(64)))
+
+    assert len({id(generator) for generator in generators}) == 1
+    assert factory.cache_info().currsize == 1
+    assert all(generator.validate(generator.generate()) for generator in generators[:8])
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+银行卡、信用卡、IBAN、股票代码、加密货币地址和金融档案生成器测试
+"""
+
+import random
+
+import pytest
+
+from dataforge.core.factory import default_factory
+from dataforge.generators.finance.checksum import append_luhn, luhn_check_digit, luhn_valid_batch
+from dataforge.generators.finance.crypto import btc_address_valid
+from dataforge.generators.finance.market import stock_name
+
+
+def _luhn(number: str) -> bool:
+    total = 0
+    for position, char in enumerate(reversed(number)):
+        digit = int(char) * (2 if position % 2 else 1)
+        total += digit - 9 if digit > 9 else digit
+    return total % 10 == 0
+
+
+def test_luhn_columns_match_digitwise_reference():
+    rng = random.Random(1)
+    numbers = [str(rng.randrange(10 ** rng.randint(1, 19))) for _ in range(5000)]
+    assert luhn_valid_batch(numbers) == [_luhn(number) for number in numbers]
+    assert all(_luhn(str(number)) for number in append_luhn([rng.randrange(10 ** 18) for _ in range(5000)], 18))
+    assert luhn_check_digit("7992739871") == "3"
+    assert luhn_valid_batch(["", "12a4", None, 4111111111111111]) == [False] * 4
+
+
+def test_bank_card_follows_bin_table():
+    generator = default_factory.create_generator_simple("银行卡", bank="招商银行", card_type="信用卡")
+    records = generator.generate_batch(200, seed=1)
+    assert {record["bank_code"] for record in records} == {"CMB"}
+    assert all(record["card_number"][:6] in ("439225", "622575") for record in records)
+    assert all(len(record["card_number"]) == 16 for record in records)
+    assert generator.generate_batch(200, seed=1, workers=4) == records
+
+    numbers = default_factory.create_generator_simple("bank_card", field="card_number").generate_batch(2000, seed=2)
+    assert {len(number) for number in numbers} == {16, 18, 19}
+    assert all(generator.validate_batch(numbers))
+    assert generator.validate_batch(["6222020000000000001", "4111111111111111"]) == [False, False]
+    with pytest.raises(ValueError):
+        default_factory.create_generator_simple("bank_card", bank="不存在的银行")
+
+
+def test_credit_card_schemes():
+    generator = default_factory.create_generator_simple("信用卡")
+    records = generator.generate_batch(1000, seed=1)
+    assert {record["card_type"] for record in records} >= {"Visa", "MasterCard", "UnionPay"}
+    assert all(len(record["cvv"]) == (4 if record["card_type"] == "American Express" else 3) for record in records)
+    assert all(generator.validate_batch(records))
+    assert generator.validate_batch(["4111111111111111", "378282246310005", "4111111111111112"]) == [True, True, False]
+    spaced = generator.generate_batch(5, seed=2, card_type="amex", field="card_number", format="spaced")
+    assert all(value.startswith("3") and len(value.replace(" ", "")) == 15 for value in spaced)
+
+
+def test_iban_mod97():
+    generator = default_factory.create_generator_simple("iban")
+    records = generator.generate_batch(500, seed=1)
+    assert all(generator.validate_batch(records))
+    assert generator.validate_batch(
+        ["DE89 3704 0044 0532 0130 00", "GB82WEST12345698765432", "GB82WEST12345698765431", "DE8937040044053201300"]
+    ) == [True, True, False, False]
+    ibans = generator.generate_batch(20, seed=2, country="GB", field="iban")
+    assert all(iban.startswith("GB") and len(iban) == 22 for iban in ibans)
+
+
+def test_stock_crypto_and_profile():
+    stocks = default_factory.create_generator_simple("stock_code", market="SH", board="科创板")
+    records = stocks.generate_batch(100, seed=1)
+    assert all(record["code"].startswith("68") and record["symbol"].endswith(".SH") for record in records)
+    assert all(record["name"] == stock_name(record["code"]) for record in records)
+    assert not stocks.validate("123456")
+
+    crypto = default_factory.create_generator_simple("crypto_address")
+    for btc_format, head in (("p2pkh", "1"), ("p2sh", "3"), ("bech32", "bc1q")):
+        addresses = crypto.generate_batch(50, seed=2, btc_format=btc_format, field="btc_address")
+        assert all(address.startswith(head) and btc_address_valid(address) for address in addresses)
+    assert crypto.validate("1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa")
+    assert not crypto.validate("1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNb")
+
+    profile = default_factory.create_generator_simple("金融档案", min_income=50000, max_income=60000)
+    records = profile.generate_batch(500, seed=3)
+    assert all(50000 <= record["annual_income"] <= 60000 and record["annual_income"] % 100 == 0 for record in records)
+    assert all(350 <= record["credit_score"] <= 950 for record in records)
+    conservative = {record["investment_preference"] for record in records if record["risk_tolerance"] == "保守型"}
+    assert conservative <= {"银行存款", "国债", "货币基金"}
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+定长列测试
+"""
+
+import pytest
+
+from dataforge.core.factory import default_factory
+from dataforge.core.record_batch import FixedWidthColumn, RecordBatch
+from dataforge.core.template import DataTemplate
+from dataforge.output.formatter import OutputFormatter
+
+
+def test_column_storage_and_views():
+    """值连续存放在一个缓冲区中，按下标取值或取 memoryview 切片"""
+    column = FixedWidthColumn.from_strings(["110101199001011234", "11010119900101123X"], 18)
+    assert column.nbytes == 36
+    assert list(column) == ["110101199001011234", "11010119900101123X"]
+    assert bytes(column.view(1)) == b"11010119900101123X"
+    assert list(column[1:]) == ["11010119900101123X"]
+
+    with pytest.raises(ValueError):
+        column.append("123")
+    with pytest.raises(ValueError):
+        column.append("一" * 18)
+
+
+def test_generate_column_matches_generate_batch():
+    """定长生成器直接填充定长列，结果与 generate_batch 相同"""
+    for name in ("idcard", "uscc", "phone"):
+        generator = default_factory.get_generator_simple(name)
+        column = generator.generate_column(5000, seed=11)
+        assert isinstance(column, FixedWidthColumn)
+        assert list(column) == generator.generate_batch(5000, seed=11)
+
+    formatted = default_factory.get_generator_simple("phone", format_type="dash")
+    assert formatted.fixed_width is None
+    assert isinstance(formatted.generate_column(10, seed=1), list)
+
+
+@pytest.mark.parametrize("format_type", ["csv", "ndjson", "sql"])
+def test_bytes_output_matches_text_output(format_type):
+    """定长列直接写出的字节与逐值格式化后编码的结果相同"""
+    template = DataTemplate.from_dict([
+        {"name": "身份证", "generator": "idcard"},
+        {"name": "姓名", "generator": "name"},
+        {"name": "手机", "generator": "phone"},
+    ])
+    batch = template.generate_record_batch(0, 300, seed=4)
+    assert isinstance(batch.column("身份证"), FixedWidthColumn)
+
+    formatter = OutputFormatter()
+    for first in (True, False):
+        expected = formatter.format_chunk(batch, format_type, first=first).encode("utf-8")
+        assert formatter.format_chunk_bytes(batch, format_type, first=first) == expected
+
+    tricky = RecordBatch.from_rows(
+        ["code", "note"],
+        [("AB12", 'say "hi", ok'), ("CD34", None), ("EF56", "line\nbreak")],
+        widths=[4, None],
+    )
+    assert formatter.format_chunk_bytes(tricky, format_type) == formatter.format_chunk(tricky, format_type).encode("utf-8")
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+生成计划测试
+验证单次调用的参数覆盖不修改生成器实例，且可并发调用
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from dataforge.generators.basic.company import ChineseCompanyNameGenerator
+from dataforge.generators.basic.uscc import USCCGenerator
+from dataforge.generators.contact.email import EmailGenerator
+
+
+def test_email_overrides_do_not_touch_instance():
+    """generate_batch 的参数覆盖只作用于本次调用"""
+    generator = EmailGenerator({"domain_type": "chinese"})
+    plan = generator._plan
+    parameters = dict(generator.parameters)
+
+    emails = generator.generate_batch(20, custom_domain="example.com", username_style="business")
+
+    assert all(email.endswith("@example.com") for email in emails)
+    assert generator.parameters == parameters
+    assert generator._plan is plan
+    assert generator.custom_domain is None
+
+
+def test_plans_are_shared_by_parameters():
+    """相同参数的计划在实例间复用"""
+    first = ChineseCompanyNameGenerator({"type": "tech", "size": "large"})
+    second = ChineseCompanyNameGenerator({"size": "large", "type": "tech"})
+    assert first._plan is second._plan
+    assert first._plan_with_overrides({"region": "杭州"}) is second._plan_with_overrides({"region": "杭州"})
+
+
+def test_concurrent_batches_with_different_overrides():
+    """同一实例上并发的不同覆盖互不干扰"""
+    generator = ChineseCompanyNameGenerator({"include_region": True})
+    regions = ["北京", "上海", "广州", "深圳"] * 4
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        batches = list(pool.map(lambda region: (region, generator.generate_batch(50, region=region)), regions))
+
+    for region, names in batches:
+        assert len(names) == 50
+        assert all(name.startswith(region) for name in names)
+    assert generator.region is None
+
+
+def test_uscc_by_company_name_keeps_instance_state():
+    """根据公司名称生成信用代码时不修改实例的地区设置"""
+    generator = USCCGenerator({"region": "上海"})
+    uscc = generator.generate_by_company_name("北京星光科技有限公司")
+
+    assert generator.extract_info(uscc)["province_name"] == "北京"
+    assert generator.region == "上海"
+    assert generator.extract_info(generator.generate())["province_name"] == "上海"
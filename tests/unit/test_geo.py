@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+地区形状与坐标生成测试
+"""
+
+import operator
+import random
+from collections import Counter
+
+import pytest
+
+from dataforge.core.factory import default_factory
+from dataforge.geo import build_shape, sample_point, sample_points, triangulate
+from dataforge.geo.shapes import build_geo_table
+
+
+@pytest.fixture(scope="module")
+def geo_table():
+    return build_geo_table()
+
+
+def _polygon_area(xs, ys):
+    return abs(sum(xs[i - 1] * ys[i] - xs[i] * ys[i - 1] for i in range(len(xs)))) / 2
+
+
+def test_triangulation_covers_outline(geo_table):
+    """三角剖分的总面积等于轮廓面积（轮廓为简单多边形）"""
+    for shape in geo_table["shapes"].values():
+        assert shape.area == pytest.approx(sum(_polygon_area(xs, ys) for xs, ys in shape.rings), rel=1e-9)
+
+    # 凹多边形，顶点顺时针；剩下的三个顶点共线时不产生退化三角形
+    xs, ys = (0, 0, 2, 2, 1), (0, 2, 2, 0, 1)
+    areas = [_polygon_area([xs[i] for i in triangle], [ys[i] for i in triangle]) for triangle in triangulate(xs, ys)]
+    assert sorted(areas) == [1, 2]
+    assert build_shape("凹", [(0, 0, 0, 2, 2, 2, 2, 0, 1, 1)]).area == pytest.approx(3.0)
+
+
+def test_samples_are_uniform_inside(geo_table):
+    """采样点都在各自地区内，且按面积均匀落入两个不相交的半区"""
+    rng = random.Random(7)
+    shapes = list(geo_table["shapes"].values())
+    rows = [shape for shape in shapes for _ in range(2000)]
+    lngs, lats = sample_points(rng, rows)
+    assert all(map(lambda shape, lng, lat: shape.contains(lng, lat), rows, lngs, lats))
+
+    square = build_shape("正方形", [(0, 0, 2, 0, 2, 2, 0, 2)])
+    lngs, _ = sample_points(rng, [square] * 20000)
+    assert sum(lng < 0.5 for lng in lngs) / 20000 == pytest.approx(0.25, abs=0.02)
+    assert square.contains(*sample_point(rng, square))
+
+
+def test_grid_index_locates_cities(geo_table):
+    index = geo_table["index"]
+    assert index.locate(116.40, 39.90) == "北京市"
+    assert index.locate(121.47, 31.23) == "上海市"
+    assert index.locate(113.26, 23.13) == "广东省"
+    assert index.locate(104.07, 30.67) == "四川省"
+    assert index.locate(87.62, 43.83) is None
+    assert index.locate_many([118.80, 120.15], [32.06, 30.27]) == ["江苏省", "浙江省"]
+
+
+def test_address_coordinates_follow_region(geo_table):
+    """地址的坐标落在地址所属省份内；城市开头的地址取所在省份"""
+    index = geo_table["index"]
+    generator = default_factory.create_generator_simple("address", format_style="casual")
+    addresses = generator.generate_batch(2000, seed=4)
+    provinces = {city: province for province, info in generator.PROVINCES.items() for city in info["cities"]}
+    provinces.update((province, province) for province in generator.PROVINCES)
+
+    coordinates = generator.generate_coordinates_batch(addresses, seed=5)
+    assert len(coordinates) == len(addresses)
+    located = index.locate_many(
+        [point["longitude"] for point in coordinates], [point["latitude"] for point in coordinates]
+    )
+    expected = [next(provinces[city] for city in provinces if address.startswith(city)) for address in addresses]
+    # 保留6位小数后，极少数紧贴边界的点可能落到相邻省份
+    assert Counter(map(operator.eq, located, expected))[False] <= 2
+    assert generator.generate_coordinates_batch(addresses, seed=5) == coordinates
+
+    point = generator.generate_coordinates("北京市朝阳区建国路1号")
+    assert index.locate(point["longitude"], point["latitude"]) == "北京市"
+    point = generator.generate_coordinates("某地")
+    assert 35.0 <= point["latitude"] <= 40.0 and 103.0 <= point["longitude"] <= 120.0
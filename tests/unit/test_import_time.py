@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+导入性能测试
+验证 import dataforge 不加载生成器模块，且耗时在预算之内
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# import dataforge 的累计耗时预算（毫秒）
+IMPORT_BUDGET_MS = 150
+
+
+def _run_python(*args):
+    env = dict(os.environ, PYTHONPATH=PROJECT_ROOT)
+    env.pop("DATAFORGE_PRELOAD", None)
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_import_does_not_load_generators():
+    """导入包时不应导入任何生成器模块"""
+    result = _run_python(
+        "-c",
+        "import sys, dataforge; "
+        "print('\\n'.join(m for m in sys.modules if m.startswith('dataforge.generators.')))",
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_import_time_budget():
+    """import dataforge 的累计耗时应低于预算"""
+    result = _run_python("-X", "importtime", "-c", "import dataforge")
+
+    cumulative_us = None
+    for line in result.stderr.splitlines():
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == "dataforge":
+            cumulative_us = int(parts[1])
+
+    assert cumulative_us is not None, result.stderr
+    assert cumulative_us / 1000 < IMPORT_BUDGET_MS, f"import dataforge took {cumulative_us / 1000:.1f}ms"
+
+
+def test_lazy_registry_resolves_aliases():
+    """中文别名在首次查找时触发导入并解析到生成器类"""
+    import dataforge
+    from dataforge.generators import BUILTIN_GENERATORS
+
+    for name, (target, aliases) in BUILTIN_GENERATORS.items():
+        generator_class = dataforge.default_registry.get(name)
+        assert generator_class is not None
+        assert f"{generator_class.__module__}:{generator_class.__name__}" == target
+        for alias in aliases:
+            assert dataforge.default_registry.get(alias) is generator_class
+
+
+def test_register_lazy_rejects_bad_target():
+    """懒加载目标必须是 module:Class 形式"""
+    from dataforge.core.factory import GeneratorRegistry
+
+    with pytest.raises(ValueError):
+        GeneratorRegistry().register_lazy("broken", "dataforge.generators.basic.name")
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+座机、传真、客服电话和分机号码测试
+"""
+
+import random
+
+import pytest
+
+from dataforge.core.factory import default_factory
+from dataforge.core.template import DataTemplate
+from dataforge.generators.contact.landline import AREA_CODES, _area_code_index, _digit_trie
+
+
+def _area_code(number):
+    return number.split("-")[0]
+
+
+def test_area_code_table_matches_address_regions():
+    """地址生成器的每个城市都有区号；区号的本地号码位数一致"""
+    generator = default_factory.create_generator_simple("address")
+    cities = {city for _, city, _, _ in AREA_CODES}
+    for province, info in generator.PROVINCES.items():
+        if province not in cities:
+            assert set(info["cities"]) <= cities
+
+    lengths = {}
+    for _, _, code, length in AREA_CODES:
+        assert lengths.setdefault(code, length) == length
+        assert len(code) + length in (11, 12)
+
+
+@pytest.mark.parametrize(
+    "parameters",
+    [{}, {"city": "杭州"}, {"province": "四川省", "format_type": "international"}, {"format_type": "parentheses"}],
+)
+def test_batch_matches_single(parameters):
+    """整列组装的号码全部有效，区号分布与逐条生成一致"""
+    generator = default_factory.create_generator_simple("landline", **parameters)
+    with generator._using_rng(random.Random(3)):
+        single = [generator.generate() for _ in range(20000)]
+        batch = generator._compose_batch(generator._plan, 20000)
+
+    assert all(generator.validate(number) for number in batch)
+    shares = [
+        {code: sum(number.startswith(prefix) for number in numbers) / len(numbers)
+         for code, prefix in generator._plan.prefixes.items()}
+        for numbers in (single, batch)
+    ]
+    for code in shares[0]:
+        assert shares[1][code] == pytest.approx(shares[0][code], abs=0.01)
+
+
+def test_fixed_region_and_validation():
+    generator = default_factory.create_generator_simple("座机", city="深圳市")
+    numbers = generator.generate_batch(500, seed=1)
+    assert {_area_code(number) for number in numbers} == {"0755"}
+    assert all(len(number) == 13 for number in numbers)
+    assert generator.generate_batch(500, seed=1) == numbers
+
+    numbers = generator.generate_batch(500, seed=1, area_code="571")
+    assert {_area_code(number) for number in numbers} == {"0571"}
+    assert generator.validate("0755-28765432")
+    assert not generator.validate("0755-2876543")  # 深圳为8位本地号码
+    assert not generator.validate("0756-12345678")  # 本地号码不以 1 开头
+    assert not generator.validate("0999-2876543")
+    assert generator.get_area_info("(0731)82345678")["cities"] == ["长沙市", "株洲市", "湘潭市"]
+    with pytest.raises(ValueError):
+        default_factory.create_generator_simple("landline", area_code="0999")
+
+
+def test_area_code_follows_address():
+    """同一行的座机区号与地址所在城市一致"""
+    template = DataTemplate.from_dict(
+        [
+            {"name": "地址", "generator": "address"},
+            {"name": "座机", "generator": "landline"},
+            {"name": "传真", "generator": "fax", "parameters": {"format_type": "plain"}},
+        ]
+    )
+    generator = default_factory.create_generator_simple("landline")
+    index = _area_code_index()
+    for row in template.generate_range(0, 300, seed=2):
+        codes = {code for code, _ in index.candidates_for(row["地址"])}
+        assert _area_code(row["座机"]) in codes
+        assert row["传真"][:4] in codes or row["传真"][:3] in codes
+        assert generator.validate(row["传真"])
+
+    addresses = ["浙江省杭州市西湖区", "深圳市南山区", "北京市北京市朝阳区", "某地"] * 50
+    numbers = generator.generate_for_addresses(addresses, seed=4)
+    assert [_area_code(number) for number in numbers[:3]] == ["0571", "0755", "010"]
+    assert generator.generate_for_addresses(addresses, seed=4) == numbers
+
+
+def test_toll_free_and_extension():
+    toll_free = default_factory.create_generator_simple("客服电话", prefix="400")
+    numbers = toll_free.generate_batch(1000, seed=1)
+    assert all(number.startswith("400-") and toll_free.validate(number) for number in numbers)
+    assert all(len(number) == 10 for number in toll_free.generate_batch(100, format_type="plain"))
+
+    extension = default_factory.create_generator_simple("分机号")
+    assert all(len(value) == 4 and value[0] != "0" for value in extension.generate_batch(1000, seed=1))
+    numbers = extension.generate_batch(200, seed=1, with_number=True, separator="转", length=3, city="南京")
+    assert all(number.startswith("025-") and len(number.split("转")[1]) == 3 for number in numbers)
+    assert extension.generate_for_addresses(["苏州市姑苏区"], seed=1)[0].startswith("0512-")
+
+
+def test_digit_trie():
+    assert _digit_trie(["571", "574", "10"]) == "(?:10|57[14])"
+    assert _digit_trie(["1", "10"]) == "1(?:0)?"
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+IP 地址、MAC 地址、域名和 URL 生成器测试
+"""
+
+import collections
+import ipaddress
+import random
+import re
+
+import pytest
+
+from dataforge.core import sampling
+from dataforge.core.factory import default_factory
+from dataforge.generators.network.ip import (
+    CHINA_ISP_BLOCKS,
+    cidr_interval,
+    format_ipv4,
+    format_ipv6,
+    subtract_intervals,
+)
+
+
+def test_random_below_wide_bounds_match_per_value_draws():
+    bound = (1 << 125) + 12345
+    expected_rng, rng = random.Random(7), random.Random(7)
+    expected = [int.from_bytes(expected_rng.randbytes(16), "little") % bound for _ in range(1000)]
+    assert sampling.random_below(rng, bound, 1000) == expected
+    with pytest.raises(ValueError):
+        sampling.random_below(rng, (1 << 128) + 1, 1)
+
+
+def test_formatting_matches_ipaddress():
+    rng = random.Random(1)
+    v4 = [rng.getrandbits(32) for _ in range(5000)] + [0, (1 << 32) - 1]
+    assert format_ipv4(v4) == [str(ipaddress.IPv4Address(value)) for value in v4]
+    # 随机清零若干连续位，覆盖各种长度和位置的全零组
+    v6 = [rng.getrandbits(128) & ~((1 << rng.randrange(128)) - 1 << rng.randrange(64)) for _ in range(5000)]
+    v6 += [0, 1, 1 << 127, (1 << 128) - 1, 1 << 16]
+    assert format_ipv6(v6) == [str(ipaddress.IPv6Address(value)) for value in v6]
+
+
+def test_public_addresses_exclude_reserved_ranges():
+    generator = default_factory.create_generator_simple("ip_address")
+    values = generator.generate_integers(20000, seed=1)
+    assert values.typecode == "I"
+    assert all(ipaddress.IPv4Address(value).is_global for value in values)
+    assert generator.generate_batch(1000, seed=2, workers=4) == generator.generate_batch(1000, seed=2)
+    assert generator.validate("8.8.8.8") and not generator.validate("192.168.1.1")
+    assert not generator.validate("1.2.3") and not generator.validate("01.2.3.4")
+
+    v6 = default_factory.create_generator_simple("ip_address", version=6, type="PUBLIC")
+    assert all(ipaddress.IPv6Address(value).is_global for value in v6.generate_integers(5000, seed=1))
+    assert all(v6.validate(value) for value in v6.generate_batch(200, seed=2))
+    assert subtract_intervals([(0, 10)], [(2, 4), (3, 6), (8, 20)]) == [(0, 2), (6, 8)]
+
+
+def test_cidr_constraints():
+    generator = default_factory.create_generator_simple("ipv4", cidr=["8.8.8.0/24", "10.0.0.0/8"])
+    assert all(value.startswith("8.8.8.") for value in generator.generate_batch(500, seed=1))
+    private = default_factory.create_generator_simple("ipv4", type="PRIVATE", cidr="172.16.0.0/12")
+    network = ipaddress.ip_network("172.16.0.0/12")
+    assert all(ipaddress.IPv4Address(value) in network for value in private.generate_integers(500, seed=1))
+    v6 = default_factory.create_generator_simple("ipv6", cidr="2409:8000::/20")
+    network = ipaddress.ip_network("2409:8000::/20")
+    assert all(ipaddress.IPv6Address(value) in network for value in v6.generate_batch(200))
+    with pytest.raises(ValueError):
+        default_factory.create_generator_simple("ipv4", cidr="10.0.0.0/8")
+    with pytest.raises(ValueError):
+        default_factory.create_generator_simple("ipv4", cidr="2409:8000::/20")
+
+
+def test_china_addresses_follow_isp_shares():
+    generator = default_factory.create_generator_simple("IP地址", type="CHINA")
+    intervals = {name: [cidr_interval(cidr) for cidr in cidrs] for name, (_, cidrs) in CHINA_ISP_BLOCKS.items()}
+    counts = collections.Counter(
+        next(name for name, blocks in intervals.items() if any(start <= value < end for start, end in blocks))
+        for value in generator.generate_integers(20000, seed=1)
+    )
+    total = sum(weight for weight, _ in CHINA_ISP_BLOCKS.values())
+    for name, (weight, _) in CHINA_ISP_BLOCKS.items():
+        assert counts[name] / 20000 == pytest.approx(weight / total, abs=0.015)
+    mobile = default_factory.create_generator_simple("ip_address", type="CHINA", isp="mobile")
+    assert all(mobile.validate(value) for value in mobile.generate_batch(200, seed=1))
+    assert not mobile.validate("58.32.0.1")
+
+
+def test_mac_domain_and_url_formats():
+    mac = default_factory.create_generator_simple("MAC地址")
+    addresses = mac.generate_batch(500, seed=1)
+    assert all(re.fullmatch(r"[0-9a-f]{2}(:[0-9a-f]{2}){5}", value) for value in addresses)
+    # 单播、全局管理：首字节最低两位为0
+    assert all(int(value[:2], 16) & 3 == 0 for value in addresses)
+    assert all(re.fullmatch(r"[0-9A-F]{2}(-[0-9A-F]{2}){5}", value) for value in mac.generate_batch(50, separator="-"))
+    assert all(mac.validate(value) for value in mac.generate_batch(50, separator="."))
+    huawei = mac.generate_batch(200, seed=2, vendor="华为")
+    assert {value[:8] for value in huawei} <= {"00:e0:fc", "28:6e:d4", "00:18:82", "48:db:50"}
+
+    domains = default_factory.create_generator_simple("域名", tld=".cn")
+    assert all(value.endswith(".cn") and domains.validate(value) for value in domains.generate_batch(200, seed=1))
+
+    urls = default_factory.create_generator_simple("url")
+    values = urls.generate_batch(500, seed=1)
+    assert all(urls.validate(value) for value in values)
+    assert {value.split("://")[0] for value in values} == {"http", "https"}
+    fixed = urls.generate_batch(50, seed=1, domain="example.com", scheme="https", query_probability=0)
+    assert all(value.startswith("https://example.com") and "?" not in value for value in fixed)
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+数值分布与整数、小数、年龄生成器测试
+"""
+
+import random
+import statistics
+from collections import Counter
+
+import pytest
+
+from dataforge.core.distributions import build_distribution, sample_values
+from dataforge.core.factory import default_factory
+from dataforge.core.template import DataTemplate
+from dataforge.generators.numeric.age import CENSUS_AGE_BINS, CENSUS_AGE_WEIGHTS
+
+
+@pytest.mark.parametrize(
+    "kind, options",
+    [
+        ("uniform", {}),
+        ("normal", {"mean": 30, "std": 20}),
+        ("lognormal", {"median": 5, "sigma": 1.5}),
+        ("zipf", {"exponent": 1.1}),
+        ("histogram", {"bins": [-10, 10, 40, 90], "weights": [2, 0, 1]}),
+    ],
+)
+def test_distribution_column_matches_quantile(kind, options):
+    """整列采样与逐个求分位数的结果逐值相同，且都在截断区间内"""
+    distribution = build_distribution(kind, 0, 50, **options)
+    column = sample_values(random.Random(1), distribution, 5000)
+    rng = random.Random(1)
+    assert column == [distribution.quantile(rng.random()) for _ in range(5000)]
+    assert all(0 <= value < 50 for value in column)
+
+
+def test_distribution_shapes():
+    rng = random.Random(2)
+    values = sample_values(rng, build_distribution("normal", -100, 100, mean=3, std=2), 50000)
+    assert statistics.mean(values) == pytest.approx(3, abs=0.05)
+    assert statistics.stdev(values) == pytest.approx(2, abs=0.05)
+
+    # 截断到右尾：取值都在 [8, 9) 内，不需要拒绝采样
+    values = sample_values(rng, build_distribution("normal", 8, 9, mean=0, std=1), 1000)
+    assert all(8 <= value < 9 for value in values)
+
+    counts = Counter(sample_values(rng, build_distribution("zipf", 1, 11, exponent=1.0), 50000))
+    assert counts[1.0] / counts[2.0] == pytest.approx(2, rel=0.1)
+
+    # 截断后部分落在区间内的组按比例保留权重：[5, 10) 占 1，[10, 20) 占 4
+    values = sample_values(rng, build_distribution("histogram", 5, 20, bins=[0, 10, 20], weights=[2, 4]), 50000)
+    assert sum(value < 10 for value in values) / len(values) == pytest.approx(0.2, abs=0.01)
+
+    with pytest.raises(ValueError):
+        build_distribution("poisson", 0, 1)
+    with pytest.raises(ValueError):
+        build_distribution("histogram", 0, 10, bins=[20, 30], weights=[1])
+
+
+def test_integer_batch_and_column():
+    generator = default_factory.create_generator_simple("integer", min=-5, max=5, distribution="normal", std=3)
+    with generator._using_rng(random.Random(3)):
+        single = [generator.generate() for _ in range(2000)]
+    with generator._using_rng(random.Random(3)):
+        assert generator._sample(generator._plan, 2000) == single
+
+    values = generator.generate_batch(20000, seed=4)
+    assert set(values) == set(range(-5, 6))
+    assert statistics.mean(values) == pytest.approx(0, abs=0.05)
+    column = generator.generate_column(20000, seed=4)
+    assert column.typecode == "q" and column.itemsize == 8
+    assert column.tolist() == values
+    assert generator.generate_batch(20000, seed=4, workers=4) == values
+
+    zipf = generator.generate_batch(10000, seed=5, distribution="zipf", min=1, max=1000, exponent=2)
+    assert Counter(zipf).most_common(1)[0][0] == 1
+    with pytest.raises(ValueError):
+        default_factory.create_generator_simple("integer", min=0, max=2 ** 63)
+    with pytest.raises(ValueError):
+        default_factory.create_generator_simple("整数", min=10, max=1)
+
+
+def test_integer_range_beyond_int32():
+    generator = default_factory.create_generator_simple("integer", min=-2 ** 62, max=2 ** 62)
+    values = generator.generate_batch(1000, seed=1)
+    assert all(-2 ** 62 <= value <= 2 ** 62 for value in values)
+    assert max(map(abs, values)) > 2 ** 31
+    assert generator.generate_column(1000, seed=1).tolist() == values
+
+
+def test_integer_histogram_includes_last_edge():
+    """直方图最后一组含右端点，与其他分布一样可以取到 max"""
+    generator = default_factory.create_generator_simple(
+        "integer", min=1, max=10, distribution="histogram", bins=[1, 5, 10], weights=[1, 1]
+    )
+    values = generator.generate_batch(5000, seed=1)
+    assert set(values) == set(range(1, 11))
+
+
+def test_decimal_precision_and_column():
+    generator = default_factory.create_generator_simple("小数", min=1, max=2, precision=3, distribution="lognormal")
+    values = generator.generate_batch(5000, seed=1)
+    assert all(1 <= value <= 2 and round(value, 3) == value for value in values)
+    column = generator.generate_column(5000, seed=1)
+    assert column.typecode == "d" and column.tolist() == values
+    assert generator.validate(1.5) and not generator.validate(2.5) and not generator.validate(True)
+    with pytest.raises(ValueError):
+        default_factory.create_generator_simple("decimal", distribution="zipf")
+
+
+def test_age_follows_census_within_range():
+    generator = default_factory.create_generator_simple("年龄", min=18, max=65)
+    values = generator.generate_batch(50000, seed=1)
+    assert min(values) == 18 and max(values) == 65
+
+    # 30-34 岁组与 60-64 岁组之比接近普查人口之比
+    ratio = CENSUS_AGE_WEIGHTS[6] / CENSUS_AGE_WEIGHTS[12]
+    counts = Counter(value // 5 for value in values)
+    assert counts[6] / counts[12] == pytest.approx(ratio, rel=0.1)
+    assert CENSUS_AGE_BINS[-1] == 110
+
+    template = DataTemplate.from_dict([{"name": "年龄", "generator": "age", "parameters": {"min": 25, "max": 35}}])
+    assert all(25 <= row["年龄"] <= 35 for row in template.generate_range(0, 200, seed=2))
+
+
+def test_numpy_sampling():
+    np = pytest.importorskip("numpy")
+    generator = default_factory.create_generator_simple("age", min=18, max=65)
+    values = generator.generate_ndarray(10000, seed=1)
+    assert values.dtype == np.int64 and values.min() >= 18 and values.max() <= 65
+    assert (generator.generate_ndarray(10000, seed=1) == values).all()
+    decimals = default_factory.create_generator_simple("decimal", distribution="normal").generate_ndarray(100, seed="x")
+    assert decimals.dtype == np.float64
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+线程池批量生成测试
+验证带种子的批量生成与线程数、执行方式无关，且线程间随机状态互不干扰
+"""
+
+import threading
+
+import pytest
+
+from dataforge.core import parallel
+from dataforge.generators.basic.idcard import ChineseIDCardGenerator
+from dataforge.generators.contact.email import EmailGenerator
+
+
+@pytest.fixture
+def free_threaded(monkeypatch):
+    """模拟 free-threaded 构建，使 executor="thread" 真正使用线程池"""
+    monkeypatch.setattr(parallel, "gil_enabled", lambda: False)
+
+
+def test_seeded_batch_independent_of_workers(free_threaded):
+    """相同种子在不同线程数和执行方式下结果一致"""
+    generator = ChineseIDCardGenerator()
+    count = parallel.DEFAULT_CHUNK_SIZE * 2 + 17
+
+    serial = generator.generate_batch(count, seed=123, executor="serial")
+    threaded = generator.generate_batch(count, seed=123, workers=4, executor="thread")
+
+    assert len(serial) == count
+    assert serial == threaded
+    assert all(generator.validate(idcard) for idcard in threaded)
+    assert generator.generate_batch(100, seed=124) != serial[:100]
+
+
+def test_unique_batch_with_workers(free_threaded):
+    """去重批量生成在多线程下仍然不重复且可复现"""
+    generator = EmailGenerator()
+    first = generator.generate_batch(5000, workers=4, seed=9, unique=True)
+    second = generator.generate_batch(5000, workers=2, seed=9, unique=True)
+
+    assert len(set(first)) == len(first) == 5000
+    assert first == second
+
+
+def test_rng_is_per_thread():
+    """每个线程拥有独立的随机数生成器"""
+    generator = ChineseIDCardGenerator()
+    rngs = []
+
+    def collect():
+        rngs.append(generator.rng)
+
+    threads = [threading.Thread(target=collect) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(rng) for rng in rngs + [generator.rng]}) == 5
+
+
+def test_unknown_executor():
+    """不支持的执行方式抛出 ValueError"""
+    with pytest.raises(ValueError):
+        ChineseIDCardGenerator().generate_batch(10, executor="process")
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+生成流水线测试
+"""
+
+import pytest
+
+from dataforge.output.job import GenerationJob
+from dataforge.output.pipeline import GenerationPipeline
+
+TEMPLATE = {
+    "fields": [
+        {"name": "姓名", "generator": "name"},
+        {"name": "地址", "generator": "address"},
+    ],
+}
+
+
+def test_output_matches_generation_job(tmp_path):
+    """多线程流水线的输出与按分块顺序生成的任务输出一致"""
+    job = GenerationJob.create(str(tmp_path / "job"), TEMPLATE, count=2050, seed=3, chunk_size=100, format_type="sql")
+    with open(job.run(), "rb") as f:
+        expected = f.read()
+
+    output = str(tmp_path / "out.sql")
+    progress = []
+    pipeline = GenerationPipeline(TEMPLATE, "sql", chunk_size=100, generator_workers=3, formatter_workers=2, queue_size=2)
+    stats = pipeline.run(2050, 3, output, progress=lambda done, total: progress.append((done, total)))
+
+    with open(output, "rb") as f:
+        assert f.read() == expected
+    assert stats.bytes == len(expected)
+    assert progress[-1] == (21, 21)
+    assert {name: stage.items for name, stage in stats.stages.items()} == {"generate": 21, "format": 21, "write": 21}
+    assert stats.bottleneck in stats.stages
+    assert all(0.0 <= stage.utilization(stats.elapsed) <= 1.0 for stage in stats.stages.values())
+
+
+def test_stage_error_stops_pipeline(tmp_path):
+    """任一阶段出错时流水线终止并抛出异常，不留下半成品文件"""
+    pipeline = GenerationPipeline(TEMPLATE, "csv", chunk_size=50)
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("formatter failed")
+
+    pipeline.formatter.format_chunk = fail
+    with pytest.raises(RuntimeError, match="formatter failed"):
+        pipeline.run(500, 1, str(tmp_path / "out.csv"))
+    assert list(tmp_path.iterdir()) == []
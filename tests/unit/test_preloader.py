@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+数据预加载器测试
+验证后台加载、wait_ready 以及版本化磁盘缓存
+"""
+
+import pytest
+
+from dataforge.core.preloader import DataPreloader
+
+BUILD_CALLS = []
+
+
+def build_squares():
+    """测试用构建函数，记录调用次数"""
+    BUILD_CALLS.append(1)
+    return {i: i * i for i in range(100)}
+
+
+TARGET = f"{__name__}:build_squares"
+
+
+def test_background_load_and_timings(tmp_path):
+    """后台线程加载完成后可直接取表，并记录耗时来源"""
+    preloader = DataPreloader(cache_dir=str(tmp_path))
+    preloader.register("squares", TARGET)
+
+    assert preloader.wait_ready(0) is False  # 未启动
+    preloader.start()
+    assert preloader.wait_ready(5)
+    assert preloader.get("squares")[9] == 81
+    assert preloader.timings()["squares"].source in ("built", "disk")
+    assert preloader.errors() == {}
+
+
+def test_disk_cache_starts_warm(tmp_path):
+    """第二个预加载器实例直接读取磁盘缓存，不再调用构建函数"""
+    BUILD_CALLS.clear()
+    first = DataPreloader(cache_dir=str(tmp_path))
+    first.register("squares", TARGET)
+    first.get("squares")
+    assert len(BUILD_CALLS) == 1
+
+    second = DataPreloader(cache_dir=str(tmp_path))
+    second.register("squares", TARGET)
+    assert second.get("squares") == first.get("squares")
+    assert second.timings()["squares"].source == "disk"
+    assert len(BUILD_CALLS) == 1
+
+    # 表版本变化后缓存失效
+    third = DataPreloader(cache_dir=str(tmp_path))
+    third.register("squares", TARGET, version=2)
+    third.get("squares")
+    assert third.timings()["squares"].source == "built"
+
+    third.clear_cache()
+    assert not list(tmp_path.rglob("*.pkl"))
+
+
+def test_source_modules_invalidate_cache(tmp_path, monkeypatch):
+    """表数据所在的其他模块变化后缓存失效"""
+    source_dir = tmp_path / "src"
+    source_dir.mkdir()
+    source = source_dir / "preload_source_data.py"
+    source.write_text("VALUES = [1, 2]\n")
+    monkeypatch.syspath_prepend(str(source_dir))
+
+    def load(**kwargs):
+        preloader = DataPreloader(cache_dir=str(tmp_path / "cache"))
+        preloader.register("squares", TARGET, **kwargs)
+        preloader.get("squares")
+        return preloader.timings()["squares"].source
+
+    assert load(sources=["preload_source_data"]) == "built"
+    assert load(sources=["preload_source_data"]) == "disk"
+    source.write_text("VALUES = [1, 2, 3]\n")
+    assert load(sources=["preload_source_data"]) == "built"
+    assert load() == "built"
+
+
+def test_builtin_geo_table_tracks_outlines():
+    """地区表的数据在 geo.outlines 中，计入缓存指纹"""
+    from dataforge.core.preloader import default_preloader
+
+    assert default_preloader._specs["geo.regions"].sources == ("dataforge.geo.outlines",)
+
+
+def test_default_cache_dir_is_isolated(isolated_cache_dir):
+    """测试期间全局预加载器写入临时目录"""
+    from dataforge.core.preloader import default_preloader
+
+    assert default_preloader.cache_dir == isolated_cache_dir
+
+
+def test_disabled_disk_cache(tmp_path):
+    """关闭磁盘缓存时不写文件"""
+    preloader = DataPreloader(cache_dir=str(tmp_path), use_disk_cache=False)
+    preloader.register("squares", TARGET)
+    preloader.get("squares")
+    assert not list(tmp_path.rglob("*.pkl"))
+
+
+def test_unknown_table():
+    """未注册的表抛出 KeyError"""
+    with pytest.raises(KeyError):
+        DataPreloader(use_disk_cache=False).get("missing")
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+随机访问生成测试
+验证任意行可直接生成，且与顺序生成的结果一致
+"""
+
+import pickle
+
+from dataforge.core.random_access import CounterRandom, stream_key
+from dataforge.core.template import DataTemplate
+from dataforge.generators.basic.idcard import ChineseIDCardGenerator
+
+TEMPLATE = {
+    "name": "用户信息模板",
+    "fields": [
+        {"id": "field_1", "name": "姓名", "type": "name", "generator": "name", "parameters": {}},
+        {"id": "field_2", "name": "身份证", "type": "idcard", "generator": "idcard", "parameters": {}},
+        {"id": "field_3", "name": "手机号", "type": "phone", "generator": "phone", "parameters": {}},
+    ],
+}
+
+
+def test_counter_random_seek():
+    """定位到某一行后的随机序列与顺序读取一致，且可序列化"""
+    rng = CounterRandom(stream_key(42))
+    rng.seek(7)
+    expected = [rng.random() for _ in range(20)]
+
+    other = CounterRandom(stream_key(42))
+    other.seek(3)
+    other.random()
+    other.seek(7)
+    assert [other.random() for _ in range(20)] == expected
+
+    other.seek(7)
+    other.random()
+    restored = pickle.loads(pickle.dumps(other))
+    assert [restored.random() for _ in range(19)] == expected[1:]
+
+
+def test_generator_random_access():
+    """generate_at 与 generate_range 中对应行一致"""
+    generator = ChineseIDCardGenerator()
+    rows = generator.generate_range(0, 200, seed="fixture")
+
+    assert generator.generate_at(137, seed="fixture") == rows[137]
+    assert generator.generate_range(100, 200, seed="fixture") == rows[100:]
+    assert generator.generate_range(0, 200, seed="other") != rows
+
+
+def test_template_random_access():
+    """模板任意区间可独立生成，拼接后与整体生成一致"""
+    template = DataTemplate.from_dict(TEMPLATE)
+    rows = template.generate_batch(300, seed=2024)
+
+    assert template.field_names == ["姓名", "身份证", "手机号"]
+    assert template.generate_range(0, 150, 2024) + template.generate_range(150, 300, 2024) == rows
+    assert template.generate_at(299, 2024) == rows[-1]
+
+    # 删除字段不影响其他字段的值
+    reduced = DataTemplate.from_dict({"fields": TEMPLATE["fields"][1:]})
+    assert [row["身份证"] for row in reduced.generate_range(0, 300, 2024)] == [row["身份证"] for row in rows]
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+列式记录批次测试
+"""
+
+import json
+from array import array
+
+import pytest
+
+from dataforge.core.record_batch import RecordBatch
+from dataforge.core.template import DataTemplate
+from dataforge.core.types import DataType
+from dataforge.output.formatter import OutputFormatter
+
+RECORDS = [
+    {"name": "周磊", "age": 20, "active": True, "score": 1.5, "note": None},
+    {"name": "O'Neil", "age": 45, "active": False, "score": 2.0, "note": "vip"},
+]
+
+
+def test_schema_columns_and_row_views():
+    """模式按列推断类型，数值列紧凑存储，行视图按字段名或序号取值"""
+    batch = RecordBatch.from_records(RECORDS)
+
+    assert batch.names == ("name", "age", "active", "score", "note")
+    assert [item.type for item in batch.schema.fields] == [
+        DataType.STRING, DataType.INTEGER, DataType.BOOLEAN, DataType.FLOAT, DataType.STRING,
+    ]
+    assert isinstance(batch.column("age"), array)
+    assert batch.row(-1)["name"] == "O'Neil" and batch.row(0)[1] == 20
+    assert [dict(row) for row in batch] == batch.to_records() == RECORDS
+    assert RecordBatch.concat([batch.slice(0, 1), batch.slice(1)]).to_records() == RECORDS
+
+    with pytest.raises(ValueError):
+        RecordBatch(batch.schema, batch.columns[:2])
+
+
+@pytest.mark.parametrize("format_type", ["json", "ndjson", "csv", "sql", "xml"])
+def test_formatter_output_matches_dict_records(format_type):
+    """记录批次的输出与字典记录的输出相同"""
+    formatter = OutputFormatter()
+    batch = RecordBatch.from_records(RECORDS)
+    assert formatter.format(batch, format_type) == formatter.format(RECORDS, format_type)
+    if format_type == "json":
+        assert formatter.format(batch, "json") == json.dumps(RECORDS, ensure_ascii=False)
+
+
+def test_template_record_batch():
+    """模板直接生成列式批次，内容与 generate_range 相同"""
+    template = DataTemplate.from_dict([{"name": "姓名", "generator": "name"}, {"name": "手机", "generator": "phone"}])
+    batch = template.generate_record_batch(5, 25, seed=1)
+    assert len(batch) == 20
+    assert batch.to_records() == template.generate_range(5, 25, seed=1)
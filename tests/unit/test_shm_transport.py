@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+多进程共享内存传输测试
+"""
+
+import pytest
+
+from dataforge.core.record_batch import FixedWidthColumn, OffsetStringColumn, RecordBatch
+from dataforge.core.template import DataTemplate
+from dataforge.core.transport import SharedMemoryTransport, generate_batches_in_processes
+from dataforge.output.formatter import OutputFormatter
+
+TEMPLATE = [
+    {"name": "姓名", "generator": "name"},
+    {"name": "身份证", "generator": "idcard"},
+    {"name": "手机", "generator": "phone"},
+    {"name": "地址", "generator": "address"},
+]
+
+
+def test_shared_memory_round_trip():
+    """各类列经共享内存传输后逐值相同，定长列和字符串列直接映射共享内存"""
+    batch = RecordBatch.from_records(
+        [
+            {"name": "周磊", "code": "A1", "age": 20, "score": 1.5, "note": None},
+            {"name": "O'Neil", "code": "B2", "age": 45, "score": 2.0, "note": "vip"},
+        ]
+    )
+    batch.columns[1] = FixedWidthColumn.from_strings(["A1", "B2"], 2)
+    transport = SharedMemoryTransport()
+
+    with transport.receive(transport.send(batch)) as received:
+        assert isinstance(received.column("name"), OffsetStringColumn)
+        assert isinstance(received.column("code"), FixedWidthColumn)
+        assert received.to_records() == batch.to_records()
+
+
+@pytest.mark.parametrize("transport", ["shared_memory", "pickle"])
+def test_process_batches_match_in_process_generation(transport):
+    """多进程分块生成的结果与单进程 generate_record_batch 相同"""
+    template = DataTemplate.from_dict(TEMPLATE)
+    records = []
+    for batch in generate_batches_in_processes(template, 2500, seed=3, workers=2, chunk_size=1000, transport=transport):
+        records.extend(batch.to_records())
+    assert records == template.generate_record_batch(0, 2500, seed=3).to_records()
+
+
+def test_plain_string_columns_format_identically():
+    """映射的变长字符串列走 CSV 快速路径，输出与列表列相同；含需要引用的字符时回退逐值转义"""
+    batch = RecordBatch.from_records([{"id": "A1", "name": "周磊"}, {"id": "B2", "name": 'say "hi", ok'}])
+    batch.columns[0] = FixedWidthColumn.from_strings(["A1", "B2"], 2)
+    transport = SharedMemoryTransport()
+    formatter = OutputFormatter()
+
+    expected = formatter.format_chunk(batch, "csv").encode("utf-8")
+    with transport.receive(transport.send(batch)) as received:
+        assert formatter.format_chunk_bytes(received, "csv") == expected
+        assert formatter.format_chunk_bytes(received.slice(0, 1), "csv") == formatter.format_chunk(
+            batch.slice(0, 1), "csv"
+        ).encode("utf-8")
+
+
+def test_close_with_live_slice_still_unlinks():
+    """关闭时仍持有映射列的切片：共享内存照常删除，切片在回收前仍可读取"""
+    from multiprocessing import shared_memory
+
+    batch = RecordBatch.from_records([{"name": "周磊", "age": 20}, {"name": "李娜", "age": 31}])
+    transport = SharedMemoryTransport()
+    handle = transport.send(batch)
+    shared = transport.receive(handle)
+    kept = shared.batch.slice(0, 1)
+    shared.close()
+
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=handle.name)
+    assert kept.to_records() == [{"name": "周磊", "age": 20}]
+
+    kept_slices = [
+        batch.slice(0, 1)
+        for batch in generate_batches_in_processes(TEMPLATE, 200, seed=1, workers=2, chunk_size=100)
+    ]
+    expected = DataTemplate.from_dict(TEMPLATE).generate_record_batch(0, 200, seed=1).to_records()
+    assert [piece.to_records()[0] for piece in kept_slices] == [expected[0], expected[100]]
+
+
+def test_failed_send_unlinks_segment(monkeypatch):
+    """写入共享内存失败时删除已创建的共享内存"""
+    from multiprocessing import shared_memory
+
+    from dataforge.core import transport as transport_module
+
+    created = []
+
+    class RecordingSharedMemory(shared_memory.SharedMemory):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            created.append(self.name)
+
+    def failing_write(buffer, encoded):
+        raise RuntimeError("写入失败")
+
+    monkeypatch.setattr(shared_memory, "SharedMemory", RecordingSharedMemory)
+    monkeypatch.setattr(transport_module, "_write_columns", failing_write)
+    batch = RecordBatch.from_records([{"name": "周磊", "age": 20}])
+    with pytest.raises(RuntimeError):
+        SharedMemoryTransport().send(batch)
+    monkeypatch.undo()
+
+    assert len(created) == 1
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=created[0])